@@ -4,10 +4,10 @@ from typing import List
 from . import types
 
 # ========================================== ENGINE LIFECYCLE ==========================================
-def init() -> None:
-    """Initialise le moteur"""
+def init(release: bool = None) -> None:
+    """Initialise le moteur (release : active ou désactive le mode release)"""
     from .core.engine import init as _init
-    _init()
+    _init(release)
 
 def run() -> None:
     """Lance la boucle principale"""
@@ -19,6 +19,11 @@ def stop() -> None:
     from .core.engine import stop as _stop
     _stop()
 
+def set_release(enabled: bool) -> None:
+    """Bascule entre le mode release (sans vérification d'arguments) et le mode debug"""
+    from .core.engine import set_release as _set_release
+    _set_release(enabled)
+
 # ========================================== MANAGERS ==========================================
 from .managers.audio import AudioManager
 from .managers.data import DataManager
@@ -29,6 +34,7 @@ from .managers.languages import LanguagesManager
 from .managers.mouse import MouseManager
 from .managers.network import NetworkManager
 from .managers.panels import PanelsManager
+from .managers.physics import PhysicsManager
 from .managers.screen import ScreenManager
 from .managers.settings import SettingsManager
 from .managers.states import StatesManager
@@ -45,6 +51,7 @@ languages = LanguagesManager()
 mouse = MouseManager()
 network = NetworkManager()
 panels = PanelsManager()
+physics = PhysicsManager()
 screen = ScreenManager()
 settings = SettingsManager()
 states = StatesManager()
@@ -57,6 +64,7 @@ __all__: List[str] = [
     "init",
     "run",
     "stop",
+    "set_release",
     
     # Managers
     "audio",
@@ -68,6 +76,7 @@ __all__: List[str] = [
     "mouse",
     "network",
     "panels",
+    "physics",
     "screen",
     "settings",
     "states",
@@ -11,9 +11,10 @@ globals().update({
 init = _engine.init
 run = _engine.run
 stop = _engine.stop
+set_release = _engine.set_release
 
 # exports
-__all__ = [name for name in _engine.__dict__ if not name.startswith("_")] + ["init", "run", "stop"]
+__all__ = [name for name in _engine.__dict__ if not name.startswith("_")] + ["init", "run", "stop", "set_release"]
 
 
 """
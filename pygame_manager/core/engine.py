@@ -2,6 +2,7 @@
 import pygame
 from .. import context
 from pygame_manager import managers
+from .release import Release
 
 # ======================================== MOTEUR ========================================
 class Engine:
@@ -22,14 +23,27 @@ class Engine:
         self._initialized = False
         self._running = False
 
+        # mode release (variable d'environnement PYGAME_MANAGER_RELEASE)
+        self._release = Release()
+        context.release = False
+        if Release.from_env():
+            self.set_release(True)
+
     # ======================================== METHODES INTERNES ========================================
     def _raise_error(obj: object, method: str, text: str):
         """Lève une erreur"""
         raise RuntimeError(f"[{obj.__class__.__name__}].{method} : {text}")
 
     # ======================================== INITIALISATION ========================================
-    def init(self):
-        """Initialise Pygame Manager"""
+    def init(self, release: bool = None):
+        """
+        Initialise Pygame Manager
+
+        Args:
+            release (bool, optional) : active (True) ou désactive (False) le mode release
+        """
+        if release is not None:
+            self.set_release(release)
         if self._initialized: # déjà initialisé
             return self
 
@@ -47,6 +61,32 @@ class Engine:
 
         return self
 
+    # ======================================== MODE RELEASE ========================================
+    def set_release(self, enabled: bool):
+        """
+        Bascule entre le mode release (sans vérification d'arguments) et le mode debug
+
+        Args:
+            enabled (bool) : True pour le mode release
+        """
+        if not isinstance(enabled, bool):
+            self._raise_error("set_release", "enabled must be a bool")
+        if enabled:
+            self._release.enable(self._release_classes())
+        else:
+            self._release.disable()
+        context.release = enabled
+
+    def _release_classes(self) -> list[type]:
+        """Renvoie les classes des managers et les classes qu'ils exposent"""
+        classes = []
+        for manager_name in managers.__all__:
+            if manager_name.endswith("_manager"):
+                manager_instance = getattr(managers, manager_name)
+                classes.append(type(manager_instance))
+                classes.extend(attr for attr in vars(manager_instance).values() if isinstance(attr, type))
+        return classes
+
     # ======================================== BOUCLE PRINCIPALE ========================================
     def run(self, update: callable, final: callable = None):
         """
@@ -84,6 +124,7 @@ class Engine:
                     self.states.update()
                     self.panels.update()
                     self.entities.update()
+                    self.physics.update()
                     self.ui.update()
 
                     # Affichage
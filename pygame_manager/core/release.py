@@ -0,0 +1,160 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+import ast
+import inspect
+import os
+import re
+import textwrap
+
+# ======================================== CONSTANTES ========================================
+ENV_VAR = "PYGAME_MANAGER_RELEASE"
+ENV_TRUE = ("1", "true", "yes", "on")
+CHECK_MESSAGE = re.compile(r"^Invalid .*argument", re.IGNORECASE)     # messages des validations d'arguments retirées
+
+# ======================================== MODE RELEASE ========================================
+class Release:
+    """
+    Mode release : retire les vérifications d'arguments des chemins chauds
+
+    Fonctionnalités:
+        réécriture des méthodes publiques sans leurs validations d'arguments (if ...: _raise_error(..., 'Invalid ... argument'))
+        conservation des autres erreurs (préconditions métier, états invalides)
+        chemins rapides dédiés déclarés par les classes (attribut _RELEASE)
+        restauration des méthodes strictes (mode debug)
+    """
+    def __init__(self):
+        self._enabled = False
+        self._originals = {}        # {(cls, name): attribut strict d'origine}
+        self._missing = []          # méthodes dont la source est indisponible
+
+    # ======================================== GETTERS ========================================
+    @property
+    def enabled(self) -> bool:
+        """Vérifie que le mode release est actif"""
+        return self._enabled
+
+    @staticmethod
+    def from_env() -> bool:
+        """Vérifie que le mode release est demandé par la variable d'environnement"""
+        return os.environ.get(ENV_VAR, "").strip().lower() in ENV_TRUE
+
+    # ======================================== BASCULE ========================================
+    def enable(self, classes: list[type]):
+        """
+        Remplace les méthodes strictes par leurs versions sans validation
+
+        Args:
+            classes (list[type]) : classes à traiter (les classes parentes du package sont incluses)
+        """
+        if self._enabled:
+            return
+        for cls in self._collect(classes):
+            fast_paths = cls.__dict__.get('_RELEASE', {})
+            for name, attr in list(vars(cls).items()):
+                if name in fast_paths:
+                    fast = self._fast_path(attr, cls.__dict__[fast_paths[name]])
+                elif name.startswith('_') and not (name.startswith('__') and name.endswith('__')):
+                    continue
+                else:
+                    fast = self._release_attr(attr)
+                if fast is not None:
+                    self._originals[(cls, name)] = attr
+                    setattr(cls, name, fast)
+        if self._missing:
+            print(f"[Release] Source unavailable, validations kept for {len(self._missing)} methods: {', '.join(self._missing)}")
+            self._missing.clear()
+        self._enabled = True
+
+    def disable(self):
+        """Restaure les méthodes strictes"""
+        for (cls, name), attr in self._originals.items():
+            setattr(cls, name, attr)
+        self._originals.clear()
+        self._enabled = False
+
+    # ======================================== REECRITURE ========================================
+    @staticmethod
+    def _collect(classes: list[type]) -> list[type]:
+        """Renvoie les classes du package et leurs parents du package, sans doublon"""
+        package = __name__.split('.')[0]
+        found = {}
+        for cls in classes:
+            for parent in cls.__mro__:
+                if parent.__module__.split('.')[0] == package:
+                    found.setdefault(parent, None)
+        return list(found)
+
+    @staticmethod
+    def _fast_path(attr: object, fast: object) -> object:
+        """Adapte un chemin rapide dédié à la forme de l'attribut remplacé"""
+        if isinstance(attr, property):
+            return property(attr.fget, fast, attr.fdel, attr.__doc__)
+        return fast
+
+    def _release_attr(self, attr: object) -> object | None:
+        """Renvoie la version sans validation d'un attribut de classe (None si inchangé)"""
+        if isinstance(attr, property):
+            fset = self._strip(attr.fset) if attr.fset is not None else None
+            return property(attr.fget, fset, attr.fdel, attr.__doc__) if fset is not None else None
+        if isinstance(attr, (staticmethod, classmethod)):
+            func = self._strip(attr.__func__)
+            return type(attr)(func) if func is not None else None
+        if inspect.isfunction(attr):
+            return self._strip(attr)
+        return None
+
+    def _strip(self, func: callable) -> callable | None:
+        """Recompile une fonction sans ses instructions de validation (None si aucune ou source indisponible)"""
+        if func.__code__.co_freevars:       # super(), fermetures
+            return None
+        try:
+            lines, start = inspect.getsourcelines(func)
+            tree = ast.parse(textwrap.dedent(''.join(lines)))
+        except (OSError, TypeError, SyntaxError):
+            self._missing.append(func.__qualname__)
+            return None
+        node = tree.body[0]
+        if not isinstance(node, ast.FunctionDef):
+            return None
+        body = [stmt for stmt in node.body if not self._is_check(stmt)]
+        if len(body) == len(node.body):
+            return None
+        node.body = body or [ast.Pass()]
+
+        # définition nue : ni décorateurs, ni annotations, valeurs par défaut reprises de l'original
+        node.decorator_list = []
+        node.returns = None
+        arguments = node.args
+        for arg in arguments.posonlyargs + arguments.args + arguments.kwonlyargs + [arguments.vararg, arguments.kwarg]:
+            if arg is not None:
+                arg.annotation = None
+        arguments.defaults = [ast.Constant(None) for _ in arguments.defaults]
+        arguments.kw_defaults = [None if d is None else ast.Constant(None) for d in arguments.kw_defaults]
+
+        ast.increment_lineno(tree, start - 1)
+        namespace = {}
+        try:
+            exec(compile(tree, inspect.getsourcefile(func) or '<release>', 'exec'), func.__globals__, namespace)
+        except Exception:
+            return None
+        fast = namespace[node.name]
+        fast.__defaults__ = func.__defaults__
+        fast.__kwdefaults__ = func.__kwdefaults__
+        fast.__qualname__ = func.__qualname__
+        fast.__doc__ = func.__doc__
+        return fast
+
+    def _is_check(self, stmt: ast.stmt) -> bool:
+        """Vérifie qu'une instruction est une pure validation d'arguments (if ...: _raise_error(..., 'Invalid ... argument'), elif compris)"""
+        if not isinstance(stmt, ast.If):
+            return False
+        raises = all(self._is_argument_error(s) for s in stmt.body)
+        return raises and all(self._is_check(s) for s in stmt.orelse)
+
+    @staticmethod
+    def _is_argument_error(stmt: ast.stmt) -> bool:
+        """Vérifie qu'une instruction lève une erreur d'argument (message littéral 'Invalid ... argument')"""
+        if not (isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call) and isinstance(stmt.value.func, ast.Name) and stmt.value.func.id == '_raise_error'):
+            return False
+        message = stmt.value.args[-1] if stmt.value.args else None
+        return isinstance(message, ast.Constant) and isinstance(message.value, str) and CHECK_MESSAGE.match(message.value) is not None
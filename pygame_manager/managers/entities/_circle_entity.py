@@ -77,6 +77,7 @@ class CircleEntity(Entity):
             value (tuple[float, float]): Nouvelles coordonnées (x, y)
         """
         self._circle.center = value
+        self._moved()
     
     @property
     def centerx(self) -> float:
@@ -92,6 +93,7 @@ class CircleEntity(Entity):
             value (float): Nouvelle coordonnée x
         """
         self._circle.centerx = value
+        self._moved()
     
     @property
     def centery(self) -> float:
@@ -107,6 +109,7 @@ class CircleEntity(Entity):
             value (float): Nouvelle coordonnée y
         """
         self._circle.centery = value
+        self._moved()
     
     @property
     def radius(self) -> float:
@@ -122,6 +125,7 @@ class CircleEntity(Entity):
             value (float): Nouveau rayon
         """
         self._circle.radius = value
+        self._moved()
     
     @property
     def diameter(self) -> float:
@@ -137,6 +141,7 @@ class CircleEntity(Entity):
             value (float): Nouveau diamètre
         """
         self._circle.diameter = value
+        self._moved()
     
     @property
     def x(self) -> float:
@@ -152,6 +157,7 @@ class CircleEntity(Entity):
             value (float): Nouvelle coordonnée x
         """
         self._circle.centerx = value
+        self._moved()
     
     @property
     def y(self) -> float:
@@ -167,6 +173,7 @@ class CircleEntity(Entity):
             value (float): Nouvelle coordonnée y
         """
         self._circle.centery = value
+        self._moved()
     
     @property
     def top(self):
@@ -182,6 +189,7 @@ class CircleEntity(Entity):
             value (float): Nouvelle coordonnée y
         """
         self._circle.centery = value + self._circle.radius
+        self._moved()
     
     @property
     def right(self):
@@ -197,6 +205,7 @@ class CircleEntity(Entity):
             value (float): Nouvelle coordonnée x
         """
         self._circle.centerx = value - self._circle.radius
+        self._moved()
     
     @property
     def bottom(self):
@@ -212,6 +221,7 @@ class CircleEntity(Entity):
             value (float): Nouvelle coordonnée y
         """
         self._circle.centery = value - self._circle.radius
+        self._moved()
     
     @property
     def left(self):
@@ -227,6 +237,7 @@ class CircleEntity(Entity):
             value (float): Nouvelle coordonnée x
         """
         self._circle.centerx = value + self._circle.radius
+        self._moved()
 
     # ======================================== PARAMETRES D'AFFICHAGE ========================================
     @property
@@ -351,6 +362,7 @@ class CircleEntity(Entity):
         self._circle.centery -= dy
         if min is not None and self._circle.centery < min:
             self._circle.centery = min
+        self._moved()
     
     def move_down(self, dy: float = 1, max: float = None):
         """
@@ -363,6 +375,7 @@ class CircleEntity(Entity):
         self._circle.centery += dy
         if max is not None and self._circle.centery > max:
             self._circle.centery = max
+        self._moved()
     
     def move_left(self, dx: float = 1, min: float = None):
         """
@@ -375,6 +388,7 @@ class CircleEntity(Entity):
         self._circle.centerx -= dx
         if min is not None and self._circle.centerx < min:
             self._circle.centerx = min
+        self._moved()
     
     def move_right(self, dx: float = 1, max: float = None):
         """
@@ -387,6 +401,7 @@ class CircleEntity(Entity):
         self._circle.centerx += dx
         if max is not None and self._circle.centerx > max:
             self._circle.centerx = max
+        self._moved()
     
     def move_up_left(self, n: float = 1, xmin: float = None, ymin: float = None):
         """
@@ -404,6 +419,7 @@ class CircleEntity(Entity):
             self._circle.centerx = xmin
         if ymin is not None and self._circle.centery < ymin:
             self._circle.centery = ymin
+        self._moved()
     
     def move_up_right(self, n: float = 1, xmax: float = None, ymin: float = None):
         """
@@ -421,6 +437,7 @@ class CircleEntity(Entity):
             self._circle.centerx = xmax
         if ymin is not None and self._circle.centery < ymin:
             self._circle.centery = ymin
+        self._moved()
     
     def move_down_left(self, n: float = 1, xmin: float = None, ymax: float = None):
         """
@@ -438,6 +455,7 @@ class CircleEntity(Entity):
             self._circle.centerx = xmin
         if ymax is not None and self._circle.centery > ymax:
             self._circle.centery = ymax
+        self._moved()
     
     def move_down_right(self, n: float = 1, xmax: float = None, ymax: float = None):
         """
@@ -455,6 +473,7 @@ class CircleEntity(Entity):
             self._circle.centerx = xmax
         if ymax is not None and self._circle.centery > ymax:
             self._circle.centery = ymax
+        self._moved()
     
     # ======================================== COLLISIONS ========================================
     def collidepoint(self, point: tuple[float, float]) -> bool:
@@ -529,6 +548,20 @@ class CircleEntity(Entity):
         """
         return polygon._collidecircle(self._circle)
     
+    def move_and_collide(self, dx: float, dy: float, candidates: Iterable[object] = ()) -> tuple | None:
+        """
+        Déplace le cercle de (dx, dy) en s'arrêtant au premier contact (collision continue, sans sous-pas)
+        
+        Args:
+            dx (float): Déplacement horizontal
+            dy (float): Déplacement vertical
+            candidates (Iterable): Entités ou formes géométriques obstacles
+            
+        Returns:
+            tuple | None: None si le déplacement est complet, sinon (obstacle, t, point de contact, normale)
+        """
+        return context.entities._move_and_collide(self, self._circle, dx, dy, candidates)
+    
     # ======================================== METHODES DYNAMIQUES ========================================
     def reset(self):
         """Remet l'entité à son état initial"""
@@ -548,8 +581,7 @@ class CircleEntity(Entity):
         Args:
             surface (pygame.Surface): Surface de dessin
         """
-        center_pos = (int(self._circle.centerx), int(self._circle.centery))
-        radius = int(self._circle.radius)
+        center_pos, radius = self._circle._draw_args()
         
         if self._filling:
             pygame.draw.circle(surface, self._color, center_pos, radius)
@@ -2,6 +2,7 @@ from .imports import *
 from .utils import *
 __all__ = [
     "pygame",
+    "math",
     "Real",
     "Iterable",
     "Optional",
@@ -1,5 +1,6 @@
 # ======================================== LIBS ========================================
 import pygame
+import math
 
 # ======================================== TYPAGE ========================================
 from numbers import (
@@ -16,6 +17,7 @@ from .... import context
 # ======================================== EXPORTS ========================================
 __all__ = [
     "pygame",
+    "math",
     "Real",
     "Iterable",
     "Optional",
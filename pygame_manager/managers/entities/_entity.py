@@ -111,6 +111,13 @@ class Entity:
         context.entities.discard(self)
         self.on_discard()
 
+    # ======================================== PHYSIQUE ========================================
+    def _moved(self):
+        """Reporte un changement de position ou de taille dans le corps physique de l'entité (s'il existe)"""
+        body = context.physics.get(self)
+        if body is not None:
+            context.physics._follow(body)
+
     # ======================================== ACTUALISATION ========================================
     def update(self, *args, **kwargs):
         """Appelé à chaque frame (à override)"""
@@ -53,6 +53,9 @@ class PolygonEntity(Entity):
         self._border_color = (0, 0, 0)
         self._border_width = 1
         self._border_around = False
+
+        # Rendu mis en cache (clé, surface, marge)
+        self._raster = None
     
     # ======================================== PROXY GEOMETRIQUE ========================================
     @property
@@ -117,6 +120,7 @@ class PolygonEntity(Entity):
         cx, cy = self._polygon.center
         dx = value - cx
         self._polygon.translate(dx, 0)
+        self._moved()
     
     @property
     def y(self) -> float:
@@ -134,6 +138,7 @@ class PolygonEntity(Entity):
         cx, cy = self._polygon.center
         dy = value - cy
         self._polygon.translate(0, dy)
+        self._moved()
     
     @property
     def centerx(self) -> float:
@@ -151,6 +156,7 @@ class PolygonEntity(Entity):
         cx, cy = self._polygon.center
         dx = value - cx
         self._polygon.translate(dx, 0)
+        self._moved()
     
     @property
     def centery(self) -> float:
@@ -168,6 +174,7 @@ class PolygonEntity(Entity):
         cx, cy = self._polygon.center
         dy = value - cy
         self._polygon.translate(0, dy)
+        self._moved()
     
     # ======================================== PARAMETRES D'AFFICHAGE ========================================
     @property
@@ -292,6 +299,7 @@ class PolygonEntity(Entity):
         self._polygon.translate(0, -dy)
         if min is not None and self._polygon.center[1] < min:
             self._polygon.translate(0, min - self._polygon.center[1])
+        self._moved()
     
     def move_down(self, dy: float = 1, max: float = None):
         """
@@ -304,6 +312,7 @@ class PolygonEntity(Entity):
         self._polygon.translate(0, dy)
         if max is not None and self._polygon.center[1] > max:
             self._polygon.translate(0, max - self._polygon.center[1])
+        self._moved()
     
     def move_left(self, dx: float = 1, min: float = None):
         """
@@ -316,6 +325,7 @@ class PolygonEntity(Entity):
         self._polygon.translate(-dx, 0)
         if min is not None and self._polygon.center[0] < min:
             self._polygon.translate(min - self._polygon.center[0], 0)
+        self._moved()
     
     def move_right(self, dx: float = 1, max: float = None):
         """
@@ -328,6 +338,7 @@ class PolygonEntity(Entity):
         self._polygon.translate(dx, 0)
         if max is not None and self._polygon.center[0] > max:
             self._polygon.translate(max - self._polygon.center[0], 0)
+        self._moved()
     
     def move_up_left(self, n: float = 1, xmin: float = None, ymin: float = None):
         """
@@ -344,6 +355,7 @@ class PolygonEntity(Entity):
             self._polygon.translate(xmin - self._polygon.center[0], 0)
         if ymin is not None and self._polygon.center[1] < ymin:
             self._polygon.translate(0, ymin - self._polygon.center[1])
+        self._moved()
     
     def move_up_right(self, n: float = 1, xmax: float = None, ymin: float = None):
         """
@@ -360,6 +372,7 @@ class PolygonEntity(Entity):
             self._polygon.translate(xmax - self._polygon.center[0], 0)
         if ymin is not None and self._polygon.center[1] < ymin:
             self._polygon.translate(0, ymin - self._polygon.center[1])
+        self._moved()
     
     def move_down_left(self, n: float = 1, xmin: float = None, ymax: float = None):
         """
@@ -376,6 +389,7 @@ class PolygonEntity(Entity):
             self._polygon.translate(xmin - self._polygon.center[0], 0)
         if ymax is not None and self._polygon.center[1] > ymax:
             self._polygon.translate(0, ymax - self._polygon.center[1])
+        self._moved()
     
     def move_down_right(self, n: float = 1, xmax: float = None, ymax: float = None):
         """
@@ -392,6 +406,7 @@ class PolygonEntity(Entity):
             self._polygon.translate(xmax - self._polygon.center[0], 0)
         if ymax is not None and self._polygon.center[1] > ymax:
             self._polygon.translate(0, ymax - self._polygon.center[1])
+        self._moved()
     
     # ======================================== ALTERATION ========================================
     def rotate(self, angle: float, center: tuple[float, float] = None, degrees: bool = False):
@@ -404,6 +419,7 @@ class PolygonEntity(Entity):
             degrees (bool): True si angle en degrés, False si radians (défaut: False)
         """
         self._polygon.rotate(angle, center, degrees)
+        self._moved()
     
     def scale(self, ratio: float, center: tuple[float, float] = None):
         """
@@ -414,6 +430,7 @@ class PolygonEntity(Entity):
             center (tuple[float, float]): Centre de redimensionnement (défaut: centroïde)
         """
         self._polygon.scale(ratio, center)
+        self._moved()
     
     # ======================================== COLLISIONS ========================================
     def collidepoint(self, point: tuple[float, float]) -> bool:
@@ -492,6 +509,7 @@ class PolygonEntity(Entity):
     def reset(self):
         """Remet l'entité à son état initial"""
         self._polygon = context.geometry.Polygon(*self._points_init)
+        self._moved()
     
     # ======================================== ACTUALISATION ========================================
     def update(self, *args, **kwargs):
@@ -506,8 +524,51 @@ class PolygonEntity(Entity):
         Args:
             surface (pygame.Surface): Surface de dessin
         """
-        points = [(int(x), int(y)) for x, y in self._polygon.vertices]
-        
+        points = self._polygon._draw_points()
+        ox, oy = min(x for x, _ in points), min(y for _, y in points)
+
+        # le rendu n'est mis en cache que si la forme (au pixel près) et le style sont inchangés depuis la frame précédente
+        # (les couleurs semi-transparentes sont écrites telles quelles dans la cible : pas de cache, qui les mélangerait)
+        key = (tuple((x - ox, y - oy) for x, y in points), self._filling, tuple(self._color), self._border, tuple(self._border_color), self._border_width, self._border_around)
+        if self._raster is None or self._raster[0] != key or not self._opaque():
+            self._raster = (key, None, 0)
+            self._render(surface, points)
+            return
+        if self._raster[1] is None:
+            self._raster = (key, *self._rasterize(key[0]))
+        _, raster, pad = self._raster
+        surface.blit(raster, (ox - pad, oy - pad))
+
+    def _opaque(self) -> bool:
+        """Vérifie que les couleurs utilisées sont opaques"""
+        colors = ([self._color] if self._filling else []) + ([self._border_color] if self._border else [])
+        return all(len(color) < 4 or color[3] == 255 for color in colors)
+
+    def _rasterize(self, points: tuple[tuple[int, int]]) -> tuple[pygame.Surface, int]:
+        """
+        Dessine le polygone sur une surface transparente dédiée
+
+        Args:
+            points (tuple[tuple[int, int]]): Sommets entiers relatifs au coin haut gauche
+
+        Returns:
+            tuple[pygame.Surface, int]: Surface et marge laissée autour des sommets pour la bordure
+        """
+        pad = self._border_width * 2 + 1 if self._border else 1
+        width = max(x for x, _ in points) + 2 * pad + 1
+        height = max(y for _, y in points) + 2 * pad + 1
+        raster = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._render(raster, [(x + pad, y + pad) for x, y in points])
+        return raster, pad
+
+    def _render(self, surface: pygame.Surface, points: list[tuple[int, int]]):
+        """
+        Dessine le polygone directement sur une surface
+
+        Args:
+            surface (pygame.Surface): Surface de dessin
+            points (list[tuple[int, int]]): Sommets entiers
+        """
         if self._filling:
             pygame.draw.polygon(surface, self._color, points)
         
@@ -92,6 +92,7 @@ class RectEntity(Entity):
     def x(self, value: float):
         """Fixe la coordonnée x du coin haut gauche"""
         self._rect.x = value
+        self._moved()
     
     @property
     def y(self) -> float:
@@ -102,6 +103,7 @@ class RectEntity(Entity):
     def y(self, value: float):
         """Fixe la coordonnée y du coin haut gauche"""
         self._rect.y = value
+        self._moved()
     
     @property
     def width(self) -> float:
@@ -112,6 +114,7 @@ class RectEntity(Entity):
     def width(self, value: float):
         """Fixe la largeur"""
         self._rect.width = value
+        self._moved()
     
     @property
     def height(self) -> float:
@@ -122,6 +125,7 @@ class RectEntity(Entity):
     def height(self, value: float):
         """Fixe la hauteur"""
         self._rect.height = value
+        self._moved()
     
     @property
     def topleft(self) -> tuple[float, float]:
@@ -132,6 +136,7 @@ class RectEntity(Entity):
     def topleft(self, value: tuple[float, float]):
         """Fixe les coordonnées du coin haut gauche"""
         self._rect.topleft = value
+        self._moved()
     
     @property
     def top(self) -> float:
@@ -142,6 +147,7 @@ class RectEntity(Entity):
     def top(self, value: float):
         """Fixe la coordonnée y du haut"""
         self._rect.top = value
+        self._moved()
     
     @property
     def topright(self) -> tuple[float, float]:
@@ -152,6 +158,7 @@ class RectEntity(Entity):
     def topright(self, value: tuple[float, float]):
         """Fixe les coordonnées du coin haut droit"""
         self._rect.topright = value
+        self._moved()
     
     @property
     def right(self) -> float:
@@ -162,6 +169,7 @@ class RectEntity(Entity):
     def right(self, value: float):
         """Fixe la coordonnée x de la droite"""
         self._rect.right = value
+        self._moved()
     
     @property
     def bottomright(self) -> tuple[float, float]:
@@ -172,6 +180,7 @@ class RectEntity(Entity):
     def bottomright(self, value: tuple[float, float]):
         """Fixe les coordonnées du coin bas droit"""
         self._rect.bottomright = value
+        self._moved()
     
     @property
     def bottom(self) -> float:
@@ -182,6 +191,7 @@ class RectEntity(Entity):
     def bottom(self, value: float):
         """Fixe la coordonnée y du bas"""
         self._rect.bottom = value
+        self._moved()
     
     @property
     def bottomleft(self) -> tuple[float, float]:
@@ -192,6 +202,7 @@ class RectEntity(Entity):
     def bottomleft(self, value: tuple[float, float]):
         """Fixe les coordonnées du coin bas gauche"""
         self._rect.bottomleft = value
+        self._moved()
     
     @property
     def left(self) -> float:
@@ -202,6 +213,7 @@ class RectEntity(Entity):
     def left(self, value: float):
         """Fixe la coordonnée x de la gauche"""
         self._rect.left = value
+        self._moved()
     
     @property
     def center(self) -> tuple[float, float]:
@@ -212,6 +224,7 @@ class RectEntity(Entity):
     def center(self, value: tuple[float, float]):
         """Fixe les coordonnées du centre"""
         self._rect.center = value
+        self._moved()
     
     @property
     def centerx(self) -> float:
@@ -222,6 +235,7 @@ class RectEntity(Entity):
     def centerx(self, value: float):
         """Fixe la coordonnée x du centre"""
         self._rect.centerx = value
+        self._moved()
     
     @property
     def centery(self) -> float:
@@ -232,6 +246,7 @@ class RectEntity(Entity):
     def centery(self, value: float):
         """Fixe la coordonnée y du centre"""
         self._rect.centery = value
+        self._moved()
     
     # ======================================== PARAMETRES D'AFFICHAGE ========================================
     @property
@@ -358,24 +373,28 @@ class RectEntity(Entity):
         self._rect.y -= dy
         if min is not None and self._rect.y < min:
             self._rect.y = min
+        self._moved()
     
     def move_down(self, dy: float = 1, max: float = None):
         """Déplace le rectangle vers le bas"""
         self._rect.y += dy
         if max is not None and self._rect.y > max:
             self._rect.y = max
+        self._moved()
     
     def move_left(self, dx: float = 1, min: float = None):
         """Déplace le rectangle vers la gauche"""
         self._rect.x -= dx
         if min is not None and self._rect.x < min:
             self._rect.x = min
+        self._moved()
     
     def move_right(self, dx: float = 1, max: float = None):
         """Déplace le rectangle vers la droite"""
         self._rect.x += dx
         if max is not None and self._rect.x > max:
             self._rect.x = max
+        self._moved()
     
     def move_up_left(self, n: float = 1, xmin: float = None, ymin: float = None):
         """Déplace le rectangle en diagonale haut-gauche"""
@@ -386,6 +405,7 @@ class RectEntity(Entity):
             self._rect.x = xmin
         if ymin is not None and self._rect.y < ymin:
             self._rect.y = ymin
+        self._moved()
     
     def move_up_right(self, n: float = 1, xmax: float = None, ymin: float = None):
         """Déplace le rectangle en diagonale haut-droite"""
@@ -396,6 +416,7 @@ class RectEntity(Entity):
             self._rect.x = xmax
         if ymin is not None and self._rect.y < ymin:
             self._rect.y = ymin
+        self._moved()
     
     def move_down_left(self, n: float = 1, xmin: float = None, ymax: float = None):
         """Déplace le rectangle en diagonale bas-gauche"""
@@ -406,6 +427,7 @@ class RectEntity(Entity):
             self._rect.x = xmin
         if ymax is not None and self._rect.y > ymax:
             self._rect.y = ymax
+        self._moved()
     
     def move_down_right(self, n: float = 1, xmax: float = None, ymax: float = None):
         """Déplace le rectangle en diagonale bas-droite"""
@@ -416,6 +438,7 @@ class RectEntity(Entity):
             self._rect.x = xmax
         if ymax is not None and self._rect.y > ymax:
             self._rect.y = ymax
+        self._moved()
     
     # ======================================== COLLISIONS ========================================
     def collidepoint(self, point: tuple[float, float]) -> bool:
@@ -442,6 +465,20 @@ class RectEntity(Entity):
         """Vérifie la collision avec un polygone"""
         return polygon._colliderect(self._rect)
 
+    def move_and_collide(self, dx: float, dy: float, candidates: Iterable[object] = ()) -> tuple | None:
+        """
+        Déplace le rectangle de (dx, dy) en s'arrêtant au premier contact (collision continue, sans sous-pas)
+
+        Args:
+            dx (float): Déplacement horizontal
+            dy (float): Déplacement vertical
+            candidates (Iterable): Entités ou formes géométriques obstacles (rects et cercles)
+
+        Returns:
+            tuple | None: None si le déplacement est complet, sinon (obstacle, t, point de contact, normale)
+        """
+        return context.entities._move_and_collide(self, self._rect, dx, dy, candidates)
+
     # ======================================== METHODES DYNAMIQUES ========================================
     def reset(self):
         """Remet l'entité à son état initial"""
@@ -16,7 +16,11 @@ class EntitiesManager:
 
     Fonctionnalités:
         gestion du zorder
+        lancer de rayons par lots sur les entités actives
+        déplacements continus jusqu'au premier contact
     """
+    SKIN = 1e-3     # marge laissée au contact (évite le chevauchement à la frame suivante)
+
     def __init__(self):
         self._all = defaultdict(list)          # {"panel": [Entity1, Entity2], ...}
         self._filtered = []
@@ -91,7 +95,7 @@ class EntitiesManager:
 
     def discard(self, entity: Entity):
         """
-        Supprime une entité
+        Supprime une entité (et son corps physique)
 
         Args:
             entity (Entity) : objet de l'entité
@@ -101,6 +105,9 @@ class EntitiesManager:
         if panel in self._all and entity in self._all[panel]:
             self._all[panel].remove(entity)
             if not self._all[panel]: del self._all[panel]
+        body = context.physics.get(entity)
+        if body is not None:
+            context.physics.remove(body)
 
     # ======================================== Z-ORDER ========================================
     def reorder(self, entity: Entity, direction: str, index: int = None, panel: str | None = None):
@@ -154,6 +161,66 @@ class EntitiesManager:
         """Supprime toutes les entités"""
         self._all.clear()
 
+    # ======================================== RAYCASTING ========================================
+    def raycast(self, origins: object, directions: object, max_dist: Real = float('inf'), panel: str | None = None, entities: Iterable[Entity] = None) -> tuple[list[Entity | None], object, object, object]:
+        """
+        Lance un lot de rayons contre les entités et renvoie le premier impact de chacun
+
+        Args:
+            origins (PointArray | Point | np.ndarray) : origines (n, 2) ou origine commune
+            directions (VectorArray | Vector | np.ndarray) : directions (n, 2) non nulles ou direction commune
+            max_dist (Real | np.ndarray) : portée commune ou une portée par rayon
+            panel (str, optional) : limitation aux entités d'un panel (défaut: panels actifs)
+            entities (Iterable[Entity], optional) : entités visées (remplace panel)
+
+        Returns:
+            hits (list[Entity | None]) : entité touchée par chaque rayon
+            distances, points, normals : voir context.geometry.raycast
+        """
+        if entities is None:
+            panels = [panel] if panel else (self._filtered if self._filtered else self._all.keys())
+            entities = [e for p in panels for e in self._all.get(p, [])]
+        targets, owners = [], []
+        for entity in entities:
+            shape = self._shape_of(entity)
+            if shape is not None:
+                targets.append(shape)
+                owners.append(entity)
+        indices, distances, points, normals = context.geometry.raycast(origins, directions, max_dist, targets)
+        return [owners[i] if i >= 0 else None for i in indices.tolist()], distances, points, normals
+
+    @staticmethod
+    def _shape_of(entity: Entity) -> object | None:
+        """Renvoie la forme géométrique d'une entité (None si non supportée)"""
+        for name in ('_polygon', '_circle', '_rect', '_segment'):
+            shape = getattr(entity, name, None)
+            if shape is not None:
+                return shape
+        return None
+
+    # ======================================== COLLISIONS CONTINUES ========================================
+    def _move_and_collide(self, entity: Entity, shape: object, dx: float, dy: float, candidates: Iterable[object]) -> tuple | None:
+        """Implémentation commune de move_and_collide : déplace la forme jusqu'au premier contact"""
+        if not isinstance(dx, Real) or not isinstance(dy, Real):
+            _raise_error(entity, 'move_and_collide', 'Invalid displacement arguments')
+        best, obstacle = None, None
+        for candidate in candidates:
+            if candidate is entity:
+                continue
+            target = self._shape_of(candidate) if isinstance(candidate, Entity) else candidate
+            if target is None:
+                continue
+            hit = context.geometry.sweep(shape, (dx, dy), target)
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best, obstacle = hit, candidate
+
+        # arrêt juste avant le contact
+        t = 1.0 if best is None else max(0.0, best[0] - self.SKIN / max(math.hypot(dx, dy), self.SKIN))
+        if t > 0:
+            shape.translate(context.geometry.Vector(dx * t, dy * t))
+            entity._moved()
+        return None if best is None else (obstacle, *best)
+
     # ======================================== ACTUALISATION ========================================
     def update_filter(self):
         """Actualise les entités filtrées"""
@@ -1,2 +1,2 @@
-from .geometry import GeometryManager, geometry_manager, VectorObject, PointObject, SegmentObject, LineObject, CircleObject, RectObject, PolygonObject
-__all__ = ["GeometryManager", "geometry_manager", "VectorObject", "PointObject", "SegmentObject", "LineObject", "CircleObject", "RectObject", "PolygonObject"]
\ No newline at end of file
+from .geometry import GeometryManager, geometry_manager, VectorObject, PointObject, SegmentObject, LineObject, CircleObject, RectObject, PolygonObject, PointArrayObject, VectorArrayObject, SegmentArrayObject
+__all__ = ["GeometryManager", "geometry_manager", "VectorObject", "PointObject", "SegmentObject", "LineObject", "CircleObject", "RectObject", "PolygonObject", "PointArrayObject", "VectorArrayObject", "SegmentArrayObject"]
\ No newline at end of file
@@ -7,7 +7,7 @@ class CircleObject:
     """
     Object géométrique 2D : Cercle
     """
-    __slots__ = ["_center", "_radius"]
+    __slots__ = ["_center", "_radius", "_cache"]
     PRECISION = 9
     def __init__(self, center: context.geometry.Point, radius: Real):
         """
@@ -22,6 +22,9 @@ class CircleObject:
         # rayon
         if not isinstance(radius, Real) or radius <= 0:  _raise_error(self, '__init__', 'Invalid radius argument')
         self._radius = float(radius)
+
+        # données dérivées
+        self._cache = {}
     
     def __repr__(self) -> str:
         """Représentation du cercle"""
@@ -71,6 +74,11 @@ class CircleObject:
     def area(self) -> float:
         """Renvoie l'aire"""
         return math.pi * self._radius**2
+
+    @property
+    def aabb(self) -> tuple[float, float, float, float]:
+        """Renvoie la boîte englobante alignée (left, top, right, bottom)"""
+        return self._aabb()
     
     # ======================================== SETTERS ========================================
     @center.setter
@@ -78,16 +86,19 @@ class CircleObject:
         """Fixe le point central"""
         self._center = context.geometry._to_point(point, copy=True)
         self._center.reshape(2)
+        self._invalidate()
 
     @centerx.setter
     def centerx(self, coordinate: Real):
         """Fixe la coordonnée x du point central"""
         self._center.x = coordinate
+        self._invalidate()
 
     @centery.setter
     def centery(self, coordinate: Real):
         """Fixe la coordonnée y du point central"""
         self._center.y = coordinate
+        self._invalidate()
 
     @radius.setter
     def radius(self, radius: Real):
@@ -95,6 +106,7 @@ class CircleObject:
         if not isinstance(radius, Real) or radius <= 0:
             _raise_error(self, 'set_radius', 'Invalid Radius Argument')
         self._radius = round(float(radius), self.PRECISION)
+        self._invalidate()
     
     @diameter.setter
     def diameter(self, diameter: Real):
@@ -102,6 +114,7 @@ class CircleObject:
         if not isinstance(diameter, Real) or diameter <= 0:
             _raise_error(self, 'set_diameter', 'Invalid diameter argument')
         self._radius = round(float(diameter) / 2, self.PRECISION)
+        self._invalidate()
     
     @perimeter.setter
     def perimeter(self, perimeter: Real):
@@ -109,6 +122,7 @@ class CircleObject:
         if not isinstance(perimeter, Real) or perimeter <= 0:
             _raise_error(self, 'set_perimeter', 'Invalid perimeter argument')
         self._radius = round(float(perimeter) / (2 * math.pi), self.PRECISION)
+        self._invalidate()
 
     @area.setter
     def area(self, area: Real):
@@ -116,6 +130,7 @@ class CircleObject:
         if not isinstance(area, Real) or area <= 0:
             _raise_error(self, 'set_area', 'Invalid area argument')
         self._radius = round(math.sqrt(float(area) / math.pi), self.PRECISION)
+        self._invalidate()
 
     # ======================================== PREDICATS ========================================
     def collidepoint(self, point: context.geometry.Point) -> bool:
@@ -203,7 +218,10 @@ class CircleObject:
     
     def to_tuple(self) -> tuple[float]:
         """Renvoie les propriétés dans un tuple"""
-        return (self.center.to_tuple(), self.radius)
+        values = self._cache.get('tuple')
+        if values is None:
+            values = self._cache['tuple'] = (self._center.to_tuple(), self._radius)
+        return values
     
     def to_list(self) -> tuple[float]:
         """Renvoie les propriétés dans une liste"""
@@ -235,9 +253,13 @@ class CircleObject:
         self._translate(vector)
 
     def _translate(self, vector: context.geometry.Vector):
-        """Implémentation interne de translate"""
-        self.centerx += vector.x
-        self.centery += vector.y
+        """Implémentation interne de translate (mise à jour incrémentale du cache)"""
+        aabb = self._cache.get('aabb')
+        self._center = context.geometry.Point(self._center.x + vector.x, self._center.y + vector.y)
+        self._invalidate()
+        if aabb is not None:
+            dx, dy = vector.x, vector.y
+            self._cache['aabb'] = (aabb[0] + dx, aabb[1] + dy, aabb[2] + dx, aabb[3] + dy)
     
     def point_from_angle(self, angle: Real, degrees: bool = False) -> context.geometry.Point:
         """
@@ -624,3 +646,23 @@ class CircleObject:
 
         # Par défaut : vecteur horizontal selon position par rapport au centre du rectangle
         return context.geometry.Vector(1, 0) if px >= rect.centerx else context.geometry.Vector(-1, 0)
+
+    # ======================================== CACHE ========================================
+    def _invalidate(self):
+        """Vide les données dérivées mises en cache (à appeler après toute modification)"""
+        self._cache.clear()
+
+    def _aabb(self) -> tuple[float, float, float, float]:
+        """Renvoie la boîte englobante (left, top, right, bottom) (mise en cache)"""
+        aabb = self._cache.get('aabb')
+        if aabb is None:
+            cx, cy, r = self._center.x, self._center.y, self._radius
+            aabb = self._cache['aabb'] = (cx - r, cy - r, cx + r, cy + r)
+        return aabb
+
+    def _draw_args(self) -> tuple[tuple[int, int], int]:
+        """Renvoie le centre et le rayon entiers passés à pygame.draw.circle (mis en cache)"""
+        args = self._cache.get('draw')
+        if args is None:
+            args = self._cache['draw'] = ((int(self._center.x), int(self._center.y)), int(self._radius))
+        return args
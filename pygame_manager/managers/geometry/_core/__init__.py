@@ -5,6 +5,7 @@ __all__ = [
     "np",
     "math",
     "pygame",
+    "FRect",
     "Real",
     "Iterable",
     "Iterator",
@@ -13,8 +14,11 @@ __all__ = [
     "context",
 
     "Sequence",
+    "PygameRect",
     "Reshapable",
     "_raise_error",
     "_deepcopy",
     "_to_color",
+    "_to_rows",
+    "_rotation_matrix",
 ]
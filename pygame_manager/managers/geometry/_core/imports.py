@@ -3,6 +3,9 @@ import numpy as np
 import math
 import pygame
 
+# pygame.FRect n'existe que sous pygame-ce
+FRect = getattr(pygame, 'FRect', None)
+
 # ======================================== TYPAGE ========================================
 from numbers import (
     Real,
@@ -23,6 +26,7 @@ __all__ = [
     "np",
     "math",
     "pygame",
+    "FRect",
     "Real",
     "Iterable",
     "Iterator",
@@ -1,9 +1,11 @@
 # ======================================== IMPORTS ========================================
 from .imports import *
+from copy import copy as _copy
 from typing import Protocol, runtime_checkable
 
 # ======================================== FAMILLES DE TYPES ========================================
 Sequence = (tuple, list, dict, set, np.ndarray)
+PygameRect = (pygame.Rect,) if FRect is None else (pygame.Rect, FRect)
 
 @runtime_checkable
 class Reshapable(Protocol):
@@ -61,8 +63,14 @@ def _deepcopy(obj: object, memo=None) -> object:
         memo[obj_id] = copied
         return copied
 
-    # objets custom
+    # objets natifs (extensions C : pygame.mask.Mask, pygame.Surface...) : __new__ les laisserait non initialisés
     cls = obj.__class__
+    if not hasattr(obj, '__dict__') and not hasattr(cls, '__slots__'):
+        copied = obj.copy() if callable(getattr(obj, 'copy', None)) else _copy(obj)
+        memo[obj_id] = copied
+        return copied
+
+    # objets custom
     new_obj = cls.__new__(cls)
     memo[obj_id] = new_obj
 
@@ -86,11 +94,44 @@ def _to_color(color: pygame.Color | Iterable[int], fallback: object=None, raised
         return pygame.Color(color)
     return fallback if fallback is not None else _raise_error(pygame.Color, method, message) if raised else None
 
+def _to_rows(obj: object, dim: int, fallback: object=None, raised: bool=True, method: str='_to_rows', message: str='Invalid array argument') -> np.ndarray:
+    """
+    Convertit un objet géométrique (ou une collection) en array float64 de forme (dim,) ou (n, dim)
+
+    Args:
+        obj : Point, Vector, PointArray, VectorArray, array numpy ou séquence de composantes
+        dim (int) : dimension attendue (les objets plus courts sont complétés par des zéros)
+    """
+    data = getattr(obj, '_data', None)
+    if data is None:
+        if hasattr(obj, 'to_tuple') and not hasattr(obj, '__array__'):
+            obj = obj.to_tuple()
+        try:
+            data = np.asarray(obj, dtype=np.float64)
+        except (TypeError, ValueError):
+            data = None
+    if data is None or data.ndim not in (1, 2) or data.shape[-1] > dim and np.any(data[..., dim:]):
+        return fallback if fallback is not None else _raise_error(np.ndarray, method, message) if raised else None
+    if data.shape[-1] < dim:
+        pad = [(0, 0)] * (data.ndim - 1) + [(0, dim - data.shape[-1])]
+        data = np.pad(data, pad)
+    return data[..., :dim]
+
+def _rotation_matrix(angle: Real, degrees: bool=False) -> np.ndarray:
+    """Renvoie la matrice de rotation 2D (transposée, pour des lignes de points)"""
+    if degrees:
+        angle = math.radians(angle)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    return np.array([[cos_a, sin_a], [-sin_a, cos_a]], dtype=np.float64)
+
 # ======================================== EXPORTS ========================================
 __all__ = [
     "Sequence",
+    "PygameRect",
     "Reshapable",
     "_raise_error",
     "_deepcopy",
-    "_to_color"
+    "_to_color",
+    "_to_rows",
+    "_rotation_matrix",
 ]
\ No newline at end of file
@@ -9,6 +9,7 @@ class PointObject:
     """
     __slots__ = ["_pos"]
     PRECISION = 9
+    _RELEASE = {"__init__": "_init_release"}    # chemins rapides du mode release
     def __init__(self, *coos: Real):
         if len(coos) == 0:
             _raise_error(self, '__init__', 'Point must have at least 1 coordinate')
@@ -16,6 +17,18 @@ class PointObject:
             if len(coos) == 1 and isinstance(coos[0], Sequence): coos = coos[0]
             else: _raise_error(self, '__init__', 'Invalid coos arguments')
         self._pos = [round(c, self.PRECISION) for c in list(map(float, coos))]
+
+    def _init_release(self, *coos: Real):
+        """Constructeur du mode release (coordonnées supposées valides)"""
+        if len(coos) == 1 and isinstance(coos[0], Sequence): coos = coos[0]
+        self._pos = [round(float(c), self.PRECISION) for c in coos]
+
+    @classmethod
+    def _new(cls, coos: list[float]) -> PointObject:
+        """Construit un point sans vérification (coordonnées déjà arrondies)"""
+        point = object.__new__(cls)
+        point._pos = coos
+        return point
     
     def __repr__(self) -> str:
         """Représentation du point"""
@@ -0,0 +1,296 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from ._core import *
+
+# ======================================== OBJET ========================================
+class PointArrayObject:
+    """
+    Collection géométrique nD : Tableau de points
+
+    Stockage:
+        array numpy contigu float64 de forme (n, d)
+    """
+    __slots__ = ["_data"]
+    PRECISION = 9
+    CHUNK = 1 << 22     # nombre maximal de distances calculées simultanément
+
+    def __init__(self, points: Iterable[context.geometry.Point] | np.ndarray, dim: int = None):
+        """
+        Args:
+            points (Iterable[context.geometry.Point] | np.ndarray) : points ou array de forme (n, d)
+            dim (int, optional) : dimension imposée (défaut: dimension maximale des points)
+        """
+        if dim is not None and (not isinstance(dim, int) or dim <= 0):
+            _raise_error(self, '__init__', 'Invalid dim argument')
+        self._data = self._to_data(points, dim, method='__init__')
+
+    @classmethod
+    def _new(cls, data: np.ndarray) -> PointArrayObject:
+        """Construit un tableau sans vérification (data contigu float64 de forme (n, d))"""
+        array = object.__new__(cls)
+        array._data = data
+        return array
+
+    @staticmethod
+    def _to_data(points: object, dim: int = None, method: str = '_to_data') -> np.ndarray:
+        """Convertit une collection de points en array (n, d)"""
+        if isinstance(points, np.ndarray) or hasattr(points, '_data'):
+            data = np.array(getattr(points, '_data', points), dtype=np.float64)
+        else:
+            rows = [p._pos if isinstance(p, context.geometry.Point) else p for p in points]
+            if not rows: _raise_error(PointArrayObject, method, 'Point array must have at least 1 point')
+            width = max(map(len, rows))
+            if any(len(r) != width for r in rows):
+                rows = [list(r) + [0.0] * (width - len(r)) for r in rows]
+            try:
+                data = np.array(rows, dtype=np.float64)
+            except (TypeError, ValueError):
+                _raise_error(PointArrayObject, method, 'Invalid points argument')
+        if data.ndim != 2 or data.shape[1] == 0:
+            _raise_error(PointArrayObject, method, 'Points must form a (n, d) array')
+        if dim is not None:
+            data = _to_rows(data, dim, method=method, message='Points have non zero coordinates beyond dim')
+        return np.ascontiguousarray(data)
+
+    def __repr__(self) -> str:
+        """Représentation du tableau"""
+        return f"PointArray(n={self.n}, dim={self.dim})"
+
+    def __iter__(self) -> Iterator[context.geometry.Point]:
+        """Itération sur les points"""
+        return iter(self.to_points())
+
+    def __hash__(self) -> int:
+        """Renvoie le tableau hashé"""
+        return hash((self._data.shape, np.round(self._data, self.PRECISION).tobytes()))
+
+    # ======================================== GETTERS ========================================
+    def __getitem__(self, i: int | slice | np.ndarray) -> context.geometry.Point | PointArrayObject:
+        """Renvoie le point de rang i, ou un sous-tableau (slice, masque ou indices)"""
+        if isinstance(i, (int, np.integer)):
+            return context.geometry.Point._new(np.round(self._data[i], self.PRECISION).tolist())
+        return PointArrayObject._new(np.ascontiguousarray(self._data[i]))
+
+    @property
+    def array(self) -> np.ndarray:
+        """Renvoie une copie de l'array (n, d)"""
+        return self._data.copy()
+
+    @property
+    def x(self) -> np.ndarray:
+        """Renvoie les coordonnées x"""
+        return self._data[:, 0].copy()
+
+    @property
+    def y(self) -> np.ndarray:
+        """Renvoie les coordonnées y"""
+        return self._data[:, 1].copy() if self.dim > 1 else np.zeros(self.n)
+
+    @property
+    def n(self) -> int:
+        """Renvoie le nombre de points"""
+        return self._data.shape[0]
+
+    def __len__(self) -> int:
+        """Renvoie le nombre de points"""
+        return self._data.shape[0]
+
+    @property
+    def dim(self) -> int:
+        """Renvoie la dimension des points"""
+        return self._data.shape[1]
+
+    @property
+    def centroid(self) -> context.geometry.Point:
+        """Renvoie l'isobarycentre des points"""
+        return context.geometry.Point(*self._data.mean(axis=0))
+
+    # ======================================== SETTERS ========================================
+    def __setitem__(self, i: int | slice | np.ndarray, points: object):
+        """Fixe le point de rang i (ou plusieurs points)"""
+        rows = _to_rows(points, self.dim, method='__setitem__', message='Invalid points argument')
+        self._data[i] = rows
+
+    # ======================================== OPERATIONS ========================================
+    def __add__(self, vector: object) -> PointArrayObject:
+        """Renvoie l'image des points par un vecteur (ou un vecteur par point)"""
+        offsets = _to_rows(vector, self.dim, raised=False)
+        if offsets is None: return NotImplemented
+        return PointArrayObject._new(self._data + offsets)
+
+    def __radd__(self, vector: object) -> PointArrayObject:
+        """Renvoie l'image des points par un vecteur (ou un vecteur par point)"""
+        return self.__add__(vector)
+
+    def __sub__(self, obj: object) -> PointArrayObject | context.geometry.VectorArray:
+        """Renvoie les vecteurs obj -> points si obj est un (tableau de) point(s), l'image par -vecteur sinon"""
+        rows = _to_rows(obj, self.dim, raised=False)
+        if rows is None: return NotImplemented
+        if isinstance(obj, (context.geometry.Point, PointArrayObject)):
+            return context.geometry.VectorArray._new(self._data - rows)
+        return PointArrayObject._new(self._data - rows)
+
+    # ======================================== COMPARATEURS ========================================
+    def __eq__(self, points: object) -> bool:
+        """Vérifie la correspondance de deux tableaux (à PRECISION près)"""
+        if not isinstance(points, PointArrayObject) or points._data.shape != self._data.shape:
+            return False
+        return bool(np.all(np.abs(self._data - points._data) <= 10**-self.PRECISION))
+
+    # ======================================== CONVERSIONS ========================================
+    @classmethod
+    def from_points(cls, points: Iterable[context.geometry.Point], dim: int = None) -> PointArrayObject:
+        """
+        Construit un tableau à partir de points
+
+        Args:
+            points (Iterable[context.geometry.Point]) : points ou coordonnées
+            dim (int, optional) : dimension imposée
+        """
+        return cls(points, dim=dim)
+
+    def to_points(self) -> list[context.geometry.Point]:
+        """Renvoie la liste des points"""
+        new = context.geometry.Point._new
+        return [new(row) for row in np.round(self._data, self.PRECISION).tolist()]
+
+    def to_tuple(self) -> tuple[tuple[float]]:
+        """Renvoie les coordonnées en tuple de tuples"""
+        return tuple(map(tuple, self._data.tolist()))
+
+    def to_list(self) -> list[list[float]]:
+        """Renvoie les coordonnées en liste de listes"""
+        return self._data.tolist()
+
+    def copy(self) -> PointArrayObject:
+        """Renvoie une copie du tableau"""
+        return PointArrayObject._new(self._data.copy())
+
+    # ======================================== TRANSFORMATIONS ========================================
+    def translate(self, vector: object):
+        """
+        Translate les points
+
+        Args:
+            vector (Vector | VectorArray | np.ndarray) : vecteur commun ou un vecteur par point
+        """
+        offsets = _to_rows(vector, self.dim, method='translate', message='Invalid vector argument')
+        if offsets.ndim == 2 and offsets.shape[0] != self.n:
+            _raise_error(self, 'translate', f'Need {self.n} vectors, got {offsets.shape[0]}')
+        self._translate(offsets)
+
+    def _translate(self, offsets: np.ndarray):
+        """Implémentation interne de translate"""
+        self._data += offsets
+
+    def rotate(self, angle: Real, center: context.geometry.Point = None, degrees: bool = False):
+        """
+        Tourne les points autour d'un centre (2D)
+
+        Args:
+            angle (Real) : angle de rotation
+            center (context.geometry.Point, optional) : centre de rotation (défaut: origine)
+            degrees (bool) : si True, angle en degrés
+        """
+        if not isinstance(angle, Real):
+            _raise_error(self, 'rotate', 'Invalid angle argument')
+        if self.dim != 2:
+            _raise_error(self, 'rotate', 'Rotation is only defined in 2D')
+        center = np.zeros(2) if center is None else _to_rows(context.geometry._to_point(center), 2, method='rotate')
+        self._rotate(angle, center, degrees=degrees)
+
+    def _rotate(self, angle: Real, center: np.ndarray, degrees: bool = False):
+        """Implémentation interne de rotate"""
+        self._data -= center
+        self._data[:] = self._data @ _rotation_matrix(angle, degrees=degrees)
+        self._data += center
+
+    def scale(self, ratio: Real | Iterable[Real], center: context.geometry.Point = None):
+        """
+        Redimensionne le nuage de points depuis un centre
+
+        Args:
+            ratio (Real | Iterable[Real]) : ratio commun ou ratio par axe
+            center (context.geometry.Point, optional) : centre de redimensionnement (défaut: origine)
+        """
+        ratio = np.asarray(ratio, dtype=np.float64) if isinstance(ratio, Sequence) else ratio
+        if not isinstance(ratio, (Real, np.ndarray)) or np.any(np.asarray(ratio) <= 0):
+            _raise_error(self, 'scale', 'Invalid ratio argument')
+        center = np.zeros(self.dim) if center is None else _to_rows(context.geometry._to_point(center), self.dim, method='scale')
+        self._scale(ratio, center)
+
+    def _scale(self, ratio: float | np.ndarray, center: np.ndarray):
+        """Implémentation interne de scale"""
+        self._data -= center
+        self._data *= ratio
+        self._data += center
+
+    # ======================================== REQUETES ========================================
+    def distances(self, point: context.geometry.Point) -> np.ndarray:
+        """
+        Renvoie la distance de chaque point à un point donné
+
+        Args:
+            point (context.geometry.Point) : point de référence
+        """
+        point = _to_rows(context.geometry._to_point(point), self.dim, method='distances')
+        return self._distances(point)
+
+    def _distances(self, point: np.ndarray) -> np.ndarray:
+        """Implémentation interne de distances"""
+        diff = self._data - point
+        return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+    def pairwise_distances(self, points: PointArrayObject) -> np.ndarray:
+        """
+        Renvoie la matrice (n, m) des distances entre deux tableaux
+
+        Args:
+            points (PointArray) : second tableau
+        """
+        if not isinstance(points, PointArrayObject):
+            _raise_error(self, 'pairwise_distances', 'Invalid points argument')
+        diff = self._data[:, None, :] - _to_rows(points, self.dim)[None, :, :]
+        return np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
+
+    def nearest(self, point: context.geometry.Point) -> tuple[int, float]:
+        """
+        Renvoie l'indice et la distance du point le plus proche d'un point donné
+
+        Args:
+            point (context.geometry.Point) : point de référence
+        """
+        distances = self.distances(point)
+        i = int(np.argmin(distances))
+        return i, float(distances[i])
+
+    def nearest_neighbors(self, points: PointArrayObject) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Pour chaque point de Self, renvoie l'indice et la distance du plus proche point d'un second tableau
+
+        Args:
+            points (PointArray) : tableau de recherche
+        """
+        if not isinstance(points, PointArrayObject):
+            _raise_error(self, 'nearest_neighbors', 'Invalid points argument')
+        return self._nearest_neighbors(_to_rows(points, self.dim))
+
+    def _nearest_neighbors(self, other: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Implémentation interne de nearest_neighbors (différences exactes, par blocs pour borner la mémoire)"""
+        indices = np.empty(self.n, dtype=np.intp)
+        distances = np.empty(self.n, dtype=np.float64)
+        step = max(1, self.CHUNK // max(1, other.shape[0]))
+        for start in range(0, self.n, step):
+            rows = self._data[start:start + step]
+            block = np.zeros((rows.shape[0], other.shape[0]))
+            for k in range(rows.shape[1]):      # somme des carrés coordonnée par coordonnée (pas de tableau (n, m, d))
+                diff = np.subtract.outer(rows[:, k], other[:, k])
+                block += np.multiply(diff, diff, out=diff)
+            best = np.argmin(block, axis=1)
+            indices[start:start + step] = best
+            distances[start:start + step] = np.sqrt(block[np.arange(block.shape[0]), best])
+        return indices, distances
+
+    def bounding_box(self) -> tuple[context.geometry.Point, context.geometry.Point]:
+        """Renvoie les coins minimal et maximal de la boîte englobante"""
+        return context.geometry.Point(*self._data.min(axis=0)), context.geometry.Point(*self._data.max(axis=0))
@@ -7,7 +7,7 @@ class PolygonObject:
     """
     Object géométrique 2D : Polygone
     """
-    __slots__ = ["_vertices", "_filling", "_color", "_border", "_border_color", "_border_width", "_border_around"]
+    __slots__ = ["_vertices", "_cache", "_filling", "_color", "_border", "_border_color", "_border_width", "_border_around"]
     PRECISION = 9
 
     def __init__(self, *points: context.geometry.Point):
@@ -17,6 +17,7 @@ class PolygonObject:
         self._vertices = [context.geometry._to_point(p, copy=True) for p in points]
         for v in self._vertices:
             v.reshape(2)
+        self._cache = {}
 
         # remplissage
         self._filling = True
@@ -65,8 +66,8 @@ class PolygonObject:
     @property
     def edges(self) -> list[context.geometry.Segment]:
         """Renvoie la liste des arêtes"""
-        n = self.n
-        return [context.geometry.Segment(self._vertices[i], self._vertices[(i + 1) % n]) for i in range(n)]
+        new_point, new_segment = context.geometry.Point._new, context.geometry.Segment._new
+        return [new_segment(new_point(list(a)), new_point(list(b))) for a, b in self._edges()]
 
     @property
     def center(self) -> context.geometry.Point:
@@ -76,10 +77,10 @@ class PolygonObject:
     @property
     def perimeter(self) -> float:
         """Renvoie le périmètre"""
-        return sum(
-            self._vertices[i]._distance(self._vertices[(i + 1) % self.n])
-            for i in range(self.n)
-        )
+        perimeter = self._cache.get('perimeter')
+        if perimeter is None:
+            perimeter = self._cache['perimeter'] = sum(math.dist(a, b) for a, b in self._edges())
+        return perimeter
 
     @property
     def area(self) -> float:
@@ -91,6 +92,11 @@ class PolygonObject:
         """Vérifie la convexité du polygone"""
         return self._is_convex()
 
+    @property
+    def aabb(self) -> tuple[float, float, float, float]:
+        """Renvoie la boîte englobante alignée (left, top, right, bottom)"""
+        return self._aabb()
+
     # paramètres d'affichage
     @property
     def filling(self) -> bool:
@@ -130,6 +136,7 @@ class PolygonObject:
         point = context.geometry._to_point(point, copy=True)
         point.reshape(2)
         self._vertices[i] = point
+        self._invalidate()
 
     @filling.setter
     def filling(self, value: bool):
@@ -206,15 +213,25 @@ class PolygonObject:
         return self._collidepoint(point)
 
     def _collidepoint(self, point: context.geometry.Point) -> bool:
-        """Implémentation interne de collidepoint (ray casting)"""
+        """Implémentation interne de collidepoint (demi-plans si convexe, index de triangles si simple, ray casting sinon)"""
         px, py = point.x, point.y
+        left, top, right, bottom = self._aabb()
+        if px < left or px > right or py < top or py > bottom:
+            return False
+        if self._is_convex():
+            return self._convex_contains(px, py)
+        if self._is_simple():
+            return self._triangle_contains(px, py)
+
+        # polygone auto-intersecté : ray casting
+        coords = self._coords()
         n = self.n
         inside = False
 
         j = n - 1
         for i in range(n):
-            xi, yi = self._vertices[i].x, self._vertices[i].y
-            xj, yj = self._vertices[j].x, self._vertices[j].y
+            xi, yi = coords[i]
+            xj, yj = coords[j]
 
             # vérifie si le point est exactement sur une arête horizontale
             if yi == yj == py and min(xi, xj) <= px <= max(xi, xj):
@@ -244,6 +261,13 @@ class PolygonObject:
 
     def _collideline(self, line: context.geometry.Line) -> bool:
         """Implémentation interne de collideline"""
+        # la droite laisse toute la boîte englobante du même côté
+        ox, oy = line._origin.x, line._origin.y
+        vx, vy = line._vector.x, line._vector.y
+        left, top, right, bottom = self._aabb()
+        sides = [vx * (y - oy) - vy * (x - ox) for x, y in ((left, top), (right, top), (right, bottom), (left, bottom))]
+        if min(sides) > 0 or max(sides) < 0:
+            return False
         intersections = self._line_intersection(line)
         return intersections is not None and len(intersections) > 0
 
@@ -260,15 +284,19 @@ class PolygonObject:
 
     def _collidesegment(self, segment: context.geometry.Segment) -> bool:
         """Implémentation interne de collidesegment"""
+        sx1, sy1 = segment._start.x, segment._start.y
+        sx2, sy2 = segment._end.x, segment._end.y
+        if not self._aabb_overlap(min(sx1, sx2), min(sy1, sy2), max(sx1, sx2), max(sy1, sy2)):
+            return False
         if self._collidepoint(segment._start) or self._collidepoint(segment._end):
             return True
 
-        sx1, sy1 = segment._start.x, segment._start.y
-        sx2, sy2 = segment._end.x, segment._end.y
+        segment_segment_collide = context.geometry.segment_segment_collide
+        coords = self._coords()
         n = self.n
         for i in range(n):
-            j = (i + 1) % n
-            if context.geometry.segment_segment_collide(sx1, sy1, sx2, sy2, self._vertices[i].x, self._vertices[i].y, self._vertices[j].x, self._vertices[j].y):
+            (x1, y1), (x2, y2) = coords[i], coords[(i + 1) % n]
+            if segment_segment_collide(sx1, sy1, sx2, sy2, x1, y1, x2, y2):
                 return True
         return False
 
@@ -284,6 +312,14 @@ class PolygonObject:
 
     def _colliderect(self, rect: context.geometry.Rect) -> bool:
         """Implémentation interne de colliderect"""
+        if not self._aabb_overlap(rect.left, rect.top, rect.right, rect.bottom):
+            return False
+
+        # rect sans arrondi : axes séparateurs sur les pièces convexes
+        if rect.border_radius <= 0 and self._is_simple():
+            corners = ((rect.left, rect.top), (rect.right, rect.top), (rect.right, rect.bottom), (rect.left, rect.bottom))
+            return self._collide_shapes(((corners, ((1.0, 0.0), (0.0, 1.0)), (rect.left, rect.top, rect.right, rect.bottom)),))
+
         # un sommet du polygone dans le rect
         for v in self._vertices:
             if rect._collidepoint(v):
@@ -301,13 +337,13 @@ class PolygonObject:
             (rect.right, rect.bottom, rect.left, rect.bottom),
             (rect.left, rect.bottom, rect.left, rect.top),
         ]
+        segment_segment_collide = context.geometry.segment_segment_collide
+        coords = self._coords()
         n = self.n
         for i in range(n):
-            j = (i + 1) % n
-            px1, py1 = self._vertices[i].x, self._vertices[i].y
-            px2, py2 = self._vertices[j].x, self._vertices[j].y
+            (px1, py1), (px2, py2) = coords[i], coords[(i + 1) % n]
             for rx1, ry1, rx2, ry2 in rect_edges:
-                if context.geometry.segment_segment_collide(px1, py1, px2, py2, rx1, ry1, rx2, ry2):
+                if segment_segment_collide(px1, py1, px2, py2, rx1, ry1, rx2, ry2):
                     return True
 
         return False
@@ -325,21 +361,22 @@ class PolygonObject:
 
     def _collidecircle(self, circle: context.geometry.Circle) -> bool:
         """Implémentation interne de collidecircle"""
+        cx, cy = circle._center.x, circle._center.y
+        r = circle._radius
+        if not self._aabb_overlap(cx - r, cy - r, cx + r, cy + r):
+            return False
+
         # le centre du cercle est dans le polygone
         if self._collidepoint(circle._center):
             return True
 
-        cx, cy = circle._center.x, circle._center.y
-        r = circle._radius
-
+        # une arête du polygone est à moins de rayon du centre (couvre les sommets dans le cercle)
+        segment_point_distance = context.geometry.segment_point_distance
+        coords = self._coords()
         n = self.n
         for i in range(n):
-            j = (i + 1) % n
-            # un sommet du polygone est dans le cercle
-            if circle._collidepoint(self._vertices[i]):
-                return True
-            # une arête du polygone est à moins de rayon du centre
-            if context.geometry.segment_point_distance(self._vertices[i].x, self._vertices[i].y, self._vertices[j].x, self._vertices[j].y, cx, cy) <= r:
+            (x1, y1), (x2, y2) = coords[i], coords[(i + 1) % n]
+            if segment_point_distance(x1, y1, x2, y2, cx, cy) <= r:
                 return True
 
         return False
@@ -357,7 +394,14 @@ class PolygonObject:
 
     def _collidepolygon(self, polygon: context.geometry.Polygon) -> bool:
         """Implémentation interne de collidepolygon"""
-        # un sommet de l'un est dans l'autre
+        if not self._aabb_overlap(*polygon._aabb()):
+            return False
+
+        # axes séparateurs entre pièces convexes
+        if self._is_simple() and polygon._is_simple():
+            return self._collide_shapes(polygon._convex_shapes())
+
+        # polygone auto-intersecté : un sommet de l'un est dans l'autre
         for v in self._vertices:
             if polygon._collidepoint(v):
                 return True
@@ -366,27 +410,50 @@ class PolygonObject:
                 return True
 
         # une arête de l'un croise une arête de l'autre
+        segment_segment_collide = context.geometry.segment_segment_collide
+        coords1, coords2 = self._coords(), polygon._coords()
         n1 = self.n
         n2 = polygon.n
         for i in range(n1):
-            i2 = (i + 1) % n1
-            ax1, ay1 = self._vertices[i].x, self._vertices[i].y
-            ax2, ay2 = self._vertices[i2].x, self._vertices[i2].y
+            (ax1, ay1), (ax2, ay2) = coords1[i], coords1[(i + 1) % n1]
             for j in range(n2):
-                j2 = (j + 1) % n2
-                if context.geometry.segment_segment_collide(ax1, ay1, ax2, ay2, polygon._vertices[j].x, polygon._vertices[j].y, polygon._vertices[j2].x, polygon._vertices[j2].y):
+                (bx1, by1), (bx2, by2) = coords2[j], coords2[(j + 1) % n2]
+                if segment_segment_collide(ax1, ay1, ax2, ay2, bx1, by1, bx2, by2):
                     return True
 
         return False
 
+    def minimum_translation_vector(self, polygon: context.geometry.Polygon) -> context.geometry.Vector | None:
+        """
+        Renvoie le vecteur de translation minimal à appliquer au polygone pour le séparer d'un autre (polygones convexes)
+
+        Args:
+            polygon (context.geometry.Polygon) : polygone en collision
+        """
+        if not isinstance(polygon, context.geometry.Polygon):
+            _raise_error(self, 'minimum_translation_vector', 'Invalid polygon argument')
+        if not self._is_convex() or not polygon._is_convex():
+            _raise_error(self, 'minimum_translation_vector', 'Both polygons must be convex')
+        return self._minimum_translation_vector(polygon)
+
+    def _minimum_translation_vector(self, polygon: context.geometry.Polygon) -> context.geometry.Vector | None:
+        """Implémentation interne de minimum_translation_vector"""
+        if not self._aabb_overlap(*polygon._aabb()):
+            return None
+        result = self._sat(polygon._coords(), polygon._axes())
+        if result is None:
+            return None
+        (nx, ny), depth = result
+        return context.geometry.Vector(nx * depth, ny * depth)
+
     # ======================================== METHODES INTERACTIVES ========================================
     def copy(self) -> context.geometry.Polygon:
-        """Renvoie une copie du polygone"""
+        """Renvoie une copie du polygone (le masque en cache est recopié, pas partagé)"""
         return _deepcopy(self)
 
     def to_tuple(self) -> tuple[tuple[float, float]]:
         """Renvoie les sommets en tuple de tuples"""
-        return tuple(v.to_tuple() for v in self._vertices)
+        return self._coords()
 
     def to_list(self) -> list[list[float]]:
         """Renvoie les sommets en liste de listes"""
@@ -410,12 +477,17 @@ class PolygonObject:
 
     def _scale(self, ratio: Real, center: context.geometry.Point):
         """Implémentation interne de scale"""
-        for i in range(self.n):
-            v = self._vertices[i]
-            self._vertices[i] = context.geometry.Point(
-                center.x + (v.x - center.x) * ratio,
-                center.y + (v.y - center.y) * ratio,
-            )
+        cx, cy = center.x, center.y
+        coords = self._coords()
+
+        # invariants par homothétie
+        cache = self._cache
+        kept = {key: cache[key] for key in ('convex', 'simple', 'axes', 'triangles', 'pieces') if key in cache}
+        if 'area' in cache: kept['area'] = cache['area'] * ratio * ratio
+        if 'perimeter' in cache: kept['perimeter'] = cache['perimeter'] * ratio
+        self._invalidate()
+        cache.update(kept)
+        self._set_coords((cx + (x - cx) * ratio, cy + (y - cy) * ratio) for x, y in coords)
 
     def translate(self, vector: context.geometry.Vector):
         """
@@ -428,9 +500,24 @@ class PolygonObject:
         self._translate(vector)
 
     def _translate(self, vector: context.geometry.Vector):
-        """Implémentation interne de translate"""
-        for i in range(self.n):
-            self._vertices[i] = self._vertices[i] + vector
+        """Implémentation interne de translate (mise à jour incrémentale du cache)"""
+        dx, dy = vector.x, vector.y
+        cache = self._cache
+        coords = self._coords()
+        aabb, centroid, edges = cache.get('aabb'), cache.get('centroid'), 'edges' in cache
+
+        # aire, périmètre, convexité, normales et découpages sont invariants par translation
+        kept = {key: cache[key] for key in ('convex', 'simple', 'area', 'perimeter', 'axes', 'triangles', 'pieces') if key in cache}
+        self._invalidate()
+        cache.update(kept)
+        self._set_coords((x + dx, y + dy) for x, y in coords)
+        if aabb is not None:
+            left, top, right, bottom = aabb
+            cache['aabb'] = (round(left + dx, self.PRECISION), round(top + dy, self.PRECISION), round(right + dx, self.PRECISION), round(bottom + dy, self.PRECISION))
+        if centroid is not None:
+            cache['centroid'] = (centroid[0] + dx, centroid[1] + dy)
+        if edges:
+            self._edges()
 
     def rotate(self, angle: Real, center: context.geometry.Point = None, degrees: bool = False):
         """
@@ -456,14 +543,14 @@ class PolygonObject:
         cos_a = math.cos(angle)
         sin_a = math.sin(angle)
         cx, cy = center.x, center.y
+        coords = self._coords()
 
-        for i in range(self.n):
-            dx = self._vertices[i].x - cx
-            dy = self._vertices[i].y - cy
-            self._vertices[i] = context.geometry.Point(
-                cx + dx * cos_a - dy * sin_a,
-                cy + dx * sin_a + dy * cos_a,
-            )
+        # invariants par rotation
+        cache = self._cache
+        kept = {key: cache[key] for key in ('convex', 'simple', 'area', 'perimeter', 'triangles', 'pieces') if key in cache}
+        self._invalidate()
+        cache.update(kept)
+        self._set_coords((cx + (x - cx) * cos_a - (y - cy) * sin_a, cy + (x - cx) * sin_a + (y - cy) * cos_a) for x, y in coords)
 
     def line_intersection(self, line: context.geometry.Line) -> tuple[context.geometry.Point] | None:
         """
@@ -482,10 +569,8 @@ class PolygonObject:
         vx, vy = line.get_vector().x, line.get_vector().y
 
         points = []
-        n = self.n
-        for i in range(n):
-            j = (i + 1) % n
-            result = context.geometry.line_segment_intersection(ox, oy, vx, vy, self._vertices[i].x, self._vertices[i].y, self._vertices[j].x, self._vertices[j].y)
+        for (x1, y1), (x2, y2) in self._edges():
+            result = context.geometry.line_segment_intersection(ox, oy, vx, vy, x1, y1, x2, y2)
             if result is not None:
                 points.append(context.geometry.Point(*result))
 
@@ -510,45 +595,57 @@ class PolygonObject:
 
     # ======================================== INTERNALS ========================================
     def _signed_area(self) -> float:
-        """Aire signée par la formule de Shoelace (positif = sens anti-horaire)"""
-        n = self.n
-        area = 0.0
-        for i in range(n):
-            j = (i + 1) % n
-            area += self._vertices[i].x * self._vertices[j].y
-            area -= self._vertices[j].x * self._vertices[i].y
-        return area / 2.0
+        """Aire signée par la formule de Shoelace (positif = sens anti-horaire, mise en cache)"""
+        area = self._cache.get('area')
+        if area is None:
+            area = 0.0
+            for (x1, y1), (x2, y2) in self._edges():
+                area += x1 * y2 - x2 * y1
+            area = self._cache['area'] = area / 2.0
+        return area
 
     def _center(self) -> context.geometry.Point:
         """Centroïde du polygone"""
+        return context.geometry.Point(*self._centroid())
+
+    def _centroid(self) -> tuple[float, float]:
+        """Coordonnées du centroïde (mises en cache)"""
+        centroid = self._cache.get('centroid')
+        if centroid is not None:
+            return centroid
+
         n = self.n
         a = self._signed_area()
-
         if abs(a) < 1e-10:
-            # polygone dégénéré : retourne la moyenne des sommets
-            cx = sum(v.x for v in self._vertices) / n
-            cy = sum(v.y for v in self._vertices) / n
-            return context.geometry.Point(cx, cy)
-
-        cx, cy = 0.0, 0.0
-        for i in range(n):
-            j = (i + 1) % n
-            cross = self._vertices[i].x * self._vertices[j].y - self._vertices[j].x * self._vertices[i].y
-            cx += (self._vertices[i].x + self._vertices[j].x) * cross
-            cy += (self._vertices[i].y + self._vertices[j].y) * cross
-
-        cx /= (6.0 * a)
-        cy /= (6.0 * a)
-        return context.geometry.Point(cx, cy)
+            # polygone dégénéré : moyenne des sommets
+            xs, ys = zip(*self._coords())
+            centroid = (sum(xs) / n, sum(ys) / n)
+        else:
+            cx, cy = 0.0, 0.0
+            for (x1, y1), (x2, y2) in self._edges():
+                cross = x1 * y2 - x2 * y1
+                cx += (x1 + x2) * cross
+                cy += (y1 + y2) * cross
+            centroid = (cx / (6.0 * a), cy / (6.0 * a))
+        self._cache['centroid'] = centroid
+        return centroid
 
     def _is_convex(self) -> bool:
-        """Vérifie la convexité via le signe du produit vectoriel consécutif"""
+        """Vérifie la convexité via le signe du produit vectoriel consécutif (mis en cache)"""
+        convex = self._cache.get('convex')
+        if convex is None:
+            convex = self._cache['convex'] = self._compute_convex()
+        return convex
+
+    def _compute_convex(self) -> bool:
+        """Calcule la convexité via le signe du produit vectoriel consécutif"""
+        coords = self._coords()
         n = self.n
         sign = None
         for i in range(n):
-            x1, y1 = self._vertices[i].x, self._vertices[i].y
-            x2, y2 = self._vertices[(i + 1) % n].x, self._vertices[(i + 1) % n].y
-            x3, y3 = self._vertices[(i + 2) % n].x, self._vertices[(i + 2) % n].y
+            x1, y1 = coords[i]
+            x2, y2 = coords[(i + 1) % n]
+            x3, y3 = coords[(i + 2) % n]
 
             cross = (x2 - x1) * (y3 - y2) - (y2 - y1) * (x3 - x2)
             if abs(cross) < 1e-10:
@@ -559,8 +656,353 @@ class PolygonObject:
             elif (cross > 0) != sign:
                 return False
 
+        # un polygone qui s'auto-intersecte peut tourner toujours du même côté
+        if sign is not None and abs(self._signed_area()) > 1e-10:
+            turning = 0.0
+            for i in range(n):
+                x1, y1 = coords[i]
+                x2, y2 = coords[(i + 1) % n]
+                x3, y3 = coords[(i + 2) % n]
+                a1 = math.atan2(y2 - y1, x2 - x1)
+                a2 = math.atan2(y3 - y2, x3 - x2)
+                turning += (a2 - a1 + math.pi) % (2 * math.pi) - math.pi
+            return abs(abs(turning) - 2 * math.pi) < 1e-6
+        return True
+
+    def _is_simple(self) -> bool:
+        """Vérifie que le contour ne s'auto-intersecte pas (mis en cache)"""
+        simple = self._cache.get('simple')
+        if simple is None:
+            simple = True
+            if not self._is_convex():
+                segment_segment_collide = context.geometry.segment_segment_collide
+                edges = self._edges()
+                n = self.n
+                for i in range(n):
+                    (ax1, ay1), (ax2, ay2) = edges[i]
+                    # arêtes non adjacentes uniquement
+                    for j in range(i + 2, n - (i == 0)):
+                        (bx1, by1), (bx2, by2) = edges[j]
+                        if segment_segment_collide(ax1, ay1, ax2, ay2, bx1, by1, bx2, by2):
+                            simple = False
+                            break
+                    if not simple:
+                        break
+            self._cache['simple'] = simple
+        return simple
+
+    # ======================================== CACHE ========================================
+    def _invalidate(self):
+        """Vide les données dérivées mises en cache (à appeler après toute modification des sommets)"""
+        self._cache.clear()
+
+    def _set_coords(self, coords: Iterable[tuple[float, float]]):
+        """Remplace les sommets par des coordonnées brutes (arrondies comme PointObject) sans toucher au reste du cache"""
+        precision = self.PRECISION
+        coords = tuple((round(x, precision), round(y, precision)) for x, y in coords)
+        new = context.geometry.Point._new
+        self._vertices = [new([x, y]) for x, y in coords]
+        self._cache['coords'] = coords
+
+    def _coords(self) -> tuple[tuple[float, float]]:
+        """Renvoie les coordonnées des sommets (mises en cache)"""
+        coords = self._cache.get('coords')
+        if coords is None:
+            coords = self._cache['coords'] = tuple((v.x, v.y) for v in self._vertices)
+        return coords
+
+    def _edges(self) -> tuple[tuple[tuple[float, float], tuple[float, float]]]:
+        """Renvoie les arêtes en couples de coordonnées (mises en cache)"""
+        edges = self._cache.get('edges')
+        if edges is None:
+            coords = self._coords()
+            edges = self._cache['edges'] = tuple(zip(coords, coords[1:] + coords[:1]))
+        return edges
+
+    def _draw_points(self) -> list[tuple[int, int]]:
+        """Renvoie les sommets entiers passés à pygame.draw (mis en cache)"""
+        points = self._cache.get('draw')
+        if points is None:
+            points = self._cache['draw'] = [(int(x), int(y)) for x, y in self._coords()]
+        return points
+
+    def _aabb(self) -> tuple[float, float, float, float]:
+        """Renvoie la boîte englobante (left, top, right, bottom) (mise en cache)"""
+        aabb = self._cache.get('aabb')
+        if aabb is None:
+            xs, ys = zip(*self._coords())
+            aabb = self._cache['aabb'] = (min(xs), min(ys), max(xs), max(ys))
+        return aabb
+
+    def _aabb_overlap(self, left: float, top: float, right: float, bottom: float) -> bool:
+        """Vérifie le recouvrement de la boîte englobante avec une autre"""
+        l, t, r, b = self._aabb()
+        return not (right < l or r < left or bottom < t or b < top)
+
+    def _axes(self) -> tuple[tuple[float, float]]:
+        """Renvoie les normales unitaires des arêtes, sans doublon de direction (mises en cache)"""
+        axes = self._cache.get('axes')
+        if axes is None:
+            axes = self._cache['axes'] = self._normals(self._coords())
+        return axes
+
+    @staticmethod
+    def _normals(coords: tuple[tuple[float, float]]) -> tuple[tuple[float, float]]:
+        """Calcule les normales unitaires des arêtes d'un contour, sans doublon de direction"""
+        n = len(coords)
+        seen = set()
+        axes = []
+        for i in range(n):
+            (x1, y1), (x2, y2) = coords[i], coords[(i + 1) % n]
+            length = math.hypot(x2 - x1, y2 - y1)
+            if length < 1e-12:
+                continue
+            nx, ny = (y1 - y2) / length, (x2 - x1) / length
+            if nx < 0 or (nx == 0 and ny < 0):
+                nx, ny = -nx, -ny
+            key = (round(nx, 9), round(ny, 9))
+            if key not in seen:
+                seen.add(key)
+                axes.append((nx, ny))
+        return tuple(axes)
+
+    def _convex_contains(self, px: float, py: float) -> bool:
+        """Vérifie qu'un point soit dans le polygone convexe (même côté de toutes les arêtes)"""
+        coords = self._coords()
+        n = self.n
+        positive = negative = False
+        for i in range(n):
+            (x1, y1), (x2, y2) = coords[i], coords[(i + 1) % n]
+            cross = (x2 - x1) * (py - y1) - (y2 - y1) * (px - x1)
+            if cross > 1e-10:
+                positive = True
+            elif cross < -1e-10:
+                negative = True
+            if positive and negative:
+                return False
         return True
 
+    def _sat(self, coords: tuple[tuple[float, float]], axes: tuple[tuple[float, float]]) -> tuple[tuple[float, float], float] | None:
+        """
+        Test des axes séparateurs contre un polygone convexe donné par ses sommets et ses normales
+
+        Returns:
+            None : axe séparateur trouvé (pas de collision)
+            ((nx, ny), depth) : axe et profondeur minimale, orientés pour éloigner Self de l'autre forme
+        """
+        return self._separating_axes(self._coords(), self._axes(), coords, axes)
+
+    @staticmethod
+    def _separating_axes(own: tuple[tuple[float, float]], own_axes: tuple[tuple[float, float]], coords: tuple[tuple[float, float]], axes: tuple[tuple[float, float]]) -> tuple[tuple[float, float], float] | None:
+        """Test des axes séparateurs entre deux contours convexes (voir _sat)"""
+        best_axis, best_depth = None, math.inf
+        for nx, ny in own_axes + tuple(axes):
+            min1 = max1 = own[0][0] * nx + own[0][1] * ny
+            for x, y in own:
+                d = x * nx + y * ny
+                if d < min1: min1 = d
+                elif d > max1: max1 = d
+            min2 = max2 = coords[0][0] * nx + coords[0][1] * ny
+            for x, y in coords:
+                d = x * nx + y * ny
+                if d < min2: min2 = d
+                elif d > max2: max2 = d
+            if max1 < min2 or max2 < min1:
+                return None
+            # sortie par le côté le moins enfoncé
+            if max1 - min2 < max2 - min1:
+                if max1 - min2 < best_depth:
+                    best_axis, best_depth = (-nx, -ny), max1 - min2
+            elif max2 - min1 < best_depth:
+                best_axis, best_depth = (nx, ny), max2 - min1
+        return best_axis, best_depth
+
+    # ======================================== DECOUPAGE ========================================
+    def triangulate(self) -> list[context.geometry.Polygon]:
+        """Renvoie la triangulation du polygone (ear clipping, mise en cache)"""
+        coords = self._coords()
+        return [PolygonObject(*(coords[i] for i in triangle)) for triangle in self._triangles()]
+
+    def convex_decomposition(self) -> list[context.geometry.Polygon]:
+        """Renvoie une partition du polygone en polygones convexes (Hertel-Mehlhorn, mise en cache)"""
+        coords = self._coords()
+        return [PolygonObject(*(coords[i] for i in piece)) for piece in self._pieces()]
+
+    def to_mask(self) -> tuple[pygame.mask.Mask, tuple[int, int]]:
+        """
+        Renvoie le masque de collision du polygone et la position de son coin haut gauche (mis en cache)
+
+        Returns:
+            (mask, (x, y)) : masque pygame et décalage à appliquer pour le placer
+        """
+        result = self._cache.get('mask')
+        if result is None:
+            points = self._draw_points()
+            ox, oy = min(x for x, _ in points), min(y for _, y in points)
+            width = max(x for x, _ in points) - ox + 1
+            height = max(y for _, y in points) - oy + 1
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            for piece in self._pieces():
+                pygame.draw.polygon(surface, (255, 255, 255, 255), [(points[i][0] - ox, points[i][1] - oy) for i in piece])
+            result = self._cache['mask'] = (pygame.mask.from_surface(surface), (ox, oy))
+        mask, offset = result
+        return mask.copy(), offset
+
+    def _triangles(self) -> tuple[tuple[int, int, int]]:
+        """Triangulation par ear clipping en indices de sommets orientés anti-horaire (mise en cache)"""
+        triangles = self._cache.get('triangles')
+        if triangles is not None:
+            return triangles
+
+        coords = self._coords()
+        indices = list(range(self.n))
+        if self._signed_area() < 0:
+            indices.reverse()
+
+        def cross(a: int, b: int, c: int) -> float:
+            (ax, ay), (bx, by), (cx, cy) = coords[a], coords[b], coords[c]
+            return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+        triangles = []
+        failures = 0
+        i = 0
+        while len(indices) > 3:
+            m = len(indices)
+            a, b, c = indices[(i - 1) % m], indices[i % m], indices[(i + 1) % m]
+            ear = cross(a, b, c) > 1e-12
+            if ear:
+                # aucun sommet restant dans le triangle candidat
+                for k in indices:
+                    if k in (a, b, c):
+                        continue
+                    if cross(a, b, k) >= -1e-12 and cross(b, c, k) >= -1e-12 and cross(c, a, k) >= -1e-12:
+                        ear = False
+                        break
+            # polygone dégénéré ou auto-intersecté : on force la découpe pour terminer
+            if ear or failures >= m:
+                triangles.append((a, b, c))
+                indices.pop(i % m)
+                failures = 0
+                i = max(i - 1, 0)
+            else:
+                failures += 1
+                i += 1
+        triangles.append(tuple(indices))
+
+        triangles = self._cache['triangles'] = tuple(triangles)
+        return triangles
+
+    def _pieces(self) -> tuple[tuple[int]]:
+        """Partition convexe (Hertel-Mehlhorn) en indices de sommets orientés anti-horaire (mise en cache)"""
+        pieces = self._cache.get('pieces')
+        if pieces is not None:
+            return pieces
+        if self._is_convex():
+            indices = tuple(range(self.n))
+            pieces = self._cache['pieces'] = (indices if self._signed_area() >= 0 else indices[::-1],)
+            return pieces
+
+        coords = self._coords()
+
+        def convex(piece: list[int]) -> bool:
+            m = len(piece)
+            for k in range(m):
+                (ax, ay), (bx, by), (cx, cy) = coords[piece[k - 1]], coords[piece[k]], coords[piece[(k + 1) % m]]
+                if (bx - ax) * (cy - by) - (by - ay) * (cx - bx) < -1e-12:
+                    return False
+            return True
+
+        # suppression gloutonne des diagonales non essentielles
+        pieces = [list(t) for t in self._triangles()]
+        merged = True
+        while merged:
+            merged = False
+            owners = {}
+            for p, piece in enumerate(pieces):
+                m = len(piece)
+                for k in range(m):
+                    a, b = piece[k], piece[(k + 1) % m]
+                    q = owners.get((b, a))
+                    if q is not None:
+                        other = pieces[q]
+                        i, j = piece.index(b), other.index(a)
+                        candidate = piece[i:] + piece[:i] + (other[j:] + other[:j])[1:-1]
+                        if convex(candidate):
+                            pieces[p] = candidate
+                            pieces.pop(q)
+                            merged = True
+                            break
+                    owners[(a, b)] = p
+                if merged:
+                    break
+
+        pieces = self._cache['pieces'] = tuple(tuple(piece) for piece in pieces)
+        return pieces
+
+    def _convex_shapes(self) -> tuple[tuple[tuple[tuple[float, float]], tuple[tuple[float, float]], tuple[float, float, float, float]]]:
+        """Renvoie (sommets, normales, boîte englobante) de chaque pièce convexe (mis en cache)"""
+        shapes = self._cache.get('shapes')
+        if shapes is None:
+            if self._is_convex():
+                shapes = ((self._coords(), self._axes(), self._aabb()),)
+            else:
+                coords = self._coords()
+                shapes = []
+                for piece in self._pieces():
+                    piece_coords = tuple(coords[i] for i in piece)
+                    xs, ys = zip(*piece_coords)
+                    shapes.append((piece_coords, self._normals(piece_coords), (min(xs), min(ys), max(xs), max(ys))))
+                shapes = tuple(shapes)
+            self._cache['shapes'] = shapes
+        return shapes
+
+    def _collide_shapes(self, shapes: tuple) -> bool:
+        """Vérifie la collision des pièces convexes avec d'autres contours convexes (sommets, normales, boîte englobante)"""
+        separating_axes = self._separating_axes
+        for coords1, axes1, (l1, t1, r1, b1) in self._convex_shapes():
+            for coords2, axes2, (l2, t2, r2, b2) in shapes:
+                if r1 < l2 or r2 < l1 or b1 < t2 or b2 < t1:
+                    continue
+                if separating_axes(coords1, axes1, coords2, axes2) is not None:
+                    return True
+        return False
+
+    def _triangle_index(self) -> tuple:
+        """Grille régulière des triangles pour les tests d'appartenance (mise en cache)"""
+        index = self._cache.get('triangle_index')
+        if index is not None:
+            return index
+
+        coords = self._coords()
+        triangles = [tuple(coords[i] for i in t) for t in self._triangles()]
+        left, top, right, bottom = self._aabb()
+        size = max(1, int(math.sqrt(len(triangles))))
+        cell_w = (right - left) / size or 1.0
+        cell_h = (bottom - top) / size or 1.0
+
+        cells = {}
+        for triangle in triangles:
+            xs, ys = zip(*triangle)
+            i1, i2 = int((min(xs) - left) / cell_w), min(size - 1, int((max(xs) - left) / cell_w))
+            j1, j2 = int((min(ys) - top) / cell_h), min(size - 1, int((max(ys) - top) / cell_h))
+            for i in range(i1, i2 + 1):
+                for j in range(j1, j2 + 1):
+                    cells.setdefault((i, j), []).append(triangle)
+
+        index = self._cache['triangle_index'] = (left, top, cell_w, cell_h, size, cells)
+        return index
+
+    def _triangle_contains(self, px: float, py: float) -> bool:
+        """Vérifie qu'un point soit dans l'un des triangles (bords inclus), via la grille"""
+        left, top, cell_w, cell_h, size, cells = self._triangle_index()
+        cell = (min(size - 1, int((px - left) / cell_w)), min(size - 1, int((py - top) / cell_h)))
+        for (ax, ay), (bx, by), (cx, cy) in cells.get(cell, ()):
+            if (bx - ax) * (py - ay) - (by - ay) * (px - ax) >= -1e-10 \
+                    and (cx - bx) * (py - by) - (cy - by) * (px - bx) >= -1e-10 \
+                    and (ax - cx) * (py - cy) - (ay - cy) * (px - cx) >= -1e-10:
+                return True
+        return False
+
     # ======================================== AFFICHAGE ========================================
     def draw(self, surface: pygame.Surface, filling: bool = None, color: pygame.Color = None,
              border: bool = None, border_width: int = None, border_color: pygame.Color = None):
@@ -586,7 +1028,7 @@ class PolygonObject:
         border_color = self._border_color if border_color is None else _to_color(border_color)
         border_around = self._border_around
 
-        points = [(int(v.x), int(v.y)) for v in self._vertices]
+        points = self._draw_points()
 
         # remplissage
         if filling:
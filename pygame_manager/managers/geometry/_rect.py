@@ -6,39 +6,64 @@ from ._core import *
 class RectObject:
     """
     Object géométrique 2D : Rectangle
+
+    Stockage:
+        quatre flottants (x, y, largeur, hauteur) et le rayon d'arrondissement des coins
+        pas de cache de données dérivées : to_tuple et rect se lisent sur les flottants, écrits directement par la physique
     """
-    __slots__ = ["_O", "_w", "_h", "_border_radius"]
+    __slots__ = ["_x", "_y", "_width", "_height", "_border_radius"]
+    PRECISION = 9
     def __init__(self, point: context.geometry.Point, width: Real, height: Real, border_radius: int = 0):
         # point haut gauche
-        self._O = context.geometry._to_point(point)       
-        self._O.reshape(2)
+        point = context.geometry._to_point(point)       
+        point.reshape(2)
+        self._x, self._y = point.x, point.y
 
         # largeur
         if not isinstance(width, Real) or width <= 0:
             _raise_error(self, '__init__', 'Invalid width argument')
-        self._w = context.geometry.Vector(width, 0)
+        self._width = float(width)
 
         # hauteur
         if not isinstance(height, Real) or height <= 0:
             _raise_error(self, '__init__', 'Invalid height argument')
-        self._h = context.geometry.Vector(0, height)
+        self._height = float(height)
 
         # arrondissement des coins
         self._border_radius = border_radius
 
+    @classmethod
+    def _new(cls, x: float, y: float, width: float, height: float, border_radius: int = 0) -> RectObject:
+        """Construit un rect sans vérification (flottants déjà arrondis)"""
+        rect = object.__new__(cls)
+        rect._x, rect._y, rect._width, rect._height, rect._border_radius = x, y, width, height, border_radius
+        return rect
+
+    @classmethod
+    def from_rect(cls, rect: pygame.Rect | FRect, border_radius: int = 0) -> RectObject:
+        """
+        Construit un rect à partir d'un pygame.Rect ou pygame.FRect
+
+        Args:
+            rect (pygame.Rect | FRect) : rect pygame
+            border_radius (int, optional) : rayon d'arrondissement des coins
+        """
+        if not isinstance(rect, PygameRect) or rect.width <= 0 or rect.height <= 0:
+            _raise_error(cls, 'from_rect', 'Invalid rect argument')
+        precision = cls.PRECISION
+        x, y, w, h = rect
+        return cls._new(round(float(x), precision), round(float(y), precision), float(w), float(h), border_radius)
+
     def __repr__(self) -> str:
         """Représentation du rect"""
-        return f"Rect({self.x}, {self.y}, {self.width}, {self.height})"
+        return f"Rect({self._x}, {self._y}, {self._width}, {self._height})"
     
     def __iter__(self) -> Iterator[context.geometry.Point]:
         """Itération sur les sommets"""
-        for vertex in [
-            context.geometry.Point(*self.topleft), 
-            context.geometry.Point(*self.topright), 
-            context.geometry.Point(*self.bottomright), 
-            context.geometry.Point(*self.bottomleft)
-        ]: 
-            yield vertex 
+        new = context.geometry.Point._new
+        x, y, right, bottom = self._x, self._y, self.right, self.bottom
+        for coos in ([x, y], [right, y], [right, bottom], [x, bottom]):
+            yield new(coos)
 
     def __hash__(self) -> int:
         """Renvoie le rect hashé"""
@@ -48,107 +73,114 @@ class RectObject:
     @property
     def rect(self) -> pygame.Rect:
         """Renvoie l'objet pygame.Rect"""
-        return pygame.Rect(*map(int, [self.x, self.y, self.width, self.height]))
+        return pygame.Rect(int(self._x), int(self._y), int(self._width), int(self._height))
+
+    @property
+    def frect(self) -> FRect:
+        """Renvoie l'objet pygame.FRect (pygame-ce)"""
+        if FRect is None:
+            _raise_error(self, 'frect', 'pygame.FRect requires pygame-ce')
+        return FRect(self._x, self._y, self._width, self._height)
     
     # position
     def get_pos(self) -> context.geometry.Point:
         """Renvoie le point positionnel"""
-        return self._O.copy()
+        return context.geometry.Point._new([self._x, self._y])
     
     @property
     def x(self) -> float:
         """Renvoie la coordonnée x"""
-        return self._O.x
+        return self._x
     
     @property
     def y(self) -> float:
         """Renvoie la coordonnée y"""
-        return self._O.y
+        return self._y
     
     @property
     def topleft(self) -> context.geometry.Point:
         """Renvoie le point haut gauche"""
-        return self._O.copy()
+        return context.geometry.Point._new([self._x, self._y])
     
     @property
     def top(self) -> float:
         """Renvoie la coordonnée du haut"""
-        return self.y
+        return self._y
     
     @property
     def topright(self) -> context.geometry.Point:
         """Renvoie le point haut droit"""
-        return self._O + self._w
+        return context.geometry.Point(self._x + self._width, self._y)
     
     @property
     def right(self) -> float:
         """Renvoie la coordonnée de la droite"""
-        return self.x + self.width
+        return self._x + self._width
     
     @property
     def bottomright(self) -> context.geometry.Point:
         """Renvoie le du point bas droit"""
-        return self._O + self._w + self._h
+        return context.geometry.Point(self._x + self._width, self._y + self._height)
     
     @property
     def bottom(self) -> float:
         """Renvoie la coordonnée du bas"""
-        return self.y + self.height
+        return self._y + self._height
     
     @property
     def bottomleft(self) -> context.geometry.Point:
         """Renvoie le du point bas gauche"""
-        return self._O + self._h
+        return context.geometry.Point(self._x, self._y + self._height)
     
     @property
     def left(self) -> float:
         """Renvoie la coordonnée de la gauche"""
-        return self.x
+        return self._x
     
     @property
     def center(self) -> context.geometry.Point:
         """Renvoie le point central"""
-        return self._O + 0.5 * (self._w + self._h)
+        return context.geometry.Point(self._x + self._width / 2, self._y + self._height / 2)
     
     @property
     def centerx(self) -> float:
         """Renvoie la coordonnée x du centre"""
-        return self.x + self.width / 2
+        return self._x + self._width / 2
 
     @property
     def centery(self) -> float:
         """Renvoie la coordonnée y du centre"""
-        return self.y + self.height / 2
+        return self._y + self._height / 2
 
     # taille
     def get_size(self) -> tuple[float, float]:
         """Renvoie les dimensions du rect"""
-        return (self.width, self.height)
+        return (self._width, self._height)
     
     @property
     def width(self) -> float:
         """Renvoie la largeur"""
-        return self._w.norm
+        return self._width
     
     @property
     def height(self) -> float:
         """Renvoie la hauteur"""
-        return self._h.norm
+        return self._height
     
     @property
     def diagonal(self) -> float:
         """Renvoie la longueur de la diagonale"""
-        return math.sqrt(self.width**2 + self.height**2)
+        return math.hypot(self._width, self._height)
     
     @property
     def perimeter(self) -> float:
         """Renvoie le périmètre"""
-        return 2 * (self.width + self.height)
+        return 2 * (self._width + self._height)
     
     @property
     def area(self) -> float:
         """Renvoie l'aire"""
-        return self.width * self.height
+        return self._width * self._height
     
     @property
     def border_radius(self) -> int:
@@ -162,95 +194,100 @@ class RectObject:
         """Fixe la coordonnée x"""
         if not isinstance(coordinate, Real):
             _raise_error(self, 'set_x', 'Invalid coordinate argument')
-        self._O.x = coordinate
+        self._x = round(float(coordinate), self.PRECISION)
     
     @y.setter
     def y(self, coordinate: Real):
         """Fixe la coordonnée y"""
         if not isinstance(coordinate, Real):
             _raise_error(self, 'set_y', 'Invalid coordinate argument')
-        self._O.y = coordinate
+        self._y = round(float(coordinate), self.PRECISION)
 
     @topleft.setter
     def topleft(self, point: context.geometry.Point):
         """Fixe les coordonnées du coin haut gauche"""
-        self._O = context.geometry._to_point(point)
+        point = context.geometry._to_point(point)
+        self._x, self._y = point.x, point.y
 
     @top.setter
     def top(self, coordinate: Real):
         """Fixe la coordonnée du haut"""
         if not isinstance(coordinate, Real):
             _raise_error(self, 'set_top', 'Invalid coordinate argument')
-        self._O.y = coordinate
+        self._y = round(float(coordinate), self.PRECISION)
 
     @topright.setter
     def topright(self, point: context.geometry.Point):
         """Fixe les coordonnées du coin haut droit"""
-        self._O = context.geometry._to_point(point) - self._w
+        point = context.geometry._to_point(point)
+        self._x, self._y = round(point.x - self._width, self.PRECISION), point.y
     
     @right.setter
     def right(self, coordinate: Real):
         """Fixe la coordonnée de la droite"""
         if not isinstance(coordinate, Real):
             _raise_error(self, 'set_right', 'Invalid coordinate argument')
-        self._O.x = coordinate - self.width
+        self._x = round(coordinate - self._width, self.PRECISION)
 
     @bottomright.setter
     def bottomright(self, point: context.geometry.Point):
         """Fixe les coordonnées du coin bas droit"""
-        self._O = context.geometry._to_point(point) - (self._w + self._h)
+        point = context.geometry._to_point(point)
+        self._x, self._y = round(point.x - self._width, self.PRECISION), round(point.y - self._height, self.PRECISION)
     
     @bottom.setter
     def bottom(self, coordinate: Real):
         """Fixe la coordonnée du bas"""
         if not isinstance(coordinate, Real):
             _raise_error(self, 'set_bottom', 'Invalid coordinate argument')
-        self._O.y = coordinate - self.height
+        self._y = round(coordinate - self._height, self.PRECISION)
     
     @bottomleft.setter
     def bottomleft(self, point: context.geometry.Point):
         """Fixe les coordonnées du coin bas gauche"""
-        self._O = context.geometry._to_point(point) - self._h
+        point = context.geometry._to_point(point)
+        self._x, self._y = point.x, round(point.y - self._height, self.PRECISION)
 
     @left.setter
     def left(self, coordinate: Real):
         """Fixe la coordonnée de la gauche"""
         if not isinstance(coordinate, Real):
             _raise_error(self, 'set_left', 'Invalid coordinate argument')
-        self._O.x = coordinate
+        self._x = round(float(coordinate), self.PRECISION)
     
     @center.setter
     def center(self, point: context.geometry.Point):
         """Fixe les coordonnées du centre"""
-        self._O = context.geometry._to_point(point) - 0.5 * (self._w + self._h)
+        point = context.geometry._to_point(point)
+        self._x, self._y = round(point.x - self._width / 2, self.PRECISION), round(point.y - self._height / 2, self.PRECISION)
 
     @centerx.setter
     def centerx(self, coordinate: Real):
         """Fixe la coordonnée x du centre"""
         if not isinstance(coordinate, Real):
             _raise_error(self, 'set_centerx', 'Invalid coordinate argument')
-        self._O.x = coordinate - self.width / 2
+        self._x = round(coordinate - self._width / 2, self.PRECISION)
     
     @centery.setter
     def centery(self, coordinate: Real):
         """Fixe la coordonnée y du centre"""
         if not isinstance(coordinate, Real):
             _raise_error(self, 'set_centery', 'Invalid coordinate argument')
-        self._O.y = coordinate - self.height / 2
+        self._y = round(coordinate - self._height / 2, self.PRECISION)
     
     @width.setter
     def width(self, width: Real):
         """Fixe la largeur"""
         if not isinstance(width, Real) or width <= 0:
             _raise_error(self, 'set_width', 'Invalid width argument')
-        self._w.set_norm(width)
+        self._width = float(width)
 
     @height.setter
     def height(self, height: Real):
         """Fixe la hauteur"""
         if not isinstance(height, Real) or height <= 0:
             _raise_error(self, 'set_height', 'Invalid height argument')
-        self._h.set_norm(height)
+        self._height = float(height)
 
     @border_radius.setter
     def border_radius(self, radius: int):
@@ -299,7 +336,7 @@ class RectObject:
         """Implémentation interne de collidepoint"""
         px, py = point.x, point.y
         if self._border_radius <= 0:
-            return self.left <= px <= self.right and self.top <= py <= self.bottom
+            return self._x <= px <= self._x + self._width and self._y <= py <= self._y + self._height
         
         r = self._border_radius
         
@@ -380,9 +417,9 @@ class RectObject:
     
     def _colliderect(self, rect: context.geometry.Rect) -> bool:
         """Implémentation interne de colliderect"""       
-        if self.right < rect.left or rect.right < self.left:
+        if self._x + self._width < rect._x or rect._x + rect._width < self._x:
             return False
-        if self.bottom < rect.top or rect.bottom < self.top:
+        if self._y + self._height < rect._y or rect._y + rect._height < self._y:
             return False
         
         if self._border_radius == 0 and rect._border_radius == 0:
@@ -506,15 +543,15 @@ class RectObject:
     # ======================================== METHODES INTERACTIVES ========================================
     def copy(self) -> context.geometry.Rect:
         """Renvoie une copie du rect"""
-        return _deepcopy(self)
+        return RectObject._new(self._x, self._y, self._width, self._height, self._border_radius)
 
     def to_tuple(self) -> tuple[float, float, float, float]:
         """Renvoie les propriétés dans un tuple"""
-        return (self.x, self.y, self.width, self.height)
+        return (self._x, self._y, self._width, self._height)
 
     def to_list(self) -> list[float]:
         """Renvoie les propriétés dans une liste"""
-        return [self.x, self.y, self.width, self.height]
+        return [self._x, self._y, self._width, self._height]
     
     def scale(self, ratio: Real):
         """
@@ -529,8 +566,8 @@ class RectObject:
 
     def _scale(self, ratio: Real):
         """Implémentation interne de scale """
-        self.width = self.width * ratio
-        self.height = self.height * ratio
+        self._width = self._width * ratio
+        self._height = self._height * ratio
     
     def translate(self, vector: context.geometry.Vector):
         """
@@ -544,8 +581,8 @@ class RectObject:
 
     def _translate(self, vector: context.geometry.Vector):
         """Implémentation interne de translate"""
-        self.x += vector.x
-        self.y += vector.y
+        self._x = round(self._x + vector.x, self.PRECISION)
+        self._y = round(self._y + vector.y, self.PRECISION)
     
     def closest_point(self, point: context.geometry.Point):
         """
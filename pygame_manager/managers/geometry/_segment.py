@@ -15,6 +15,14 @@ class SegmentObject:
         # point d'arrivée
         self._end = context.geometry._to_point(end, copy=True)
 
+    @classmethod
+    def _new(cls, start: context.geometry.Point, end: context.geometry.Point) -> SegmentObject:
+        """Construit un segment sans vérification (extrémités non partagées)"""
+        segment = object.__new__(cls)
+        segment._start = start
+        segment._end = end
+        return segment
+
     def __repr__(self) -> str:
         """Représentation du segment"""
         return f"Segment(P1{self._start.to_tuple()}, P2{self._end.to_tuple()})"
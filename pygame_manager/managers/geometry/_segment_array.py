@@ -0,0 +1,239 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from ._core import *
+
+# ======================================== OBJET ========================================
+class SegmentArrayObject:
+    """
+    Collection géométrique nD : Tableau de segments
+
+    Stockage:
+        deux arrays numpy contigus float64 de forme (n, d) (départs et arrivées)
+    """
+    __slots__ = ["_start", "_end"]
+    PRECISION = 9
+
+    def __init__(self, segments: Iterable[context.geometry.Segment] | np.ndarray, end: np.ndarray = None, dim: int = None):
+        """
+        Args:
+            segments (Iterable[context.geometry.Segment] | np.ndarray) : segments, array (n, 2, d) ou array (n, d) des départs
+            end (np.ndarray, optional) : array (n, d) des arrivées si segments contient les départs
+            dim (int, optional) : dimension imposée (défaut: dimension maximale des extrémités)
+        """
+        if dim is not None and (not isinstance(dim, int) or dim <= 0):
+            _raise_error(self, '__init__', 'Invalid dim argument')
+        to_data = context.geometry.PointArray._to_data
+        if end is not None:
+            start, end = to_data(segments, dim, method='__init__'), to_data(end, dim, method='__init__')
+        elif isinstance(segments, np.ndarray):
+            if segments.ndim != 3 or segments.shape[1] != 2:
+                _raise_error(self, '__init__', 'Segments array must be of shape (n, 2, d)')
+            start, end = to_data(segments[:, 0], dim, method='__init__'), to_data(segments[:, 1], dim, method='__init__')
+        else:
+            segments = [s if isinstance(s, context.geometry.Segment) else context.geometry.Segment(*s) for s in segments]
+            start = to_data([s._start for s in segments], dim, method='__init__')
+            end = to_data([s._end for s in segments], dim, method='__init__')
+        if start.shape != end.shape:
+            width = max(start.shape[1], end.shape[1])
+            start, end = _to_rows(start, width), _to_rows(end, width)
+            if start.shape != end.shape:
+                _raise_error(self, '__init__', 'Start and end arrays must have the same length')
+        self._start = np.ascontiguousarray(start)
+        self._end = np.ascontiguousarray(end)
+
+    @classmethod
+    def _new(cls, start: np.ndarray, end: np.ndarray) -> SegmentArrayObject:
+        """Construit un tableau sans vérification (arrays contigus float64 de même forme (n, d))"""
+        array = object.__new__(cls)
+        array._start = start
+        array._end = end
+        return array
+
+    def __repr__(self) -> str:
+        """Représentation du tableau"""
+        return f"SegmentArray(n={self.n}, dim={self.dim})"
+
+    def __iter__(self) -> Iterator[context.geometry.Segment]:
+        """Itération sur les segments"""
+        return iter(self.to_segments())
+
+    def __hash__(self) -> int:
+        """Renvoie le tableau hashé"""
+        return hash((self._start.shape, np.round(self._start, self.PRECISION).tobytes(), np.round(self._end, self.PRECISION).tobytes()))
+
+    # ======================================== GETTERS ========================================
+    def __getitem__(self, i: int | slice | np.ndarray) -> context.geometry.Segment | SegmentArrayObject:
+        """Renvoie le segment de rang i, ou un sous-tableau (slice, masque ou indices)"""
+        if isinstance(i, (int, np.integer)):
+            new = context.geometry.Point._new
+            return context.geometry.Segment._new(new(np.round(self._start[i], self.PRECISION).tolist()), new(np.round(self._end[i], self.PRECISION).tolist()))
+        return SegmentArrayObject._new(np.ascontiguousarray(self._start[i]), np.ascontiguousarray(self._end[i]))
+
+    @property
+    def n(self) -> int:
+        """Renvoie le nombre de segments"""
+        return self._start.shape[0]
+
+    def __len__(self) -> int:
+        """Renvoie le nombre de segments"""
+        return self._start.shape[0]
+
+    @property
+    def dim(self) -> int:
+        """Renvoie la dimension des segments"""
+        return self._start.shape[1]
+
+    @property
+    def starts(self) -> context.geometry.PointArray:
+        """Renvoie les premières extrémités"""
+        return context.geometry.PointArray._new(self._start.copy())
+
+    @property
+    def ends(self) -> context.geometry.PointArray:
+        """Renvoie les secondes extrémités"""
+        return context.geometry.PointArray._new(self._end.copy())
+
+    @property
+    def midpoints(self) -> context.geometry.PointArray:
+        """Renvoie les milieux des segments"""
+        return context.geometry.PointArray._new((self._start + self._end) * 0.5)
+
+    @property
+    def vectors(self) -> context.geometry.VectorArray:
+        """Renvoie les vecteurs départ -> arrivée (non normalisés)"""
+        return context.geometry.VectorArray._new(self._end - self._start)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Renvoie la longueur de chaque segment"""
+        diff = self._end - self._start
+        return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+    @property
+    def array(self) -> np.ndarray:
+        """Renvoie une copie sous forme d'array (n, 2, d)"""
+        return np.stack((self._start, self._end), axis=1)
+
+    # ======================================== CONVERSIONS ========================================
+    @classmethod
+    def from_segments(cls, segments: Iterable[context.geometry.Segment], dim: int = None) -> SegmentArrayObject:
+        """
+        Construit un tableau à partir de segments
+
+        Args:
+            segments (Iterable[context.geometry.Segment]) : segments ou couples d'extrémités
+            dim (int, optional) : dimension imposée
+        """
+        return cls(segments, dim=dim)
+
+    def to_segments(self) -> list[context.geometry.Segment]:
+        """Renvoie la liste des segments"""
+        new_point, new_segment = context.geometry.Point._new, context.geometry.Segment._new
+        starts = np.round(self._start, self.PRECISION).tolist()
+        ends = np.round(self._end, self.PRECISION).tolist()
+        return [new_segment(new_point(a), new_point(b)) for a, b in zip(starts, ends)]
+
+    def to_tuple(self) -> tuple[tuple[tuple[float]]]:
+        """Renvoie les extrémités en tuple de couples"""
+        return tuple(zip(map(tuple, self._start.tolist()), map(tuple, self._end.tolist())))
+
+    def to_list(self) -> list[list[list[float]]]:
+        """Renvoie les extrémités en liste de couples"""
+        return self.array.tolist()
+
+    def copy(self) -> SegmentArrayObject:
+        """Renvoie une copie du tableau"""
+        return SegmentArrayObject._new(self._start.copy(), self._end.copy())
+
+    # ======================================== TRANSFORMATIONS ========================================
+    def translate(self, vector: object):
+        """
+        Translate les segments
+
+        Args:
+            vector (Vector | VectorArray | np.ndarray) : vecteur commun ou un vecteur par segment
+        """
+        offsets = _to_rows(vector, self.dim, method='translate', message='Invalid vector argument')
+        if offsets.ndim == 2 and offsets.shape[0] != self.n:
+            _raise_error(self, 'translate', f'Need {self.n} vectors, got {offsets.shape[0]}')
+        self._start += offsets
+        self._end += offsets
+
+    def rotate(self, angle: Real, center: context.geometry.Point = None, degrees: bool = False):
+        """
+        Tourne les segments autour d'un centre (2D)
+
+        Args:
+            angle (Real) : angle de rotation
+            center (context.geometry.Point, optional) : centre de rotation (défaut: origine)
+            degrees (bool) : si True, angle en degrés
+        """
+        if not isinstance(angle, Real):
+            _raise_error(self, 'rotate', 'Invalid angle argument')
+        if self.dim != 2:
+            _raise_error(self, 'rotate', 'Rotation is only defined in 2D')
+        center = np.zeros(2) if center is None else _to_rows(context.geometry._to_point(center), 2, method='rotate')
+        matrix = _rotation_matrix(angle, degrees=degrees)
+        self._start = (self._start - center) @ matrix + center
+        self._end = (self._end - center) @ matrix + center
+
+    def scale(self, ratio: Real, center: context.geometry.Point = None):
+        """
+        Redimensionne les segments depuis un centre
+
+        Args:
+            ratio (Real) : ratio de redimensionnement
+            center (context.geometry.Point, optional) : centre de redimensionnement (défaut: origine)
+        """
+        if not isinstance(ratio, Real) or ratio <= 0:
+            _raise_error(self, 'scale', 'Invalid ratio argument')
+        center = np.zeros(self.dim) if center is None else _to_rows(context.geometry._to_point(center), self.dim, method='scale')
+        self._start = (self._start - center) * ratio + center
+        self._end = (self._end - center) * ratio + center
+
+    # ======================================== REQUETES ========================================
+    def project(self, point: context.geometry.Point) -> context.geometry.PointArray:
+        """
+        Renvoie le projeté d'un point sur chaque segment
+
+        Args:
+            point (context.geometry.Point) : point à projeter
+        """
+        point = _to_rows(context.geometry._to_point(point), self.dim, method='project')
+        return context.geometry.PointArray._new(self._project(point))
+
+    def _project(self, point: np.ndarray) -> np.ndarray:
+        """Implémentation interne de project"""
+        u = self._end - self._start
+        uu = np.einsum('ij,ij->i', u, u)
+        t = np.divide(np.einsum('ij,ij->i', point - self._start, u), uu, out=np.zeros_like(uu), where=uu > 0)
+        np.clip(t, 0.0, 1.0, out=t)
+        return self._start + t[:, None] * u
+
+    def distances(self, point: context.geometry.Point) -> np.ndarray:
+        """
+        Renvoie la distance d'un point à chaque segment
+
+        Args:
+            point (context.geometry.Point) : point de référence
+        """
+        point = _to_rows(context.geometry._to_point(point), self.dim, method='distances')
+        diff = self._project(point) - point
+        return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+    def nearest(self, point: context.geometry.Point) -> tuple[int, float]:
+        """
+        Renvoie l'indice et la distance du segment le plus proche d'un point donné
+
+        Args:
+            point (context.geometry.Point) : point de référence
+        """
+        distances = self.distances(point)
+        i = int(np.argmin(distances))
+        return i, float(distances[i])
+
+    def bounding_box(self) -> tuple[context.geometry.Point, context.geometry.Point]:
+        """Renvoie les coins minimal et maximal de la boîte englobante"""
+        low = np.minimum(self._start.min(axis=0), self._end.min(axis=0))
+        high = np.maximum(self._start.max(axis=0), self._end.max(axis=0))
+        return context.geometry.Point(*low), context.geometry.Point(*high)
@@ -1,24 +1,53 @@
 # ======================================== IMPORTS ========================================
 from __future__ import annotations
 from ._core import *
+from operator import mul
+
+# ======================================== CONSTANTES ========================================
+FAST_DIM = 3    # dimension maximale stockée en flottants Python (au-delà : numpy)
+_NATIVE = {float, int}
 
 # ======================================== OBJET ========================================
 class VectorObject:
     """
     Objet géométrique nD : Vecteur
+
+    Stockage:
+        dim <= FAST_DIM : liste de flottants Python (chemin rapide 2D / 3D)
+        dim > FAST_DIM : array numpy float64 (calcul nD)
     """
     __slots__ = ["_v"]
     PRECISION = 9
+    _RELEASE = {"__init__": "_init_release"}    # chemins rapides du mode release
     def __init__(self, *components: Real):
         if len(components) == 0: _raise_error(self, '__init__', 'Vector must have at least 1 component')
-        while any(not isinstance(c, Real) for c in components):
+        while not all(type(c) in _NATIVE or isinstance(c, Real) for c in components):
             if len(components) == 1 and isinstance(components[0], Sequence): components = components[0]
             else: _raise_error(self, '__init__', 'Invalid components arguments')
-        self._v = np.round(np.array(components, dtype=np.float32), self.PRECISION)
+        self._v = self._store(components)
+
+    def _init_release(self, *components: Real):
+        """Constructeur du mode release (composantes supposées valides)"""
+        if len(components) == 1 and isinstance(components[0], Sequence): components = components[0]
+        self._v = self._store(components)
+
+    @staticmethod
+    def _store(components: Iterable[Real]) -> list[float] | np.ndarray:
+        """Choisit la représentation interne selon la dimension"""
+        if len(components) <= FAST_DIM:
+            return [float(c) for c in components]
+        return np.array(components, dtype=np.float64)
+
+    @classmethod
+    def _new(cls, components: list[float] | np.ndarray) -> VectorObject:
+        """Construit un vecteur sans vérification (composantes déjà valides)"""
+        vector = object.__new__(cls)
+        vector._v = components if (type(components) is list) == (len(components) <= FAST_DIM) else cls._store(components)
+        return vector
 
     def __repr__(self) -> str:
         """Représentation du vecteur"""
-        return f"Vector({', '.join(map(str, self._v))})"
+        return f"Vector({', '.join(map(str, self.to_tuple()))})"
     
     def __iter__(self) -> Iterator[float]:
         """Itération sur le vecteur"""
@@ -27,7 +56,11 @@ class VectorObject:
     def __hash__(self) -> int:
        """Renvoie le vecteur hashé"""
        self.reshape(0)
-       return hash(self.to_tuple())
+       return hash(self._rounded())
+
+    def _rounded(self) -> tuple[float]:
+        """Renvoie les composantes arrondies à PRECISION (comparaison et hash)"""
+        return tuple(round(c, self.PRECISION) for c in self.to_tuple())
     
     @staticmethod
     def _compute_rank(matrix: list[list[float]], epsilon: float = 1e-10) -> int:
@@ -69,35 +102,37 @@ class VectorObject:
     @property
     def x(self) -> float:
         """Renvoie la composante x du vecteur"""
-        return self[0]
+        return float(self._v[0])
     
     @property
     def y(self) -> float:
         """Renvoie la composante y du vecteur"""
-        return self[1]
+        return float(self._v[1]) if len(self._v) > 1 else 0.0
     
     @property
     def z(self) -> float:
         """Renvoie la composante z du vecteur"""
-        return self[2]
+        return float(self._v[2]) if len(self._v) > 2 else 0.0
     
     @property
     def array(self) -> np.ndarray:
         """Renvoie le vecteur sous forme d'array numpy"""
-        return self._v.copy()
+        return np.array(self._v, dtype=np.float64)
     
     @property
     def dim(self) -> int:
         """Renvoie la dimension du vecteur"""
-        return self._v.shape[0]
+        return len(self._v)
     
     def __len__(self) -> int:
         """Renvoie la dimension du vecteur"""
-        return self._v.shape[0]
+        return len(self._v)
     
     @property
     def norm(self) -> float:
         """Renvoie la norme du vecteur"""
+        if type(self._v) is list:
+            return math.hypot(*self._v)
         return float(np.linalg.norm(self._v))
     
     def __abs__(self) -> float:
@@ -108,14 +143,17 @@ class VectorObject:
     def normalized(self) -> context.geometry.Vector:
         """Renvoie le vecteur normalisé"""
         if self.is_null(): _raise_error(self, 'normalized', 'Cannot normalize null vector')
-        return context.geometry.Vector(*(self / self.norm))
+        norm = self.norm
+        if type(self._v) is list:
+            return VectorObject._new([c / norm for c in self._v])
+        return VectorObject._new(self._v / norm)
     
     # ======================================== SETTERS ========================================
     def __setitem__(self, i: int, r: Real):
         """Fixe la composante de rang i du vecteur"""
         if not isinstance(r, Real): _raise_error(self, '__setitem__', 'Invalid r argument')
         self.reshape(-i-1)
-        self._v[i] = np.round(np.float32(r), self.PRECISION)
+        self._v[i] = float(r)
 
     @x.setter
     def x(self, x: Real) :
@@ -135,42 +173,46 @@ class VectorObject:
     @norm.setter
     def norm(self, norm: Real):
         """Fixe la norme du vecteur"""
-        self._v = (self.normalized * np.float32(norm)).array
+        self._v = (self.normalized * float(norm))._v
 
     def set_norm(self, norm: Real):
         """Fixe la norme du vecteur"""
-        self._v = (self.normalized * np.float32(norm)).array
+        self._v = (self.normalized * float(norm))._v
 
     # ======================================== OPERATIONS ========================================
     def __add__(self, vector: context.geometry.Vector) -> context.geometry.Vector:
         """addition vectorielle"""
         vector = context.geometry._to_vector(vector, method='__add__', raised=False)
         if vector is None: return NotImplemented
-        self._equalize(vector)
-        return context.geometry.Vector(*(self.array + vector.array))
+        if len(self._v) != len(vector._v): self._equalize(vector)
+        if type(self._v) is list:
+            return VectorObject._new([a + b for a, b in zip(self._v, vector._v)])
+        return VectorObject._new(self._v + vector._v)
 
     def __sub__(self, vector: context.geometry.Vector) -> context.geometry.Vector:
         """Soustraction vectorielle"""
         vector = context.geometry._to_vector(vector, method='__sub__', raised=False)
         if vector is None: return NotImplemented
-        self._equalize(vector)
-        return context.geometry.Vector(*(self.array - vector.array))
+        if len(self._v) != len(vector._v): self._equalize(vector)
+        if type(self._v) is list:
+            return VectorObject._new([a - b for a, b in zip(self._v, vector._v)])
+        return VectorObject._new(self._v - vector._v)
     
     def __mul__(self, scalar: Real) -> context.geometry.Vector:
         """Multiplication par un scalaire"""
         if not isinstance(scalar, Real): return NotImplemented
-        return context.geometry.Vector(*(self.array * float(scalar)))
+        return self._scaled(float(scalar))
     
     def __rmul__(self, scalar: Real) -> context.geometry.Vector:
         """Multiplication par un scalaire (inversée)"""
         if not isinstance(scalar, Real): return NotImplemented
-        return context.geometry.Vector(*(self.array * float(scalar)))
+        return self._scaled(float(scalar))
     
     def __truediv__(self, scalar: Real) -> context.geometry.Vector:
         """Division par un scalaire"""
         if not isinstance(scalar, Real): return NotImplemented
         if scalar == 0: _raise_error(self, '__truediv__', 'Cannot divide by zero')
-        return context.geometry.Vector(*(self.array / float(scalar)))
+        return self._scaled(1.0 / float(scalar))
     
     def __rtruediv__(self, vector: context.geometry.Vector) -> float:
         """Rapport scalaire entre deux vecteurs colinéaires"""
@@ -196,19 +238,27 @@ class VectorObject:
     
     def __pos__(self) -> context.geometry.Vector:
         """Copie"""
-        return context.geometry.Vector(*self.array)
+        return self.copy()
 
     def __neg__(self) -> context.geometry.Vector:
         """Opposé"""
-        return context.geometry.Vector(*(-self.array))
+        if type(self._v) is list:
+            return VectorObject._new([-c for c in self._v])
+        return VectorObject._new(-self._v)
+
+    def _scaled(self, scalar: float) -> context.geometry.Vector:
+        """Renvoie le vecteur multiplié par un flottant (sans vérification)"""
+        if type(self._v) is list:
+            return VectorObject._new([c * scalar for c in self._v])
+        return VectorObject._new(self._v * scalar)
     
     # ======================================== COMPARATEURS ========================================
     def __eq__(self, vector: context.geometry.Vector) -> bool:
-        """Vérifie la correspondance de deux vecteurs"""
+        """Vérifie la correspondance de deux vecteurs (à PRECISION près)"""
         vector = context.geometry._to_vector(vector, raised=False)
         if vector is None:return False
         self._equalize(vector)
-        return all(self[i] == vector[i] for i in range(self.dim))
+        return self._rounded() == vector._rounded()
     
     def __contains__(self, r: Real) -> bool:
         """Vérifie que le vecteur contienne une composante spécifique"""
@@ -219,7 +269,9 @@ class VectorObject:
     # ======================================== PREDICATS ========================================
     def is_null(self) -> bool:
         """Vérifie que le vecteur soit nul"""
-        return np.all(self._v == 0)
+        if type(self._v) is list:
+            return not any(self._v)
+        return not self._v.any()
     
     def __bool__(self) -> bool:
         """Vérifie que le vecteur ne soit pas nul"""
@@ -232,14 +284,14 @@ class VectorObject:
         Args:
             vector (context.geometry.Vector) : second vecteur
         """
-        context.geometry._to_vector(vector, method='is_orthogonal')
+        vector = context.geometry._to_vector(vector, method='is_orthogonal')
         return self._is_orthogonal(vector)
     
     def _is_orthogonal(self, vector: context.geometry.Vector) -> bool:
         """Implémentation interne de is_orthogonal"""
         if self.is_null() or vector.is_null():
             return True
-        return np.isclose(self._dot(vector), 0)
+        return abs(self._dot(vector)) <= 1e-8
 
     def is_collinear(self, vector: context.geometry.Vector) -> bool:
         """
@@ -255,7 +307,7 @@ class VectorObject:
         """Implémentation interne de is_collinear"""
         if self.is_null() or vector.is_null():
             return True
-        return abs(self._dot(vector)) == self.norm * vector.norm
+        return math.isclose(abs(self._dot(vector)), self.norm * vector.norm, rel_tol=10**-self.PRECISION)
     
     def is_coplanar(self, *vectors: context.geometry.Vector) -> bool:
         """
@@ -289,19 +341,23 @@ class VectorObject:
     # ======================================== METHODES INTERACTIVES ========================================
     def copy(self) -> context.geometry.Vector:
         """Renvoie une copie du vecteur"""
-        return context.geometry.Vector(*self.array)
+        return VectorObject._new(self._v.copy())
     
     def to_tuple(self) -> tuple[float]:
         """Renvoie les composantes du vecteur en tuple"""
-        return tuple(map(float, self.array))
+        if type(self._v) is list:
+            return tuple(self._v)
+        return tuple(map(float, self._v))
     
     def to_list(self) -> list[float]:
         """Renvoie les composantes du vecteur en liste"""
-        return list(map(float, self.array))
+        if type(self._v) is list:
+            return self._v.copy()
+        return list(map(float, self._v))
     
     def normalize(self):
         """Normalise le vecteur"""
-        self._v = self.normalized.array
+        self._v = self.normalized._v
     
     def reshape(self, dim: int=0):
         """
@@ -315,13 +371,16 @@ class VectorObject:
         """
         if not isinstance(dim, int): _raise_error(self, 'reshape', 'Invalid dim argument')
         if dim == 0:
-            self._v = self._v[: np.max(np.nonzero(self._v)[0]) + 1] if np.any(self._v != 0) else np.array([0.0], dtype=np.float32)
+            components = self.to_list()
+            while len(components) > 1 and components[-1] == 0:
+                components.pop()
+            self._v = self._store(components)
         elif dim < 0:
             if self.dim < abs(dim): self.reshape(abs(dim))
-        elif dim <= self.dim:
-            self._v = np.array(self._v[:dim], dtype=np.float32)
-        else:
-            self._v = np.concatenate([self._v, np.zeros(dim - len(self), dtype=np.float32)])
+        elif dim != self.dim:
+            components = self.to_list()[:dim]
+            components.extend([0.0] * (dim - len(components)))
+            self._v = self._store(components)
 
     def equalize(self, *objs: Reshapable):
         """
@@ -335,9 +394,10 @@ class VectorObject:
     
     def _equalize(self, *objs: Reshapable):
         """Implémentation interne de equalize"""
-        if not any(obj.dim != objs[0].dim for obj in objs): return objs
-        objs = {self, *objs}
-        dim = max(objs, key=lambda o: o.dim).dim
+        dim = len(self._v)
+        if all(obj.dim == dim for obj in objs): return objs
+        objs = (self, *objs)
+        dim = max(obj.dim for obj in objs)
         for obj in objs:
             obj.reshape(dim)
 
@@ -353,8 +413,10 @@ class VectorObject:
     
     def _dot(self, vector: context.geometry.Vector) -> float:
         """Implémentation interne de dot"""
-        self._equalize(vector)
-        return float(np.dot(self.array, vector.array))
+        if len(self._v) != len(vector._v): self._equalize(vector)
+        if type(self._v) is list:
+            return sum(map(mul, self._v, vector._v))
+        return float(np.dot(self._v, vector._v))
     
     def cross(self, vector: context.geometry.Vector) -> context.geometry.Vector:
         """
@@ -367,9 +429,13 @@ class VectorObject:
         return self._cross(vector)
     
     def _cross(self, vector: context.geometry.Vector) -> context.geometry.Vector:
-        """Implémentation interne de cross"""
+        """Implémentation interne de cross (les vecteurs 1D / 2D sont plongés en 3D)"""
         self._equalize(vector)
-        return context.geometry.Vector(*np.cross(self.array, vector.array))
+        if self.dim > FAST_DIM:
+            return VectorObject._new(np.cross(self._v, vector._v))
+        x1, y1, z1 = (*self._v, 0.0, 0.0)[:3]
+        x2, y2, z2 = (*vector._v, 0.0, 0.0)[:3]
+        return VectorObject._new([y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2])
     
     def angle_with(self, vector: context.geometry.Vector, degrees: bool=False) -> float:
         """
@@ -387,7 +453,7 @@ class VectorObject:
         """Implémentation interne de angle_with"""
         cos_angle = self._dot(vector) / (self.norm * vector.norm)
         cos_angle = max(-1.0, min(1.0, cos_angle))  # Clamp pour éviter les erreurs d'arrondi
-        angle = float(np.arccos(cos_angle))
+        angle = math.acos(cos_angle)
         if degrees:
             return math.degrees(angle)
         return angle
@@ -404,7 +470,7 @@ class VectorObject:
     
     def _projection(self, vector: context.geometry.Vector) -> context.geometry.Vector:
         """Implémentation interne de projection"""
-        return (vector._dot(self) / self._dot(self)) * self
+        return self._scaled(vector._dot(self) / self._dot(self))
     
     def distance(self, vector: context.geometry.Vector) -> float:
         """
@@ -418,4 +484,7 @@ class VectorObject:
     
     def _distance(self, vector: context.geometry.Vector) -> float:
         """Implémentation interne de distance"""
-        return (self - vector).norm
\ No newline at end of file
+        self._equalize(vector)
+        if type(self._v) is list:
+            return math.dist(self._v, vector._v)
+        return float(np.linalg.norm(self._v - vector._v))
@@ -0,0 +1,246 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from ._core import *
+
+# ======================================== OBJET ========================================
+class VectorArrayObject:
+    """
+    Collection géométrique nD : Tableau de vecteurs
+
+    Stockage:
+        array numpy contigu float64 de forme (n, d)
+    """
+    __slots__ = ["_data"]
+    PRECISION = 9
+
+    def __init__(self, vectors: Iterable[context.geometry.Vector] | np.ndarray, dim: int = None):
+        """
+        Args:
+            vectors (Iterable[context.geometry.Vector] | np.ndarray) : vecteurs ou array de forme (n, d)
+            dim (int, optional) : dimension imposée (défaut: dimension maximale des vecteurs)
+        """
+        if dim is not None and (not isinstance(dim, int) or dim <= 0):
+            _raise_error(self, '__init__', 'Invalid dim argument')
+        if not isinstance(vectors, np.ndarray) and not hasattr(vectors, '_data'):
+            vectors = [v.to_list() if isinstance(v, context.geometry.Vector) else v for v in vectors]
+        self._data = context.geometry.PointArray._to_data(vectors, dim, method='__init__')
+
+    @classmethod
+    def _new(cls, data: np.ndarray) -> VectorArrayObject:
+        """Construit un tableau sans vérification (data contigu float64 de forme (n, d))"""
+        array = object.__new__(cls)
+        array._data = data
+        return array
+
+    def __repr__(self) -> str:
+        """Représentation du tableau"""
+        return f"VectorArray(n={self.n}, dim={self.dim})"
+
+    def __iter__(self) -> Iterator[context.geometry.Vector]:
+        """Itération sur les vecteurs"""
+        return iter(self.to_vectors())
+
+    def __hash__(self) -> int:
+        """Renvoie le tableau hashé"""
+        return hash((self._data.shape, np.round(self._data, self.PRECISION).tobytes()))
+
+    # ======================================== GETTERS ========================================
+    def __getitem__(self, i: int | slice | np.ndarray) -> context.geometry.Vector | VectorArrayObject:
+        """Renvoie le vecteur de rang i, ou un sous-tableau (slice, masque ou indices)"""
+        if isinstance(i, (int, np.integer)):
+            return context.geometry.Vector._new(self._data[i].tolist())
+        return VectorArrayObject._new(np.ascontiguousarray(self._data[i]))
+
+    @property
+    def array(self) -> np.ndarray:
+        """Renvoie une copie de l'array (n, d)"""
+        return self._data.copy()
+
+    @property
+    def x(self) -> np.ndarray:
+        """Renvoie les composantes x"""
+        return self._data[:, 0].copy()
+
+    @property
+    def y(self) -> np.ndarray:
+        """Renvoie les composantes y"""
+        return self._data[:, 1].copy() if self.dim > 1 else np.zeros(self.n)
+
+    @property
+    def n(self) -> int:
+        """Renvoie le nombre de vecteurs"""
+        return self._data.shape[0]
+
+    def __len__(self) -> int:
+        """Renvoie le nombre de vecteurs"""
+        return self._data.shape[0]
+
+    @property
+    def dim(self) -> int:
+        """Renvoie la dimension des vecteurs"""
+        return self._data.shape[1]
+
+    @property
+    def norms(self) -> np.ndarray:
+        """Renvoie la norme de chaque vecteur"""
+        return np.sqrt(np.einsum('ij,ij->i', self._data, self._data))
+
+    @property
+    def normalized(self) -> VectorArrayObject:
+        """Renvoie les vecteurs normalisés (les vecteurs nuls restent nuls)"""
+        norms = self.norms
+        return VectorArrayObject._new(np.divide(self._data, norms[:, None], out=np.zeros_like(self._data), where=norms[:, None] > 0))
+
+    # ======================================== SETTERS ========================================
+    def __setitem__(self, i: int | slice | np.ndarray, vectors: object):
+        """Fixe le vecteur de rang i (ou plusieurs vecteurs)"""
+        self._data[i] = _to_rows(vectors, self.dim, method='__setitem__', message='Invalid vectors argument')
+
+    # ======================================== OPERATIONS ========================================
+    def __add__(self, vectors: object) -> VectorArrayObject:
+        """Addition vectorielle (vecteur commun ou terme à terme)"""
+        rows = _to_rows(vectors, self.dim, raised=False)
+        if rows is None: return NotImplemented
+        return VectorArrayObject._new(self._data + rows)
+
+    def __radd__(self, vectors: object) -> VectorArrayObject:
+        """Addition vectorielle (vecteur commun ou terme à terme)"""
+        return self.__add__(vectors)
+
+    def __sub__(self, vectors: object) -> VectorArrayObject:
+        """Soustraction vectorielle (vecteur commun ou terme à terme)"""
+        rows = _to_rows(vectors, self.dim, raised=False)
+        if rows is None: return NotImplemented
+        return VectorArrayObject._new(self._data - rows)
+
+    def __mul__(self, scalar: Real | np.ndarray) -> VectorArrayObject:
+        """Multiplication par un scalaire (ou un scalaire par vecteur)"""
+        if isinstance(scalar, np.ndarray) and scalar.ndim == 1:
+            scalar = scalar[:, None]
+        elif not isinstance(scalar, (Real, np.ndarray)):
+            return NotImplemented
+        return VectorArrayObject._new(self._data * scalar)
+
+    def __rmul__(self, scalar: Real | np.ndarray) -> VectorArrayObject:
+        """Multiplication par un scalaire (inversée)"""
+        return self.__mul__(scalar)
+
+    def __truediv__(self, scalar: Real | np.ndarray) -> VectorArrayObject:
+        """Division par un scalaire (ou un scalaire par vecteur)"""
+        if isinstance(scalar, np.ndarray) and scalar.ndim == 1:
+            scalar = scalar[:, None]
+        elif not isinstance(scalar, (Real, np.ndarray)):
+            return NotImplemented
+        if np.any(np.asarray(scalar) == 0): _raise_error(self, '__truediv__', 'Cannot divide by zero')
+        return VectorArrayObject._new(self._data / scalar)
+
+    def __neg__(self) -> VectorArrayObject:
+        """Opposé"""
+        return VectorArrayObject._new(-self._data)
+
+    # ======================================== COMPARATEURS ========================================
+    def __eq__(self, vectors: object) -> bool:
+        """Vérifie la correspondance de deux tableaux (à PRECISION près)"""
+        if not isinstance(vectors, VectorArrayObject) or vectors._data.shape != self._data.shape:
+            return False
+        return bool(np.all(np.abs(self._data - vectors._data) <= 10**-self.PRECISION))
+
+    # ======================================== CONVERSIONS ========================================
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[context.geometry.Vector], dim: int = None) -> VectorArrayObject:
+        """
+        Construit un tableau à partir de vecteurs
+
+        Args:
+            vectors (Iterable[context.geometry.Vector]) : vecteurs ou composantes
+            dim (int, optional) : dimension imposée
+        """
+        return cls(vectors, dim=dim)
+
+    def to_vectors(self) -> list[context.geometry.Vector]:
+        """Renvoie la liste des vecteurs"""
+        new = context.geometry.Vector._new
+        return [new(row) for row in self._data.tolist()]
+
+    def to_points(self) -> context.geometry.PointArray:
+        """Renvoie les extrémités des vecteurs placés à l'origine"""
+        return context.geometry.PointArray._new(self._data.copy())
+
+    def to_tuple(self) -> tuple[tuple[float]]:
+        """Renvoie les composantes en tuple de tuples"""
+        return tuple(map(tuple, self._data.tolist()))
+
+    def to_list(self) -> list[list[float]]:
+        """Renvoie les composantes en liste de listes"""
+        return self._data.tolist()
+
+    def copy(self) -> VectorArrayObject:
+        """Renvoie une copie du tableau"""
+        return VectorArrayObject._new(self._data.copy())
+
+    # ======================================== TRANSFORMATIONS ========================================
+    def normalize(self):
+        """Normalise les vecteurs (les vecteurs nuls restent nuls)"""
+        self._data = self.normalized._data
+
+    def rotate(self, angle: Real, degrees: bool = False):
+        """
+        Tourne les vecteurs (2D)
+
+        Args:
+            angle (Real) : angle de rotation
+            degrees (bool) : si True, angle en degrés
+        """
+        if not isinstance(angle, Real):
+            _raise_error(self, 'rotate', 'Invalid angle argument')
+        if self.dim != 2:
+            _raise_error(self, 'rotate', 'Rotation is only defined in 2D')
+        self._data = self._data @ _rotation_matrix(angle, degrees=degrees)
+
+    def scale(self, ratio: Real | np.ndarray):
+        """
+        Multiplie les vecteurs
+
+        Args:
+            ratio (Real | np.ndarray) : ratio commun ou un ratio par vecteur
+        """
+        scaled = self.__mul__(ratio)
+        if scaled is NotImplemented:
+            _raise_error(self, 'scale', 'Invalid ratio argument')
+        self._data = scaled._data
+
+    # ======================================== PRODUITS ========================================
+    def dot(self, vectors: object) -> np.ndarray:
+        """
+        Renvoie les produits scalaires (vecteur commun ou terme à terme)
+
+        Args:
+            vectors (Vector | VectorArray | np.ndarray) : second(s) vecteur(s)
+        """
+        rows = _to_rows(vectors, self.dim, method='dot', message='Invalid vectors argument')
+        return self._data @ rows if rows.ndim == 1 else np.einsum('ij,ij->i', self._data, rows)
+
+    def cross(self, vectors: object) -> np.ndarray:
+        """
+        Renvoie les produits vectoriels (composante z en 2D, vecteurs (n, 3) en 3D)
+
+        Args:
+            vectors (Vector | VectorArray | np.ndarray) : second(s) vecteur(s)
+        """
+        if self.dim not in (2, 3):
+            _raise_error(self, 'cross', 'Cross product is only defined in 2D and 3D')
+        rows = _to_rows(vectors, self.dim, method='cross', message='Invalid vectors argument')
+        if self.dim == 2:
+            rows = np.broadcast_to(rows, self._data.shape)
+            return self._data[:, 0] * rows[:, 1] - self._data[:, 1] * rows[:, 0]
+        return np.cross(self._data, rows)
+
+    def angles(self, degrees: bool = False) -> np.ndarray:
+        """
+        Renvoie l'angle polaire de chaque vecteur (2D)
+
+        Args:
+            degrees (bool) : si True, angles en degrés
+        """
+        angles = np.arctan2(self._data[:, 1], self._data[:, 0]) if self.dim > 1 else np.where(self._data[:, 0] < 0, np.pi, 0.0)
+        return np.degrees(angles) if degrees else angles
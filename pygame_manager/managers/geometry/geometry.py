@@ -7,6 +7,9 @@ from ._line import LineObject
 from ._circle import CircleObject
 from ._rect import RectObject
 from ._polygon import PolygonObject
+from ._point_array import PointArrayObject
+from ._vector_array import VectorArrayObject
+from ._segment_array import SegmentArrayObject
 
 # ======================================== GESTIONNAIRE ========================================
 class GeometryManager:
@@ -15,7 +18,17 @@ class GeometryManager:
 
     Fonctionnalités:
         manipulation vectorielle
+        collections vectorisées (PointArray, VectorArray, SegmentArray)
+        collisions vectorisées (*_many)
+        collisions continues (*_sweep, sweep)
+        lancer de rayons par lots (raycast, visibility_polygon)
     """
+    CHUNK = 1 << 20     # nombre maximal de paires testées par bloc
+    RAY_TILE = 256      # nombre de rayons voisins traités ensemble
+    RAY_GRID = 16       # résolution de la grille de regroupement des origines
+    RAY_EPSILON = 1e-4  # décalage angulaire autour des sommets (visibility_polygon)
+    RAY_ARC_SAMPLES = 32    # échantillons angulaires par arc (visibility_polygon)
+
     def __init__(self):
         self.Vector = VectorObject
         self.Point = PointObject
@@ -25,6 +38,10 @@ class GeometryManager:
         self.Rect = RectObject
         self.Polygon = PolygonObject
 
+        self.PointArray = PointArrayObject
+        self.VectorArray = VectorArrayObject
+        self.SegmentArray = SegmentArrayObject
+
     # ======================================== TRANSFORMATIONS INTERMEDIAIRE ========================================
     @staticmethod
     def _to_vector(vector: VectorObject | Iterable[Real], copy:bool=False, fallback: object=None, raised: bool=True, method: str='_to_vector', message: str='Invalid vector argument') -> VectorObject | object | None:
@@ -49,8 +66,8 @@ class GeometryManager:
         """Transforme l'objet en rect si besoin l'est"""
         if isinstance(rect, RectObject):
             return rect.copy() if copy else rect
-        elif isinstance(rect, pygame.Rect):
-            return RectObject((rect.x, rect.y), rect.width, rect.height)
+        elif isinstance(rect, PygameRect):
+            return RectObject.from_rect(rect)
         elif isinstance(rect, Sequence) and len(rect) == 4 and all(isinstance(c, Real) for c in rect):
             return RectObject(tuple(rect[:2]), *rect[2:])
         return fallback if fallback is not None else _raise_error(RectObject, method, message) if raised else None
@@ -313,7 +330,7 @@ class GeometryManager:
         
         dx, dy = x1 - ox, y1 - oy
         t = (dx * (-svy) - dy * (-svx)) / det
-        s = (dx * vy - dy * vx) / det
+        s = (dy * vx - dx * vy) / det
         
         if 0 <= s <= 1:
             return (ox + vx * t, oy + vy * t)
@@ -414,7 +431,7 @@ class GeometryManager:
         
         dx, dy = x3 - x1, y3 - y1
         t = (dx * (-vy2) - dy * (-vx2)) / det
-        s = (dx * vy1 - dy * vx1) / det
+        s = (dy * vx1 - dx * vy1) / det
         
         if 0 <= t <= 1 and 0 <= s <= 1:
             return (x1 + vx1 * t, y1 + vy1 * t)
@@ -534,7 +551,7 @@ class GeometryManager:
         
         return False
 
-    def rect_closest_point(px: float, py: float, left: float, top: float, right: float, bottom: float, border_radius: float = 0) -> tuple[float, float]:
+    def rect_closest_point(self, px: float, py: float, left: float, top: float, right: float, bottom: float, border_radius: float = 0) -> tuple[float, float]:
         """Point du rect le plus proche d'un point donné"""
         br = max(border_radius, 0)
         
@@ -604,6 +621,223 @@ class GeometryManager:
             return (dx / dist, dy / dist)
         return (0.0, -1.0)
 
+    # ======================================== COLLISIONS CONTINUES ========================================
+    def circle_circle_sweep(self, cx1: float, cy1: float, r1: float, dx: float, dy: float, cx2: float, cy2: float, r2: float) -> tuple | None:
+        """
+        Cercle (cx1, cy1, r1) déplacé de (dx, dy) contre un cercle fixe
+
+        Returns:
+            None : pas de contact sur le déplacement
+            (t, (px, py), (nx, ny)) : instant d'impact dans [0, 1], point de contact, normale (obstacle -> cercle mobile)
+        """
+        t = self._sweep_time(cx1 - cx2, cy1 - cy2, dx, dy, r1 + r2)
+        if t is None:
+            return None
+        nx, ny = self._sweep_normal(cx1 + t * dx - cx2, cy1 + t * dy - cy2, dx, dy)
+        return (t, (cx2 + nx * r2, cy2 + ny * r2), (nx, ny))
+
+    def circle_segment_sweep(self, cx: float, cy: float, r: float, dx: float, dy: float, x1: float, y1: float, x2: float, y2: float) -> tuple | None:
+        """
+        Cercle déplacé de (dx, dy) contre un segment fixe (capsule de rayon r autour du segment)
+
+        Returns:
+            None : pas de contact sur le déplacement
+            (t, (px, py), (nx, ny)) : instant d'impact dans [0, 1], point de contact, normale (obstacle -> cercle mobile)
+        """
+        if self.segment_point_distance(x1, y1, x2, y2, cx, cy) <= r:
+            t = 0.0
+        else:
+            candidates = [self._sweep_time(cx - x1, cy - y1, dx, dy, r), self._sweep_time(cx - x2, cy - y2, dx, dy, r)]
+
+            # flancs de la capsule : droites parallèles au segment à distance r
+            ex, ey = x2 - x1, y2 - y1
+            length_sq = ex**2 + ey**2
+            if length_sq > 0:
+                length = math.sqrt(length_sq)
+                nx, ny = -ey / length, ex / length
+                side = nx * (cx - x1) + ny * (cy - y1)
+                speed = nx * dx + ny * dy
+                if side * speed < 0:
+                    t = (math.copysign(r, side) - side) / speed
+                    u = ((cx + t * dx - x1) * ex + (cy + t * dy - y1) * ey) / length_sq
+                    if 0 <= t <= 1 and 0 <= u <= 1:
+                        candidates.append(t)
+
+            candidates = [t for t in candidates if t is not None]
+            if not candidates:
+                return None
+            t = min(candidates)
+
+        px, py = cx + t * dx, cy + t * dy
+        contact = self.segment_point_projection(x1, y1, x2, y2, px, py)
+        return (t, contact, self._sweep_normal(px - contact[0], py - contact[1], dx, dy))
+
+    def circle_rect_sweep(self, cx: float, cy: float, r: float, dx: float, dy: float, left: float, top: float, right: float, bottom: float, border_radius: float = 0) -> tuple | None:
+        """
+        Cercle déplacé de (dx, dy) contre un rect fixe (avec border_radius)
+
+        Returns:
+            None : pas de contact sur le déplacement
+            (t, (px, py), (nx, ny)) : instant d'impact dans [0, 1], point de contact, normale (obstacle -> cercle mobile)
+        """
+        # rect arrondi = rect intérieur dilaté de br, le cercle ajoute r : rect intérieur dilaté de R
+        br = max(0, min(border_radius, (right - left) / 2, (bottom - top) / 2))
+        il, it, ir, ib = left + br, top + br, right - br, bottom - br
+        R = r + br
+
+        qx, qy = max(il, min(cx, ir)), max(it, min(cy, ib))
+        if self.point_distance_sq(cx, cy, qx, qy) <= R**2:
+            t = 0.0
+        else:
+            # boîte dilatée de R (méthode des dalles)
+            t_in, t_out = 0.0, 1.0
+            for p, d, low, high in ((cx, dx, il - R, ir + R), (cy, dy, it - R, ib + R)):
+                if d == 0:
+                    if p < low or p > high:
+                        return None
+                    continue
+                t1, t2 = (low - p) / d, (high - p) / d
+                if t1 > t2:
+                    t1, t2 = t2, t1
+                t_in, t_out = max(t_in, t1), min(t_out, t2)
+                if t_in > t_out:
+                    return None
+            t = t_in
+
+            # entrée par une zone de coin : le contact se fait sur le disque de rayon R du coin (ou pas du tout)
+            hx, hy = cx + t * dx, cy + t * dy
+            if (hx < il or hx > ir) and (hy < it or hy > ib):
+                kx, ky = (il if hx < il else ir), (it if hy < it else ib)
+                t = self._sweep_time(cx - kx, cy - ky, dx, dy, R)
+                if t is None:
+                    return None
+
+        px, py = cx + t * dx, cy + t * dy
+        if left < px < right and top < py < bottom and self.rect_contains_point(px, py, left, top, right, bottom, br):
+            # centre déjà dans le rect : sortie par l'arrière du déplacement
+            return (t, (px, py), self._sweep_normal(0.0, 0.0, dx, dy))
+        contact = self.rect_closest_point(px, py, left, top, right, bottom, br)
+        return (t, contact, self.rect_collision_normal(contact[0], contact[1], left, top, right, bottom, br, px, py))
+
+    def circle_polygon_sweep(self, cx: float, cy: float, r: float, dx: float, dy: float, polygon: PolygonObject | Iterable) -> tuple | None:
+        """
+        Cercle déplacé de (dx, dy) contre un polygone fixe
+
+        Args:
+            polygon (PolygonObject | Iterable) : polygone ou sommets [(x, y), ...]
+
+        Returns:
+            None : pas de contact sur le déplacement
+            (t, (px, py), (nx, ny)) : instant d'impact dans [0, 1], point de contact, normale (obstacle -> cercle mobile)
+        """
+        coords = polygon._coords() if isinstance(polygon, PolygonObject) else [tuple(p[:2]) for p in polygon]
+        best = None
+        for (x1, y1), (x2, y2) in zip(coords, coords[1:] + coords[:1]):
+            hit = self.circle_segment_sweep(cx, cy, r, dx, dy, x1, y1, x2, y2)
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = hit
+                if hit[0] == 0:
+                    break
+        if (best is None or best[0] > 0) and self._polygon_contains(cx, cy, coords):
+            # centre à l'intérieur : sortie par le bord le plus proche
+            contact = min(
+                (self.segment_point_projection(x1, y1, x2, y2, cx, cy) for (x1, y1), (x2, y2) in zip(coords, coords[1:] + coords[:1])),
+                key=lambda q: self.point_distance_sq(cx, cy, q[0], q[1]),
+            )
+            return (0.0, contact, self._sweep_normal(contact[0] - cx, contact[1] - cy, dx, dy))
+        return best
+
+    def rect_rect_sweep(self, l1: float, t1: float, r1: float, b1: float, dx: float, dy: float, l2: float, t2: float, r2: float, b2: float) -> tuple | None:
+        """
+        Rect (l1, t1, r1, b1) déplacé de (dx, dy) contre un rect fixe (coins droits)
+
+        Returns:
+            None : pas de contact sur le déplacement
+            (t, (px, py), (nx, ny)) : instant d'impact dans [0, 1], point de contact, normale (obstacle -> rect mobile)
+        """
+        if l1 < r2 and r1 > l2 and t1 < b2 and b1 > t2:
+            # chevauchement initial : axe de moindre pénétration
+            t = 0.0
+            depth_x, depth_y = min(r1 - l2, r2 - l1), min(b1 - t2, b2 - t1)
+            if depth_x <= depth_y:
+                normal = (-1.0, 0.0) if l1 + r1 < l2 + r2 else (1.0, 0.0)
+            else:
+                normal = (0.0, -1.0) if t1 + b1 < t2 + b2 else (0.0, 1.0)
+        else:
+            times = []
+            for low1, high1, d, low2, high2 in ((l1, r1, dx, l2, r2), (t1, b1, dy, t2, b2)):
+                if d > 0:
+                    times.append(((low2 - high1) / d, (high2 - low1) / d))
+                elif d < 0:
+                    times.append(((high2 - low1) / d, (low2 - high1) / d))
+                elif high1 <= low2 or low1 >= high2:
+                    return None
+                else:
+                    times.append((-math.inf, math.inf))
+            (tx_in, tx_out), (ty_in, ty_out) = times
+            t_in, t_out = max(tx_in, ty_in), min(tx_out, ty_out)
+            if t_in >= t_out or t_in > 1 or t_in < 0:
+                return None
+            t = t_in
+            normal = (-math.copysign(1.0, dx), 0.0) if tx_in >= ty_in else (0.0, -math.copysign(1.0, dy))
+
+        # point de contact : milieu de la zone commune sur la face touchée
+        ml, mt, mr, mb = l1 + t * dx, t1 + t * dy, r1 + t * dx, b1 + t * dy
+        if normal[0]:
+            px = r2 if normal[0] > 0 else l2
+            py = (max(mt, t2) + min(mb, b2)) / 2
+        else:
+            px = (max(ml, l2) + min(mr, r2)) / 2
+            py = b2 if normal[1] > 0 else t2
+        return (t, (px, py), normal)
+
+    def sweep(self, shape: CircleObject | RectObject, vector: VectorObject | Iterable[Real], target: object) -> tuple | None:
+        """
+        Déplacement continu d'une forme contre un obstacle (pas d'effet tunnel)
+
+        Args:
+            shape (CircleObject | RectObject) : forme mobile
+            vector (VectorObject | Iterable[Real]) : déplacement sur la frame
+            target (SegmentObject | CircleObject | RectObject | PolygonObject | pygame.Rect) : obstacle fixe
+
+        Returns:
+            None : pas de contact sur le déplacement
+            (t, (px, py), (nx, ny)) : instant d'impact dans [0, 1], point de contact, normale (obstacle -> forme mobile)
+        """
+        vector = self._to_vector(vector, method='sweep')
+        if isinstance(target, PygameRect):
+            target = self._to_rect(target)
+        if not isinstance(shape, (CircleObject, RectObject)):
+            _raise_error(self, 'sweep', 'Moving shape must be a Circle or a Rect')
+        if not isinstance(target, (SegmentObject, CircleObject, RectObject, PolygonObject)):
+            _raise_error(self, 'sweep', 'Invalid target argument')
+        if isinstance(shape, RectObject) and isinstance(target, (SegmentObject, PolygonObject)):
+            _raise_error(self, 'sweep', 'Moving rects can only be swept against rects and circles')
+        return self._sweep(shape, vector.x, vector.y, target)
+
+    def _sweep(self, shape: CircleObject | RectObject, dx: float, dy: float, target: object) -> tuple | None:
+        """Implémentation interne de sweep"""
+        if isinstance(shape, CircleObject):
+            cx, cy, r = shape._center.x, shape._center.y, shape._radius
+            if isinstance(target, CircleObject):
+                return self.circle_circle_sweep(cx, cy, r, dx, dy, target._center.x, target._center.y, target._radius)
+            if isinstance(target, RectObject):
+                return self.circle_rect_sweep(cx, cy, r, dx, dy, target._x, target._y, target._x + target._width, target._y + target._height, target._border_radius)
+            if isinstance(target, SegmentObject):
+                return self.circle_segment_sweep(cx, cy, r, dx, dy, target._start.x, target._start.y, target._end.x, target._end.y)
+            return self.circle_polygon_sweep(cx, cy, r, dx, dy, target)
+
+        l, t, w, h = shape._x, shape._y, shape._width, shape._height
+        if isinstance(target, RectObject):
+            return self.rect_rect_sweep(l, t, l + w, t + h, dx, dy, target._x, target._y, target._x + target._width, target._y + target._height)
+
+        # rect mobile contre cercle fixe : cercle mobile en sens inverse, normale retournée
+        hit = self.circle_rect_sweep(target._center.x, target._center.y, target._radius, -dx, -dy, l, t, l + w, t + h, shape._border_radius)
+        if hit is None:
+            return None
+        time, (px, py), (nx, ny) = hit
+        return (time, (px + time * dx, py + time * dy), (-nx, -ny))
+
     # ======================================== LIGNE - POINT ========================================
     def line_point_distance(self, ox: float, oy: float, vx: float, vy: float, px: float, py: float) -> float:
         """Distance d'un point à une droite"""
@@ -638,6 +872,417 @@ class GeometryManager:
         t = max(0, min(1, ((px - x1) * vx + (py - y1) * vy) / v_len_sq))
         return (x1 + t * vx, y1 + t * vy)
 
+    # ======================================== COLLISIONS VECTORISEES ========================================
+    def circle_circle_collide_many(self, circles1: np.ndarray, circles2: np.ndarray = None, pairs: bool = False) -> np.ndarray:
+        """
+        Collisions cercles / cercles en une passe vectorisée
+
+        Args:
+            circles1 (np.ndarray) : cercles (n, 3) [cx, cy, r]
+            circles2 (np.ndarray, optional) : cercles (m, 3) (défaut: circles1 contre lui-même, paires i < j)
+            pairs (bool) : si True, renvoie les paires d'indices (k, 2) au lieu du masque (n, m)
+        """
+        A = self._to_shape_array(circles1, 3, method='circle_circle_collide_many', message='Invalid circles1 argument')
+        B = A if circles2 is None else self._to_shape_array(circles2, 3, method='circle_circle_collide_many', message='Invalid circles2 argument')
+
+        def kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+            dx = a[:, 0, None] - b[None, :, 0]
+            dy = a[:, 1, None] - b[None, :, 1]
+            rr = a[:, 2, None] + b[None, :, 2]
+            return dx * dx + dy * dy <= rr * rr
+
+        return self._collide_many(kernel, A, B, pairs=pairs, self_test=circles2 is None)
+
+    def circle_rect_collide_many(self, circles: np.ndarray, rects: np.ndarray, pairs: bool = False) -> np.ndarray:
+        """
+        Collisions cercles / rects (avec border_radius) en une passe vectorisée
+
+        Args:
+            circles (np.ndarray) : cercles (n, 3) [cx, cy, r]
+            rects (np.ndarray) : rects (m, 4) [left, top, right, bottom] ou (m, 5) [..., border_radius]
+            pairs (bool) : si True, renvoie les paires d'indices (k, 2) au lieu du masque (n, m)
+        """
+        A = self._to_shape_array(circles, 3, method='circle_rect_collide_many', message='Invalid circles argument')
+        B = self._to_rect_array(rects, method='circle_rect_collide_many')
+
+        def kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+            # rect arrondi = rect intérieur (réduit de br) dilaté d'un disque de rayon br
+            d_sq = self._inner_rect_distance_sq(a[:, 0, None], a[:, 1, None], b)
+            rr = a[:, 2, None] + b[None, :, 4]
+            return d_sq <= rr * rr
+
+        return self._collide_many(kernel, A, B, pairs=pairs)
+
+    def rect_contains_point_many(self, points: np.ndarray, rects: np.ndarray, pairs: bool = False) -> np.ndarray:
+        """
+        Appartenance points / rects (avec border_radius) en une passe vectorisée
+
+        Args:
+            points (np.ndarray) : points (n, 2) [px, py]
+            rects (np.ndarray) : rects (m, 4) [left, top, right, bottom] ou (m, 5) [..., border_radius]
+            pairs (bool) : si True, renvoie les paires d'indices (k, 2) au lieu du masque (n, m)
+        """
+        A = self._to_shape_array(points, 2, method='rect_contains_point_many', message='Invalid points argument')
+        B = self._to_rect_array(rects, method='rect_contains_point_many')
+
+        def kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+            d_sq = self._inner_rect_distance_sq(a[:, 0, None], a[:, 1, None], b)
+            return d_sq <= b[None, :, 4] ** 2
+
+        return self._collide_many(kernel, A, B, pairs=pairs)
+
+    def segment_segment_collide_many(self, segments1: np.ndarray, segments2: np.ndarray = None, pairs: bool = False) -> np.ndarray:
+        """
+        Collisions segments / segments en une passe vectorisée (segments parallèles : pas de collision)
+
+        Args:
+            segments1 (np.ndarray) : segments (n, 4) [x1, y1, x2, y2]
+            segments2 (np.ndarray, optional) : segments (m, 4) (défaut: segments1 contre lui-même, paires i < j)
+            pairs (bool) : si True, renvoie les paires d'indices (k, 2) au lieu du masque (n, m)
+        """
+        A = self._to_shape_array(segments1, 4, method='segment_segment_collide_many', message='Invalid segments1 argument')
+        B = A if segments2 is None else self._to_shape_array(segments2, 4, method='segment_segment_collide_many', message='Invalid segments2 argument')
+
+        def kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+            vx1, vy1 = (a[:, 2] - a[:, 0])[:, None], (a[:, 3] - a[:, 1])[:, None]
+            vx2, vy2 = (b[:, 2] - b[:, 0])[None, :], (b[:, 3] - b[:, 1])[None, :]
+            det = vy1 * vx2 - vx1 * vy2
+            dx = b[None, :, 0] - a[:, 0, None]
+            dy = b[None, :, 1] - a[:, 1, None]
+            valid = np.abs(det) >= 1e-10
+            safe = np.where(valid, det, 1.0)
+            t = (dy * vx2 - dx * vy2) / safe
+            s = (dy * vx1 - dx * vy1) / safe
+            return valid & (t >= 0) & (t <= 1) & (s >= 0) & (s <= 1)
+
+        return self._collide_many(kernel, A, B, pairs=pairs, self_test=segments2 is None)
+
+    # ======================================== RAYCASTING ========================================
+    def raycast(self, origins: object, directions: object, max_dist: Real | np.ndarray = math.inf, targets: Iterable[object] = ()) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Lance un lot de rayons et renvoie le premier impact de chacun
+
+        Args:
+            origins (PointArray | Point | np.ndarray) : origines (n, 2) ou origine commune
+            directions (VectorArray | Vector | np.ndarray) : directions (n, 2) non nulles ou direction commune
+            max_dist (Real | np.ndarray) : portée commune ou une portée par rayon
+            targets (Iterable) : formes visées (Segment, SegmentArray, Circle, Rect, Polygon)
+
+        Returns:
+            indices (n,) : rang de la forme touchée dans targets (-1 si aucune)
+            distances (n,) : distance à l'impact (inf si aucun)
+            points (n, 2) : points d'impact (nan si aucun)
+            normals (n, 2) : normales unitaires tournées vers le rayon (nan si aucun)
+        """
+        origins, directions, max_dist = self._to_rays(origins, directions, max_dist, method='raycast')
+        segments, arcs = self._ray_primitives(targets, method='raycast')
+        return self._raycast(origins, directions, max_dist, segments, arcs)
+
+    def _raycast(self, origins: np.ndarray, directions: np.ndarray, max_dist: np.ndarray, segments: np.ndarray, arcs: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Implémentation interne de raycast (directions unitaires)"""
+        n = origins.shape[0]
+        distances = max_dist.copy()
+        indices = np.full(n, -1, dtype=np.intp)
+        normals = np.full((n, 2), np.nan)
+        if n and (segments.shape[0] or arcs.shape[0]):
+            # boîtes englobantes des primitives et de la scène
+            seg_boxes = np.column_stack((np.minimum(segments[:, 0], segments[:, 2]), np.minimum(segments[:, 1], segments[:, 3]), np.maximum(segments[:, 0], segments[:, 2]), np.maximum(segments[:, 1], segments[:, 3])))
+            arc_boxes = np.column_stack((arcs[:, 0] - arcs[:, 2], arcs[:, 1] - arcs[:, 2], arcs[:, 0] + arcs[:, 2], arcs[:, 1] + arcs[:, 2]))
+            boxes = np.vstack((seg_boxes, arc_boxes))
+            scene = np.concatenate((boxes[:, :2].min(axis=0), boxes[:, 2:].max(axis=0)))
+
+            # portée utile : sortie de la scène (rayons infinis)
+            reach = np.minimum(max_dist, self._ray_box_exit(origins, directions, scene))
+            ends = origins + directions * np.where(np.isfinite(reach), reach, 0.0)[:, None]
+
+            # rayons regroupés par cellule d'origine pour que chaque tuile couvre une zone compacte
+            low, size = origins.min(axis=0), np.maximum(np.ptp(origins, axis=0), 1e-9)
+            cells = np.minimum((origins - low) / size * self.RAY_GRID, self.RAY_GRID - 1).astype(np.intp)
+            order = np.lexsort((np.arctan2(directions[:, 1], directions[:, 0]), cells[:, 1], cells[:, 0]))
+
+            for start in range(0, n, self.RAY_TILE):
+                tile = order[start:start + self.RAY_TILE]
+                tile = tile[reach[tile] >= 0]
+                if not tile.size:
+                    continue
+                left, top = np.minimum(origins[tile], ends[tile]).min(axis=0)
+                right, bottom = np.maximum(origins[tile], ends[tile]).max(axis=0)
+                near = (boxes[:, 0] <= right) & (boxes[:, 2] >= left) & (boxes[:, 1] <= bottom) & (boxes[:, 3] >= top)
+                selected = (segments[near[:segments.shape[0]]], arcs[near[segments.shape[0]:]])
+                for primitives, kernel in zip(selected, (self._ray_segment_kernel, self._ray_arc_kernel)):
+                    step = max(1, self.CHUNK // tile.size)
+                    for first in range(0, primitives.shape[0], step):
+                        block = primitives[first:first + step]
+                        t, nx, ny = kernel(origins[tile], directions[tile], block)
+                        best = np.argmin(t, axis=1)
+                        rows = np.arange(tile.size)
+                        t_best = t[rows, best]
+                        closer = t_best < distances[tile]
+                        if not closer.any():
+                            continue
+                        hit, pick = tile[closer], best[closer]
+                        distances[hit] = t_best[closer]
+                        indices[hit] = block[pick, -1].astype(np.intp)
+                        normals[hit, 0] = nx[rows[closer], pick]
+                        normals[hit, 1] = ny[rows[closer], pick]
+
+        missed = indices < 0
+        distances[missed] = math.inf
+        points = origins + directions * np.where(missed, 0.0, distances)[:, None]
+        points[missed] = np.nan
+        return indices, distances, points, normals
+
+    def visibility_polygon(self, origin: PointObject, targets: Iterable[object], bounds: RectObject = None) -> PolygonObject | None:
+        """
+        Renvoie le polygone de visibilité depuis un point (éclairage, champ de vision)
+
+        Args:
+            origin (PointObject) : point d'observation
+            targets (Iterable) : obstacles (Segment, SegmentArray, Circle, Rect, Polygon)
+            bounds (RectObject, optional) : zone visible maximale (défaut: boîte englobante élargie de la scène)
+        """
+        origin = self._to_point(origin, method='visibility_polygon', message='Invalid origin argument')
+        segments, arcs = self._ray_primitives(targets, method='visibility_polygon')
+        ox, oy = (origin._pos + [0.0, 0.0])[:2]
+        if bounds is None:
+            points = np.vstack((segments[:, :2], segments[:, 2:4], arcs[:, :2] - arcs[:, 2:3], arcs[:, :2] + arcs[:, 2:3], [[ox, oy]]))
+            low, high = points.min(axis=0), points.max(axis=0)
+            margin = max(float(np.max(high - low)), 1.0)
+            bounds = RectObject((low[0] - margin, low[1] - margin), high[0] - low[0] + 2 * margin, high[1] - low[1] + 2 * margin)
+        bounds = self._to_rect(bounds, method='visibility_polygon', message='Invalid bounds argument')
+        if not (bounds._x <= ox <= bounds._x + bounds._width and bounds._y <= oy <= bounds._y + bounds._height):
+            _raise_error(self, 'visibility_polygon', 'Origin must lie inside bounds')
+        return self._visibility_polygon(ox, oy, segments, arcs, bounds)
+
+    def _visibility_polygon(self, ox: float, oy: float, segments: np.ndarray, arcs: np.ndarray, bounds: RectObject) -> PolygonObject | None:
+        """Implémentation interne de visibility_polygon"""
+        border, _ = self._ray_primitives((bounds,), method='visibility_polygon')
+        border[:, -1] = np.iinfo(np.int32).max
+        segments = np.vstack((segments, border))
+
+        # angles critiques : extrémités de segments (± epsilon) et contours des arcs échantillonnés
+        corners = np.vstack((segments[:, :2], segments[:, 2:4]))
+        angles = [np.arctan2(corners[:, 1] - oy, corners[:, 0] - ox)]
+        if arcs.shape[0]:
+            steps = np.linspace(0.0, 2 * math.pi, self.RAY_ARC_SAMPLES, endpoint=False)
+            samples = arcs[:, None, :2] + arcs[:, None, 2:3] * np.stack((np.cos(steps), np.sin(steps)), axis=-1)[None]
+            angles.append(np.arctan2(samples[..., 1] - oy, samples[..., 0] - ox).ravel())
+            angles.append(np.arctan2(arcs[:, 1] - oy, arcs[:, 0] - ox))
+        angles = np.unique(np.concatenate(angles))
+        angles = np.unique(np.concatenate((angles - self.RAY_EPSILON, angles, angles + self.RAY_EPSILON)))
+
+        directions = np.column_stack((np.cos(angles), np.sin(angles)))
+        origins = np.broadcast_to(np.array([ox, oy]), directions.shape)
+        _, _, points, _ = self._raycast(origins, directions, np.full(angles.shape[0], math.inf), segments, arcs)
+        points = points[~np.isnan(points[:, 0])]
+        if points.shape[0] >= 2:
+            keep = np.any(np.abs(np.diff(points, axis=0, append=points[:1])) > 10**-PointObject.PRECISION, axis=1)
+            points = points[keep]
+        if points.shape[0] >= 3:
+            # sommets alignés sur un même mur retirés
+            before, after = points - np.roll(points, 1, axis=0), np.roll(points, -1, axis=0) - points
+            turn = before[:, 0] * after[:, 1] - before[:, 1] * after[:, 0]
+            points = points[np.abs(turn) > 1e-9 * np.hypot(*before.T) * np.hypot(*after.T)]
+        if points.shape[0] < 3:
+            return None
+        return PolygonObject(*map(tuple, points.tolist()))
+
+    # ======================================== HELPERS VECTORISES ========================================
+    def _collide_many(self, kernel: callable, A: np.ndarray, B: np.ndarray, pairs: bool = False, self_test: bool = False) -> np.ndarray:
+        """Applique un noyau (n_bloc, m) par blocs de lignes, renvoie le masque (n, m) ou les paires (k, 2)"""
+        n, m = A.shape[0], B.shape[0]
+        step = max(1, self.CHUNK // max(1, m))
+        mask = None if pairs else np.zeros((n, m), dtype=bool)
+        found = []
+        for start in range(0, n, step):
+            block = kernel(A[start:start + step], B)
+            if self_test:
+                # paires i < j uniquement
+                block &= np.arange(m)[None, :] > np.arange(start, start + block.shape[0])[:, None]
+            if pairs:
+                hits = np.argwhere(block)
+                hits[:, 0] += start
+                found.append(hits)
+            else:
+                mask[start:start + step] = block
+        if not pairs:
+            return mask
+        return np.concatenate(found) if found else np.empty((0, 2), dtype=np.intp)
+
+    @staticmethod
+    def _to_shape_array(shapes: object, width: int, method: str = '_to_shape_array', message: str = 'Invalid shapes argument') -> np.ndarray:
+        """Convertit des formes en array float64 (n, width)"""
+        data = getattr(shapes, '_data', None)
+        if data is None and hasattr(shapes, '_start'):
+            data = np.hstack((shapes._start, shapes._end))
+        try:
+            data = np.asarray(shapes if data is None else data, dtype=np.float64)
+        except (TypeError, ValueError):
+            _raise_error(GeometryManager, method, message)
+        if data.ndim == 1 and data.shape[0] == width:
+            data = data[None, :]
+        if data.ndim != 2 or data.shape[1] != width:
+            _raise_error(GeometryManager, method, message)
+        return data
+
+    @staticmethod
+    def _to_rect_array(rects: object, method: str = '_to_rect_array') -> np.ndarray:
+        """Convertit des rects en array (m, 5) [left, top, right, bottom, border_radius] (rayon borné)"""
+        data = np.asarray(rects, dtype=np.float64) if not isinstance(rects, np.ndarray) else rects.astype(np.float64, copy=False)
+        if data.ndim == 1 and data.shape[0] in (4, 5):
+            data = data[None, :]
+        if data.ndim != 2 or data.shape[1] not in (4, 5):
+            _raise_error(GeometryManager, method, 'Invalid rects argument')
+        if data.shape[1] == 4:
+            data = np.hstack((data, np.zeros((data.shape[0], 1))))
+        else:
+            data = data.copy()
+        limit = np.minimum(data[:, 2] - data[:, 0], data[:, 3] - data[:, 1]) / 2
+        data[:, 4] = np.clip(data[:, 4], 0, np.maximum(limit, 0))
+        return data
+
+    @staticmethod
+    def _inner_rect_distance_sq(px: np.ndarray, py: np.ndarray, rects: np.ndarray) -> np.ndarray:
+        """Distance au carré (n, m) entre des points et les rects intérieurs (réduits de border_radius)"""
+        br = rects[None, :, 4]
+        cx = np.clip(px, rects[None, :, 0] + br, rects[None, :, 2] - br)
+        cy = np.clip(py, rects[None, :, 1] + br, rects[None, :, 3] - br)
+        dx, dy = px - cx, py - cy
+        return dx * dx + dy * dy
+
+    # ======================================== HELPERS RAYCASTING ========================================
+    def _to_rays(self, origins: object, directions: object, max_dist: Real | np.ndarray, method: str = '_to_rays') -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Convertit un lot de rayons en arrays (n, 2), (n, 2) unitaires et (n,)"""
+        O = np.atleast_2d(_to_rows(origins, 2, method=method, message='Invalid origins argument'))
+        D = np.atleast_2d(_to_rows(directions, 2, method=method, message='Invalid directions argument'))
+        n = max(O.shape[0], D.shape[0])
+        if O.shape[0] not in (1, n) or D.shape[0] not in (1, n):
+            _raise_error(self, method, f'Need as many origins as directions, got {O.shape[0]} and {D.shape[0]}')
+        O, D = np.broadcast_to(O, (n, 2)), np.broadcast_to(D, (n, 2))
+        norms = np.hypot(D[:, 0], D[:, 1])
+        if np.any(norms == 0):
+            _raise_error(self, method, 'Directions must be non zero')
+        try:
+            limits = np.broadcast_to(np.asarray(max_dist, dtype=np.float64), (n,)).copy()
+        except (TypeError, ValueError):
+            _raise_error(self, method, 'Invalid max_dist argument')
+        if np.any(np.isnan(limits)) or np.any(limits < 0):
+            _raise_error(self, method, 'Invalid max_dist argument')
+        return np.ascontiguousarray(O), D / norms[:, None], limits
+
+    def _ray_primitives(self, targets: Iterable[object], method: str = '_ray_primitives') -> tuple[np.ndarray, np.ndarray]:
+        """Décompose des formes en segments (m, 5) [x1, y1, x2, y2, rang] et arcs (k, 6) [cx, cy, r, sx, sy, rang]"""
+        segments, arcs = [], []
+        for k, shape in enumerate(targets):
+            if isinstance(shape, SegmentObject):
+                segments.append([*(shape._start._pos + [0.0])[:2], *(shape._end._pos + [0.0])[:2], k])
+            elif isinstance(shape, SegmentArrayObject):
+                block = np.hstack((_to_rows(shape._start, 2, method=method, message='SegmentArray must be 2D'), _to_rows(shape._end, 2, method=method, message='SegmentArray must be 2D'), np.full((shape.n, 1), k)))
+                segments.extend(block.tolist())
+            elif isinstance(shape, CircleObject):
+                arcs.append([shape._center.x, shape._center.y, shape._radius, 0.0, 0.0, k])
+            elif isinstance(shape, (RectObject, *PygameRect)):
+                shape = self._to_rect(shape, method=method)
+                l, t, w, h = shape._x, shape._y, shape._width, shape._height
+                r, b = l + w, t + h
+                br = min(max(shape._border_radius, 0), min(w, h) / 2)
+                segments.extend([[l + br, t, r - br, t, k], [r, t + br, r, b - br, k], [r - br, b, l + br, b, k], [l, b - br, l, t + br, k]])
+                if br > 0:
+                    arcs.extend([[l + br, t + br, br, -1.0, -1.0, k], [r - br, t + br, br, 1.0, -1.0, k], [r - br, b - br, br, 1.0, 1.0, k], [l + br, b - br, br, -1.0, 1.0, k]])
+            elif isinstance(shape, PolygonObject):
+                segments.extend([[*a, *c, k] for a, c in shape._edges()])
+            else:
+                _raise_error(self, method, f'Invalid target of type {type(shape).__name__}')
+        return np.array(segments, dtype=np.float64).reshape(-1, 5), np.array(arcs, dtype=np.float64).reshape(-1, 6)
+
+    @staticmethod
+    def _ray_box_exit(origins: np.ndarray, directions: np.ndarray, box: np.ndarray) -> np.ndarray:
+        """Distance de sortie de chaque rayon hors d'une boîte [left, top, right, bottom] (-1 si le rayon la manque)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inverse = 1.0 / directions
+            t1 = (box[:2] - origins) * inverse
+            t2 = (box[2:] - origins) * inverse
+            t_in = np.nanmax(np.minimum(t1, t2), axis=1)
+            t_out = np.nanmin(np.maximum(t1, t2), axis=1)
+        return np.where(t_out >= np.maximum(t_in, 0.0), t_out, -1.0)
+
+    @staticmethod
+    def _ray_segment_kernel(origins: np.ndarray, directions: np.ndarray, segments: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Distances (n, m) rayons / segments (inf si pas d'impact) et normales des segments tournées vers les rayons"""
+        dx, dy = directions[:, 0, None], directions[:, 1, None]
+        ex, ey = (segments[:, 2] - segments[:, 0])[None, :], (segments[:, 3] - segments[:, 1])[None, :]
+        wx = segments[None, :, 0] - origins[:, 0, None]
+        wy = segments[None, :, 1] - origins[:, 1, None]
+        denom = dx * ey - dy * ex
+        valid = np.abs(denom) > 1e-12
+        safe = np.where(valid, denom, 1.0)
+        t = (wx * ey - wy * ex) / safe
+        u = (wx * dy - wy * dx) / safe
+        valid &= (t >= 0) & (u >= 0) & (u <= 1)
+        length = np.hypot(ex, ey)
+        length = np.where(length > 0, length, 1.0)
+        nx, ny = -ey / length, ex / length
+        flip = nx * dx + ny * dy > 0
+        return np.where(valid, t, math.inf), np.where(flip, -nx, nx), np.where(flip, -ny, ny)
+
+    @staticmethod
+    def _ray_arc_kernel(origins: np.ndarray, directions: np.ndarray, arcs: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Distances (n, k) rayons / arcs (inf si pas d'impact) et normales tournées vers les rayons"""
+        dx, dy = directions[:, 0, None], directions[:, 1, None]
+        fx = origins[:, 0, None] - arcs[None, :, 0]
+        fy = origins[:, 1, None] - arcs[None, :, 1]
+        r, sx, sy = arcs[None, :, 2], arcs[None, :, 3], arcs[None, :, 4]
+        b = fx * dx + fy * dy
+        disc = b * b - (fx * fx + fy * fy - r * r)
+        valid = disc >= 0
+        root = np.sqrt(np.where(valid, disc, 0.0))
+        best = np.full(disc.shape, math.inf)
+        # première racine positive située dans le quadrant de l'arc (sx = sy = 0 : cercle complet)
+        for t in (-b - root, -b + root):
+            hx, hy = fx + t * dx, fy + t * dy
+            ok = valid & (t >= 0) & (sx * hx >= -1e-9) & (sy * hy >= -1e-9) & np.isinf(best)
+            best = np.where(ok, t, best)
+        t = np.where(np.isinf(best), 0.0, best)
+        radius = np.where(r > 0, r, 1.0)
+        nx, ny = (fx + t * dx) / radius, (fy + t * dy) / radius
+        flip = nx * dx + ny * dy > 0
+        return best, np.where(flip, -nx, nx), np.where(flip, -ny, ny)
+
+    # ======================================== HELPERS COLLISIONS CONTINUES ========================================
+    @staticmethod
+    def _sweep_time(fx: float, fy: float, dx: float, dy: float, R: float) -> float | None:
+        """Instant d'entrée dans [0, 1] d'un point (origine - centre = (fx, fy)) déplacé de (dx, dy) dans un disque de rayon R"""
+        c = fx * fx + fy * fy - R * R
+        if c <= 0:
+            return 0.0
+        a = dx * dx + dy * dy
+        b = fx * dx + fy * dy
+        if a == 0 or b >= 0:
+            return None
+        disc = b * b - a * c
+        if disc < 0:
+            return None
+        t = (-b - math.sqrt(disc)) / a
+        return t if t <= 1 else None
+
+    @staticmethod
+    def _sweep_normal(nx: float, ny: float, dx: float, dy: float) -> tuple[float, float]:
+        """Normalise une normale de contact (repli : opposée au déplacement)"""
+        length = math.sqrt(nx * nx + ny * ny)
+        if length > 0:
+            return (nx / length, ny / length)
+        length = math.sqrt(dx * dx + dy * dy)
+        return (-dx / length, -dy / length) if length > 0 else (0.0, -1.0)
+
+    @staticmethod
+    def _polygon_contains(px: float, py: float, coords: Sequence) -> bool:
+        """Appartenance d'un point à un polygone (règle pair-impair)"""
+        inside = False
+        for (x1, y1), (x2, y2) in zip(coords, coords[1:] + coords[:1]):
+            if (y1 > py) != (y2 > py) and px < x1 + (py - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+        return inside
+
     # ======================================== HELPERS INTERNES ========================================
     def _rect_corner_centers(self, left: float, top: float, right: float, bottom: float, br: float) -> list[tuple[float, float]]:
         """Centres des 4 coins arrondis d'un rect"""
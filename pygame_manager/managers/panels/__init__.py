@@ -1,2 +1,2 @@
-from .panels import PanelsManager, panels_manager, Panel
-__all__ = ["PanelsManager", "panels_manager", "Panel"]
\ No newline at end of file
+from .panels import PanelsManager, panels_manager, Panel, ScrollPanel
+__all__ = ["PanelsManager", "panels_manager", "Panel", "ScrollPanel"]
\ No newline at end of file
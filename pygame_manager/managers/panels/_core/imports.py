@@ -1,5 +1,6 @@
 # ======================================== LIBS ========================================
 import pygame
+from collections import OrderedDict
 
 # ======================================== TYPAGE ========================================
 from numbers import (
@@ -15,6 +16,7 @@ from .... import context
 # ======================================== EXPORTS ========================================
 __all__ = [
     "pygame",
+    "OrderedDict",
     "Real",
     "Iterable",
     "context",
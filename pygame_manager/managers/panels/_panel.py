@@ -1,4 +1,5 @@
 # ======================================== IMPORTS ========================================
+from __future__ import annotations
 from ._core import *
 
 # ======================================== SUPERCLASS ========================================
@@ -11,6 +12,7 @@ class Panel:
         gestion automatique de la surface
         z-ordre manipulable
         affichage automatique sur le panel prédecesseur
+        composite du sous-arbre mis en cache (recomposé seulement après modification)
 
     Override update() et draw() pour l'actualisation et l'affichage
     """
@@ -61,7 +63,7 @@ class Panel:
         self._surface_rect = rect.rect
         self._surface_width = rect.width
         self._surface_height = rect.height
-        self._surface = pygame.Surface((self._surface_width, self._surface_height), pygame.SRCALPHA if srcalpha else 0)
+        self._surface = context.screen.acquire(self._surface_rect.size, alpha=srcalpha)
 
         # bordure
         self._border_width = border_width
@@ -79,6 +81,12 @@ class Panel:
         # survol
         self._hoverable = hoverable
 
+        # composition
+        self._dirty = True              # surface modifiée depuis la dernière composition
+        self._version = 0               # incrémenté à chaque changement du rendu du sous-arbre
+        self._signature = None          # état des enfants lors de la dernière composition
+        self._composite = None          # surface + enfants (None si aucun enfant affiché)
+
         # auto-registration
         context.panels.register(self)
 
@@ -110,14 +118,70 @@ class Panel:
         pass
 
     def draw(self, surface: pygame.Surface):
-        """Affichage du panel sur la surface du prédecesseur"""
+        """Affichage du panel (et de ses successeurs) sur la surface du prédecesseur"""
         if not isinstance(surface, pygame.Surface):
             return
-        surface.blit(self._surface, self._surface_rect)
+        surface.blit(self._surface if self._composite is None else self._composite, self._surface_rect)
 
         if self._border is not None:
             pygame.draw.rect(surface, self._border_color, self._border, self._border_width)
         
+    # ======================================== COMPOSITION ========================================
+    def invalidate(self):
+        """Signale une modification de la surface (dessins directs sur _surface)"""
+        self._dirty = True
+
+    def _compose(self, children: list[Panel]):
+        """Recompose le sous-arbre si la surface ou un successeur affiché a changé"""
+        signature = tuple(
+            (child, child._version if type(child).draw is Panel.draw else object(), tuple(child._surface_rect))
+            for child in children
+        )
+        previous = self._signature
+        if not self._dirty and signature == previous:
+            return
+        self._signature = signature
+        self._version += 1
+        if not children:
+            self._dirty = False
+            context.screen.release(self._composite)
+            self._composite = None
+            return
+
+        # mêmes successeurs sur une surface inchangée : seules les zones des successeurs modifiés sont recomposées
+        if not self._dirty and self._composite is not None and previous is not None and len(previous) == len(signature) and all(old[0] is new[0] for old, new in zip(previous, signature)):
+            damage = [new[0]._bounds(old[2]).union(new[0]._bounds()) for old, new in zip(previous, signature) if old != new]
+            for area in damage:
+                self._redraw(children, area)
+            self._composite.set_clip(None)
+            return
+
+        self._dirty = False
+        if self._composite is None or self._composite.get_size() != self._surface.get_size():
+            context.screen.release(self._composite)
+            self._composite = context.screen.acquire(self._surface.get_size(), alpha=bool(self._surface.get_flags() & pygame.SRCALPHA))
+        self._redraw(children, self._composite.get_rect())
+        self._composite.set_clip(None)
+
+    def _redraw(self, children: list[Panel], area: pygame.Rect):
+        """Recompose une zone du composite : copie exacte de la surface puis successeurs qui la recouvrent"""
+        self._composite.set_clip(area)
+        if self._surface.get_flags() & pygame.SRCALPHA:
+            self._composite.fill((0, 0, 0, 0), area)
+            self._composite.blit(self._surface, area, area, special_flags=pygame.BLEND_RGBA_MAX)
+        else:
+            self._composite.blit(self._surface, area, area)
+        for child in children:
+            if child._bounds().colliderect(area):
+                child.draw(self._composite)
+
+    def _bounds(self, rect: tuple[int, int, int, int] = None) -> pygame.Rect:
+        """Renvoie la zone couverte sur le prédecesseur (bordure comprise), pour un rect donné ou le rect courant"""
+        bounds = pygame.Rect(rect if rect is not None else self._surface_rect)
+        if self._border is None:
+            return bounds
+        return bounds.union(self._border.move(bounds.x - self._surface_rect.x, bounds.y - self._surface_rect.y))
+
     # ======================================== ACTIVATION ========================================
     def activate(self):
         """Active le panel"""
@@ -182,14 +246,10 @@ class Panel:
 
     # ======================================== GETTERS ========================================
     # Surface
-    @property
-    def surface(self) -> pygame.Surface:
-        """Renvoie la surface"""
-        return self._surface
-
     @property
     def surface_rect(self) -> pygame.Rect:
-        """Renvoie la hitbox de la surface"""
+        """Renvoie la hitbox de la surface (modifiable : les origines absolues sont invalidées)"""
+        context.panels._moved()
         return self._surface_rect
 
     # Conversions
@@ -220,12 +280,14 @@ class Panel:
     # Surface
     @property
     def surface(self) -> pygame.Surface:
-        """Surface du panel"""
+        """Surface du panel (considérée comme modifiée par l'appelant)"""
+        self._dirty = True
         return self._surface
     
     @property
     def rect(self) -> pygame.Rect:
-        """Rectangle du panel"""
+        """Rectangle du panel (modifiable : les origines absolues sont invalidées)"""
+        context.panels._moved()
         return self._surface_rect
 
     @property
@@ -262,4 +324,38 @@ class Panel:
     @property
     def centery(self) -> float:
         """Centre y du panel"""
-        return self._surface_rect.height / 2
\ No newline at end of file
+        return self._surface_rect.height / 2
+
+    # ======================================== DEPLACEMENT ========================================
+    @x.setter
+    def x(self, value: int):
+        """Fixe la position x du panel"""
+        if not isinstance(value, int):
+            _raise_error(self, 'set_x', 'Invalid value argument')
+        self._move(value - self._surface_rect.x, 0)
+
+    @y.setter
+    def y(self, value: int):
+        """Fixe la position y du panel"""
+        if not isinstance(value, int):
+            _raise_error(self, 'set_y', 'Invalid value argument')
+        self._move(0, value - self._surface_rect.y)
+
+    def move(self, dx: int, dy: int):
+        """
+        Déplace le panel (et ses successeurs) sur son prédecesseur
+
+        Args:
+            dx (int) : déplacement horizontal
+            dy (int) : déplacement vertical
+        """
+        if not isinstance(dx, int) or not isinstance(dy, int):
+            _raise_error(self, 'move', 'Invalid offset arguments')
+        self._move(dx, dy)
+
+    def _move(self, dx: int, dy: int):
+        """Implémentation interne de move"""
+        self._surface_rect.move_ip(dx, dy)
+        if self._border is not None:
+            self._border.move_ip(dx, dy)
+        context.panels._moved()
@@ -0,0 +1,258 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from ._core import *
+from ._panel import Panel
+
+# ======================================== PANEL DEFILANT ========================================
+class ScrollPanel(Panel):
+    """
+    Panel défilant à contenu virtuel (journaux, classements, inventaires)
+
+    Fonctionnalités:
+        contenu découpé en tuiles de hauteur fixe, rendues à la demande
+        cache LRU des tuiles proches de la zone visible
+        rendu utilisateur appelé uniquement pour les lignes des tuiles créées
+        barre de défilement (ScrollBarObject) et molette de la souris
+
+    Le coût d'une frame ne dépend que de la hauteur visible, pas du nombre de lignes.
+    """
+    TILE_HEIGHT = 256           # hauteur visée d'une tuile (arrondie à un multiple de la hauteur de ligne)
+    MIN_THUMB_RATIO = 0.05      # taille relative minimale du curseur de la barre de défilement
+
+    def __init__(
+            self,
+            name: str,
+            render_row: callable,
+            row_count: int,
+            row_height: int,
+            predecessor: str = None,
+            rect: pygame.Rect = (0, 0, 400, 600),
+            centered: bool = False,
+            border_width: int = 0,
+            border_color: pygame.Color = (0, 0, 0, 255),
+            border_around: bool = False,
+            srcalpha: bool = False,
+            hoverable: bool = True,
+            background: pygame.Color = (0, 0, 0, 0),
+            scrollbar_thickness: int = 12,
+            cache_tiles: int = 16,
+            wheel_rows: int = 3,
+            ):
+        """
+        Args:
+            name (str): nom du panel (doit être unique)
+            render_row (callable): rendu d'une ligne, appelé avec (surface, index) ; surface de la taille de la ligne
+            row_count (int): nombre de lignes du contenu
+            row_height (int): hauteur d'une ligne
+            predecessor (str, optional): nom du panel prédecesseur
+            rect (RectObject, optional): dimensions de la zone visible
+            centered (bool, optional): coordonnées à partir du centre de la surface maître
+            border_width (int, optional): épaisseur de la bordure du panel
+            border_around (bool, optional): affichage de la bordure à l'extérieur du panel
+            srcalpha (bool, optional): activation du canal alpha
+            hoverable (bool, optional): peut être survolé
+            background (Color, optional): couleur de fond des tuiles
+            scrollbar_thickness (int, optional): épaisseur de la barre de défilement (0 : sans barre)
+            cache_tiles (int, optional): nombre maximal de tuiles conservées
+            wheel_rows (int, optional): lignes défilées par cran de molette
+        """
+        if not callable(render_row): _raise_error(self, '__init__', 'Invalid render_row argument')
+        if not isinstance(row_count, int) or row_count < 0: _raise_error(self, '__init__', 'Invalid row_count argument')
+        if not isinstance(row_height, int) or row_height <= 0: _raise_error(self, '__init__', 'Invalid row_height argument')
+        background = _to_color(background)
+        if background is None: _raise_error(self, '__init__', 'Invalid background argument')
+        if not isinstance(scrollbar_thickness, int) or scrollbar_thickness < 0: _raise_error(self, '__init__', 'Invalid scrollbar_thickness argument')
+        if not isinstance(cache_tiles, int) or cache_tiles < 1: _raise_error(self, '__init__', 'Invalid cache_tiles argument')
+        if not isinstance(wheel_rows, int) or wheel_rows < 0: _raise_error(self, '__init__', 'Invalid wheel_rows argument')
+        super().__init__(name, predecessor, rect, centered, border_width, border_color, border_around, srcalpha, hoverable)
+
+        # contenu virtuel
+        self._render_row = render_row
+        self._row_count = row_count
+        self._row_height = row_height
+        self._background = background
+        self._content_width = max(1, self._surface_rect.width - scrollbar_thickness)
+
+        # tuiles : un nombre entier de lignes par tuile (aucune ligne à cheval)
+        self._tile_rows = max(1, self.TILE_HEIGHT // row_height)
+        self._tile_height = self._tile_rows * row_height
+        self._tiles = OrderedDict()             # {indice de tuile: surface}, du moins au plus récemment utilisé
+        self._cache_tiles = max(cache_tiles, self._surface_rect.height // self._tile_height + 2)
+
+        # défilement
+        self._scroll = 0
+        self._wheel_rows = wheel_rows
+        self._scrollbar = None
+        if scrollbar_thickness > 0:
+            self._scrollbar = context.ui.ScrollBar(
+                x=self._surface_rect.width - scrollbar_thickness, y=0,
+                length=self._surface_rect.height, thickness=scrollbar_thickness,
+                thumb_ratio=self._thumb_ratio(), panel=name,
+            )
+            self._scrollbar._init()     # la barre possède son listener (une seule fois, même avant init())
+        context.inputs.add_listener(context.inputs.MOUSEWHEELUP, self.scroll_by, args=[-wheel_rows * row_height], condition=self._wheel_enabled)
+        context.inputs.add_listener(context.inputs.MOUSEWHEELDOWN, self.scroll_by, args=[wheel_rows * row_height], condition=self._wheel_enabled)
+
+    # ======================================== GETTERS ========================================
+    @property
+    def row_count(self) -> int:
+        """Renvoie le nombre de lignes"""
+        return self._row_count
+
+    @property
+    def row_height(self) -> int:
+        """Renvoie la hauteur d'une ligne"""
+        return self._row_height
+
+    @property
+    def content_height(self) -> int:
+        """Renvoie la hauteur totale du contenu virtuel"""
+        return self._row_count * self._row_height
+
+    @property
+    def max_scroll(self) -> int:
+        """Renvoie le défilement maximal"""
+        return max(0, self.content_height - self._surface_rect.height)
+
+    @property
+    def scroll(self) -> int:
+        """Renvoie le défilement (en pixels depuis le haut du contenu)"""
+        return self._scroll
+
+    @property
+    def visible_rows(self) -> range:
+        """Renvoie les indices des lignes visibles"""
+        first = self._scroll // self._row_height
+        last = min(self._row_count, -(-(self._scroll + self._surface_rect.height) // self._row_height))
+        return range(first, last)
+
+    @property
+    def scrollbar(self) -> object | None:
+        """Renvoie la barre de défilement"""
+        return self._scrollbar
+
+    def row_at(self, point: tuple[Real, Real]) -> int | None:
+        """
+        Renvoie l'indice de la ligne sous un point relatif au panel (None si hors contenu)
+
+        Args:
+            point (tuple[Real, Real]) : (x, y) relatif au panel
+        """
+        x, y = point
+        if not 0 <= x < self._content_width or not 0 <= y < self._surface_rect.height:
+            return None
+        index = int(y + self._scroll) // self._row_height
+        return index if index < self._row_count else None
+
+    # ======================================== SETTERS ========================================
+    @row_count.setter
+    def row_count(self, value: int):
+        """Fixe le nombre de lignes (seules les tuiles à partir de l'ancienne fin sont rendues à nouveau)"""
+        if not isinstance(value, int) or value < 0:
+            _raise_error(self, 'set_row_count', 'Invalid value argument')
+        first = min(value, self._row_count) // self._tile_rows
+        for index in [index for index in self._tiles if index >= first]:
+            del self._tiles[index]
+        self._row_count = value
+        self._scroll = min(self._scroll, self.max_scroll)
+        if self._scrollbar is not None:
+            self._scrollbar._thumb_ratio = self._thumb_ratio()
+
+    @scroll.setter
+    def scroll(self, value: Real):
+        """Fixe le défilement (borné au contenu)"""
+        if not isinstance(value, Real):
+            _raise_error(self, 'set_scroll', 'Invalid value argument')
+        self._scroll = max(0, min(self.max_scroll, int(value)))
+
+    # ======================================== DEFILEMENT ========================================
+    def scroll_by(self, delta: Real):
+        """
+        Fait défiler le contenu
+
+        Args:
+            delta (Real) : déplacement en pixels (positif : vers le bas)
+        """
+        if not isinstance(delta, Real):
+            _raise_error(self, 'scroll_by', 'Invalid delta argument')
+        self._scroll = max(0, min(self.max_scroll, int(self._scroll + delta)))
+
+    def scroll_to(self, index: int, align: str = "top"):
+        """
+        Fait défiler jusqu'à une ligne
+
+        Args:
+            index (int) : indice de la ligne
+            align (str, optional) : position de la ligne dans la zone visible ("top", "center", "bottom")
+        """
+        if not isinstance(index, int) or not 0 <= index < max(1, self._row_count):
+            _raise_error(self, 'scroll_to', 'Invalid index argument')
+        if align not in ("top", "center", "bottom"):
+            _raise_error(self, 'scroll_to', 'Invalid align argument')
+        y = index * self._row_height
+        if align == "center":
+            y -= (self._surface_rect.height - self._row_height) // 2
+        elif align == "bottom":
+            y -= self._surface_rect.height - self._row_height
+        self._scroll = max(0, min(self.max_scroll, y))
+
+    def refresh(self, index: int = None):
+        """
+        Demande un nouveau rendu d'une ligne (ou de tout le contenu)
+
+        Args:
+            index (int, optional) : indice de la ligne modifiée
+        """
+        if index is None:
+            self._tiles.clear()
+            return
+        if not isinstance(index, int):
+            _raise_error(self, 'refresh', 'Invalid index argument')
+        self._tiles.pop(index // self._tile_rows, None)
+
+    # ======================================== ACTUALISATION ========================================
+    def update(self, *args, **kwargs):
+        """Synchronise la barre de défilement et le défilement"""
+        if self._scrollbar is None:
+            return
+        if self._scrollbar.dragging:
+            self._scroll = int(round(self._scrollbar.scroll_ratio * self.max_scroll))
+        else:
+            self._scrollbar.scroll_ratio = self._scroll / self.max_scroll if self.max_scroll else 0.0
+
+    # ======================================== AFFICHAGE ========================================
+    def draw_back(self, surface: pygame.Surface):
+        """Affiche les tuiles visibles sur la surface du panel"""
+        surface.fill(self._background)
+        first = self._scroll // self._tile_height
+        last = (self._scroll + self._surface_rect.height - 1) // self._tile_height
+        count = -(-self._row_count // self._tile_rows)
+        for index in range(first, min(last, count - 1) + 1):
+            surface.blit(self._tile(index), (0, index * self._tile_height - self._scroll))
+
+    def _tile(self, index: int) -> pygame.Surface:
+        """Renvoie une tuile (rendue à la demande, conservée dans le cache LRU)"""
+        tile = self._tiles.get(index)
+        if tile is not None:
+            self._tiles.move_to_end(index)
+            return tile
+
+        tile = pygame.Surface((self._content_width, self._tile_height), pygame.SRCALPHA if self._surface.get_flags() & pygame.SRCALPHA else 0)
+        tile.fill(self._background)
+        start = index * self._tile_rows
+        for row in range(start, min(start + self._tile_rows, self._row_count)):
+            self._render_row(tile.subsurface((0, (row - start) * self._row_height, self._content_width, self._row_height)), row)
+
+        self._tiles[index] = tile
+        while len(self._tiles) > self._cache_tiles:
+            self._tiles.popitem(last=False)
+        return tile
+
+    # ======================================== METHODES INTERNES ========================================
+    def _thumb_ratio(self) -> float:
+        """Renvoie la taille relative du curseur (zone visible / contenu, bornée à MIN_THUMB_RATIO pour rester saisissable)"""
+        return max(self.MIN_THUMB_RATIO, min(1.0, self._surface_rect.height / self.content_height)) if self.content_height > 0 else 1.0
+
+    def _wheel_enabled(self) -> bool:
+        """Vérifie que la molette s'applique au panel (actif et survolé)"""
+        return context.panels.hovered == self._name
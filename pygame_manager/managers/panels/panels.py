@@ -1,6 +1,7 @@
 # ======================================== IMPORTS ========================================
 from ._core import *
 from ._panel import Panel
+from ._scroll_panel import ScrollPanel
 
 # ======================================== MANAGER ========================================
 class PanelsManager:
@@ -16,6 +17,12 @@ class PanelsManager:
         _update_hover            → reversed(_zorder): dernier frère (topmost) checké en premier
         reorder "forward"/"front"  → vers la fin des successors (monte, passe devant)
         reorder "backward"/"back"  → vers le début des successors (descend, passe derrière)
+
+    Caches :
+        _chains     = chaînes d'ancêtres, reconstruites à l'enregistrement
+        _offsets    = origines absolues cumulées, invalidées à l'enregistrement et au déplacement d'un panel
+        _active_set = miroir de _active_panels pour les tests d'appartenance
+        _visible    = panels actifs dont tous les ancêtres sont actifs (reconstruit après (dés)activation)
     """
     def __init__(self):
         self._dict = {None: {"predecessor": None, "successors": [], "object": None}}
@@ -24,7 +31,14 @@ class PanelsManager:
         self._active_panels = []
         self._hovered = None
 
+        # caches de la hiérarchie
+        self._chains = {}
+        self._offsets = {}
+        self._active_set = set()
+        self._visible = None
+
         self.Panel = Panel
+        self.ScrollPanel = ScrollPanel
 
     def _raise_error(self, method: str, text: str):
         """Lève une erreur"""
@@ -41,53 +55,90 @@ class PanelsManager:
         """
         self._zorder = []
         self._draw_order = []
+        self._chains = {}
 
-        def visit(name: str):
+        def visit(name: str, chain: tuple):
             if name not in self._dict:
                 return
+            chain = (name,) + chain
+            self._chains[name] = chain
             self._zorder.append(name)
             for child in self._dict[name]["successors"]:
-                visit(child)
+                visit(child, chain)
             self._draw_order.append(name)
 
         for successor in self._dict[None]["successors"]:
-            visit(successor)
+            visit(successor, ())
 
+        self._offsets.clear()
         self._sort_active_panels()
 
     def _sort_active_panels(self):
         """Tri des panels actifs selon le zorder (pre-order)"""
         active = set(self._active_panels)
         self._active_panels = list(filter(lambda name: name in active, self._zorder))
+        self._active_changed()
+
+    def _active_changed(self):
+        """Synchronise les caches d'activation avec _active_panels"""
+        self._active_set = set(self._active_panels)
+        self._visible = None
+
+    def _visible_panels(self) -> set:
+        """Renvoie les panels actifs dont tous les ancêtres sont actifs (mis en cache)"""
+        if self._visible is None:
+            visible = set()
+            for name in self._active_panels:        # pre-order : les ancêtres sont traités avant
+                predecessor = self._dict[name]["predecessor"]
+                if predecessor is None or predecessor in visible:
+                    visible.add(name)
+            self._visible = visible
+        return self._visible
+
+    def _offset(self, name: str) -> tuple[float, float]:
+        """Renvoie l'origine absolue d'un panel (décalages cumulés de sa chaîne, mise en cache)"""
+        offset = self._offsets.get(name)
+        if offset is None:
+            predecessor = self._dict[name]["predecessor"]
+            x, y = self._offset(predecessor) if predecessor is not None else (0.0, 0.0)
+            rect = getattr(self._dict[name]["object"], '_surface_rect', None)
+            offset = (x + rect.x, y + rect.y) if rect is not None else (x, y)
+            self._offsets[name] = offset
+        return offset
+
+    def _moved(self):
+        """Invalide les origines absolues (déplacement d'un panel)"""
+        self._offsets.clear()
 
     def _get_subtree(self, name: str) -> list:
         """Retourne tous les descendants d'un panel (lui-même inclus), en ordre BFS"""
-        result = []
-        queue = [name]
-        while queue:
-            current = queue.pop(0)
-            result.append(current)
+        result = [name]
+        for current in result:          # la liste sert de file : parcours en largeur sans pop(0)
             if current in self._dict:
-                queue.extend(self._dict[current]["successors"])
+                result.extend(self._dict[current]["successors"])
         return result
 
     def _deactivate_subtree(self, name: str):
         """Désactive un panel et tout son sous-arbre"""
         subtree = self._get_subtree(name)
         for panel_name in reversed(subtree):
-            if panel_name in self._active_panels:
+            if panel_name in self._active_set:
                 obj = self._dict[panel_name]["object"]
                 obj.on_exit()
                 self._active_panels.remove(panel_name)
+                self._active_set.discard(panel_name)
 
     def _update_hover(self):
         """Détecte le panel survolé"""
+        visible = self._visible_panels()
+        mouse_x, mouse_y = context.mouse.get_pos()
         for name in reversed(self._active_panels):
             obj = self._dict[name]["object"]
             if not hasattr(obj, '_surface_rect'): continue
             if not getattr(obj, "_hoverable", True): continue
-            if any(p not in self._active_panels for p in self._get_chain(name)): continue
-            if 0 <= obj.mouse_x <= obj._surface_rect.width and 0 <= obj.mouse_y <= obj._surface_rect.height:
+            if name not in visible: continue
+            x, y = self._offset(name)
+            if 0 <= mouse_x - x <= obj._surface_rect.width and 0 <= mouse_y - y <= obj._surface_rect.height:
                 self._hovered = name
                 return
         self._hovered = None
@@ -167,13 +218,14 @@ class PanelsManager:
             return False
         if isinstance(panel, str):
             return panel in self._dict
-        return panel in [data["object"] for data in self._dict.values()]
+        data = self._dict.get(getattr(panel, '_name', None))
+        return data is not None and data["object"] is panel
 
     def is_active(self, panel: str | Panel) -> bool:
         """Vérifie qu'un panel soit actif"""
         if isinstance(panel, str):
-            return panel in self._active_panels
-        return panel in [data["object"] for name, data in self._dict.items() if name in self._active_panels]
+            return panel in self._active_set
+        return panel in self and panel._name in self._active_set
 
     # ======================================== ACTIVATION ========================================
     def activate(self, name: str):
@@ -185,7 +237,7 @@ class PanelsManager:
         """
         if name not in self._dict:
             _raise_error(self, 'activate', f'panel "{name}" does not exist')
-        if name in self._active_panels or name is None:
+        if name in self._active_set or name is None:
             return
         self._active_panels.append(name)
         self._sort_active_panels()
@@ -201,12 +253,13 @@ class PanelsManager:
         """
         if name not in self._dict or name is None:
             return
-        if name not in self._active_panels:
+        if name not in self._active_set:
             return
         if not pruning:
             obj = self._dict[name]["object"]
             obj.on_exit()
             self._active_panels.remove(name)
+            self._active_changed()
             return
         self._deactivate_subtree(name)
         self._sort_active_panels()
@@ -216,6 +269,7 @@ class PanelsManager:
         for name in list(self._active_panels):
             self._dict[name]["object"].on_exit()
         self._active_panels = []
+        self._active_changed()
 
     # ======================================== SWITCH ========================================
     def switch(self, to_close: str | Iterable[str], to_activate: str, pruning: bool = True):
@@ -289,20 +343,12 @@ class PanelsManager:
         self._update_zorder()
 
     # ======================================== COORDONNÉES ========================================
-    def _get_chain(self, name: str) -> list:
+    def _get_chain(self, name: str) -> tuple:
         """
         Remonte la chaîne predecessor depuis un panel jusqu'à la racine.
-        Retourne la liste des noms du panel vers la racine (panel lui-même inclus).
+        Retourne les noms du panel vers la racine (panel lui-même inclus), précalculés à l'enregistrement.
         """
-        chain = []
-        current = name
-        while current is not None:
-            chain.append(current)
-            if current in self._dict:
-                current = self._dict[current]["predecessor"]
-            else:
-                break
-        return chain
+        return self._chains.get(name, (name,))
 
     def absolute(self, point: tuple[Real, Real], panel_name: str) -> tuple[float, float]:
         """
@@ -316,16 +362,8 @@ class PanelsManager:
             _raise_error(self, 'absolute', f'panel "{panel_name}" does not exist')
 
         x, y = map(float, point)
-        chain = self._get_chain(panel_name)
-
-        for name in chain:
-            rect = None
-            if hasattr(self._dict[name]["object"], 'surface_rect'):
-                rect = self._dict[name]["object"].surface_rect
-            x += rect.x if rect is not None else 0
-            y += rect.y if rect is not None else 0
-
-        return (x, y)
+        offset_x, offset_y = self._offset(panel_name)
+        return (x + offset_x, y + offset_y)
 
     def relative(self, point: tuple[Real, Real], panel_name: str) -> tuple[float, float]:
         """
@@ -339,25 +377,19 @@ class PanelsManager:
             _raise_error(self, 'relative', f'panel "{panel_name}" does not exist')
 
         x, y = map(float, point)
-        chain = self._get_chain(panel_name)
-
-        for name in chain:
-            rect = None
-            if hasattr(self._dict[name]["object"], 'surface_rect'):
-                rect = self._dict[name]["object"].surface_rect
-            x -= rect.x if rect is not None else 0
-            y -= rect.y if rect is not None else 0
-
-        return (x, y)
+        offset_x, offset_y = self._offset(panel_name)
+        return (x - offset_x, y - offset_y)
 
     # ======================================== METHODES DYNAMIQUES ========================================
     def update(self):
-        """Exécute update de tous les panels actifs"""
+        """Exécute update de tous les panels actifs (un update redéfini peut dessiner sur la surface : panel à recomposer)"""
         self._update_hover()
         for name in self._active_panels:
             obj = self._dict[name]["object"]
             if hasattr(obj, 'update'):
                 obj.update()
+            if self._overrides(obj, 'update'):
+                obj._dirty = True
 
     def draw_back(self):
         """
@@ -365,11 +397,11 @@ class PanelsManager:
         """
         for name in self._active_panels:
             predecessor = self._dict[name]["predecessor"]
-            if predecessor is not None and predecessor not in self._active_panels:
+            if predecessor is not None and predecessor not in self._active_set:
                 continue
             obj = self._dict[name]["object"]
-            if hasattr(obj, 'draw_back'):
-                obj.draw_back(obj._surface)
+            if self._overrides(obj, 'draw_back'):
+                obj.draw_back(obj.surface)
 
     def draw_between(self):
         """
@@ -377,17 +409,18 @@ class PanelsManager:
         """
         for name in self._active_panels:
             predecessor = self._dict[name]["predecessor"]
-            if predecessor is not None and predecessor not in self._active_panels:
+            if predecessor is not None and predecessor not in self._active_set:
                 continue
             obj = self._dict[name]["object"]
-            if hasattr(obj, 'draw_between'):
-                obj.draw_between(obj._surface)
+            if self._overrides(obj, 'draw_between'):
+                obj.draw_between(obj.surface)
 
     def draw(self):
         """
-        Exécute draw de tous les panels actifs et affichés.
+        Compose les panels actifs et affichés (enfants avant parents), puis affiche les racines à l'écran.
+        Les sous-arbres inchangés depuis la frame précédente ne sont pas recomposés.
         """
-        active = set(self._active_panels)
+        active = self._active_set
         for name in self._draw_order:
             if name not in active:
                 continue
@@ -395,14 +428,15 @@ class PanelsManager:
             if predecessor is not None and predecessor not in active:
                 continue
 
-            if predecessor is not None:
-                predecessor_surface = getattr(self._dict[predecessor]["object"], 'surface')
-            else:
-                predecessor_surface = context.screen.surface
-
             obj = self._dict[name]["object"]
-            if hasattr(obj, 'draw'):
-                obj.draw(predecessor_surface)
+            obj._compose([self._dict[child]["object"] for child in self._dict[name]["successors"] if child in active])
+            if predecessor is None:
+                obj.draw(context.screen.surface)
+
+    @staticmethod
+    def _overrides(obj: Panel, method: str) -> bool:
+        """Vérifie qu'un panel redéfinit une méthode d'actualisation ou d'affichage (les méthodes vides sont ignorées)"""
+        return getattr(type(obj), method, None) is not getattr(Panel, method)
 
 # ======================================== INSTANCE ========================================
 panels_manager = PanelsManager()
\ No newline at end of file
@@ -0,0 +1,5 @@
+# ======================================== IMPORTS ========================================
+from .physics import PhysicsManager, physics_manager, BodyObject
+
+# ======================================== EXPORTS ========================================
+__all__ = ["PhysicsManager", "physics_manager", "BodyObject"]
@@ -0,0 +1,146 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from ._core import *
+
+# ======================================== OBJET ========================================
+class BodyObject:
+    """
+    Corps physique : poignée vers une ligne des tableaux du monde
+
+    Fonctionnalités:
+        lecture / écriture de la position et de la vitesse
+        impulsions, réveil et mise en sommeil
+    """
+    __slots__ = ["_entity", "_shape", "_kind", "_pieces", "_index"]
+
+    def __init__(self, entity: object, shape: object, kind: int, pieces: tuple, index: int):
+        """
+        Args:
+            entity (Entity) : entité simulée
+            shape (Circle | Rect | Polygon) : forme géométrique de l'entité
+            kind (int) : type de forme (PhysicsManager.CIRCLE, BOX ou POLYGON)
+            pieces (tuple) : pièces convexes locales (polygones uniquement)
+            index (int) : ligne dans les tableaux du monde
+        """
+        self._entity = entity
+        self._shape = shape
+        self._kind = kind
+        self._pieces = pieces
+        self._index = index
+
+    def __repr__(self) -> str:
+        """Représentation du corps"""
+        if self._index is None:
+            return "Body(removed)"
+        state = 'static' if self.static else 'sleeping' if self.sleeping else 'awake'
+        return f"Body({type(self._entity).__name__}, pos={self.position}, {state})"
+
+    def _row(self, method: str) -> int:
+        """Renvoie la ligne du corps dans le monde (erreur si retiré)"""
+        if self._index is None:
+            _raise_error(self, method, 'Body has been removed from the world')
+        return self._index
+
+    # ======================================== GETTERS ========================================
+    @property
+    def entity(self) -> object:
+        """Renvoie l'entité simulée"""
+        return self._entity
+
+    @property
+    def position(self) -> tuple[float, float]:
+        """Renvoie la position du centre"""
+        x, y = context.physics._pos[self._row('position')]
+        return (float(x), float(y))
+
+    @property
+    def velocity(self) -> tuple[float, float]:
+        """Renvoie la vitesse (px/s)"""
+        vx, vy = context.physics._vel[self._row('velocity')]
+        return (float(vx), float(vy))
+
+    @property
+    def mass(self) -> float:
+        """Renvoie la masse (inf si statique)"""
+        inv = context.physics._inv_mass[self._row('mass')]
+        return 1.0 / inv if inv > 0 else math.inf
+
+    @property
+    def static(self) -> bool:
+        """Vérifie que le corps est statique"""
+        return bool(context.physics._inv_mass[self._row('static')] == 0)
+
+    @property
+    def sleeping(self) -> bool:
+        """Vérifie que le corps dynamique est endormi"""
+        i = self._row('sleeping')
+        return bool(context.physics._inv_mass[i] > 0 and not context.physics._awake[i])
+
+    @property
+    def restitution(self) -> float:
+        """Renvoie le coefficient de restitution"""
+        return float(context.physics._restitution[self._row('restitution')])
+
+    @property
+    def friction(self) -> float:
+        """Renvoie le coefficient de frottement"""
+        return float(context.physics._friction[self._row('friction')])
+
+    # ======================================== SETTERS ========================================
+    @position.setter
+    def position(self, position: tuple[float, float]):
+        """Téléporte le corps (et son entité), le réveille"""
+        x, y = _to_pair(position, self, 'set_position', 'Invalid position argument')
+        i = self._row('set_position')
+        context.physics._pos[i] = (x, y)
+        context.physics._sync_rows([i])
+        context.physics._wake_rows([i])
+
+    @velocity.setter
+    def velocity(self, velocity: tuple[float, float]):
+        """Fixe la vitesse (px/s), réveille le corps"""
+        vx, vy = _to_pair(velocity, self, 'set_velocity', 'Invalid velocity argument')
+        i = self._row('set_velocity')
+        if self.static:
+            _raise_error(self, 'set_velocity', 'Static bodies cannot move')
+        context.physics._vel[i] = (vx, vy)
+        context.physics._wake_rows([i])
+
+    @restitution.setter
+    def restitution(self, value: Real):
+        """Fixe le coefficient de restitution"""
+        if not isinstance(value, Real) or not 0 <= value <= 1:
+            _raise_error(self, 'set_restitution', 'Restitution must be in [0, 1]')
+        context.physics._restitution[self._row('set_restitution')] = value
+
+    @friction.setter
+    def friction(self, value: Real):
+        """Fixe le coefficient de frottement"""
+        if not isinstance(value, Real) or value < 0:
+            _raise_error(self, 'set_friction', 'Friction must be positive')
+        context.physics._friction[self._row('set_friction')] = value
+
+    # ======================================== METHODES DYNAMIQUES ========================================
+    def apply_impulse(self, impulse: tuple[float, float]):
+        """
+        Applique une impulsion (variation de quantité de mouvement), réveille le corps
+
+        Args:
+            impulse (tuple[float, float]) : impulsion (masse * px/s)
+        """
+        ix, iy = _to_pair(impulse, self, 'apply_impulse', 'Invalid impulse argument')
+        i = self._row('apply_impulse')
+        inv = context.physics._inv_mass[i]
+        if inv > 0:
+            context.physics._vel[i] += (ix * inv, iy * inv)
+            context.physics._wake_rows([i])
+
+    def wake(self):
+        """Réveille le corps et son îlot"""
+        context.physics._wake_rows([self._row('wake')])
+
+    def sleep(self):
+        """Endort le corps immédiatement"""
+        i = self._row('sleep')
+        context.physics._awake[i] = False
+        context.physics._vel[i] = 0.0
@@ -0,0 +1,16 @@
+from .imports import *
+from .utils import *
+
+__all__ = [
+    "pygame",
+    "np",
+    "math",
+    "Real",
+    "Iterable",
+    "Optional",
+    "context",
+
+    "Sequence",
+    "_raise_error",
+    "_to_pair",
+]
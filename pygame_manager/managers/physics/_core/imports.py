@@ -0,0 +1,27 @@
+# ======================================== LIBS ========================================
+import pygame
+import numpy as np
+import math
+
+# ======================================== TYPAGE ========================================
+from numbers import (
+    Real,
+)
+
+from typing import (
+    Iterable,
+    Optional,
+)
+
+from .... import context
+
+# ======================================== EXPORTS ========================================
+__all__ = [
+    "pygame",
+    "np",
+    "math",
+    "Real",
+    "Iterable",
+    "Optional",
+    "context",
+]
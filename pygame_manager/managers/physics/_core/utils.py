@@ -0,0 +1,25 @@
+# ======================================== IMPORTS ========================================
+from .imports import *
+
+# ======================================== FAMILLES DE TYPES ========================================
+Sequence = (tuple, list)
+
+# ======================================== FONCTIONS UTILES ========================================
+def _raise_error(obj: object, method: str, text: str):
+    """Lève une erreur"""
+    raise RuntimeError(f"[{obj.__class__.__name__}].{method} : {text}")
+
+def _to_pair(value: object, obj: object, method: str = '_to_pair', message: str = 'Invalid pair argument') -> tuple[float, float]:
+    """Convertit un couple de réels (ou un vecteur) en tuple de flottants"""
+    if isinstance(value, context.geometry.Vector):
+        return (value.x, value.y)
+    if isinstance(value, Sequence) and len(value) == 2 and all(isinstance(c, Real) for c in value):
+        return (float(value[0]), float(value[1]))
+    _raise_error(obj, method, message)
+
+# ======================================== EXPORTS ========================================
+__all__ = [
+    "Sequence",
+    "_raise_error",
+    "_to_pair",
+]
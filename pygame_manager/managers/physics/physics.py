@@ -0,0 +1,608 @@
+# ======================================== IMPORTS ========================================
+from ._core import *
+from ._body import BodyObject
+
+# ======================================== GESTIONNAIRE ========================================
+class PhysicsManager:
+    """
+    Gestionnaire de la physique 2D (corps en translation, sans rotation)
+
+    Fonctionnalités:
+        pas fixes découplés de l'affichage (update)
+        broad-phase par balayage trié (sweep and prune) vectorisée
+        narrow-phase vectorisée cercles / boîtes, SAT pour les polygones
+        solveur positionnel par sous-pas (Jacobi moyenné), restitution et frottement
+        mise en sommeil par îlots de contacts
+    """
+    CIRCLE, BOX, POLYGON = 0, 1, 2
+    SUBSTEPS = 4            # sous-pas par pas fixe
+    ITERATIONS = 2          # itérations de Jacobi par sous-pas
+    RELAXATION = 1.5        # sur-relaxation des corrections moyennées
+    MARGIN = 2.0            # marge de la broad-phase (px)
+    SLEEP_SPEED = 4.0       # vitesse sous laquelle un corps est au repos (px/s)
+    SLEEP_TIME = 0.5        # durée de repos avant la mise en sommeil d'un îlot (s)
+    MAX_STEPS = 4           # pas fixes maximum par frame (évite la spirale de rattrapage)
+
+    def __init__(self, timestep: float = 1 / 60):
+        self.Body = BodyObject
+
+        # corps
+        self._bodies = []               # [BodyObject, ...] par ligne
+        self._by_entity = {}            # {entité: BodyObject}
+        self._n = 0
+
+        # tableaux du monde (une ligne par corps)
+        self._pos = np.zeros((0, 2))            # centres
+        self._vel = np.zeros((0, 2))            # vitesses (px/s)
+        self._ext = np.zeros((0, 2))            # demi-étendues des boîtes englobantes
+        self._synced = np.zeros((0, 2))         # dernières positions écrites dans les entités
+        self._inv_mass = np.zeros(0)            # 0 : corps statique
+        self._restitution = np.zeros(0)
+        self._friction = np.zeros(0)
+        self._kind = np.zeros(0, dtype=np.int8)
+        self._awake = np.zeros(0, dtype=bool)
+        self._rest = np.zeros(0)                # durée passée au repos
+        self._island = np.zeros(0, dtype=np.intp)
+
+        # temps
+        self._gravity = np.array([0.0, 980.0])
+        self._timestep = timestep
+        self._accumulator = 0.0
+
+    def __repr__(self) -> str:
+        return f"<physicsmanager: {self._n} bodies, {int(self._awake[:self._n].sum())} awake>"
+
+    def __len__(self) -> int:
+        """Renvoie le nombre de corps"""
+        return self._n
+
+    # ======================================== GETTERS ========================================
+    @property
+    def gravity(self) -> tuple[float, float]:
+        """Renvoie la gravité (px/s²)"""
+        return (float(self._gravity[0]), float(self._gravity[1]))
+
+    @property
+    def timestep(self) -> float:
+        """Renvoie la durée d'un pas fixe (s)"""
+        return self._timestep
+
+    @property
+    def alpha(self) -> float:
+        """Renvoie la fraction de pas restant à simuler (interpolation de l'affichage)"""
+        return self._accumulator / self._timestep
+
+    @property
+    def bodies(self) -> list[BodyObject]:
+        """Renvoie la liste des corps"""
+        return list(self._bodies)
+
+    def get(self, entity: object) -> BodyObject | None:
+        """
+        Renvoie le corps associé à une entité
+
+        Args:
+            entity (Entity) : entité recherchée
+        """
+        return self._by_entity.get(entity)
+
+    def islands(self) -> list[list[BodyObject]]:
+        """Renvoie les îlots de corps dynamiques en contact (calculés au dernier pas)"""
+        dynamic = np.flatnonzero(self._inv_mass[:self._n] > 0)
+        groups = {}
+        for i, label in zip(dynamic.tolist(), self._island[dynamic].tolist()):
+            groups.setdefault(label, []).append(self._bodies[i])
+        return list(groups.values())
+
+    # ======================================== SETTERS ========================================
+    @gravity.setter
+    def gravity(self, gravity: tuple[float, float]):
+        """Fixe la gravité (px/s²), réveille le monde"""
+        self._gravity[:] = _to_pair(gravity, self, 'set_gravity', 'Invalid gravity argument')
+        self._wake_rows(np.flatnonzero(self._inv_mass[:self._n] > 0))
+
+    @timestep.setter
+    def timestep(self, timestep: Real):
+        """Fixe la durée d'un pas fixe (s)"""
+        if not isinstance(timestep, Real) or timestep <= 0:
+            _raise_error(self, 'set_timestep', 'Invalid timestep argument')
+        self._timestep = float(timestep)
+
+    # ======================================== ENREGISTREMENT ========================================
+    def add(self, entity: object, mass: Real = None, static: bool = False, restitution: Real = 0.0, friction: Real = 0.5) -> BodyObject:
+        """
+        Ajoute une entité au monde physique
+
+        Args:
+            entity (CircleEntity | RectEntity | PolygonEntity) : entité simulée
+            mass (Real, optional) : masse (défaut: aire de la forme)
+            static (bool) : si True, corps immobile (sol, murs)
+            restitution (Real) : coefficient de rebond dans [0, 1]
+            friction (Real) : coefficient de frottement
+        """
+        if entity in self._by_entity:
+            _raise_error(self, 'add', 'Entity is already in the world')
+        shape = context.entities._shape_of(entity)
+        if not isinstance(shape, (context.geometry.Circle, context.geometry.Rect, context.geometry.Polygon)):
+            _raise_error(self, 'add', 'Entity must be a CircleEntity, a RectEntity or a PolygonEntity')
+        if mass is not None and (not isinstance(mass, Real) or mass <= 0):
+            _raise_error(self, 'add', 'Invalid mass argument')
+        if not isinstance(static, bool):
+            _raise_error(self, 'add', 'Invalid static argument')
+        if not isinstance(restitution, Real) or not 0 <= restitution <= 1:
+            _raise_error(self, 'add', 'Restitution must be in [0, 1]')
+        if not isinstance(friction, Real) or friction < 0:
+            _raise_error(self, 'add', 'Friction must be positive')
+        return self._add(entity, shape, mass, static, restitution, friction)
+
+    def _add(self, entity: object, shape: object, mass: float | None, static: bool, restitution: float, friction: float) -> BodyObject:
+        """Implémentation interne de add"""
+        kind, (x, y), ext, pieces = self._measure(shape)
+        if kind == self.CIRCLE:
+            area = math.pi * shape._radius ** 2
+        elif kind == self.BOX:
+            area = shape._width * shape._height
+        else:
+            area = abs(shape.area)
+
+        i = self._n
+        if i == self._pos.shape[0]:
+            self._grow(max(16, 2 * i))
+        body = BodyObject(entity, shape, kind, pieces, i)
+        self._bodies.append(body)
+        self._by_entity[entity] = body
+        self._n += 1
+
+        self._pos[i] = self._synced[i] = (x, y)
+        self._vel[i] = 0.0
+        self._ext[i] = ext
+        self._inv_mass[i] = 0.0 if static else 1.0 / (mass if mass is not None else max(area, 1e-9))
+        self._restitution[i] = restitution
+        self._friction[i] = friction
+        self._kind[i] = kind
+        self._awake[i] = not static
+        self._rest[i] = 0.0
+        self._island[i] = i
+        return body
+
+    def _measure(self, shape: object) -> tuple[int, tuple[float, float], tuple[float, float], tuple]:
+        """Renvoie le type, le centre, les demi-étendues et les pièces convexes locales d'une forme"""
+        if isinstance(shape, context.geometry.Circle):
+            return self.CIRCLE, (shape._center.x, shape._center.y), (shape._radius, shape._radius), ()
+        if isinstance(shape, context.geometry.Rect):
+            ext = (shape._width / 2, shape._height / 2)
+            return self.BOX, (shape._x + ext[0], shape._y + ext[1]), ext, ()
+        left, top, right, bottom = shape._aabb()
+        x, y = (left + right) / 2, (top + bottom) / 2
+        # pièces convexes en coordonnées locales (invariantes : pas de rotation)
+        pieces = tuple((tuple((px - x, py - y) for px, py in coords), axes) for coords, axes, _ in shape._convex_shapes())
+        return self.POLYGON, (x, y), ((right - left) / 2, (bottom - top) / 2), pieces
+
+    def _follow(self, body: BodyObject):
+        """Reprend la forme d'une entité modifiée hors de la simulation (setters, déplacements), réveille le corps"""
+        i = body._index
+        shape = body._shape = context.entities._shape_of(body._entity)
+        _, self._pos[i], self._ext[i], body._pieces = self._measure(shape)
+        self._synced[i] = self._pos[i]
+        self._wake_rows([i])
+
+    def remove(self, body: BodyObject | object):
+        """
+        Retire un corps du monde (ses voisins sont réveillés)
+
+        Args:
+            body (BodyObject | Entity) : corps ou entité simulée
+        """
+        if not isinstance(body, BodyObject):
+            body = self._by_entity.get(body)
+        if body is None or body._index is None:
+            _raise_error(self, 'remove', 'Body is not in the world')
+        self._remove(body)
+
+    def _remove(self, body: BodyObject):
+        """Implémentation interne de remove (échange avec la dernière ligne)"""
+        i, last = body._index, self._n - 1
+        self._wake_rows(self._touching(i))     # îlots entiers des corps en contact (et du corps retiré)
+        if i != last:
+            for array in self._arrays():
+                array[i] = array[last]
+            island = self._island[:last]
+            island[island == last] = i
+            moved = self._bodies[last]
+            moved._index = i
+            self._bodies[i] = moved
+        self._bodies.pop()
+        del self._by_entity[body._entity]
+        body._index = None
+        self._n -= 1
+
+    def clear(self):
+        """Retire tous les corps"""
+        for body in self._bodies:
+            body._index = None
+        self._bodies.clear()
+        self._by_entity.clear()
+        self._n = 0
+        self._accumulator = 0.0
+
+    # ======================================== SIMULATION ========================================
+    def update(self):
+        """Avance la simulation du temps de la frame, par pas fixes (appelé par la boucle principale)"""
+        if not self._n:
+            return
+        self._accumulator = min(self._accumulator + context.time.dt, self.MAX_STEPS * self._timestep)
+        while self._accumulator >= self._timestep:
+            self._step(self._timestep)
+            self._accumulator -= self._timestep
+        self._sync()
+
+    def step(self, dt: Real = None):
+        """
+        Avance la simulation d'un pas et met à jour les entités
+
+        Args:
+            dt (Real, optional) : durée du pas (défaut: timestep)
+        """
+        if dt is not None and (not isinstance(dt, Real) or dt <= 0):
+            _raise_error(self, 'step', 'Invalid dt argument')
+        self._step(self._timestep if dt is None else float(dt))
+        self._sync()
+
+    def _step(self, dt: float):
+        """Implémentation interne de step"""
+        n = self._n
+        awake = self._awake[:n]
+        if not awake.any():
+            return      # monde endormi : aucun coût
+        pos, vel, ext, inv = self._pos[:n], self._vel[:n], self._ext[:n], self._inv_mass[:n]
+
+        # broad-phase sur les boîtes élargies du déplacement prévisible
+        pad = np.hypot(vel[:, 0], vel[:, 1]) * dt + self.MARGIN
+        a, b = self._broad_phase(pos, ext, pad, awake)
+
+        # réveil des îlots endormis touchés par un corps éveillé (avant la simulation)
+        if a.size:
+            sleeping = (inv > 0) & ~awake
+            mixed = (awake[a] & sleeping[b]) | (awake[b] & sleeping[a])
+            if mixed.any():
+                _, depth = self._narrow_phase(a[mixed], b[mixed], pos)
+                near = depth > -pad[a[mixed]] - pad[b[mixed]]
+                if near.any():
+                    self._wake_rows(np.concatenate((a[mixed][near], b[mixed][near])))
+                    a, b = self._broad_phase(pos, ext, pad, awake)
+
+        h = dt / self.SUBSTEPS
+        gravity = self._gravity * h
+        contacts = (a[:0], b[:0])
+        for _ in range(self.SUBSTEPS):
+            moving = np.flatnonzero(awake)
+            start = pos.copy()
+            vel[moving] += gravity
+            pos[moving] += vel[moving] * h
+            before = vel.copy()
+
+            normal, depth = self._narrow_phase(a, b, pos)
+            touching = depth > 0
+            ca, cb, cn = a[touching], b[touching], normal[touching]
+            pushed = self._solve_positions(ca, cb, cn, depth[touching], pos, inv, n)
+
+            # vitesses déduites des positions, puis corrigées aux contacts
+            vel[moving] = (pos[moving] - start[moving]) / h
+            self._solve_velocities(ca, cb, cn, pushed, vel, before, inv, h, n)
+            vel[~awake] = 0.0
+            near = depth > -self.MARGIN      # contacts au repos compris (séparation d'arrondi entre deux sous-pas)
+            contacts = (a[near], b[near])
+
+        self._update_sleep(contacts, dt, n)
+
+    # ======================================== BROAD-PHASE ========================================
+    @staticmethod
+    def _broad_phase(pos: np.ndarray, ext: np.ndarray, pad: np.ndarray, awake: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Paires candidates (a, b) par balayage trié sur l'axe le plus étalé (au moins un corps éveillé)"""
+        n = pos.shape[0]
+        low = pos - ext - pad[:, None]
+        high = pos + ext + pad[:, None]
+        axis = int(np.argmax(np.ptp(pos, axis=0))) if n > 1 else 0
+        other = 1 - axis
+
+        order = np.argsort(low[:, axis], kind='stable')
+        ends = np.searchsorted(low[order, axis], high[order, axis], side='right')
+        rank = np.arange(n)
+        counts = np.maximum(ends - rank - 1, 0)
+        total = int(counts.sum())
+        first = np.repeat(rank, counts)
+        second = first + 1 + np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        a, b = order[first], order[second]
+        keep = (low[a, other] <= high[b, other]) & (low[b, other] <= high[a, other]) & (awake[a] | awake[b])
+        return a[keep], b[keep]
+
+    # ======================================== NARROW-PHASE ========================================
+    def _narrow_phase(self, a: np.ndarray, b: np.ndarray, pos: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Normales (a -> b) et profondeurs de pénétration des paires (profondeur négative : séparées)"""
+        normal = np.zeros((a.size, 2))
+        depth = np.full(a.size, -np.inf)
+        if not a.size:
+            return normal, depth
+        ka, kb = self._kind[a], self._kind[b]
+        ext = self._ext
+        d = pos[b] - pos[a]
+
+        # cercle - cercle
+        m = (ka == self.CIRCLE) & (kb == self.CIRCLE)
+        if m.any():
+            dm = d[m]
+            dist = np.hypot(dm[:, 0], dm[:, 1])
+            safe = np.where(dist > 1e-12, dist, 1.0)
+            normal[m] = np.where((dist > 1e-12)[:, None], dm / safe[:, None], (0.0, 1.0))
+            depth[m] = ext[a[m], 0] + ext[b[m], 0] - dist
+
+        # boîte - boîte : axe de moindre pénétration
+        m = (ka == self.BOX) & (kb == self.BOX)
+        if m.any():
+            dm = d[m]
+            overlap = ext[a[m]] + ext[b[m]] - np.abs(dm)
+            use_x = overlap[:, 0] < overlap[:, 1]
+            sign = np.where(dm >= 0, 1.0, -1.0)
+            normal[m] = np.where(use_x[:, None], np.column_stack((sign[:, 0], np.zeros(use_x.size))), np.column_stack((np.zeros(use_x.size), sign[:, 1])))
+            depth[m] = np.minimum(overlap[:, 0], overlap[:, 1])
+
+        # cercle - boîte (dans les deux ordres)
+        for circle_first in (True, False):
+            m = (ka == self.CIRCLE) & (kb == self.BOX) if circle_first else (ka == self.BOX) & (kb == self.CIRCLE)
+            if not m.any():
+                continue
+            c, box = (a[m], b[m]) if circle_first else (b[m], a[m])
+            n_cb, depth_cb = self._circle_box(pos[c], ext[c, 0], pos[box], ext[box])
+            normal[m] = n_cb if circle_first else -n_cb
+            depth[m] = depth_cb
+
+        # polygones : SAT sur les pièces convexes
+        for k in np.flatnonzero((ka == self.POLYGON) | (kb == self.POLYGON)).tolist():
+            contact = self._polygon_contact(int(a[k]), int(b[k]), pos)
+            if contact is not None:
+                normal[k], depth[k] = contact
+        return normal, depth
+
+    @staticmethod
+    def _circle_box(centers: np.ndarray, radii: np.ndarray, boxes: np.ndarray, half: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Normales (cercle -> boîte) et profondeurs cercles / boîtes"""
+        rel = centers - boxes
+        clamped = np.clip(rel, -half, half)
+        diff = rel - clamped
+        dist = np.hypot(diff[:, 0], diff[:, 1])
+        inside = dist <= 1e-12
+        safe = np.where(inside, 1.0, dist)
+        normal = -diff / safe[:, None]
+        depth = radii - dist
+
+        # centre dans la boîte : sortie par la face la plus proche
+        if inside.any():
+            gap = half[inside] - np.abs(rel[inside])
+            use_x = gap[:, 0] < gap[:, 1]
+            sign = np.where(rel[inside] >= 0, -1.0, 1.0)
+            normal[inside] = np.where(use_x[:, None], np.column_stack((sign[:, 0], np.zeros(use_x.size))), np.column_stack((np.zeros(use_x.size), sign[:, 1])))
+            depth[inside] = radii[inside] + np.minimum(gap[:, 0], gap[:, 1])
+        return normal, depth
+
+    def _polygon_contact(self, i: int, j: int, pos: np.ndarray) -> tuple[tuple[float, float], float] | None:
+        """Contact (normale i -> j, profondeur) entre deux corps dont au moins un polygone"""
+        if self._kind[i] == self.CIRCLE or self._kind[j] == self.CIRCLE:
+            c, p, flip = (i, j, 1.0) if self._kind[i] == self.CIRCLE else (j, i, -1.0)
+            contact = self._circle_pieces(float(pos[c, 0]), float(pos[c, 1]), float(self._ext[c, 0]), self._world_pieces(p, pos))
+            if contact is None:
+                return None
+            (nx, ny), depth = contact
+            return (flip * nx, flip * ny), depth
+
+        best = None
+        for own, own_axes in self._world_pieces(i, pos):
+            for coords, axes in self._world_pieces(j, pos):
+                hit = context.geometry.Polygon._separating_axes(own, own_axes, coords, axes)
+                if hit is not None and (best is None or hit[1] > best[1]):
+                    best = hit
+        if best is None:
+            return None
+        (nx, ny), depth = best
+        return (-nx, -ny), depth        # axe orienté pour éloigner i : normale i -> j opposée
+
+    def _world_pieces(self, i: int, pos: np.ndarray) -> list[tuple[tuple, tuple]]:
+        """Pièces convexes (sommets, normales) d'un corps en coordonnées du monde"""
+        x, y = float(pos[i, 0]), float(pos[i, 1])
+        if self._kind[i] == self.BOX:
+            hx, hy = float(self._ext[i, 0]), float(self._ext[i, 1])
+            return [(((x - hx, y - hy), (x + hx, y - hy), (x + hx, y + hy), (x - hx, y + hy)), ((1.0, 0.0), (0.0, 1.0)))]
+        return [(tuple((x + px, y + py) for px, py in coords), axes) for coords, axes in self._bodies[i]._pieces]
+
+    @staticmethod
+    def _circle_pieces(cx: float, cy: float, r: float, pieces: list[tuple[tuple, tuple]]) -> tuple[tuple[float, float], float] | None:
+        """Contact (normale cercle -> pièce, profondeur) le plus profond entre un cercle et des pièces convexes"""
+        best = None
+        for coords, _ in pieces:
+            # distance signée au contour : maximum des distances aux arêtes (négatif à l'intérieur)
+            count = len(coords)
+            area = sum(coords[k][0] * coords[(k + 1) % count][1] - coords[(k + 1) % count][0] * coords[k][1] for k in range(count))
+            orient = 1.0 if area > 0 else -1.0
+            outside, inside = None, None
+            for k in range(count):
+                (x1, y1), (x2, y2) = coords[k], coords[(k + 1) % count]
+                ex, ey = x2 - x1, y2 - y1
+                length_sq = ex * ex + ey * ey
+                if length_sq < 1e-18:
+                    continue
+                t = max(0.0, min(1.0, ((cx - x1) * ex + (cy - y1) * ey) / length_sq))
+                qx, qy = x1 + t * ex, y1 + t * ey
+                dist = math.hypot(cx - qx, cy - qy)
+                if outside is None or dist < outside[0]:
+                    outside = (dist, qx, qy)
+                # normale extérieure de l'arête
+                length = math.sqrt(length_sq)
+                nx, ny = orient * ey / length, -orient * ex / length
+                signed = (cx - x1) * nx + (cy - y1) * ny
+                if inside is None or signed > inside[0]:
+                    inside = (signed, nx, ny)
+            if outside is None:
+                continue
+            if inside[0] <= 0:
+                # centre dans la pièce : sortie par l'arête la plus proche
+                contact = ((inside[1], inside[2]), r - inside[0])
+            else:
+                dist, qx, qy = outside
+                if dist <= 1e-12:
+                    continue
+                contact = (((qx - cx) / dist, (qy - cy) / dist), r - dist)
+            if contact[1] > 0 and (best is None or contact[1] > best[1]):
+                best = contact
+        return best
+
+    # ======================================== SOLVEUR ========================================
+    def _solve_positions(self, a: np.ndarray, b: np.ndarray, normal: np.ndarray, depth: np.ndarray, pos: np.ndarray, inv: np.ndarray, n: int) -> np.ndarray:
+        """Sépare les corps en contact (Jacobi moyenné), renvoie la correction normale de chaque contact"""
+        if not a.size:
+            return np.zeros(0)
+        wa, wb = inv[a], inv[b]
+        w = wa + wb
+        base = pos[b] - pos[a]
+        scale = self._contact_scale(a, b, wa, wb, n, self.RELAXATION)
+        for _ in range(self.ITERATIONS):
+            # profondeur actualisée par les corrections déjà appliquées
+            moved = np.einsum('ij,ij->i', (pos[b] - pos[a]) - base, normal)
+            step = np.maximum(depth - moved, 0.0) / w
+            self._apply(a, b, wa, wb, step[:, None] * normal, pos, scale, n)
+        return np.maximum(np.einsum('ij,ij->i', (pos[b] - pos[a]) - base, normal), 0.0)
+
+    def _solve_velocities(self, a: np.ndarray, b: np.ndarray, normal: np.ndarray, pushed: np.ndarray, vel: np.ndarray, before: np.ndarray, inv: np.ndarray, h: float, n: int):
+        """Fixe la vitesse normale des contacts au rebond, avec frottement de Coulomb (Jacobi moyenné)"""
+        if not a.size:
+            return
+        wa, wb = inv[a], inv[b]
+        w = wa + wb
+        rel = vel[b] - vel[a]
+        vn = np.einsum('ij,ij->i', rel, normal)
+        vn_before = np.einsum('ij,ij->i', before[b] - before[a], normal)
+
+        # rebond au-delà d'un seuil de vitesse, sinon vitesse normale nulle (pas d'énergie issue des corrections)
+        threshold = 2 * math.hypot(*self._gravity) * h
+        restitution = np.where(-vn_before > threshold, np.maximum(self._restitution[a], self._restitution[b]), 0.0)
+        dvn = np.maximum(-restitution * vn_before, 0.0) - vn
+
+        # frottement borné par la correction normale (impulsion / h)
+        tangent = rel - vn[:, None] * normal
+        vt = np.hypot(tangent[:, 0], tangent[:, 1])
+        mu = np.sqrt(self._friction[a] * self._friction[b])
+        ratio = np.minimum(mu * pushed / h / np.maximum(vt, 1e-12), 1.0)
+        scale = self._contact_scale(a, b, wa, wb, n, 1.0)
+        self._apply(a, b, wa, wb, (dvn / w)[:, None] * normal - (ratio / w)[:, None] * tangent, vel, scale, n)
+
+    @staticmethod
+    def _contact_scale(a: np.ndarray, b: np.ndarray, wa: np.ndarray, wb: np.ndarray, n: int, relaxation: float) -> np.ndarray:
+        """Facteur de moyenne par corps : relaxation / nombre de contacts (au plus 1)"""
+        counts = np.bincount(a[wa > 0], minlength=n) + np.bincount(b[wb > 0], minlength=n)
+        return np.minimum(relaxation / np.maximum(counts, 1), 1.0)
+
+    @staticmethod
+    def _apply(a: np.ndarray, b: np.ndarray, wa: np.ndarray, wb: np.ndarray, delta: np.ndarray, target: np.ndarray, scale: np.ndarray, n: int):
+        """Répartit des corrections de contact (a -> b) selon les masses inverses et les accumule par corps"""
+        for axis in (0, 1):
+            change = np.bincount(b, weights=wb * delta[:, axis], minlength=n) - np.bincount(a, weights=wa * delta[:, axis], minlength=n)
+            target[:, axis] += change * scale
+
+    # ======================================== SOMMEIL ========================================
+    def _update_sleep(self, contacts: tuple[np.ndarray, np.ndarray], dt: float, n: int):
+        """Met à jour les îlots et endort ceux dont tous les corps sont au repos"""
+        awake, vel, rest = self._awake[:n], self._vel[:n], self._rest[:n]
+        slow = np.einsum('ij,ij->i', vel, vel) < self.SLEEP_SPEED ** 2
+        rest[:] = np.where(awake & slow, rest + dt, 0.0)
+
+        # un corps éveillé au contact d'un corps endormi réveille son îlot : les deux partagent ensuite une étiquette
+        a, b = contacts
+        dynamic = self._inv_mass[:n] > 0
+        mixed = dynamic[a] & dynamic[b] & (awake[a] != awake[b])
+        if mixed.any():
+            self._wake_rows(np.where(awake[a[mixed]], b[mixed], a[mixed]))
+
+        # les corps endormis gardent leur îlot (absents de la broad-phase)
+        labels = np.where(awake, self._label_islands(*contacts, n), self._island[:n])
+        self._island[:n] = labels
+        calm = np.full(n, np.inf)
+        np.minimum.at(calm, labels[awake], rest[awake])
+        asleep = awake & (calm[labels] >= self.SLEEP_TIME)
+        awake[asleep] = False
+        vel[asleep] = 0.0
+
+    def _label_islands(self, a: np.ndarray, b: np.ndarray, n: int) -> np.ndarray:
+        """Étiquette les composantes connexes des corps dynamiques en contact (propagation du minimum)"""
+        labels = np.arange(n)
+        dynamic = self._inv_mass[:n] > 0
+        link = dynamic[a] & dynamic[b]
+        a, b = a[link], b[link]
+        while a.size:
+            low = np.minimum(labels[a], labels[b])
+            new = labels.copy()
+            np.minimum.at(new, a, low)
+            np.minimum.at(new, b, low)
+            np.minimum.at(new, labels[a], low)
+            np.minimum.at(new, labels[b], low)
+            new = new[new]
+            if np.array_equal(new, labels):
+                break
+            labels = new
+        return labels
+
+    def _touching(self, i: int) -> np.ndarray:
+        """Renvoie les corps dont la boîte englobante (élargie de la marge) touche celle d'un corps, lui compris"""
+        n = self._n
+        gap = np.abs(self._pos[:n] - self._pos[i]) - self._ext[:n] - self._ext[i]
+        return np.flatnonzero(np.all(gap <= self.MARGIN, axis=1))
+
+    def _wake_rows(self, rows: Iterable[int]):
+        """Réveille des corps dynamiques et les îlots auxquels ils appartiennent"""
+        n = self._n
+        rows = np.asarray(rows, dtype=np.intp)
+        if not rows.size:
+            return
+        woken = np.isin(self._island[:n], self._island[rows]) & (self._inv_mass[:n] > 0)
+        self._awake[:n] |= woken
+        self._rest[:n][woken] = 0.0
+
+    # ======================================== SYNCHRONISATION ========================================
+    def _sync(self):
+        """Reporte les positions modifiées dans les formes des entités"""
+        n = self._n
+        moved = np.flatnonzero(np.any(self._pos[:n] != self._synced[:n], axis=1))
+        if moved.size:
+            self._sync_rows(moved)
+
+    def _sync_rows(self, rows: Iterable[int]):
+        """Reporte la position de corps donnés dans leurs entités (écriture directe pour les cercles et boîtes)"""
+        rows = np.asarray(rows, dtype=np.intp)
+        kinds = self._kind[rows].tolist()
+        corners = np.round(self._pos[rows] - np.where((self._kind[rows] == self.BOX)[:, None], self._ext[rows], 0.0), context.geometry.Point.PRECISION).tolist()
+        shifts = (self._pos[rows] - self._synced[rows]).tolist()
+        new_point, new_vector = context.geometry.Point._new, context.geometry.Vector._new
+        for i, kind, (x, y), shift in zip(rows.tolist(), kinds, corners, shifts):
+            shape = self._bodies[i]._shape
+            if kind == self.BOX:
+                shape._x, shape._y = x, y
+            elif kind == self.CIRCLE:
+                shape._center = new_point([x, y])
+                shape._invalidate()
+            else:
+                shape._translate(new_vector(shift))
+        self._synced[rows] = self._pos[rows]
+
+    # ======================================== STOCKAGE ========================================
+    def _arrays(self) -> tuple[np.ndarray, ...]:
+        """Renvoie les tableaux du monde"""
+        return (self._pos, self._vel, self._ext, self._synced, self._inv_mass, self._restitution, self._friction, self._kind, self._awake, self._rest, self._island)
+
+    def _grow(self, capacity: int):
+        """Agrandit les tableaux du monde"""
+        names = ('_pos', '_vel', '_ext', '_synced', '_inv_mass', '_restitution', '_friction', '_kind', '_awake', '_rest', '_island')
+        for name, array in zip(names, self._arrays()):
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:array.shape[0]] = array
+            setattr(self, name, grown)
+
+
+# ======================================== INSTANCE ========================================
+physics_manager = PhysicsManager()
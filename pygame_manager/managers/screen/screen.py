@@ -1,6 +1,7 @@
 # ======================================== IMPORTS ========================================
 from ... import context
 import os
+import weakref
 try:
     import pygame
 except ImportError:
@@ -17,7 +18,11 @@ class ScreenManager:
         supporte la quasi totalité des méthodes de pygame.Surface
         facilite grandement le paramètrage et la maintenance de la fenêtre
         permet un transformation automatique de l'écran virtuel vers la fenêtre réel
+        alloue les surfaces au format de la fenêtre (pool par dimensions, conversion automatique)
     """
+    POOL_SIZE = 8                                                                                                   # surfaces conservées par dimensions
+    POOL_BYTES = 64 * 1024 * 1024                                                                                   # mémoire maximale du pool
+
     def __init__(self, screen: tuple[int]=(1920, 1080), window: tuple[int]=(1280, 720)):
         # buffer
         self._to_draw = []
@@ -44,6 +49,14 @@ class ScreenManager:
         self._window_height = window[1]
         self._window = pygame.display.set_mode((self._window_width, self._window_height), pygame.RESIZABLE, pygame.HWSURFACE | pygame.DOUBLEBUF, vsync=False)
         self._window_resizable = True                                                                              # possibilité de redimensionner la fenêtre
+        self._screen = self._screen.convert()                                                                      # écran virtuel au format de la fenêtre
+
+        # pool de surfaces
+        self._pool = {}                                                                                            # {(largeur, hauteur, alpha): [surfaces libres]}
+        self._pool_bytes = 0
+        self._alpha_format = None                                                                                  # modèle de format alpha de la fenêtre
+        self._leased = weakref.WeakKeyDictionary()                                                                 # {surface prêtée: clé du pool}
+        self._surface_stats = dict.fromkeys(("acquired", "allocated", "reused", "released", "dropped", "converted", "opaque"), 0)
 
         # plein écran
         self._fullscreen = False
@@ -482,6 +495,136 @@ class ScreenManager:
             pygame.image.save(capture, path)
         return capture
 
+    # ======================================== ALLOCATION DES SURFACES ========================================
+    @property
+    def surface_stats(self) -> dict[str, int]:
+        """
+        Renvoie les compteurs d'allocation des surfaces
+
+        acquired : surfaces demandées au pool
+        allocated : surfaces réellement créées
+        reused : surfaces resservies par le pool
+        released : surfaces rendues au pool
+        dropped : surfaces rendues mais non conservées (pool plein)
+        converted : surfaces converties au format de la fenêtre
+        opaque : conversions sans canal alpha (aucun pixel transparent)
+        pooled : surfaces libres dans le pool
+        pooled_bytes : mémoire occupée par le pool
+        """
+        stats = dict(self._surface_stats)
+        stats["pooled"] = sum(len(bucket) for bucket in self._pool.values())
+        stats["pooled_bytes"] = self._pool_bytes
+        return stats
+
+    def reset_surface_stats(self):
+        """
+        Remet à zéro les compteurs d'allocation des surfaces
+        """
+        for key in self._surface_stats:
+            self._surface_stats[key] = 0
+
+    def acquire(self, size: tuple[int, int], alpha: bool = True, clear: bool = True) -> pygame.Surface:
+        """
+        Renvoie une surface au format de la fenêtre (resservie par le pool si possible)
+
+        Args:
+            size (tuple[int, int]) : dimensions de la surface
+            alpha (bool, optional) : canal alpha par pixel
+            clear (bool, optional) : surface vierge ; False si l'appelant recouvre tous les pixels (évite un remplissage)
+        """
+        if not isinstance(size, tuple) or len(size) != 2 or not all(isinstance(e, (int, float)) and e >= 0 for e in size):
+            self._raise_error('acquire', 'Size must be a tuple containing two positive int values')
+        if not isinstance(alpha, bool):
+            self._raise_error('acquire', 'alpha parameter must be a boolean')
+        if not isinstance(clear, bool):
+            self._raise_error('acquire', 'clear parameter must be a boolean')
+        return self._acquire((int(size[0]), int(size[1])), alpha, clear)
+
+    def release(self, surface: pygame.Surface | None):
+        """
+        Rend une surface au pool (ignore None et les surfaces qui n'en proviennent pas)
+
+        Args:
+            surface (pygame.Surface) : surface obtenue par acquire, qui ne doit plus être utilisée
+        """
+        if surface is not None and not isinstance(surface, pygame.Surface):
+            self._raise_error('release', 'Surface must be a Surface object')
+        self._release(surface)
+
+    def optimize(self, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Renvoie la surface au format de blit le plus rapide pour la fenêtre
+        (copie sans canal alpha si aucun pixel n'est transparent) ; une surface du pool copiée y est rendue
+
+        Args:
+            surface (pygame.Surface) : surface à convertir
+        """
+        if not isinstance(surface, pygame.Surface):
+            self._raise_error('optimize', 'Surface must be a Surface object')
+        optimized = self._optimize(surface)
+        if optimized is not surface:
+            self._release(surface)
+        return optimized
+
+    def _acquire(self, size: tuple[int, int], alpha: bool, clear: bool = True) -> pygame.Surface:
+        """Sort une surface du pool ou en crée une au format de la fenêtre"""
+        self._surface_stats["acquired"] += 1
+        key = (size[0], size[1], alpha)
+        bucket = self._pool.get(key)
+        if bucket:
+            surface = bucket.pop()
+            self._pool_bytes -= size[0] * size[1] * surface.get_bytesize()
+            surface.set_alpha(255 if alpha else None)                                                               # None retirerait le canal alpha par pixel
+            if clear:
+                surface.fill((0, 0, 0, 0))
+            self._surface_stats["reused"] += 1
+        else:
+            surface = pygame.Surface(size, pygame.SRCALPHA if alpha else 0, *self._format(alpha))                  # créée directement au bon format (sans copie)
+            self._surface_stats["allocated"] += 1
+        self._leased[surface] = key
+        return surface
+
+    def _format(self, alpha: bool) -> tuple[pygame.Surface]:
+        """Renvoie la surface modèle du format de la fenêtre (vide si aucune fenêtre)"""
+        window = pygame.display.get_surface()
+        if window is None:
+            return ()
+        if not alpha:
+            return (window,)
+        if self._alpha_format is None:
+            self._alpha_format = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+        return (self._alpha_format,)
+
+    def _release(self, surface: pygame.Surface | None):
+        """Range une surface prêtée dans le pool (dans la limite des capacités)"""
+        key = self._leased.pop(surface, None) if surface is not None else None
+        if key is None:
+            return
+        size = key[0] * key[1] * surface.get_bytesize()
+        bucket = self._pool.setdefault(key, [])
+        if len(bucket) >= self.POOL_SIZE or self._pool_bytes + size > self.POOL_BYTES:
+            self._surface_stats["dropped"] += 1
+            return
+        surface.set_clip(None)
+        bucket.append(surface)
+        self._pool_bytes += size
+        self._surface_stats["released"] += 1
+
+    def _optimize(self, surface: pygame.Surface) -> pygame.Surface:
+        """Convertit une surface au format de la fenêtre (convert si entièrement opaque, convert_alpha sinon)"""
+        if pygame.display.get_surface() is None:
+            return surface
+        width, height = surface.get_size()
+        if surface.get_flags() & pygame.SRCALPHA and (width * height == 0 or pygame.mask.from_surface(surface, 254).count() != width * height):
+            if surface.get_masks() == self._format(True)[0].get_masks():                                          # déjà au format alpha de la fenêtre : conservée telle quelle
+                self._leased.pop(surface, None)
+                return surface
+            self._surface_stats["converted"] += 1
+            return surface.convert_alpha()
+        self._surface_stats["converted"] += 1
+        self._surface_stats["opaque"] += 1
+        return surface.convert()
+
 
 # ======================================== INSTANCE ========================================
 screen_manager = ScreenManager()
\ No newline at end of file
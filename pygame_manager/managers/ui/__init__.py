@@ -12,6 +12,10 @@ from .ui import (
     CircleSelectorObject,
     TextCaseObject,
     InputButtonObject,
+    GlyphAtlasObject,
+    LayoutObject,
+    ListViewObject,
+    TableViewObject,
 )
 
 __all__ = [
@@ -28,4 +32,8 @@ __all__ = [
     "CircleSelectorObject",
     "TextCaseObject",
     "InputButtonObject",
+    "GlyphAtlasObject",
+    "LayoutObject",
+    "ListViewObject",
+    "TableViewObject",
 ]
\ No newline at end of file
@@ -206,54 +206,25 @@ class CircleButtonObject:
                 self._font_size = max(3, int(self._radius * 0.7))
 
             self.font_type = "font"
-            if self._font is None: # chargement de la police
-                if self._font_path is not None:
-                    try:
-                        self._font = pygame.font.Font(self._font_path, self._font_size)
-                        self.font_type = "path"
-                    except Exception as _:
-                        if self._sysfont is not None:
-                            self._font = pygame.font.SysFont(self._sysfont, self._font_size)
-                            self.font_type = "sysfont"
-                        else:
-                            self._font = pygame.font.Font(None, self._font_size)
-                            self.font_type = "default"
-                else:
-                    if self._sysfont is not None:
-                        self._font = pygame.font.SysFont(self._sysfont, self._font_size)
-                        self.font_type = "sysfont"
-                    else:
-                        self._font = pygame.font.Font(None, self._font_size)
-                        self.font_type = "default"
-
-            # Auto ajustement
-            test_font_size = self._font_size
-            test_font = self._font
-            text_render_test = self._font.render(self._text, True, (0, 0, 0))
+            if self._font is None: # chargement de la police (registre partagé : effets inclus)
+                self._font = context.ui.get_font(self._font_size, self._sysfont, self._font_path, bold, italic, underline)
+                self.font_type = "path" if self._font_path is not None else "sysfont" if self._sysfont is not None else "default"
+
+            # Auto ajustement (mesuré, mémoïsé par le gestionnaire)
             if self.font_type != "font":
-                diameter = 2 * self._radius
-                while text_render_test.get_width() / diameter > self._font_size_ratio_limit and test_font_size > 5:
-                    test_font_size -= 1
-                    if self.font_type == "path":
-                        test_font = pygame.font.Font(self._font_path, test_font_size)
-                    elif self.font_type == "sysfont":
-                        test_font = pygame.font.SysFont(self._sysfont, test_font_size)
-                    else:
-                        test_font = pygame.font.Font(None, test_font_size)
-                    text_render_test = test_font.render(self._text, True, (0, 0, 0))
-
-            self._font_size = test_font_size
-            self._font = test_font
-            self._font_hover = test_font
+                fitted_size = context.ui.fit_font_size(self._text, self._font_size, self._font_size_ratio_limit * 2 * self._radius, min_size=5, sysfont=self._sysfont, path=self._font_path, bold=bold, italic=italic, underline=underline)
+                if fitted_size != self._font_size:
+                    self._font_size = fitted_size
+                    self._font = context.ui.get_font(fitted_size, self._sysfont, self._font_path, bold, italic, underline)
+            self._font_hover = self._font
+
+            # Effets (police fournie ; une police du registre est remplacée par sa variante, jamais modifiée)
+            if self.font_type == "font":
+                self._font = self._font_hover = context.ui._styled_font(self._font, bold, italic, underline)
 
             # Génération (classic)
             self._text_object = self._font.render(self._text, 1, self._font_color)
 
-            # Effets
-            self._font.set_bold(bold)
-            self._font.set_italic(italic)
-            self._font.set_underline(underline)
-            
             # Génération (hover)
             self._text_object_hover = self._font.render(self._text, 1, self._font_color_hover)
 
@@ -268,7 +239,6 @@ class CircleButtonObject:
 
         # effet de survol
         self._scale_ratio = 1.0
-        self._last_scale_ratio = 1.0
         self._hover_scale_ratio = float(hover_scale_ratio)
         self._hover_scale_duration = float(hover_scale_duration)
 
@@ -324,6 +294,7 @@ class CircleButtonObject:
         if not isinstance(value, int):
             _raise_error(self, 'set_zorder', 'Invalid zorder argument')
         self._zorder = value
+        context.ui._reorder(self)
 
     @visible.setter
     def visible(self, value: bool):
@@ -360,7 +331,7 @@ class CircleButtonObject:
     def load_default(self) -> pygame.Surface:
         """Génère la surface par défaut du bouton"""
         diameter = self._radius * 2
-        surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+        surface = context.screen.acquire((diameter, diameter))
         if self._filling:
             pygame.draw.circle(surface, self._filling_color, self._local_center, self._radius)
         if self._icon is not None:
@@ -369,12 +340,12 @@ class CircleButtonObject:
             surface.blit(self._text_object, self._text_object_rect)
         if self._border_width > 0:
             pygame.draw.circle(surface, self._border_color, self._local_center, self._radius, self._border_width)
-        return surface
+        return context.screen.optimize(surface)
 
     def load_hover(self) -> pygame.Surface:
         """Génère la surface survolée du bouton"""
         diameter = self._radius * 2
-        surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+        surface = context.screen.acquire((diameter, diameter))
         if self._filling_hover:
             pygame.draw.circle(surface, self._filling_color_hover, self._local_center, self._radius)
         if self._icon_hover is not None:
@@ -383,7 +354,7 @@ class CircleButtonObject:
             surface.blit(self._text_object_hover, self._text_object_rect)
         if self._border_width > 0:
             pygame.draw.circle(surface, self._border_color_hover, self._local_center, self._radius, self._border_width)
-        return surface
+        return context.screen.optimize(surface)
 
     # ======================================== METHODES DYNAMIQUES ========================================
     def kill(self):
@@ -404,13 +375,8 @@ class CircleButtonObject:
         else:
             self._scale_ratio = target_ratio
 
-        # Redimensionnement
-        surface = self._preloaded["hover" if self.hovered else "default"]
-        surface_rect = surface.get_rect()
-        if self._last_scale_ratio != self._scale_ratio:
-            self._surface = pygame.transform.smoothscale(surface, (surface_rect.width * self._scale_ratio, surface_rect.height * self._scale_ratio))
-        else:
-            self._surface = surface
+        # Redimensionnement (variante partagée du gestionnaire, ratio quantifié)
+        self._surface = context.ui._get_scaled(self._preloaded["hover" if self.hovered else "default"], self._scale_ratio)
         self._surface_rect = self._surface.get_rect(center=self._rect.center)
 
     # ======================================== AFFICHAGE ========================================
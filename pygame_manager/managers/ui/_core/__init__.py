@@ -3,12 +3,24 @@ from .utils import *
 
 __all__ = [
     "pygame",
+    "np",
+    "hashlib",
     "Real",
     "Iterable",
     "Tuple",
+    "OrderedDict",
+    "contextmanager",
+    "WeakKeyDictionary",
+    "bisect_left",
+    "bisect_right",
     "context",
 
     "Sequence",
     "_raise_error",
     "_to_color",
+    "_gradient_positions",
+    "_gradient_bands",
+    "_wave_colors",
+    "_alpha_bits",
+    "_paint_gradient",
 ]
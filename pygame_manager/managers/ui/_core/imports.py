@@ -1,5 +1,7 @@
 # ======================================== LIBS ========================================
 import pygame
+import numpy as np
+import hashlib
 
 # ======================================== TYPAGE ========================================
 from numbers import (
@@ -11,13 +13,37 @@ from typing import (
     Tuple,
 )
 
+from collections import (
+    OrderedDict,
+)
+
+from contextlib import (
+    contextmanager,
+)
+
+from weakref import (
+    WeakKeyDictionary,
+)
+
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+
 from .... import context
 
 # ======================================== EXPORTS ========================================
 __all__ = [
     "pygame",
+    "np",
+    "hashlib",
     "Real",
     "Iterable",
     "Tuple",
+    "OrderedDict",
+    "contextmanager",
+    "WeakKeyDictionary",
+    "bisect_left",
+    "bisect_right",
     "context",
 ]
\ No newline at end of file
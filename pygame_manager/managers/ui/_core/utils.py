@@ -17,9 +17,57 @@ def _to_color(color: pygame.Color | Iterable[int], fallback: object=None, raised
         return pygame.Color(color)
     return fallback if fallback is not None else _raise_error(pygame.Color, method, message) if raised else None
 
+# ======================================== DEGRADES ========================================
+def _gradient_positions(width: int, height: int, direction: str) -> np.ndarray:
+    """Position (0 à 1) de chaque pixel le long d'un dégradé, tableau diffusable sur (largeur, hauteur) (float64 : i / (n - 1) exact)"""
+    x = (np.arange(width, dtype=np.float64) / max(width - 1, 1)).reshape((width, 1))
+    y = (np.arange(height, dtype=np.float64) / max(height - 1, 1)).reshape((1, height))
+    if direction == "vertical":
+        return y
+    if direction == "diagonal":
+        return (x + y) * 0.5
+    return x
+
+def _gradient_bands(positions: np.ndarray, count: int) -> np.ndarray:
+    """Indice de bande (0 à count - 1) de chaque position"""
+    return np.minimum(count - 1, (positions * count).astype(np.intp))
+
+def _wave_colors(color: pygame.Color, other: pygame.Color, count: int, amplitude: float, phase: float, offset: int = 0) -> np.ndarray:
+    """Couleurs RGB (count, 3) d'un dégradé ondulant : mélange 0.5 + amplitude * sin(2π t + phase), t de 0 à 1"""
+    angles = np.linspace(0, 2 * np.pi, count)
+    wave = (0.5 + amplitude * np.sin(angles + phase)).reshape((count, 1))
+    return np.clip(np.subtract(other[:3], color[:3]) * wave + color[:3] + offset, 0, 255).astype(np.uint8)
+
+def _alpha_bits(surface: pygame.Surface) -> np.ndarray | None:
+    """Bits alpha des pixels d'une surface 32 bits à canal alpha (None sinon)"""
+    if surface.get_bytesize() != 4 or not surface.get_flags() & pygame.SRCALPHA:
+        return None
+    pixels = pygame.surfarray.pixels2d(surface)
+    bits = pixels & np.uint32(surface.get_masks()[3])
+    del pixels
+    return bits
+
+def _paint_gradient(surface: pygame.Surface, colors: np.ndarray, bands: np.ndarray, alpha: np.ndarray | None = None):
+    """Écrit en place la couleur de chaque pixel (colors indexée par bands), canal alpha conservé (alpha : _alpha_bits)"""
+    if surface.get_bytesize() == 4:
+        shifts = surface.get_shifts()
+        packed = colors.astype(np.uint32)
+        packed = (packed[:, 0] << shifts[0]) | (packed[:, 1] << shifts[1]) | (packed[:, 2] << shifts[2])
+        pixels = pygame.surfarray.pixels2d(surface)
+        pixels[...] = packed[bands] if alpha is None else packed[bands] | alpha
+    else:
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[...] = colors[bands]
+    del pixels
+
 # ======================================== EXPORTS ========================================
 __all__ = [
     "Sequence",
     "_raise_error",
-    "_to_color"
+    "_to_color",
+    "_gradient_positions",
+    "_gradient_bands",
+    "_wave_colors",
+    "_alpha_bits",
+    "_paint_gradient",
 ]
\ No newline at end of file
@@ -0,0 +1,163 @@
+# ======================================== IMPORTS ========================================
+from ._core import *
+
+# ======================================== OBJET ========================================
+class GlyphAtlasObject:
+    """
+    Atlas de glyphes : une police, une couleur
+
+    Fonctionnalités:
+        rasterise chaque caractère une seule fois, à la demande, dans une surface partagée
+        compose un texte par blits de régions de l'atlas (avances et crénage de la police)
+        aucune surface créée pour composer un texte
+    """
+    WIDTH = 512                 # largeur de l'atlas
+
+    def __init__(self, font: pygame.font.Font, color: pygame.Color, antialias: bool = True):
+        """
+        Args:
+            font (Font) : police rasterisée
+            color (Color) : couleur des glyphes
+            antialias (bool, optional) : antialiasing des glyphes
+        """
+        self._font = font
+        self._color = color
+        self._antialias = antialias
+
+        self._surface = pygame.Surface((self.WIDTH, 2 * font.get_linesize()), pygame.SRCALPHA)
+        self._glyphs = {}       # {caractère: (zone dans l'atlas, avance)}
+        self._kerning = {}      # {(caractère, caractère suivant): correction de l'avance}
+
+        # rangée de rangement courante
+        self._shelf_x = 0
+        self._shelf_y = 0
+        self._shelf_height = 0
+
+    # ======================================== GETTERS ========================================
+    @property
+    def font(self) -> pygame.font.Font:
+        """Renvoie la police"""
+        return self._font
+
+    @property
+    def surface(self) -> pygame.Surface:
+        """Renvoie la surface de l'atlas"""
+        return self._surface
+
+    @property
+    def glyph_count(self) -> int:
+        """Renvoie le nombre de glyphes rasterisés"""
+        return len(self._glyphs)
+
+    def size(self, text: str) -> tuple[int, int]:
+        """
+        Renvoie les dimensions du texte composé
+
+        Args:
+            text (str) : texte à mesurer
+        """
+        return self._extent(self.layout(text))
+
+    # ======================================== RENDU ========================================
+    def layout(self, text: str, start: int = 0, previous: tuple[list[int], list[int], list[int]] = None) -> tuple[list[int], list[int], list[int]]:
+        """
+        Place les glyphes d'un texte : (positions, extrémités droites cumulées, hauteurs cumulées)
+
+        Args:
+            text (str) : texte à placer
+            start (int, optional) : nombre de caractères de tête repris du placement précédent
+            previous (tuple, optional) : placement d'un texte commençant par les mêmes start caractères
+        """
+        glyphs = self._glyphs
+        kerning = self._kerning
+        if previous is not None and start > 0:
+            positions, ends, heights = previous[0][:start], previous[1][:start], previous[2][:start]
+            char = text[start - 1]
+            pen, end, height = positions[-1] + glyphs[char][1], ends[-1], heights[-1]
+        else:
+            positions, ends, heights = [], [], []
+            start, char = 0, None
+            pen = end = height = 0
+
+        for following in text[start:]:
+            glyph = glyphs.get(following)
+            if glyph is None:
+                glyph = self._add(following)
+            if char is not None:
+                kern = kerning.get((char, following))
+                if kern is None:
+                    kern = kerning[(char, following)] = self._kern(char, following)
+                pen += kern
+            area = glyph[0]
+            if pen + area.width > end:
+                end = pen + area.width
+            if area.height > height:
+                height = area.height
+            positions.append(pen)
+            ends.append(end)
+            heights.append(height)
+            pen += glyph[1]
+            char = following
+        return positions, ends, heights
+
+    def blit(self, text: str, layout: tuple[list[int], list[int], list[int]], surface: pygame.Surface, start: int = 0, dest: tuple[int, int] = (0, 0), special_flags: int = 0):
+        """
+        Blit les glyphes d'un texte placé (à partir d'un caractère)
+
+        Args:
+            text (str) : texte placé
+            layout (tuple) : placement du texte (layout)
+            surface (pygame.Surface) : surface de destination
+            start (int, optional) : indice du premier caractère blitté
+            dest (tuple[int, int], optional) : coin supérieur gauche du texte
+            special_flags (int, optional) : mode de blit (BLEND_RGBA_MAX sur une zone transparente : copie exacte)
+        """
+        atlas = self._surface
+        glyphs = self._glyphs
+        x, y = dest
+        surface.blits([(atlas, (x + pen, y), glyphs[char][0], special_flags) for char, pen in zip(text[start:], layout[0][start:])], doreturn=False)
+
+    def render(self, text: str, surface: pygame.Surface, dest: tuple[int, int] = (0, 0), special_flags: int = 0) -> pygame.Rect:
+        """
+        Compose un texte sur une surface, renvoie la zone couverte
+
+        Args:
+            text (str) : texte à composer
+            surface (pygame.Surface) : surface de destination
+            dest (tuple[int, int], optional) : coin supérieur gauche du texte
+            special_flags (int, optional) : mode de blit (BLEND_RGBA_MAX sur une zone transparente : copie exacte)
+        """
+        layout = self.layout(text)
+        self.blit(text, layout, surface, 0, dest, special_flags)
+        return pygame.Rect(dest, self._extent(layout))
+
+    def _extent(self, layout: tuple[list[int], list[int], list[int]]) -> tuple[int, int]:
+        """Dimensions d'un texte placé (hauteur de la police si vide)"""
+        return (layout[1][-1], layout[2][-1]) if layout[0] else (0, self._font.get_height())
+
+    def _kern(self, first: str, second: str) -> int:
+        """Correction d'avance d'une paire (crénage), mesurée une fois par la police"""
+        return self._font.size(first + second)[0] - self._glyphs[first][1] - self._font.size(second)[0]
+
+    def _add(self, char: str) -> tuple[pygame.Rect, int]:
+        """Rasterise un caractère dans l'atlas (agrandi si plein)"""
+        glyph = self._font.render(char, self._antialias, self._color)
+        width, height = glyph.get_size()
+        metrics = self._font.metrics(char)[0]
+        advance = metrics[4] if metrics is not None else width
+
+        if self._shelf_x + width > self.WIDTH:
+            self._shelf_x = 0
+            self._shelf_y += self._shelf_height
+            self._shelf_height = 0
+        if self._shelf_y + height > self._surface.get_height():
+            grown = pygame.Surface((self.WIDTH, 2 * self._surface.get_height() + height), pygame.SRCALPHA)
+            grown.blit(self._surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self._surface = grown
+
+        area = pygame.Rect(self._shelf_x, self._shelf_y, width, height)
+        self._surface.blit(glyph.convert_alpha() if pygame.display.get_surface() is not None else glyph, area, special_flags=pygame.BLEND_RGBA_MAX)
+        self._shelf_x += width
+        self._shelf_height = max(self._shelf_height, height)
+        self._glyphs[char] = (area, advance)
+        return self._glyphs[char]
@@ -148,6 +148,7 @@ class ImageObject:
         if not isinstance(value, int):
             _raise_error(self, 'set_zorder', 'Invalid zorder argument')
         self._zorder = value
+        context.ui._reorder(self)
 
     @visible.setter
     def visible(self, value: bool):
@@ -164,6 +165,7 @@ class ImageObject:
         self._x = value
         if self._surface:
             self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+            context.ui._moved(self)
 
     @y.setter
     def y(self, value: Real):
@@ -173,6 +175,7 @@ class ImageObject:
         self._y = value
         if self._surface:
             self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+            context.ui._moved(self)
 
     # ======================================== TRANSFORMATION ========================================
     def _update_surface(self):
@@ -200,6 +203,7 @@ class ImageObject:
 
         # mettre à jour le rect
         self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+        context.ui._moved(self)
 
     def set_position(self, x: Real, y: Real):
         """Modifie la position"""
@@ -207,6 +211,7 @@ class ImageObject:
         self._y = y
         if self._surface:
             self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+            context.ui._moved(self)
 
     def set_size(self, width: Real = None, height: Real = None):
         """Modifie la taille"""
@@ -166,8 +166,7 @@ class InputButtonObject:
         # police
         self._font_size = font_size or max(3, int(height * 0.5))
         if font is None:
-            try:    self._font = pygame.font.Font(font_path, self._font_size)
-            except: self._font = pygame.font.Font(None, self._font_size)
+            self._font = context.ui.get_font(self._font_size, path=font_path)
         else:
             self._font = font
 
@@ -178,7 +177,6 @@ class InputButtonObject:
 
         # hover scale
         self._scale_ratio          = 1.0
-        self._last_scale_ratio     = 1.0
         self._hover_scale_ratio    = float(hover_scale_ratio)
         self._hover_scale_duration = float(hover_scale_duration)
 
@@ -315,6 +313,7 @@ class InputButtonObject:
     def zorder(self, value: int):
         if not isinstance(value, int): _raise_error(self, 'zorder', 'Invalid zorder argument')
         self._zorder = value
+        context.ui._reorder(self)
 
     @visible.setter
     def visible(self, value: bool):
@@ -366,13 +365,7 @@ class InputButtonObject:
         elif self.hovered:   base = surfaces["hovered"]
         else:                base = surfaces["normal"]
 
-        if self._last_scale_ratio != self._scale_ratio:
-            w = int(base.get_width()  * self._scale_ratio)
-            h = int(base.get_height() * self._scale_ratio)
-            self._surface = pygame.transform.smoothscale(base, (w, h))
-            self._last_scale_ratio = self._scale_ratio
-        else:
-            self._surface = base
+        self._surface = context.ui._get_scaled(base, self._scale_ratio)
 
         self._surface_rect = self._surface.get_rect(center=self._rect.center)
 
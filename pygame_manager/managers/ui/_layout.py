@@ -0,0 +1,464 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from ._core import *
+
+# ======================================== OBJET ========================================
+class LayoutObject:
+    """
+    Conteneur de mise en page : place ses enfants (widgets ou conteneurs imbriqués) selon une règle
+
+    Fonctionnalités:
+        règles "row" (ligne), "column" (colonne), "grid" (grille) et "anchor" (ancrage dans la zone)
+        hébergé par un panel, une section ou l'écran (conteneur racine)
+        passe mesure / placement uniquement sur les branches invalidées (tailles et rects résolus en cache)
+        invalidation automatique : enfant redimensionné (texte modifié, ...), zone de l'hôte modifiée
+
+    Les enfants gardent leur taille : seule leur position est fixée par le conteneur.
+    Les widgets d'un conteneur hébergé par un panel doivent appartenir à ce panel.
+    """
+    MODES = ("row", "column", "grid", "anchor")
+    ALIGNS = ("start", "center", "end")
+    JUSTIFIES = ("start", "center", "end", "between")
+    ANCHORS = ("topleft", "midtop", "topright", "midleft", "center", "midright", "bottomleft", "midbottom", "bottomright")
+
+    def __init__(
+            self,
+            mode: str = "column",
+            host: object = None,
+            spacing: int = 0,
+            padding: int = 0,
+            align: str = "start",
+            justify: str = "start",
+            columns: int = 2,
+        ):
+        """
+        Args:
+            mode (str, optional) : règle de placement ("row", "column", "grid", "anchor")
+            host (str | Panel | SectionObject, optional) : hôte du conteneur racine (None : écran)
+            spacing (int, optional) : espacement entre les enfants
+            padding (int, optional) : marge intérieure
+            align (str, optional) : alignement sur l'axe secondaire, ou dans la cellule en grille ("start", "center", "end")
+            justify (str, optional) : répartition sur l'axe principal, des colonnes en grille ("start", "center", "end", "between")
+            columns (int, optional) : nombre de colonnes (grille)
+        """
+        # vérifications
+        if mode not in self.MODES: _raise_error(self, '__init__', 'Invalid mode argument')
+        if isinstance(host, str): host = context.panels[host]
+        elif host is not None and not (host in context.panels or isinstance(host, context.ui.Section)): _raise_error(self, '__init__', 'Invalid host argument')
+        if not isinstance(spacing, int) or spacing < 0: _raise_error(self, '__init__', 'Invalid spacing argument')
+        if not isinstance(padding, int) or padding < 0: _raise_error(self, '__init__', 'Invalid padding argument')
+        if align not in self.ALIGNS: _raise_error(self, '__init__', 'Invalid align argument')
+        if justify not in self.JUSTIFIES: _raise_error(self, '__init__', 'Invalid justify argument')
+        if not isinstance(columns, int) or columns < 1: _raise_error(self, '__init__', 'Invalid columns argument')
+
+        # règle
+        self._mode = mode
+        self._spacing = spacing
+        self._padding = padding
+        self._align = align
+        self._justify = justify
+        self._columns = columns
+
+        # arbre
+        self._host = host
+        self._parent = None
+        self._children = []             # enfants dans l'ordre de placement
+        self._anchors = {}              # {enfant: (ancre, décalage)} (mode "anchor")
+
+        # cache
+        self._dirty = True              # mesure et placement complets à refaire
+        self._measured = False          # taille en cache valide
+        self._stale = set()             # conteneurs enfants invalidés (seuls remesurés et replacés si leur taille ne change pas)
+        self._size = (0, 0)             # taille mesurée (contenu + marges)
+        self._sizes = {}                # {enfant: taille lors de la dernière mesure}
+        self._rects = {}                # {enfant: rect résolu}
+        self._rect = None               # zone attribuée lors du dernier placement
+        self._arranges = 0              # nombre de placements effectués
+
+        # auto-registration (conteneur racine)
+        context.ui._add_layout(self)
+
+    # ======================================== GETTERS ========================================
+    @property
+    def mode(self) -> str:
+        """Renvoie la règle de placement"""
+        return self._mode
+
+    @property
+    def host(self) -> object:
+        """Renvoie l'hôte (None : écran ou conteneur parent)"""
+        return self._host
+
+    @property
+    def parent(self) -> LayoutObject | None:
+        """Renvoie le conteneur parent"""
+        return self._parent
+
+    @property
+    def children(self) -> list:
+        """Renvoie les enfants"""
+        return list(self._children)
+
+    @property
+    def spacing(self) -> int:
+        """Renvoie l'espacement entre les enfants"""
+        return self._spacing
+
+    @property
+    def padding(self) -> int:
+        """Renvoie la marge intérieure"""
+        return self._padding
+
+    @property
+    def align(self) -> str:
+        """Renvoie l'alignement sur l'axe secondaire"""
+        return self._align
+
+    @property
+    def justify(self) -> str:
+        """Renvoie la répartition sur l'axe principal"""
+        return self._justify
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Renvoie la taille mesurée"""
+        return self._measure()
+
+    @property
+    def rect(self) -> pygame.Rect | None:
+        """Renvoie la zone attribuée au dernier placement"""
+        return self._rect.copy() if self._rect is not None else None
+
+    @property
+    def dirty(self) -> bool:
+        """Vérifie qu'une mesure et un placement soient en attente"""
+        return self._dirty or bool(self._stale)
+
+    def get_rect(self, child: object) -> pygame.Rect | None:
+        """
+        Renvoie le rect résolu d'un enfant
+
+        Args:
+            child (object) : enfant du conteneur
+        """
+        rect = self._rects.get(child)
+        return rect.copy() if rect is not None else None
+
+    # ======================================== SETTERS ========================================
+    @mode.setter
+    def mode(self, value: str):
+        """Fixe la règle de placement"""
+        if value not in self.MODES:
+            _raise_error(self, 'set_mode', 'Invalid value argument')
+        self._mode = value
+        self.invalidate()
+
+    @spacing.setter
+    def spacing(self, value: int):
+        """Fixe l'espacement entre les enfants"""
+        if not isinstance(value, int) or value < 0:
+            _raise_error(self, 'set_spacing', 'Invalid value argument')
+        self._spacing = value
+        self.invalidate()
+
+    @padding.setter
+    def padding(self, value: int):
+        """Fixe la marge intérieure"""
+        if not isinstance(value, int) or value < 0:
+            _raise_error(self, 'set_padding', 'Invalid value argument')
+        self._padding = value
+        self.invalidate()
+
+    @align.setter
+    def align(self, value: str):
+        """Fixe l'alignement sur l'axe secondaire"""
+        if value not in self.ALIGNS:
+            _raise_error(self, 'set_align', 'Invalid value argument')
+        self._align = value
+        self.invalidate()
+
+    @justify.setter
+    def justify(self, value: str):
+        """Fixe la répartition sur l'axe principal"""
+        if value not in self.JUSTIFIES:
+            _raise_error(self, 'set_justify', 'Invalid value argument')
+        self._justify = value
+        self.invalidate()
+
+    # ======================================== ARBRE ========================================
+    def add(self, child: object, anchor: str = "center", offset: tuple[int, int] = (0, 0), index: int = None) -> object:
+        """
+        Ajoute un enfant (widget ou conteneur), renvoie l'enfant
+
+        Args:
+            child (object) : widget de l'ui ou LayoutObject
+            anchor (str, optional) : point de la zone auquel l'enfant est ancré (mode "anchor" : "topleft", "center", "midbottom", ...)
+            offset (tuple[int, int], optional) : décalage depuis le point d'ancrage (mode "anchor")
+            index (int, optional) : position parmi les enfants (par défaut : à la fin)
+        """
+        if isinstance(child, LayoutObject):
+            if child._parent is not None: _raise_error(self, 'add', 'Child already belongs to a layout')
+            node = self
+            while node is not None:
+                if node is child: _raise_error(self, 'add', 'A layout cannot contain itself')
+                node = node._parent
+        else:
+            if not hasattr(child, '_rect'): _raise_error(self, 'add', 'Invalid child argument')
+            if context.ui._layout_of(child) is not None: _raise_error(self, 'add', 'Child already belongs to a layout')
+        if anchor not in self.ANCHORS: _raise_error(self, 'add', 'Invalid anchor argument')
+        if not isinstance(offset, tuple) or len(offset) != 2 or not all(isinstance(e, int) for e in offset): _raise_error(self, 'add', 'Invalid offset argument')
+        if index is not None and not isinstance(index, int): _raise_error(self, 'add', 'Invalid index argument')
+
+        if isinstance(child, LayoutObject):
+            context.ui._remove_layout(child)
+            child._parent = self
+            child._host = None
+        else:
+            context.ui._attach(child, self)
+        self._children.insert(len(self._children) if index is None else index, child)
+        self._anchors[child] = (anchor, offset)
+        self.invalidate()
+        return child
+
+    def remove(self, child: object):
+        """
+        Retire un enfant (sans le détruire ; un conteneur retiré redevient racine, hébergé par l'écran)
+
+        Args:
+            child (object) : enfant du conteneur
+        """
+        if child not in self._anchors:
+            _raise_error(self, 'remove', 'Child does not belong to this layout')
+        if isinstance(child, LayoutObject):
+            self._forget(child)
+            child._parent = None
+            context.ui._add_layout(child)
+        else:
+            context.ui._detach(child)
+
+    def clear(self):
+        """Retire tous les enfants"""
+        for child in list(self._children):
+            self.remove(child)
+
+    def invalidate(self):
+        """Demande une nouvelle mesure et un nouveau placement (les parents remesurent seulement cette branche)"""
+        self._dirty = True
+        self._measured = False
+        child, node = self, self._parent
+        while node is not None:
+            node._measured = False
+            node._stale.add(child)
+            child, node = node, node._parent
+
+    def kill(self):
+        """Détruit le conteneur et son contenu (widgets et conteneurs imbriqués)"""
+        for child in list(self._children):
+            child.kill()
+        if self._parent is not None:
+            self._parent._forget(self)
+            self._parent = None
+        else:
+            context.ui._remove_layout(self)
+
+    # ======================================== ACTUALISATION ========================================
+    def update(self):
+        """Place le contenu si le conteneur est invalidé ou si la zone de l'hôte a changé (conteneur racine)"""
+        if self._parent is not None:
+            return
+        rect = self._host_rect()
+        if self._dirty or self._stale or rect != self._rect:
+            self._arrange(rect)
+
+    # ======================================== METHODES INTERNES ========================================
+    def _host_rect(self) -> pygame.Rect:
+        """Zone de l'hôte dans les coordonnées de ses widgets (panel : zone locale, section : son rect)"""
+        host = self._host
+        if host is None:
+            return pygame.Rect(0, 0, context.screen.width, context.screen.height)
+        if isinstance(host, context.ui.Section):
+            return host._rect
+        return pygame.Rect(0, 0, host.width, host.height)
+
+    def _forget(self, child: object):
+        """Oublie un enfant (retiré ou détruit)"""
+        self._children.remove(child)
+        del self._anchors[child]
+        self._stale.discard(child)
+        self._sizes.pop(child, None)
+        self._rects.pop(child, None)
+        self.invalidate()
+
+    def _child_changed(self, child: object):
+        """Un widget enfant a changé de zone : invalidation seulement si sa taille a changé"""
+        rect = child._rect
+        if (rect.size if rect is not None else (0, 0)) != self._sizes.get(child):
+            self.invalidate()
+
+    # Mesure
+    def _measure(self) -> tuple[int, int]:
+        """Mesure le conteneur (taille en cache ; seuls les enfants invalidés sont remesurés)"""
+        if self._measured:
+            return self._size
+        if self._dirty:
+            sizes = self._sizes = {}
+            for child in self._children:
+                if isinstance(child, LayoutObject):
+                    sizes[child] = child._measure()
+                else:
+                    sizes[child] = child._rect.size if child._rect is not None else (0, 0)
+        else:
+            sizes = self._sizes
+            for child in self._stale:
+                size = child._measure()
+                if size != sizes[child]:
+                    sizes[child] = size
+                    self._dirty = True
+            if not self._dirty:
+                self._measured = True
+                return self._size
+
+        lengths = list(sizes.values())
+        gaps = self._spacing * max(0, len(lengths) - 1)
+        if not lengths:
+            width = height = 0
+        elif self._mode == "row":
+            width, height = sum(w for w, _ in lengths) + gaps, max(h for _, h in lengths)
+        elif self._mode == "column":
+            width, height = max(w for w, _ in lengths), sum(h for _, h in lengths) + gaps
+        elif self._mode == "grid":
+            widths, heights = self._tracks()
+            width = sum(widths) + self._spacing * (len(widths) - 1)
+            height = sum(heights) + self._spacing * (len(heights) - 1)
+        else:
+            width = max(size[0] + abs(self._anchors[child][1][0]) for child, size in sizes.items())
+            height = max(size[1] + abs(self._anchors[child][1][1]) for child, size in sizes.items())
+
+        self._size = (width + 2 * self._padding, height + 2 * self._padding)
+        self._measured = True
+        return self._size
+
+    def _tracks(self) -> tuple[list[int], list[int]]:
+        """Largeurs des colonnes et hauteurs des lignes de la grille"""
+        columns = self._columns
+        widths = [0] * min(columns, len(self._children))
+        heights = [0] * -(-len(self._children) // columns)
+        for i, child in enumerate(self._children):
+            w, h = self._sizes[child]
+            widths[i % columns] = max(widths[i % columns], w)
+            heights[i // columns] = max(heights[i // columns], h)
+        return widths, heights
+
+    # Placement
+    def _arrange(self, rect: pygame.Rect):
+        """Place le contenu dans une zone (seuls les enfants invalidés sont replacés si aucune taille n'a changé)"""
+        if rect != self._rect:
+            self._dirty = True
+        elif not self._dirty and not self._stale:
+            return
+        self._measure()
+        stale, self._stale = self._stale, set()
+        if not self._dirty:
+            for child in stale:
+                child._arrange(self._rects[child])
+            return
+        self._rect = pygame.Rect(rect)
+        self._dirty = False
+        self._arranges += 1
+
+        inner = self._rect.inflate(-2 * self._padding, -2 * self._padding)
+        if self._mode == "row":
+            rects = self._resolve_line(inner, 0)
+        elif self._mode == "column":
+            rects = self._resolve_line(inner, 1)
+        elif self._mode == "grid":
+            rects = self._resolve_grid(inner)
+        else:
+            rects = self._resolve_anchors(inner)
+        self._rects = rects
+
+        for child in self._children:
+            if isinstance(child, LayoutObject):
+                child._arrange(rects[child])
+            else:
+                self._place(child, rects[child].topleft)
+
+    def _resolve_line(self, inner: pygame.Rect, axis: int) -> dict:
+        """Rects des enfants en ligne (axis 0) ou en colonne (axis 1)"""
+        cross = 1 - axis
+        origin, extent = inner.topleft, inner.size
+        sizes = [self._sizes[child] for child in self._children]
+        starts = self._distribute([size[axis] for size in sizes], extent[axis])
+        rects = {}
+        for child, size, start in zip(self._children, sizes, starts):
+            position = [0, 0]
+            position[axis] = origin[axis] + start
+            position[cross] = origin[cross] + self._offset(extent[cross] - size[cross])
+            rects[child] = pygame.Rect(position, size)
+        return rects
+
+    def _resolve_grid(self, inner: pygame.Rect) -> dict:
+        """Rects des enfants en grille (colonnes réparties selon justify, alignement dans la cellule)"""
+        widths, heights = self._tracks()
+        xs = self._distribute(widths, inner.width)
+        ys = [sum(heights[:row]) + row * self._spacing for row in range(len(heights))]
+        rects = {}
+        for i, child in enumerate(self._children):
+            column, row = i % self._columns, i // self._columns
+            w, h = self._sizes[child]
+            rects[child] = pygame.Rect(inner.x + xs[column] + self._offset(widths[column] - w), inner.y + ys[row] + self._offset(heights[row] - h), w, h)
+        return rects
+
+    def _resolve_anchors(self, inner: pygame.Rect) -> dict:
+        """Rects des enfants ancrés dans la zone"""
+        rects = {}
+        for child in self._children:
+            anchor, offset = self._anchors[child]
+            rect = pygame.Rect((0, 0), self._sizes[child])
+            setattr(rect, anchor, getattr(inner, anchor))
+            rects[child] = rect.move(offset)
+        return rects
+
+    def _distribute(self, lengths: list[int], available: int) -> list[int]:
+        """Débuts des éléments sur l'axe principal (espacement et justify)"""
+        gap = self._spacing
+        free = available - sum(lengths) - gap * max(0, len(lengths) - 1)
+        start = 0
+        if self._justify == "between":
+            if len(lengths) > 1 and free > 0:
+                gap += free / (len(lengths) - 1)
+        elif self._justify == "center":
+            start = free // 2
+        elif self._justify == "end":
+            start = free
+        starts = []
+        for length in lengths:
+            starts.append(int(start))
+            start += length + gap
+        return starts
+
+    def _offset(self, free: int) -> int:
+        """Décalage sur l'axe secondaire selon align"""
+        if self._align == "center":
+            return free // 2
+        if self._align == "end":
+            return free
+        return 0
+
+    def _place(self, obj: object, topleft: tuple[int, int]):
+        """Déplace un widget (sa taille est conservée)"""
+        rect = obj._rect
+        if rect is None:
+            return
+        dx, dy = topleft[0] - rect.x, topleft[1] - rect.y
+        if not dx and not dy:
+            return
+        anchor = getattr(obj, '_anchor', None)
+        if anchor is not None and hasattr(obj, 'set_position'):
+            x, y = getattr(rect, anchor)
+            obj.set_position(x + dx, y + dy)
+            return
+        rect.move_ip(dx, dy)
+        if hasattr(obj, '_center'):
+            obj._center = (obj._center[0] + dx, obj._center[1] + dy)
+        context.ui._moved(obj)
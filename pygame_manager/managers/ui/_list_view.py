@@ -0,0 +1,552 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from ._core import *
+
+# ======================================== OBJET ========================================
+class ListViewObject:
+    """
+    Object de l'interface : Liste virtualisée liée à une source de données
+
+    Fonctionnalités:
+        une seule entrée dans le gestionnaire, quelle que soit la longueur de la liste
+        lignes recyclées : juste assez d'emplacements pour remplir la zone visible, réaffectés au défilement
+        rendus des lignes en cache (LRU) par (identifiant, version) de l'élément
+        survol, sélection et clic par ligne
+        barre de défilement (ScrollBarObject) et molette de la souris
+
+    S'enregistre et s'actualise automatiquement en tant qu'objet lors de l'instanciation
+    """
+    def __init__(
+            self,
+            x: Real = -1,
+            y: Real = -1,
+            width: Real = -1,
+            height: Real = -1,
+            anchor: str = "topleft",
+
+            items: Sequence = (),
+            row_height: int = 30,
+            render_row: callable = None,
+            key: callable = None,
+            version: callable = None,
+
+            font: pygame.font.Font | str = None,
+            font_path: str = None,
+            font_size: int = None,
+            font_color: pygame.Color = (220, 220, 220, 255),
+            text_padding: int = 8,
+
+            background_color: pygame.Color = (30, 30, 30, 255),
+            row_color: pygame.Color = (38, 38, 38, 255),
+            row_color_alt: pygame.Color = (43, 43, 43, 255),
+            row_color_hover: pygame.Color = (62, 62, 62, 255),
+            row_color_selected: pygame.Color = (65, 105, 185, 255),
+
+            selectable: bool = True,
+            callback: callable = None,
+
+            scrollbar_thickness: int = 12,
+            cache_rows: int = 256,
+            wheel_rows: int = 3,
+
+            panel: object = None,
+            zorder: int = 0,
+        ):
+        """
+        Args:
+            x (Real) : coordonnée de la gauche
+            y (Real) : coordonnée du haut
+            width (Real) : largeur
+            height (Real) : hauteur
+            anchor (str, optional) : point d'ancrage ("topleft", "center", ...)
+
+            items (Sequence, optional) : source de données (len et accès par indice, relus à chaque frame)
+            row_height (int, optional) : hauteur d'une ligne
+            render_row (callable, optional) : rendu d'une ligne, appelé avec (surface transparente de la ligne, élément, indice)
+            key (callable, optional) : identifiant d'un élément (défaut : son indice)
+            version (callable, optional) : version d'un élément, une nouvelle version est rendue à nouveau (défaut : l'élément s'il est hachable)
+
+            font (Font, optional) : police du texte
+            font_path (str, optional) : chemin vers la police
+            font_size (int, optional) : taille de la police
+            font_color (Color, optional) : couleur du texte
+            text_padding (int, optional) : marge à gauche du texte
+
+            background_color (Color, optional) : couleur de fond
+            row_color (Color, optional) : couleur des lignes paires
+            row_color_alt (Color, optional) : couleur des lignes impaires
+            row_color_hover (Color, optional) : couleur de la ligne survolée
+            row_color_selected (Color, optional) : couleur de la ligne sélectionnée
+
+            selectable (bool, optional) : sélection d'une ligne au clic
+            callback (callable, optional) : action au clic sur une ligne, appelée avec (élément, indice)
+
+            scrollbar_thickness (int, optional) : épaisseur de la barre de défilement (0 : sans barre)
+            cache_rows (int, optional) : nombre maximal de rendus de lignes conservés
+            wheel_rows (int, optional) : lignes défilées par cran de molette
+
+            panel (object, optional) : panel maître pour affichage automatique sur la surface
+            zorder (int, optional) : ordre d'affichage
+        """
+        # vérifications
+        if not isinstance(x, Real): _raise_error(self, '__init__', 'Invalid x argument')
+        if not isinstance(y, Real): _raise_error(self, '__init__', 'Invalid y argument')
+        if not isinstance(width, Real) or width <= 0: _raise_error(self, '__init__', 'Invalid width argument')
+        if not isinstance(height, Real) or height <= 0: _raise_error(self, '__init__', 'Invalid height argument')
+        if not isinstance(anchor, str): _raise_error(self, '__init__', 'Invalid anchor argument')
+        if not isinstance(items, Sequence): _raise_error(self, '__init__', 'Invalid items argument')
+        if not isinstance(row_height, int) or row_height <= 0: _raise_error(self, '__init__', 'Invalid row_height argument')
+        if render_row is not None and not callable(render_row): _raise_error(self, '__init__', 'Invalid render_row argument')
+        if key is not None and not callable(key): _raise_error(self, '__init__', 'Invalid key argument')
+        if version is not None and not callable(version): _raise_error(self, '__init__', 'Invalid version argument')
+        if font is not None and not isinstance(font, (pygame.font.Font, str)): _raise_error(self, '__init__', 'Invalid font argument')
+        if font_path is not None and not isinstance(font_path, str): _raise_error(self, '__init__', 'Invalid font_path argument')
+        if font_size is not None and (not isinstance(font_size, int) or font_size <= 0): _raise_error(self, '__init__', 'Invalid font_size argument')
+        font_color = _to_color(font_color, method='__init__')
+        if not isinstance(text_padding, int): _raise_error(self, '__init__', 'Invalid text_padding argument')
+        background_color = _to_color(background_color, method='__init__')
+        row_color = _to_color(row_color, method='__init__')
+        row_color_alt = _to_color(row_color_alt, method='__init__')
+        row_color_hover = _to_color(row_color_hover, method='__init__')
+        row_color_selected = _to_color(row_color_selected, method='__init__')
+        if not isinstance(selectable, bool): _raise_error(self, '__init__', 'Invalid selectable argument')
+        if callback is not None and not callable(callback): _raise_error(self, '__init__', 'Invalid callback argument')
+        if not isinstance(scrollbar_thickness, int) or scrollbar_thickness < 0: _raise_error(self, '__init__', 'Invalid scrollbar_thickness argument')
+        if not isinstance(cache_rows, int) or cache_rows < 1: _raise_error(self, '__init__', 'Invalid cache_rows argument')
+        if not isinstance(wheel_rows, int) or wheel_rows < 0: _raise_error(self, '__init__', 'Invalid wheel_rows argument')
+        if panel is not None and not isinstance(panel, str): _raise_error(self, '__init__', 'Invalid panel argument')
+        if not isinstance(zorder, int): _raise_error(self, '__init__', 'Invalid zorder argument')
+
+        # auto-registration
+        context.ui._append(self)
+
+        # position et taille
+        self._rect = pygame.Rect(0, 0, int(width), int(height))
+        setattr(self._rect, anchor, (x, y))
+        self._header_height = 0                     # bandeau fixe au-dessus des lignes (TableView)
+        self._content_width = max(1, self._rect.width - scrollbar_thickness)
+
+        # source de données
+        self._items = items
+        self._row_height = row_height
+        self._render_row = render_row
+        self._key = key
+        self._version = version
+
+        # texte
+        self._font_size = font_size if font_size is not None else max(8, int(row_height * 0.55))
+        if isinstance(font, pygame.font.Font): self._font = font
+        else: self._font = context.ui.get_font(self._font_size, font, font_path)
+        self._font_color = font_color
+        self._text_padding = text_padding
+
+        # couleurs
+        self._background_color = background_color
+        self._row_colors = (row_color, row_color_alt)
+        self._row_color_hover = row_color_hover
+        self._row_color_selected = row_color_selected
+
+        # interaction
+        self._selectable = selectable
+        self._callback = callback
+        self._selected = None                       # identifiant de l'élément sélectionné
+        self._hovered_index = None
+
+        # lignes recyclées et cache des rendus
+        self._slots = []                            # [[indice, identifiant, version, surface], ...] de haut en bas
+        self._rows = OrderedDict()                  # {(identifiant, version): surface}, du moins au plus récemment utilisé
+        self._cache_rows = cache_rows
+        self._render_count = 0                      # nombre de lignes rendues
+
+        # panel maître
+        if isinstance(panel, str): self._panel = context.panels[panel]
+        else: self._panel = panel if panel in context.panels else None
+        self._zorder = zorder
+
+        # défilement
+        self._scroll = 0
+        self._wheel_rows = wheel_rows
+        self._scrollbar = None
+        if scrollbar_thickness > 0:
+            self._scrollbar = context.ui.ScrollBar(
+                x=self._rect.right, y=self._rect.y, length=self._rect.height, thickness=scrollbar_thickness, anchor="topright",
+                thumb_ratio=1.0, panel=panel, zorder=zorder + 1,
+            )
+            context.inputs.add_listener(1, self._scrollbar.stop_drag, up=True, priority=1)
+        context.inputs.add_listener(context.inputs.MOUSEWHEELUP, self.scroll_by, args=[-wheel_rows * row_height], condition=self._wheel_enabled)
+        context.inputs.add_listener(context.inputs.MOUSEWHEELDOWN, self.scroll_by, args=[wheel_rows * row_height], condition=self._wheel_enabled)
+
+        # surface composée (recomposée seulement si l'état affiché change)
+        self._surface = None
+        self._surface_rect = None
+        self._state = None
+
+        # paramètres dynamiques
+        self._visible = True
+
+    # ======================================== GETTERS ========================================
+    @property
+    def zorder(self) -> int:
+        """Renvoie le zorder"""
+        return self._zorder
+
+    @property
+    def panel(self) -> object:
+        """Renvoie le panel maître"""
+        return self._panel
+
+    @property
+    def visible(self) -> bool:
+        """Vérifie la visibilité"""
+        return self._visible
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Renvoie le rect pygame"""
+        return self._rect.copy()
+
+    @property
+    def items(self) -> Sequence:
+        """Renvoie la source de données"""
+        return self._items
+
+    @property
+    def row_height(self) -> int:
+        """Renvoie la hauteur d'une ligne"""
+        return self._row_height
+
+    @property
+    def scroll(self) -> int:
+        """Renvoie le défilement (en pixels depuis le haut du contenu)"""
+        return self._scroll
+
+    @property
+    def max_scroll(self) -> int:
+        """Renvoie le défilement maximal"""
+        return max(0, len(self._items) * self._row_height - self._viewport_height())
+
+    @property
+    def visible_rows(self) -> range:
+        """Renvoie les indices des lignes visibles"""
+        first = self._scroll // self._row_height
+        last = min(len(self._items), -(-(self._scroll + self._viewport_height()) // self._row_height))
+        return range(first, last)
+
+    @property
+    def selected(self) -> object:
+        """Renvoie l'identifiant de l'élément sélectionné (None si aucun)"""
+        return self._selected
+
+    @property
+    def scrollbar(self) -> object | None:
+        """Renvoie la barre de défilement"""
+        return self._scrollbar
+
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Renvoie l'état du cache (lignes rendues depuis la création, rendus conservés, emplacements recyclés)"""
+        return {"rendered": self._render_count, "cached": len(self._rows), "slots": len(self._slots)}
+
+    def row_at(self, point: tuple[Real, Real]) -> int | None:
+        """
+        Renvoie l'indice de la ligne sous un point (coordonnées du panel, None si hors contenu)
+
+        Args:
+            point (tuple[Real, Real]) : (x, y) dans les coordonnées du panel
+        """
+        x, y = point[0] - self._rect.x, point[1] - self._rect.y - self._header_height
+        if not 0 <= x < self._content_width or not 0 <= y < self._viewport_height():
+            return None
+        index = int(y + self._scroll) // self._row_height
+        return index if index < len(self._items) else None
+
+    # ======================================== SETTERS ========================================
+    @zorder.setter
+    def zorder(self, value: int):
+        """Fixe le zorder"""
+        if not isinstance(value, int):
+            _raise_error(self, 'set_zorder', 'Invalid zorder argument')
+        self._zorder = value
+        context.ui._reorder(self)
+        if self._scrollbar is not None:
+            self._scrollbar.zorder = value + 1
+
+    @visible.setter
+    def visible(self, value: bool):
+        """Fixe la visibilité"""
+        if not isinstance(value, bool):
+            _raise_error(self, 'set_visible', 'Invalid value argument')
+        self._visible = value
+        if self._scrollbar is not None:
+            self._scrollbar.visible = value
+
+    @items.setter
+    def items(self, value: Sequence):
+        """Lie une nouvelle source de données (les rendus en cache restent valables par identifiant et version)"""
+        if not isinstance(value, Sequence):
+            _raise_error(self, 'set_items', 'Invalid value argument')
+        self._items = value
+        self._scroll = min(self._scroll, self.max_scroll)
+        self._reset_slots()
+
+    @scroll.setter
+    def scroll(self, value: Real):
+        """Fixe le défilement (borné au contenu)"""
+        if not isinstance(value, Real):
+            _raise_error(self, 'set_scroll', 'Invalid value argument')
+        self._scroll = max(0, min(self.max_scroll, int(value)))
+
+    @selected.setter
+    def selected(self, value: object):
+        """Sélectionne l'élément d'identifiant donné (None : aucun)"""
+        self._selected = value
+
+    # ======================================== DEFILEMENT ========================================
+    def scroll_by(self, delta: Real):
+        """
+        Fait défiler le contenu
+
+        Args:
+            delta (Real) : déplacement en pixels (positif : vers le bas)
+        """
+        if not isinstance(delta, Real):
+            _raise_error(self, 'scroll_by', 'Invalid delta argument')
+        self._scroll = max(0, min(self.max_scroll, int(self._scroll + delta)))
+
+    def scroll_to(self, index: int, align: str = "top"):
+        """
+        Fait défiler jusqu'à une ligne
+
+        Args:
+            index (int) : indice de la ligne
+            align (str, optional) : position de la ligne dans la zone visible ("top", "center", "bottom")
+        """
+        if not isinstance(index, int) or not 0 <= index < max(1, len(self._items)):
+            _raise_error(self, 'scroll_to', 'Invalid index argument')
+        if align not in ("top", "center", "bottom"):
+            _raise_error(self, 'scroll_to', 'Invalid align argument')
+        y = index * self._row_height
+        if align == "center":
+            y -= (self._viewport_height() - self._row_height) // 2
+        elif align == "bottom":
+            y -= self._viewport_height() - self._row_height
+        self._scroll = max(0, min(self.max_scroll, y))
+
+    def refresh(self, key: object = None):
+        """
+        Demande un nouveau rendu d'un élément (ou de tous), pour une modification que sa version ne reflète pas
+
+        Args:
+            key (object, optional) : identifiant de l'élément modifié
+        """
+        for cached in [cached for cached in self._rows if key is None or cached[0] == key]:
+            context.screen.release(self._rows.pop(cached))
+        self._reset_slots()
+
+    # ======================================== PREDICATS ========================================
+    def is_hovered(self) -> bool:
+        """Vérifie que la liste soit survolée"""
+        return context.ui.get_hovered() == self
+
+    @property
+    def hovered(self) -> bool:
+        """Vérifie que la liste soit survolée"""
+        return context.ui.get_hovered() == self
+
+    def _mouse_pos(self) -> tuple:
+        """Renvoie la position de la souris relative au panel maître"""
+        return self._panel.mouse_pos if self._panel is not None else context.mouse.get_pos()
+
+    def collidemouse(self) -> bool:
+        """Vérifie que la souris soit sur la liste"""
+        return self._rect.collidepoint(self._mouse_pos())
+
+    def _wheel_enabled(self) -> bool:
+        """Vérifie que la molette s'applique à la liste (visible, panel actif, souris au-dessus)"""
+        return self._visible and (self._panel is None or context.panels.is_active(self._panel)) and self.collidemouse()
+
+    # ======================================== LIGNES ========================================
+    def _viewport_height(self) -> int:
+        """Hauteur de la zone des lignes"""
+        return max(1, self._rect.height - self._header_height)
+
+    def _identify(self, item: object, index: int) -> tuple[object, object]:
+        """Renvoie (identifiant, version) d'un élément"""
+        key = self._key(item) if self._key is not None else index
+        if self._version is not None:
+            return key, self._version(item)
+        try:
+            hash(item)
+        except TypeError:
+            return key, None
+        return key, item
+
+    def _reset_slots(self):
+        """Oublie les affectations des emplacements (réévaluées à la prochaine actualisation)"""
+        for slot in self._slots:
+            slot[0] = None
+        self._state = None
+
+    def _sync_slots(self) -> bool:
+        """Affecte les emplacements aux lignes visibles (rendus repris du cache), renvoie True si l'un a changé"""
+        count = -(-self._viewport_height() // self._row_height) + 1
+        if len(self._slots) != count:
+            self._slots = [[None, None, None, None] for _ in range(count)]
+            self._cache_rows = max(self._cache_rows, 2 * count)
+        items = self._items
+        length = len(items)
+        first = self._scroll // self._row_height
+        changed = False
+        for index, slot in enumerate(self._slots, first):
+            if index >= length:
+                if slot[0] is not None:
+                    slot[:] = [None, None, None, None]
+                    changed = True
+                continue
+            item = items[index]
+            key, version = self._identify(item, index)
+            if slot[0] == index and slot[1] == key and slot[2] == version:
+                continue
+            slot[:] = [index, key, version, self._row_surface(item, index, key, version)]
+            changed = True
+        return changed
+
+    def _row_surface(self, item: object, index: int, key: object, version: object) -> pygame.Surface:
+        """Renvoie le rendu d'une ligne (cache LRU par identifiant et version)"""
+        cached = (key, version)
+        try:
+            surface = self._rows.get(cached)
+        except TypeError:                           # identifiant ou version non hachable : pas de cache
+            cached, surface = None, None
+        if surface is not None:
+            self._rows.move_to_end(cached)
+            return surface
+
+        surface = context.screen.acquire((self._content_width, self._row_height))
+        if self._render_row is not None:
+            self._render_row(surface, item, index)
+        else:
+            self._draw_row(surface, item, index)
+        self._render_count += 1
+        if cached is not None:
+            self._rows[cached] = surface
+            while len(self._rows) > self._cache_rows:
+                context.screen.release(self._rows.popitem(last=False)[1])
+        return surface
+
+    def _draw_row(self, surface: pygame.Surface, item: object, index: int):
+        """Rendu par défaut d'une ligne : texte de l'élément"""
+        self._blit_text(surface, str(item), self._text_padding, surface.get_width() - self._text_padding)
+
+    def _blit_text(self, surface: pygame.Surface, text: str, x: int, right: int):
+        """Blit un texte centré verticalement, coupé à la limite droite"""
+        if not text:
+            return
+        rendered = self._font.render(text, True, self._font_color)
+        y = (self._row_height - rendered.get_height()) // 2
+        surface.blit(rendered, (x, y), pygame.Rect(0, 0, max(0, right - x), rendered.get_height()))
+
+    def _draw_header(self, surface: pygame.Surface):
+        """Dessine le bandeau fixe (aucun pour une liste)"""
+        pass
+
+    # ======================================== DESSIN ========================================
+    def _compose(self):
+        """Compose la zone visible : fonds des lignes (alternance, survol, sélection) et rendus recyclés"""
+        if self._surface is None or self._surface.get_size() != self._rect.size:
+            context.screen.release(self._surface)
+            self._surface = context.screen.acquire(self._rect.size, alpha=self._background_color.a < 255, clear=False)
+        surface = self._surface
+        surface.fill(self._background_color)
+        top = self._header_height
+        viewport = pygame.Rect(0, top, self._content_width, self._viewport_height())
+        surface.set_clip(viewport)
+        offset = top - self._scroll % self._row_height
+        for i, (index, key, _, row) in enumerate(self._slots):
+            if index is None:
+                continue
+            y = offset + i * self._row_height
+            if index == self._hovered_index:
+                color = self._row_color_hover
+            elif self._selectable and key == self._selected and self._selected is not None:
+                color = self._row_color_selected
+            else:
+                color = self._row_colors[index % 2]
+            surface.fill(color, (0, y, self._content_width, self._row_height))
+            surface.blit(row, (0, y))
+        surface.set_clip(None)
+        self._draw_header(surface)
+
+    # ======================================== METHODES DYNAMIQUES ========================================
+    def kill(self):
+        """Détruit l'objet"""
+        context.ui._remove(self)
+        context.inputs.remove_listener(context.inputs.MOUSEWHEELUP, self.scroll_by)
+        context.inputs.remove_listener(context.inputs.MOUSEWHEELDOWN, self.scroll_by)
+        if self._scrollbar is not None:
+            context.inputs.remove_listener(1, self._scrollbar.stop_drag)
+            self._scrollbar.kill()
+        for surface in self._rows.values():
+            context.screen.release(surface)
+        self._rows.clear()
+        self._slots = []
+        context.screen.release(self._surface)
+        self._surface = None
+
+    def update(self):
+        """Actualisation par frame (recomposition seulement si l'état affiché change)"""
+        if not self._visible:
+            return
+        self._update_scrollbar()
+        self._scroll = max(0, min(self.max_scroll, self._scroll))
+        self._hovered_index = self.row_at(self._mouse_pos()) if self.hovered else None
+        changed = self._sync_slots()
+
+        state = (self._scroll, self._hovered_index, self._selected, self._rect.size)
+        if changed or state != self._state:
+            self._state = state
+            self._compose()
+        self._surface_rect = self._surface.get_rect(topleft=self._rect.topleft)
+
+    def _update_scrollbar(self):
+        """Synchronise la barre de défilement (position, taille du curseur, défilement)"""
+        scrollbar = self._scrollbar
+        if scrollbar is None:
+            return
+        if scrollbar._rect.topright != self._rect.topright:
+            scrollbar._rect.topright = self._rect.topright
+            context.ui._moved(scrollbar)
+        content = len(self._items) * self._row_height
+        scrollbar._thumb_ratio = max(0.05, min(1.0, self._viewport_height() / content)) if content > 0 else 1.0
+        if scrollbar.dragging:
+            self._scroll = int(round(scrollbar.scroll_ratio * self.max_scroll))
+        else:
+            scrollbar.scroll_ratio = self._scroll / self.max_scroll if self.max_scroll else 0.0
+
+    def draw(self):
+        """Dessin par frame"""
+        if not self._visible or self._surface is None:
+            return
+
+        surface = context.screen.surface
+        if self._panel is not None and hasattr(self._panel, 'surface'):
+            surface = self._panel.surface
+
+        surface.blit(self._surface, self._surface_rect)
+
+    def left_click(self, up: bool = False):
+        """Clic gauche : sélection et action de la ligne cliquée"""
+        if up:
+            return
+        index = self.row_at(self._mouse_pos())
+        if index is None:
+            return
+        item = self._items[index]
+        if self._selectable:
+            self._selected = self._identify(item, index)[0]
+        if self._callback is not None:
+            self._callback(item, index)
+
+    def right_click(self, up: bool = False):
+        """Clic droit"""
+        pass
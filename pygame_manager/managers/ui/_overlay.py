@@ -5,6 +5,8 @@ from ._core import *
 class OverlayObject:
     """
     Object de l'interface : Overlay repliable
+
+    La surface est rendue une seule fois : l'animation décale la surface en cache (découpée par l'écran).
     """
     def __init__(
             self,
@@ -117,6 +119,7 @@ class OverlayObject:
         if not isinstance(value, int):
             _raise_error(self, 'set_zorder', 'Invalid zorder argument')
         self._zorder = value
+        context.ui._reorder(self)
 
     @visible.setter
     def visible(self, value: bool):
@@ -143,6 +146,10 @@ class OverlayObject:
             self._full_rect = pygame.Rect(0, screen_h - self._size, screen_w, self._size)
             self._collapsed_rect = pygame.Rect(0, screen_h, screen_w, self._size)
 
+    def _hitbox(self) -> pygame.Rect:
+        """Zone parcourue par l'animation (indexation du survol)"""
+        return self._full_rect.union(self._collapsed_rect)
+
     def _get_current_rect(self) -> pygame.Rect:
         """Calcule le rect actuel selon la progression du collapse"""
         t = self._collapse_progress
@@ -171,7 +178,7 @@ class OverlayObject:
     # ======================================== DESSIN ========================================
     def _render_surface(self) -> pygame.Surface:
         """Génère la surface de l'overlay"""
-        surface = pygame.Surface((self._full_rect.width, self._full_rect.height), pygame.SRCALPHA)
+        surface = context.screen.acquire((self._full_rect.width, self._full_rect.height), clear=not self._filling)     # le remplissage recouvre tous les pixels
         local_rect = pygame.Rect(0, 0, self._full_rect.width, self._full_rect.height)
 
         # remplissage
@@ -195,21 +202,26 @@ class OverlayObject:
     def kill(self):
         """Détruit l'objet"""
         context.ui._remove(self)
+        context.screen.release(self._surface)
+        self._surface = None
     
     def update(self):
         """Actualisation par frame"""
         if not self._visible:
             return
         # animation du collapse
-        if self._collapse_duration > 0 and abs(self._collapse_progress - self._target_progress) > 0.01:
+        if self._collapse_duration == 0:
+            self._collapse_progress = self._target_progress
+        elif abs(self._collapse_progress - self._target_progress) > 0.01:
             speed = context.time.dt / self._collapse_duration
             if self._collapse_progress < self._target_progress:
                 self._collapse_progress = min(self._target_progress, self._collapse_progress + speed)
             else:
                 self._collapse_progress = max(self._target_progress, self._collapse_progress - speed)
 
-        # générer la surface
-        self._surface = self._render_surface()
+        # surface générée une fois, seule sa position suit l'animation
+        if self._surface is None:
+            self._surface = self._render_surface()
         self._surface_rect = self._get_current_rect()
 
     def draw(self):
@@ -212,53 +212,25 @@ class RectButtonObject:
                 self._font_size = max(3, int(self._rect.height * 0.7))
 
             self.font_type = "font"
-            if self._font is None: # chargement de la police
-                if self._font_path is not None:
-                    try:
-                        self._font = pygame.font.Font(self._font_path, self._font_size)
-                        self.font_type = "path"
-                    except Exception as _:
-                        if self._sysfont is not None:
-                            self._font = pygame.font.SysFont(self._sysfont, self._font_size)
-                            self.font_type = "sysfont"
-                        else:
-                            self._font = pygame.font.Font(None, self._font_size)
-                            self.font_type = "default"
-                else:
-                    if self._sysfont is not None:
-                        self._font = pygame.font.SysFont(self._sysfont, self._font_size)
-                        self.font_type = "sysfont"
-                    else:
-                        self._font = pygame.font.Font(None, self._font_size)
-                        self.font_type = "default"
-                    
-            # Auto ajustement
-            test_font_size = self._font_size
-            test_font = self._font
-            text_render_test = self._font.render(self._text, True, (0, 0, 0))
+            if self._font is None: # chargement de la police (registre partagé : effets inclus)
+                self._font = context.ui.get_font(self._font_size, self._sysfont, self._font_path, bold, italic, underline)
+                self.font_type = "path" if self._font_path is not None else "sysfont" if self._sysfont is not None else "default"
+
+            # Auto ajustement (mesuré, mémoïsé par le gestionnaire)
             if self.font_type != "font":
-                while text_render_test.get_width() / self._rect.width > self._font_size_ratio_limit and test_font_size > 5:
-                    test_font_size -= 1
-                    if self.font_type == "path":
-                        test_font = pygame.font.Font(self._font_path, test_font_size)
-                    elif self.font_type == "sysfont":
-                        test_font = pygame.font.SysFont(self._sysfont, test_font_size)
-                    else:
-                        test_font = pygame.font.Font(None, test_font_size)
-                    text_render_test = test_font.render(self._text, True, (0, 0, 0))
-
-            self._font_size = test_font_size
-            self._font = test_font
-            self._font_hover = test_font
+                fitted_size = context.ui.fit_font_size(self._text, self._font_size, self._font_size_ratio_limit * self._rect.width, min_size=5, sysfont=self._sysfont, path=self._font_path, bold=bold, italic=italic, underline=underline)
+                if fitted_size != self._font_size:
+                    self._font_size = fitted_size
+                    self._font = context.ui.get_font(fitted_size, self._sysfont, self._font_path, bold, italic, underline)
+            self._font_hover = self._font
+
+            # Effets (police fournie ; une police du registre est remplacée par sa variante, jamais modifiée)
+            if self.font_type == "font":
+                self._font = self._font_hover = context.ui._styled_font(self._font, bold, italic, underline)
 
             # Génération (classic)
             self._text_object = self._font.render(self._text, 1, self._font_color)
 
-            # Effets
-            self._font.set_bold(bold)
-            self._font.set_italic(italic)
-            self._font.set_underline(underline)
-            
             # Génération (hover)
             self._text_object_hover = self._font.render(self._text, 1, self._font_color_hover)
 
@@ -274,7 +246,6 @@ class RectButtonObject:
         
         # effet de survol
         self._scale_ratio = 1.0
-        self._last_scale_ratio = 1.0
         self._hover_scale_ratio = float(hover_scale_ratio)
         self._hover_scale_duration = float(hover_scale_duration)
 
@@ -330,6 +301,7 @@ class RectButtonObject:
         if not isinstance(value, int):
             _raise_error(self, 'set_zorder', 'Invalid zorder argument')
         self._zorder = value
+        context.ui._reorder(self)
 
     @visible.setter
     def visible(self, value: bool):
@@ -366,7 +338,7 @@ class RectButtonObject:
     # ======================================== DESSIN DU BOUTON ========================================
     def load_default(self) -> dict[pygame.Surface]:
         """Renvoie la surface par défaut du bouton'"""
-        default = pygame.Surface((self._rect.width, self._rect.height), pygame.SRCALPHA)
+        default = context.screen.acquire((self._rect.width, self._rect.height))
         rect = default.get_rect()
         if self._filling:
             pygame.draw.rect(default, self._filling_color, rect, border_radius=self._border_radius)
@@ -376,11 +348,11 @@ class RectButtonObject:
             default.blit(self._text_object, self._text_object.get_rect(center=rect.center))
         if self._border_width > 0:
             pygame.draw.rect(default, self._border_color, rect, self._border_width, border_radius=self._border_radius)
-        return default
+        return context.screen.optimize(default)
 
     def load_hover(self) -> dict[pygame.Surface]:
         """Renvoie la surface survolée du bouton'"""
-        hover = pygame.Surface((self._rect.width, self._rect.height), pygame.SRCALPHA)
+        hover = context.screen.acquire((self._rect.width, self._rect.height))
         rect = hover.get_rect()
         if self._filling_hover:
             pygame.draw.rect(hover, self._filling_color_hover, rect, border_radius=self._border_radius)
@@ -390,7 +362,7 @@ class RectButtonObject:
             hover.blit(self._text_object_hover, self._text_object_hover.get_rect(center=rect.center))
         if self._border_width > 0:
             pygame.draw.rect(hover, self._border_color_hover, rect, self._border_width, border_radius=self._border_radius)
-        return hover
+        return context.screen.optimize(hover)
 
     # ======================================== METHODES DYNAMIQUES ========================================
     def kill(self):
@@ -410,13 +382,8 @@ class RectButtonObject:
         else:
             self._scale_ratio = target_ratio
 
-        # Redimensionnement
-        surface = self._preloaded["hover" if self.hovered else "default"]
-        surface_rect = surface.get_rect()
-        if self._last_scale_ratio != self._scale_ratio:
-            self._surface = pygame.transform.smoothscale(surface, (surface_rect.width * self._scale_ratio, surface_rect.height * self._scale_ratio))
-        else:
-            self._surface = surface
+        # Redimensionnement (variante partagée du gestionnaire, ratio quantifié)
+        self._surface = context.ui._get_scaled(self._preloaded["hover" if self.hovered else "default"], self._scale_ratio)
         self._surface_rect = self._surface.get_rect(center=self._rect.center)
 
     def draw(self):
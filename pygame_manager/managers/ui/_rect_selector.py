@@ -302,44 +302,15 @@ class RectSelectorObject:
                 font_size = int(base_font_size * size_ratios[text_type])
                 font_size = max(5, font_size)  # Minimum 5px
                 
-                font = pygame.font.Font(None, font_size)
-                
-                # Italique pour description
-                if text_type == "description":
-                    font.set_italic(True)
-                
+                # Ajustement à la zone disponible (mesuré, mémoïsé par le gestionnaire ; listes : largeur et hauteur)
+                if isinstance(text_content, list):
+                    font_size = context.ui.fit_font_size(text_content, font_size, available_width, available_height, italic=text_type == "description")
+                else:
+                    font_size = context.ui.fit_font_size(text_content, font_size, available_width, italic=text_type == "description")
+                font = context.ui.get_font(font_size, italic=text_type == "description")     # italique pour description
+
                 # Gestion des listes (multi-lignes)
                 if isinstance(text_content, list):
-                    # Pour les listes, ajuster la taille pour que tout rentre
-                    test_size = font_size
-                    while test_size > 5:
-                        test_font = pygame.font.Font(None, test_size)
-                        if text_type == "description":
-                            test_font.set_italic(True)
-                        
-                        line_spacing = int(test_size * 0.1)
-                        
-                        # Vérifier largeur et hauteur
-                        max_width = 0
-                        total_height = 0
-                        for i, line in enumerate(text_content):
-                            line_surf = test_font.render(line, True, (0, 0, 0))
-                            max_width = max(max_width, line_surf.get_width())
-                            total_height += line_surf.get_height()
-                            if i < len(text_content) - 1:
-                                total_height += line_spacing
-                        
-                        # Si ça rentre, on garde cette taille
-                        if max_width <= available_width and total_height <= available_height:
-                            break
-                        
-                        test_size -= 1
-                    
-                    font_size = max(5, test_size)
-                    font = pygame.font.Font(None, font_size)
-                    if text_type == "description":
-                        font.set_italic(True)
-                    
                     self._text_objects[text_type] = self._create_multiline_surface(
                         text_content, font, self._font_color
                     )
@@ -350,21 +321,9 @@ class RectSelectorObject:
                         text_content, font, self._font_color_selected
                     )
                 else:
-                    # Texte simple - vérifier la largeur
-                    test_size = font_size
-                    test_font = font
-                    test_render = test_font.render(text_content, True, (0, 0, 0))
-                    
-                    while test_render.get_width() > available_width and test_size > 5:
-                        test_size -= 1
-                        test_font = pygame.font.Font(None, test_size)
-                        if text_type == "description":
-                            test_font.set_italic(True)
-                        test_render = test_font.render(text_content, True, (0, 0, 0))
-                    
-                    self._text_objects[text_type] = test_font.render(text_content, True, self._font_color)
-                    self._text_objects_hover[text_type] = test_font.render(text_content, True, self._font_color_hover)
-                    self._text_objects_selected[text_type] = test_font.render(text_content, True, self._font_color_selected)
+                    self._text_objects[text_type] = font.render(text_content, True, self._font_color)
+                    self._text_objects_hover[text_type] = font.render(text_content, True, self._font_color_hover)
+                    self._text_objects_selected[text_type] = font.render(text_content, True, self._font_color_selected)
 
             # Calcul des positions
             self._calculate_text_positions()
@@ -378,7 +337,6 @@ class RectSelectorObject:
 
         # effet de survol
         self._scale_ratio = 1.0
-        self._last_scale_ratio = 1.0
         self._hover_scale_ratio = float(hover_scale_ratio)
         self._hover_scale_duration = float(hover_scale_duration)
         self._selected_scale_ratio = float(selected_scale_ratio)
@@ -399,7 +357,6 @@ class RectSelectorObject:
 
         # paramètres dynamiques
         self._visible = True
-        self._last_status = None
 
     # ======================================== CREATION SURFACE MULTI-LIGNES ========================================
     def _create_multiline_surface(self, lines: list, font: pygame.font.Font, color: pygame.Color) -> pygame.Surface:
@@ -535,6 +492,7 @@ class RectSelectorObject:
         if not isinstance(value, int):
             _raise_error(self, 'set_zorder', 'Invalid zorder argument')
         self._zorder = value
+        context.ui._reorder(self)
 
     @visible.setter
     def visible(self, value: bool):
@@ -657,21 +615,10 @@ class RectSelectorObject:
         else:
             self._scale_ratio = target_ratio
 
-        # Redimensionnement
+        # Redimensionnement (variante partagée du gestionnaire, ratio quantifié)
         status = "selected" if self.selected else "hover" if self.hovered else "default"
-        surface = self._preloaded[status]
-        surface_rect = surface.get_rect()
-        if self._last_scale_ratio != self._scale_ratio:
-            new_width = int(surface_rect.width * self._scale_ratio)
-            new_height = int(surface_rect.height * self._scale_ratio)
-            self._surface = pygame.transform.smoothscale(surface, (new_width, new_height))
-            self._surface_rect = self._surface.get_rect(center=self._rect.center)
-            self._last_scale_ratio = self._scale_ratio
-            self._last_status = status
-        elif status != self._last_status:
-            self._surface = surface
-            self._surface_rect = self._surface.get_rect(center=self._rect.center)
-            self._last_status = status
+        self._surface = context.ui._get_scaled(self._preloaded[status], self._scale_ratio)
+        self._surface_rect = self._surface.get_rect(center=self._rect.center)
 
     # ======================================== AFFICHAGE ========================================
     def draw(self):
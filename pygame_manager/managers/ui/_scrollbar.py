@@ -115,14 +115,18 @@ class ScrollBarObject:
         self._dragging = False
         self._drag_offset = 0
         self._visible = True
+        self._listening = False     # listener de fin de glissement enregistré
 
         # surfaces
         self._surface = None
         self._surface_rect = None
 
     def _init(self):
-        """Initialisation sécurisée"""
-        context.inputs.add_lister(1, self.stop_drag(), args=[self], up=True, priority=1)
+        """Initialisation sécurisée (idempotente : le listener n'est enregistré qu'une fois)"""
+        if self._listening:
+            return
+        context.inputs.add_listener(1, self.stop_drag, up=True, priority=1)
+        self._listening = True
 
     # ======================================== GETTERS ========================================
     @property
@@ -162,6 +166,7 @@ class ScrollBarObject:
         if not isinstance(value, int):
             _raise_error(self, 'set_zorder', 'Invalid zorder argument')
         self._zorder = value
+        context.ui._reorder(self)
 
     @visible.setter
     def visible(self, value: bool):
@@ -202,8 +207,10 @@ class ScrollBarObject:
         )
 
     # ======================================== INTERACTION ========================================
-    def start_drag(self, mouse_pos: tuple):
-        """Commence le drag du curseur"""
+    def start_drag(self, mouse_pos: tuple = None):
+        """Commence le drag du curseur (défaut: position relative de la souris)"""
+        if mouse_pos is None:
+            mouse_pos = self._mouse_pos()
         thumb_rect = self._get_thumb_world_rect()
         if self._vertical:
             self._drag_offset = mouse_pos[1] - thumb_rect.y
@@ -211,10 +218,12 @@ class ScrollBarObject:
             self._drag_offset = mouse_pos[0] - thumb_rect.x
         self._dragging = True
 
-    def update_drag(self, mouse_pos: tuple):
-        """Met à jour la position pendant le drag"""
+    def update_drag(self, mouse_pos: tuple = None):
+        """Met à jour la position pendant le drag (défaut: position relative de la souris)"""
         if not self._dragging:
             return
+        if mouse_pos is None:
+            mouse_pos = self._mouse_pos()
 
         if self._vertical:
             thumb_height = int(self._rect.height * self._thumb_ratio)
@@ -250,15 +259,17 @@ class ScrollBarObject:
         """Vérifie que la scrollbar soit survolée"""
         return context.ui.get_hovered() == self
 
+    def _mouse_pos(self) -> tuple:
+        """Renvoie la position de la souris relative au panel maître"""
+        return self._panel.mouse_pos if self._panel is not None else context.mouse.get_pos()
+
     def collidemouse(self) -> bool:
         """Vérifie que la souris soit sur la scrollbar"""
-        mouse_pos = self._panel.mouse_pos if self._panel is not None else context.mouse.get_pos()
-        return self._rect.collidepoint(mouse_pos)
+        return self._rect.collidepoint(self._mouse_pos())
 
     def thumb_collidemouse(self) -> bool:
         """Vérifie que la souris soit sur le curseur"""
-        mouse_pos = self._panel.mouse_pos if self._panel is not None else context.mouse.get_pos()
-        return self._get_thumb_world_rect().collidepoint(mouse_pos)
+        return self._get_thumb_world_rect().collidepoint(self._mouse_pos())
 
     # ======================================== DESSIN ========================================
     def _render_surface(self) -> pygame.Surface:
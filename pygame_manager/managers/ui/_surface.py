@@ -1,6 +1,5 @@
 # ======================================== IMPORTS ========================================
 from ._core import *
-import numpy as np
 
 # ======================================== OBJET ========================================
 class SurfaceObject:
@@ -122,6 +121,8 @@ class SurfaceObject:
         self._gradient_fluctuation_timer = 0.0
         self._gradient_brightness_pulse = gradient_brightness_pulse
         self._gradient_brightness_amplitude = gradient_brightness_amplitude
+        self._gradient_bands = None     # indice de bande de chaque pixel (diffusable sur la surface)
+        self._gradient_alpha = None     # canal alpha du dégradé, conservé par l'animation
 
         # surface
         self._surface = None
@@ -153,64 +154,48 @@ class SurfaceObject:
         if self._gradient:
             return self._render_gradient()
         
-        self._surface = pygame.Surface((self._width, self._height), pygame.SRCALPHA)
+        self._surface = context.screen.acquire((self._width, self._height))
         
         if self._border_radius > 0:
             pygame.draw.rect(self._surface, self._color, (0, 0, self._width, self._height), border_radius=self._border_radius)
         else:
             self._surface.fill(self._color)
         
-        if self._border:
-            if self._border_radius > 0:
-                pygame.draw.rect(self._surface, self._border_color, (0, 0, self._width, self._height), width=self._border_width, border_radius=self._border_radius)
-            else:
-                pygame.draw.rect(self._surface, self._border_color, (0, 0, self._width, self._height), width=self._border_width)
-        
+        self._draw_border()
+        self._surface = context.screen.optimize(self._surface)
         self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+        context.ui._moved(self)
 
     def _render_gradient(self):
-        """Render la surface avec un dégradé statique selon direction"""
-        self._surface = pygame.Surface((self._width, self._height), pygame.SRCALPHA)
-        
-        c1 = self._color
-        c2 = self._gradient_color
-
-        if self._gradient_direction == "vertical":
-            for y in range(self._height):
-                t = y / (self._height - 1) if self._height > 1 else 0
-                r = int(c1[0] + (c2[0] - c1[0]) * t)
-                g = int(c1[1] + (c2[1] - c1[1]) * t)
-                b = int(c1[2] + (c2[2] - c1[2]) * t)
-                a = int(c1[3] + (c2[3] - c1[3]) * t) if len(c1) > 3 and len(c2) > 3 else 255
-                pygame.draw.line(self._surface, (r, g, b, a), (0, y), (self._width, y))
-
-        elif self._gradient_direction == "horizontal":
-            for x in range(self._width):
-                t = x / (self._width - 1) if self._width > 1 else 0
-                r = int(c1[0] + (c2[0] - c1[0]) * t)
-                g = int(c1[1] + (c2[1] - c1[1]) * t)
-                b = int(c1[2] + (c2[2] - c1[2]) * t)
-                a = int(c1[3] + (c2[3] - c1[3]) * t) if len(c1) > 3 and len(c2) > 3 else 255
-                pygame.draw.line(self._surface, (r, g, b, a), (x, 0), (x, self._height))
-
-        elif self._gradient_direction == "diagonal":
-            for y in range(self._height):
-                for x in range(self._width):
-                    t = ((x / (self._width - 1 if self._width > 1 else 1)) +
-                        (y / (self._height - 1 if self._height > 1 else 1))) * 0.5
-                    r = int(c1[0] + (c2[0] - c1[0]) * t)
-                    g = int(c1[1] + (c2[1] - c1[1]) * t)
-                    b = int(c1[2] + (c2[2] - c1[2]) * t)
-                    a = int(c1[3] + (c2[3] - c1[3]) * t) if len(c1) > 3 and len(c2) > 3 else 255
-                    self._surface.set_at((x, y), (r, g, b, a))
-
-        if self._border:
-            if self._border_radius > 0:
-                pygame.draw.rect(self._surface, self._border_color, (0, 0, self._width, self._height), width=self._border_width, border_radius=self._border_radius)
-            else:
-                pygame.draw.rect(self._surface, self._border_color, (0, 0, self._width, self._height), width=self._border_width)
-
+        """Render la surface avec un dégradé statique selon direction (champ de positions conservé pour l'animation)"""
+        self._surface = context.screen.acquire((self._width, self._height), clear=False)     # tous les pixels sont écrits
+
+        positions = _gradient_positions(self._width, self._height, self._gradient_direction)[..., None]
+        c1 = np.array(self._color, dtype=np.float64)
+        c2 = np.array(self._gradient_color, dtype=np.float64)
+        colors = np.broadcast_to((c1 + (c2 - c1) * positions).astype(np.uint8), (self._width, self._height, 4))
+        pixels = pygame.surfarray.pixels3d(self._surface)
+        pixels[...] = colors[..., :3]
+        del pixels
+        alpha = pygame.surfarray.pixels_alpha(self._surface)
+        alpha[...] = colors[..., 3]
+        del alpha
+
+        self._draw_border()
+        self._surface = context.screen.optimize(self._surface)
         self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+        context.ui._moved(self)
+        self._gradient_bands = _gradient_bands(positions[..., 0], self._gradient_fluctuation_bands) if self._gradient_fluctuation else None
+        self._gradient_alpha = _alpha_bits(self._surface) if self._gradient_fluctuation else None
+
+    def _draw_border(self):
+        """Dessine la bordure sur la surface"""
+        if not self._border:
+            return
+        if self._border_radius > 0:
+            pygame.draw.rect(self._surface, self._border_color, (0, 0, self._width, self._height), width=self._border_width, border_radius=self._border_radius)
+        else:
+            pygame.draw.rect(self._surface, self._border_color, (0, 0, self._width, self._height), width=self._border_width)
 
     # ======================================== GETTERS ========================================
     @property
@@ -265,6 +250,7 @@ class SurfaceObject:
         if not isinstance(value, int):
             _raise_error(self, 'set_zorder', 'Invalid zorder argument')
         self._zorder = value
+        context.ui._reorder(self)
 
     @visible.setter
     def visible(self, value: bool):
@@ -281,6 +267,7 @@ class SurfaceObject:
         self._x = value
         if self._surface:
             self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+            context.ui._moved(self)
 
     @y.setter
     def y(self, value: Real):
@@ -290,6 +277,7 @@ class SurfaceObject:
         self._y = value
         if self._surface:
             self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+            context.ui._moved(self)
 
     def set_position(self, x: Real, y: Real):
         """Modifie la position"""
@@ -297,6 +285,7 @@ class SurfaceObject:
         self._y = y
         if self._surface:
             self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+            context.ui._moved(self)
 
     def set_size(self, width: Real, height: Real):
         """Modifie la taille et re-render"""
@@ -447,79 +436,23 @@ class SurfaceObject:
         surface.blit(self._surface, self._rect)
     
     def update_gradient(self):
-        """Fluctuation du dégradé"""
+        """Fluctuation du dégradé : table de couleurs des bandes, appliquée en place au champ de bandes précalculé"""
         if not self._gradient or not self._gradient_fluctuation:
             return
 
         self._gradient_fluctuation_timer += context.time.dt
-
-        c1 = self._color
-        c2 = self._gradient_color
-        
         timer = self._gradient_fluctuation_timer * self._gradient_fluctuation_speed
-        num_bands = self._gradient_fluctuation_bands
-        
-        if self._gradient_direction == "horizontal":
-            band_width = self._width / num_bands
-            for i in range(num_bands):
-                t = i / (num_bands - 1) if num_bands > 1 else 0
-                wave = 0.5 + self._gradient_fluctuation_amplitude * np.sin(t * 2 * np.pi + timer)
-                
-                r = int(c1[0] * (1 - wave) + c2[0] * wave)
-                g = int(c1[1] * (1 - wave) + c2[1] * wave)
-                b = int(c1[2] * (1 - wave) + c2[2] * wave)
-                
-                x = int(i * band_width)
-                w = int(band_width) + 1
-                pygame.draw.rect(self._surface, (r, g, b), (x, 0, w, self._height))
-        
-        elif self._gradient_direction == "vertical":
-            band_height = self._height / num_bands
-            for i in range(num_bands):
-                t = i / (num_bands - 1) if num_bands > 1 else 0
-                wave = 0.5 + self._gradient_fluctuation_amplitude * np.sin(t * 2 * np.pi + timer)
-                
-                r = int(c1[0] * (1 - wave) + c2[0] * wave)
-                g = int(c1[1] * (1 - wave) + c2[1] * wave)
-                b = int(c1[2] * (1 - wave) + c2[2] * wave)
-                
-                y = int(i * band_height)
-                h = int(band_height) + 1
-                pygame.draw.rect(self._surface, (r, g, b), (0, y, self._width, h))
-        
-        elif self._gradient_direction == "diagonal":
-            # Pour diagonal, on fait un mix horizontal simplifié
-            band_width = self._width / num_bands
-            for i in range(num_bands):
-                t = i / (num_bands - 1) if num_bands > 1 else 0
-                wave = 0.5 + self._gradient_fluctuation_amplitude * np.sin(t * 2 * np.pi + timer)
-                
-                r = int(c1[0] * (1 - wave) + c2[0] * wave)
-                g = int(c1[1] * (1 - wave) + c2[1] * wave)
-                b = int(c1[2] * (1 - wave) + c2[2] * wave)
-                
-                x = int(i * band_width)
-                w = int(band_width) + 1
-                pygame.draw.rect(self._surface, (r, g, b), (x, 0, w, self._height))
-
-        # Pulsation de luminosité (optionnelle, très peu coûteuse)
+
+        # Pulsation de luminosité (éclaircissement léger des bandes)
+        offset = 0
         if self._gradient_brightness_pulse:
             brightness = int(255 * (1.0 - self._gradient_brightness_amplitude + 
                                     self._gradient_brightness_amplitude * np.sin(timer)))
-            overlay = pygame.Surface((self._width, self._height), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, int(brightness * 0.04)))  # Alpha très faible pour effet subtil
-            self._surface.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-
-        # Bordure
-        if self._border:
-            if self._border_radius > 0:
-                pygame.draw.rect(self._surface, self._border_color, (0, 0, self._width, self._height), 
-                               width=self._border_width, border_radius=self._border_radius)
-            else:
-                pygame.draw.rect(self._surface, self._border_color, (0, 0, self._width, self._height), 
-                               width=self._border_width)
+            offset = int(brightness * 0.04)
 
-        self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+        colors = _wave_colors(self._color, self._gradient_color, self._gradient_fluctuation_bands, self._gradient_fluctuation_amplitude, timer, offset)
+        _paint_gradient(self._surface, colors, self._gradient_bands, self._gradient_alpha)
+        self._draw_border()
     
     def update_fade(self):
         """Animation de fondu"""
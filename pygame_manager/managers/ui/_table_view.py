@@ -0,0 +1,104 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from ._core import *
+from ._list_view import ListViewObject
+
+# ======================================== OBJET ========================================
+class TableViewObject(ListViewObject):
+    """
+    Object de l'interface : Tableau virtualisé lié à une source de données
+
+    Fonctionnalités:
+        celles de ListViewObject (lignes recyclées, rendus en cache par identifiant et version)
+        colonnes de largeur fixe, cellules coupées à leur colonne
+        bandeau des titres fixe au-dessus des lignes
+
+    S'enregistre et s'actualise automatiquement en tant qu'objet lors de l'instanciation
+    """
+    def __init__(
+            self,
+            x: Real = -1,
+            y: Real = -1,
+            width: Real = -1,
+            height: Real = -1,
+            columns: list[tuple[str, int]] = (),
+            cell: callable = None,
+            header_height: int = None,
+            header_color: pygame.Color = (50, 50, 50, 255),
+            header_font_color: pygame.Color = (255, 255, 255, 255),
+            **kwargs,
+        ):
+        """
+        Args:
+            x (Real) : coordonnée de la gauche
+            y (Real) : coordonnée du haut
+            width (Real) : largeur
+            height (Real) : hauteur
+            columns (list[tuple[str, int]]) : colonnes (titre, largeur)
+            cell (callable, optional) : texte d'une cellule, appelé avec (élément, indice de colonne) (défaut : élément[colonne])
+            header_height (int, optional) : hauteur du bandeau des titres (défaut : hauteur d'une ligne)
+            header_color (Color, optional) : couleur du bandeau des titres
+            header_font_color (Color, optional) : couleur des titres
+            **kwargs : paramètres de ListViewObject (items, row_height, key, version, couleurs, panel, ...)
+        """
+        if not isinstance(columns, Sequence) or not columns: _raise_error(self, '__init__', 'Invalid columns argument')
+        if not all(isinstance(c, tuple) and len(c) == 2 and isinstance(c[0], str) and isinstance(c[1], int) and c[1] > 0 for c in columns): _raise_error(self, '__init__', 'Invalid columns argument')
+        if cell is not None and not callable(cell): _raise_error(self, '__init__', 'Invalid cell argument')
+        if header_height is not None and (not isinstance(header_height, int) or header_height < 0): _raise_error(self, '__init__', 'Invalid header_height argument')
+        header_color = _to_color(header_color, method='__init__')
+        header_font_color = _to_color(header_font_color, method='__init__')
+        super().__init__(x, y, width, height, **kwargs)
+
+        # colonnes
+        self._columns = list(columns)
+        self._cell = cell
+
+        # bandeau des titres
+        self._header_height = header_height if header_height is not None else self._row_height
+        self._header_color = header_color
+        self._header_font_color = header_font_color
+        self._header = None
+
+    # ======================================== GETTERS ========================================
+    @property
+    def columns(self) -> list[tuple[str, int]]:
+        """Renvoie les colonnes (titre, largeur)"""
+        return list(self._columns)
+
+    def column_at(self, point: tuple[Real, Real]) -> int | None:
+        """
+        Renvoie l'indice de la colonne sous un point (coordonnées du panel, None si hors colonnes)
+
+        Args:
+            point (tuple[Real, Real]) : (x, y) dans les coordonnées du panel
+        """
+        x = point[0] - self._rect.x
+        for column, (_, width) in enumerate(self._columns):
+            if 0 <= x < width:
+                return column
+            x -= width
+        return None
+
+    # ======================================== LIGNES ========================================
+    def _draw_row(self, surface: pygame.Surface, item: object, index: int):
+        """Rendu par défaut d'une ligne : une cellule par colonne"""
+        x = 0
+        for column, (_, width) in enumerate(self._columns):
+            value = self._cell(item, column) if self._cell is not None else item[column]
+            self._blit_text(surface, str(value), x + self._text_padding, x + width - self._text_padding)
+            x += width
+
+    def _draw_header(self, surface: pygame.Surface):
+        """Dessine le bandeau des titres (rendu une seule fois)"""
+        if not self._header_height:
+            return
+        if self._header is None:
+            self._header = pygame.Surface((self._content_width, self._header_height), pygame.SRCALPHA)
+            self._header.fill(self._header_color)
+            x = 0
+            for title, width in self._columns:
+                if title:
+                    rendered = self._font.render(title, True, self._header_font_color)
+                    self._header.blit(rendered, (x + self._text_padding, (self._header_height - rendered.get_height()) // 2), pygame.Rect(0, 0, max(0, width - 2 * self._text_padding), rendered.get_height()))
+                x += width
+        surface.blit(self._header, (0, 0))
@@ -1,13 +1,13 @@
 # ======================================== IMPORTS ========================================
 import pygame
 from ._core import *
-import numpy as np
 
 # ======================================== OBJET ========================================
 class TextObject:
     """
     Object de l'interface : Texte
     """
+    GRADIENT_STEPS = 256        # teintes du dégradé animé
     def __init__(
             self,
             x: Real = -1,
@@ -20,6 +20,7 @@ class TextObject:
             font_size: int = 24,
             font_color: pygame.Color = (0, 0, 0, 255),
             antialias: bool = True,
+            glyph_cache: bool = False,
 
             bold: bool = False,
             italic: bool = False,
@@ -53,6 +54,7 @@ class TextObject:
             font_size (int, optional) : taille de la police
             font_color (Color, optional) : couleur du texte
             antialias (bool, optional) : antialiasing du texte
+            glyph_cache (bool, optional) : composition par atlas de glyphes (textes changeant souvent : scores, chronos, fps)
 
             bold (bool, optional) : texte en gras
             italic (bool, optional) : texte en italique
@@ -83,6 +85,7 @@ class TextObject:
         if not isinstance(font_size, int): _raise_error(self, '__init__', 'Invalid font_size argument')
         font_color = _to_color(font_color, method='__init__')
         if not isinstance(antialias, bool): _raise_error(self, '__init__', 'Invalid antialias argument')
+        if not isinstance(glyph_cache, bool): _raise_error(self, '__init__', 'Invalid glyph_cache argument')
         if not isinstance(bold, bool): _raise_error(self, "__init__", "Invalid bool argument")
         if not isinstance(italic, bool): _raise_error(self, "__init__", "Invalid italic argument")
         if not isinstance(underline, bool): _raise_error(self, "__init__", "Invalid underline argument")
@@ -117,27 +120,16 @@ class TextObject:
         self._font_color: pygame.Color = font_color
         self._font_size: int = font_size
         self._antialias: bool = antialias
+        self._glyph_cache: bool = glyph_cache
+        self._glyph_buffers: list[pygame.Surface | None] = [None, None]     # surfaces de composition réutilisées (texte, ombre)
+        self._glyph_layouts: list[tuple | None] = [None, None]              # dernière composition de chaque surface (atlas, texte, placement, vue)
 
-        # police
+        # police (registre partagé : effets inclus)
         if self._font is None:
-            if self._font_path is not None:
-                try:
-                    self._font = pygame.font.Font(self._font_path, self._font_size)
-                except Exception as _:
-                    if self._sysfont is not None:
-                        self._font = pygame.font.SysFont(self._sysfont, self._font_size)
-                    else:
-                        self._font = pygame.font.Font(None, self._font_size)
-            else:
-                if self._sysfont is not None:
-                    self._font = pygame.font.SysFont(self._sysfont, self._font_size)
-                else:
-                    self._font = pygame.font.Font(None, self._font_size)
-
-        # Effets
-        self._font.set_bold(bold)
-        self._font.set_italic(italic)
-        self._font.set_underline(underline)
+            self._font = context.ui.get_font(self._font_size, self._sysfont, self._font_path, bold, italic, underline)
+        else:
+            # Effets (une police du registre est remplacée par sa variante, jamais modifiée)
+            self._font = context.ui._styled_font(self._font, bold, italic, underline)
         self._shadow = shadow
         self._shadow_color = shadow_color
         self._shadow_offset = shadow_offset
@@ -155,12 +147,14 @@ class TextObject:
         self._gradient_fluctuation_speed = gradient_fluctuation_speed
         self._gradient_fluctuation_amplitude = gradient_fluctuation_amplitude
         self._gradient_fluctuation_timer = 0.0
+        self._gradient_surface = None       # surface du dégradé, modifiée en place par l'animation
+        self._gradient_bands = None         # indice de teinte de chaque pixel (diffusable sur la surface)
+        self._gradient_alpha = None         # canal alpha du texte, conservé par l'animation
 
         # surface
         self._surface = None
         self._surface_init = None
         self._rect = None
-        if self._gradient: self._render_gradient()
         self._render()
 
         # panel maître
@@ -190,55 +184,94 @@ class TextObject:
         """Génère la surface du texte"""
         if self._gradient:
             return self._render_gradient()
+        if self._glyph_cache:
+            return self._render_glyphs()
         self._surface = self._font.render(self._text, self._antialias, self._font_color, self._background)
         self._surface_init = self._surface.copy()
         self._shadow_surface = self._font.render(self._text, self._antialias, self._shadow_color)
         self._shadow_surface_init = self._shadow_surface.copy()
         self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+        context.ui._moved(self)
+
+    def _render_glyphs(self):
+        """Compose le texte et son ombre (si activée) depuis les atlas de glyphes (sans nouvelle surface)"""
+        self._surface = self._compose_glyphs(0, self._font_color, self._background)
+        self._shadow_surface = self._compose_glyphs(1, self._shadow_color, None) if self._shadow else None
+        self._surface_init = self._surface
+        self._shadow_surface_init = self._shadow_surface
+        self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+        context.ui._moved(self)
+
+    def _compose_glyphs(self, index: int, color: pygame.Color, background: pygame.Color | None) -> pygame.Surface:
+        """Compose le texte dans une surface réutilisée, renvoie la vue sur la zone du texte (seule la fin modifiée est recomposée)"""
+        text = self._text
+        previous = self._glyph_layouts[index]
+        atlas = previous[0] if previous is not None else None
+        if atlas is None or atlas._font is not self._font or atlas._color != color or atlas._antialias != self._antialias:
+            atlas = context.ui._get_glyph_atlas(self._font, color, self._antialias)
+
+        # caractères de tête inchangés depuis la dernière composition (fond transparent uniquement)
+        start = 0
+        if previous is not None and previous[0] is atlas and background is None:
+            old = previous[1]
+            limit = min(len(old), len(text))
+            while start < limit and old[start] == text[start]:
+                start += 1
+        layout = atlas.layout(text, start, previous[2] if start else None)
+        width, height = atlas._extent(layout)
+
+        buffer = self._glyph_buffers[index]
+        if buffer is None or buffer.get_width() < width or buffer.get_height() < height:
+            capacity = max(width, 2 * buffer.get_width()) if buffer is not None else max(width, 64)
+            capacity = (-(-capacity // 16) * 16, max(height, buffer.get_height()) if buffer is not None else height)     # lignes alignées sur 64 octets (remplissage rapide)
+            buffer = self._glyph_buffers[index] = pygame.Surface(capacity, pygame.SRCALPHA)
+            start = 0
+            previous = None
+
+        if background is not None:
+            buffer.fill(background, (0, 0, width, height))
+            atlas.blit(text, layout, buffer)
+        else:
+            # effacement depuis le dernier glyphe inchangé (aligné sur 16 pixels : remplissage rapide),
+            # puis reblit des glyphes qui débordent sur la zone effacée (MAX : idempotent)
+            left = layout[0][start - 1] // 16 * 16 if start > 0 else 0
+            buffer.fill((0, 0, 0, 0), (left, 0, buffer.get_width() - left, buffer.get_height()))
+            first = start
+            while first > 0 and layout[1][first - 1] > left:
+                first -= 1
+            atlas.blit(text, layout, buffer, first, special_flags=pygame.BLEND_RGBA_MAX)
+
+        # vue sur la zone du texte (reprise si les dimensions sont inchangées, chiffres à chasse fixe notamment)
+        view = previous[3] if previous is not None and previous[3].get_size() == (width, height) else buffer.subsurface((0, 0, width, height))
+        view.set_alpha(255)
+        self._glyph_layouts[index] = (atlas, text, layout, view)
+        return view
 
     def _render_gradient(self):
-        """Render le texte avec un dégradé statique selon direction"""
-        text_surf = self._font.render(self._text, self._antialias, (255, 255, 255))
-        w, h = text_surf.get_size()
+        """Render le texte avec un dégradé statique selon direction (champ de positions et masque conservés pour l'animation)"""
+        mask = self._font.render(self._text, self._antialias, (255, 255, 255))
+        w, h = mask.get_size()
 
+        # couverture du texte dans le canal alpha (copie exacte sur une zone transparente)
         gradient = pygame.Surface((w, h), pygame.SRCALPHA)
-
-        c1 = self._font_color
-        c2 = self._gradient_color
-
-        if self._gradient_direction == "vertical":
-            for y in range(h):
-                t = y / (h - 1) if h > 1 else 0
-                r = int(c1[0] + (c2[0] - c1[0]) * t)
-                g = int(c1[1] + (c2[1] - c1[1]) * t)
-                b = int(c1[2] + (c2[2] - c1[2]) * t)
-                pygame.draw.line(gradient, (r, g, b), (0, y), (w, y))
-
-        elif self._gradient_direction == "horizontal":
-            for x in range(w):
-                t = x / (w - 1) if w > 1 else 0
-                r = int(c1[0] + (c2[0] - c1[0]) * t)
-                g = int(c1[1] + (c2[1] - c1[1]) * t)
-                b = int(c1[2] + (c2[2] - c1[2]) * t)
-                pygame.draw.line(gradient, (r, g, b), (x, 0), (x, h))
-
-        elif self._gradient_direction == "diagonal":
-            for y in range(h):
-                for x in range(w):
-                    t = ((x / (w - 1 if w > 1 else 1)) +
-                        (y / (h - 1 if h > 1 else 1))) * 0.5
-                    r = int(c1[0] + (c2[0] - c1[0]) * t)
-                    g = int(c1[1] + (c2[1] - c1[1]) * t)
-                    b = int(c1[2] + (c2[2] - c1[2]) * t)
-                    gradient.set_at((x, y), (r, g, b))
-
-        gradient.blit(text_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        gradient.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+
+        positions = _gradient_positions(w, h, self._gradient_direction)
+        c1 = np.array(self._font_color[:3], dtype=np.float64)
+        c2 = np.array(self._gradient_color[:3], dtype=np.float64)
+        pixels = pygame.surfarray.pixels3d(gradient)
+        pixels[...] = (c1 + (c2 - c1) * positions[..., None]).astype(np.uint8)
+        del pixels
+
+        self._gradient_surface = gradient
+        self._gradient_bands = _gradient_bands(positions, self.GRADIENT_STEPS) if self._gradient_fluctuation else None
+        self._gradient_alpha = _alpha_bits(gradient) if self._gradient_fluctuation else None
         self._surface = gradient
         self._surface_init = self._surface.copy()
         self._shadow_surface = self._font.render(self._text, self._antialias, self._shadow_color)
         self._shadow_surface_init = self._shadow_surface.copy()
         self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
-
+        context.ui._moved(self)
 
     # ======================================== GETTERS ========================================
     @property
@@ -278,6 +311,7 @@ class TextObject:
         if not isinstance(value, int):
             _raise_error(self, 'set_zorder', 'Invalid zorder argument')
         self._zorder = value
+        context.ui._reorder(self)
 
     @visible.setter
     def visible(self, value: bool):
@@ -300,6 +334,7 @@ class TextObject:
         self._y = y
         if self._surface:
             self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+            context.ui._moved(self)
 
     def set_color(self, color: pygame.Color):
         """Modifie la couleur et re-render"""
@@ -311,7 +346,8 @@ class TextObject:
         if not isinstance(alpha, int) or not 0 <= alpha <= 255:
             _raise_error(self, 'set_alpha', 'Invalid alpha argument')
         self._surface.set_alpha(alpha)
-        self._shadow_surface.set_alpha(alpha)
+        if self._shadow_surface is not None:
+            self._shadow_surface.set_alpha(alpha)
 
     # ======================================== PREDICATS ========================================
     def collidemouse(self) -> bool:
@@ -332,14 +368,17 @@ class TextObject:
         self.set_alpha(255)
         self._surface = self._surface_init.copy()
         self._rect = self._surface.get_rect(center=self._rect.center)
+        context.ui._moved(self)
 
     def scale(self, ratio: Real):
         """Redimensionne l'objet"""
         if not isinstance(ratio, Real) or not 0.0 < ratio <= 1.0:
             _raise_error(self, 'scale', 'Invalid ratio_argument')
         self._surface = pygame.transform.smoothscale(self._surface_init, (self._surface_init.get_width() * ratio, self._surface_init.get_height() * ratio))
-        self._shadow_surface = pygame.transform.smoothscale(self._shadow_surface_init, (self._shadow_surface_init.get_width() * ratio, self._shadow_surface_init.get_height() * ratio))
+        if self._shadow_surface_init is not None:
+            self._shadow_surface = pygame.transform.smoothscale(self._shadow_surface_init, (self._shadow_surface_init.get_width() * ratio, self._shadow_surface_init.get_height() * ratio))
         self._rect = self._surface.get_rect(center=self._rect.center)
+        context.ui._moved(self)
     
     def blink(self, alpha_min: int = 0, alpha_max: int = 255, duration: float | None = None, speed: float = 1.0, visible_time: float = 0.0, hidden_time: float = 0.0):
         """
@@ -388,49 +427,18 @@ class TextObject:
         self.update_blinking()
 
     def update_gradient(self):
-        """Dégradé animé type 'cycles', optimisé avec numpy, avec amplitude et direction"""
+        """Dégradé animé type 'cycles' : table de couleurs déphasée, appliquée en place au champ de positions précalculé"""
         if not self._gradient or not self._gradient_fluctuation:
             return
 
         self._gradient_fluctuation_timer += context.time.dt
-
-        text_surf = self._font.render(self._text, True, (255, 255, 255))
-        w, h = text_surf.get_size()
-        gradient = pygame.Surface((w, h), pygame.SRCALPHA)
-
-        c1 = np.array(self._font_color[:3], dtype=np.float32)
-        c2 = np.array(self._gradient_color[:3], dtype=np.float32)
-        amp = self._gradient_fluctuation_amplitude
         timer = self._gradient_fluctuation_timer * self._gradient_fluctuation_speed
 
-        if self._gradient_direction == "horizontal":
-            pos = np.linspace(0, 1, w, dtype=np.float32).reshape((w, 1))
-            pos = np.tile(pos, (1, h))
-        elif self._gradient_direction == "vertical":
-            pos = np.linspace(0, 1, h, dtype=np.float32).reshape((1, h))
-            pos = np.tile(pos, (w, 1))
-        elif self._gradient_direction == "diagonal":
-            xv = np.linspace(0, 1, w, dtype=np.float32).reshape((w, 1))
-            yv = np.linspace(0, 1, h, dtype=np.float32).reshape((1, h))
-            pos = (np.tile(xv, (1, h)) + np.tile(yv, (w, 1))) / 2
-        else:
-            pos = np.linspace(0, 1, w, dtype=np.float32).reshape((w, 1))
-            pos = np.tile(pos, (1, h))
-
-        wave = 0.5 + amp * np.sin(pos * np.pi * 2 + timer)
-
-        array = np.zeros((w, h, 3), dtype=np.uint8)
-        array[..., 0] = (c1[0] * (1 - wave) + c2[0] * wave).astype(np.uint8)
-        array[..., 1] = (c1[1] * (1 - wave) + c2[1] * wave).astype(np.uint8)
-        array[..., 2] = (c1[2] * (1 - wave) + c2[2] * wave).astype(np.uint8)
-
-        pygame.surfarray.blit_array(gradient, array)
+        colors = _wave_colors(self._font_color, self._gradient_color, self.GRADIENT_STEPS, self._gradient_fluctuation_amplitude, timer)
+        _paint_gradient(self._gradient_surface, colors, self._gradient_bands, self._gradient_alpha)
 
-        gradient.blit(text_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-
-        self._surface = gradient
-        self._surface_init = self._surface.copy()
-        self._rect = self._surface.get_rect(**{self._anchor: (self._x, self._y)})
+        self._surface = self._gradient_surface
+        self._surface_init = self._surface
     
     def update_blinking(self):
         """Actualise le clignottement avec machine à états"""
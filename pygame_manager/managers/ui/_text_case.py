@@ -151,19 +151,7 @@ class TextCaseObject:
             self._font = font
         else:
             self._sysfont = font if isinstance(font, str) else None
-            if self._font_path is not None:
-                try:
-                    self._font = pygame.font.Font(self._font_path, self._font_size)
-                except Exception:
-                    if self._sysfont is not None:
-                        self._font = pygame.font.SysFont(self._sysfont, self._font_size)
-                    else:
-                        self._font = pygame.font.Font(None, self._font_size)
-            else:
-                if self._sysfont is not None:
-                    self._font = pygame.font.SysFont(self._sysfont, self._font_size)
-                else:
-                    self._font = pygame.font.Font(None, self._font_size)
+            self._font = context.ui.get_font(self._font_size, self._sysfont, self._font_path)
 
         # background
         self._filling = filling
@@ -207,8 +195,11 @@ class TextCaseObject:
         self._held_timer   = 0.0
         self._held_initial = True   # True = on attend le délai initial, False = répétition
 
-        # pré-render
+        # pré-render (nouveau rendu uniquement si l'état affiché change)
         self._update_text_offset()
+        self._text_render = None            # (texte, surface du texte)
+        self._placeholder_render = None     # surface du placeholder
+        self._render_state = self._get_render_state()
         self._surface = self._render_frame()
         self._surface_rect = self._surface.get_rect(topleft=self._rect.topleft)
 
@@ -247,6 +238,7 @@ class TextCaseObject:
         if not isinstance(value, int):
             _raise_error(self, 'set_zorder', 'Invalid zorder argument')
         self._zorder = value
+        context.ui._reorder(self)
 
     @visible.setter
     def visible(self, value: bool):
@@ -274,6 +266,7 @@ class TextCaseObject:
     def set_position(self, x: Real, y: Real):
         """Modifie la position (selon l'anchor)"""
         setattr(self._rect, self._anchor, (x, y))
+        context.ui._moved(self)
 
     # ======================================== SCROLL TEXTE ========================================
     def _update_text_offset(self):
@@ -467,9 +460,14 @@ class TextCaseObject:
         cursor_x_in_text = self._font.size(self._text[:self._cursor_pos])[0]
         return self._text_blit_x + cursor_x_in_text
 
+    def _get_render_state(self) -> tuple:
+        """État affiché : texte, défilement, focus, survol, curseur"""
+        cursor = self._cursor_pos if self._focused and self._cursor_visible else None
+        return (self._text, self._text_blit_x, self._focused, self.hovered, cursor)
+
     def _render_frame(self) -> pygame.Surface:
         """Génère la surface pour la frame courante selon l'état actuel"""
-        surface = pygame.Surface((self._rect.width, self._rect.height), pygame.SRCALPHA)
+        surface = context.screen.acquire((self._rect.width, self._rect.height), clear=not self._filling or self._border_radius > 0)  # remplissage sans coins arrondis : tous les pixels recouverts
 
         # couleurs selon l'état
         if self._focused:
@@ -489,11 +487,15 @@ class TextCaseObject:
         # texte ou placeholder
         available = self._rect.width - 2 * self._padding
         if self._text:
-            text_surface = self._font.render(self._text, True, self._font_color)
+            if self._text_render is None or self._text_render[0] != self._text:
+                self._text_render = (self._text, self._font.render(self._text, True, self._font_color))
+            text_surface = self._text_render[1]
             text_y = (self._rect.height - text_surface.get_height()) // 2
             surface.blit(text_surface, (self._text_blit_x, text_y))
         elif self._placeholder is not None:
-            ph_surface = self._font.render(self._placeholder, True, self._font_color_placeholder)
+            if self._placeholder_render is None:
+                self._placeholder_render = self._font.render(self._placeholder, True, self._font_color_placeholder)
+            ph_surface = self._placeholder_render
             text_y = (self._rect.height - ph_surface.get_height()) // 2
             surface.blit(ph_surface, (self._padding, text_y))
 
@@ -550,8 +552,13 @@ class TextCaseObject:
             self._cursor_visible = True
             self._cursor_timer = 0.0
 
-        self._surface = self._render_frame()
-        self._surface_rect = self._surface.get_rect(topleft=self._rect.topleft)
+        # nouveau rendu si l'état affiché a changé (la surface précédente est rendue au pool)
+        state = self._get_render_state()
+        if state != self._render_state:
+            self._render_state = state
+            context.screen.release(self._surface)
+            self._surface = self._render_frame()
+        self._surface_rect.topleft = self._rect.topleft
 
     def draw(self):
         """Dessin par frame"""
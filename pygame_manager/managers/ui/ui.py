@@ -12,6 +12,10 @@ from ._surface import SurfaceObject
 from ._overlay import OverlayObject
 from ._scrollbar import ScrollBarObject
 from ._input_button import InputButtonObject
+from ._glyph_atlas import GlyphAtlasObject
+from ._layout import LayoutObject
+from ._list_view import ListViewObject
+from ._table_view import TableViewObject
 
 # ======================================== GESTIONNAIRE ========================================
 class UiManager:
@@ -22,11 +26,42 @@ class UiManager:
         créer des éléments pygame de l'ui
         manipuler ces éléments
         les actualiser
+        partager les polices entre les éléments (registre LRU)
+        ajuster la taille des textes et les découper en lignes (mémoïsé)
+        détecter le survol par une grille spatiale par panel (seule la cellule sous la souris est testée)
+        construire un écran en bloc (batch) sans retrier les objets à chaque ajout
+        placer les objets par conteneurs (LayoutObject), replacés seulement après invalidation
+        partager les variantes redimensionnées des animations de survol (ratios quantifiés, cache LRU par apparence)
     """
+    FONT_CACHE_SIZE = 128               # polices conservées par le registre
+    ATLAS_CACHE_SIZE = 32               # atlas de glyphes conservés
+    FIT_CACHE_SIZE = 512                # ajustements de texte conservés
+    HIT_CELL_SIZE = 128                 # côté d'une cellule de la grille de survol
+    SCALE_STEP = 0.01                   # pas de quantification des ratios de redimensionnement
+    SCALE_CACHE_SIZE = 512              # variantes redimensionnées conservées
+
     def __init__(self):
-        self._objects = []              # ensemble des objets
+        self._objects = []              # ensemble des objets, trié par zorder (ordre d'ajout à zorder égal)
+        self._zkeys = []                # zorder de chaque objet de _objects (recherche dichotomique)
+        self._zorders = {}              # {objet: zorder à l'insertion}
+        self._batch_depth = 0           # profondeur des blocs batch() en cours
+        self._pending = {}              # {objet: None} enregistrés mais pas encore insérés (construction en cours, batch)
         self._filtered = []             # objets actifs
         self._hovered_object = None     # objet survolé
+        self._version = 0               # incrémenté à chaque ajout, retrait ou tri des objets
+        self._filter_key = None         # (version, panels actifs) du dernier filtrage
+        self._filtered_set = set()      # miroir de _filtered pour les tests d'appartenance
+        self._ranks = None              # {objet: rang dans l'ordre z}, reconstruit après modification
+
+        # Grille de survol
+        self._hit_cells = {}            # {panel: {(colonne, ligne): {objet, ...}}}
+        self._hit_entries = {}          # {objet: (panel, cellules)}
+        self._hit_loose = set()         # objets sans zone connue, testés à chaque survol
+        self._hit_dirty = set()         # objets déplacés depuis le dernier survol
+
+        # Mise en page
+        self._layouts = []              # conteneurs racines
+        self._layout_parents = {}       # {widget: conteneur parent}
 
         self._selections = {}           # {"id_selection": "id_selector", ...}
         self._selections_limits = {}    # {"id_selection": selectors_limit}
@@ -36,6 +71,19 @@ class UiManager:
         self._message_spacing = 20
         self._message_base_y = 100
 
+        # Registre des polices
+        self._fonts = OrderedDict()     # {(chemin, police système, taille, gras, italique, souligné): Font}, du moins au plus récemment utilisé
+        self._font_files = {}           # {(police système, gras, italique): (fichier, gras synthétique, italique synthétique)}
+        self._font_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._glyph_atlases = OrderedDict()     # {(police, couleur, antialiasing): GlyphAtlasObject}
+        self._glyph_advances = OrderedDict()    # {police: {caractère: avance}}
+        self._text_fits = OrderedDict()         # {(lignes, boîte, police, options): taille ajustée}
+
+        # Variantes redimensionnées
+        self._scaled_surfaces = OrderedDict()   # {(apparence, pas): surface}, du moins au plus récemment utilisée
+        self._surface_styles = WeakKeyDictionary()  # {surface source: apparence (format, taille, empreinte des pixels)}
+        self._scale_stats = {"hits": 0, "misses": 0}
+
         # Ensemble des objets disponibles
         self.RectButton = RectButtonObject
         self.CircleButton = CircleButtonObject
@@ -49,6 +97,9 @@ class UiManager:
         self.Overlay = OverlayObject
         self.ScrollBar = ScrollBarObject
         self.InputButton = InputButtonObject
+        self.Layout = LayoutObject
+        self.ListView = ListViewObject
+        self.TableView = TableViewObject
 
     def _init(self):
         """Initialisation sécurisée"""
@@ -56,35 +107,161 @@ class UiManager:
         context.inputs.add_listener(1, self._click_up, give_key=True, up=True)
         context.inputs.add_listener(3, self._click_down, give_key=True, up=False)
         context.inputs.add_listener(3, self._click_up, give_key=True, up=True)
+        self._flush()
         for obj in self._objects:
             if hasattr(obj, '_init') and callable(obj._init):
                 obj._init()
 
     # ======================================== METHODES PRIVEES ========================================
     def _sort(self):
-        """Tri des objets par zorder"""
-        self._objects = sorted(self._objects, key=lambda o: getattr(o, 'zorder', 0), reverse=True)
+        """Tri des objets par zorder (tri stable, zorders relus)"""
+        self._objects.sort(key=lambda o: getattr(o, 'zorder', 0))
+        self._zorders = {obj: getattr(obj, 'zorder', 0) for obj in self._objects}
+        self._zkeys = list(self._zorders.values())
+        self._version += 1
 
     def _append(self, obj: object):
-        """Enregistrement d'un objet en maintenant l'ordre z"""
-        if obj in self._objects: return
-        self._objects.append(obj)
-        self._objects.sort(key=lambda o: getattr(o, 'zorder', 0))
+        """Enregistrement d'un objet (inséré dans l'ordre z à l'actualisation suivante ou à la sortie du batch)"""
+        if obj in self._zorders or obj in self._pending: return
+        self._pending[obj] = None
     
+    def _flush(self):
+        """Insère les objets en attente, une fois construits (insertion dichotomique, ou un seul tri si nombreux)"""
+        if self._batch_depth or not self._pending: return
+        pending = list(self._pending)
+        self._pending.clear()
+        if 8 * len(pending) > len(self._objects):
+            self._objects.extend(pending)
+            self._sort()
+        else:
+            for obj in pending:
+                zorder = self._zorders[obj] = getattr(obj, 'zorder', 0)
+                index = bisect_right(self._zkeys, zorder)
+                self._zkeys.insert(index, zorder)
+                self._objects.insert(index, obj)
+            self._version += 1
+        self._hit_dirty.update(pending)
+
     def _remove(self, obj: object):
-        """Suppression d'un objet"""
-        if obj not in self._objects: return
-        self._objects.remove(obj)
-    
+        """Suppression d'un objet (retiré de l'ordre z, de la grille de survol et de son conteneur)"""
+        self._discard(obj)
+        self._hit_dirty.discard(obj)
+        self._unindex(obj)
+        self._detach(obj)
+
+    def _discard(self, obj: object):
+        """Retire un objet de l'ordre z"""
+        if obj in self._pending:
+            del self._pending[obj]
+            return
+        zorder = self._zorders.pop(obj, None)
+        if zorder is None: return
+        index = self._objects.index(obj, bisect_left(self._zkeys, zorder), bisect_right(self._zkeys, zorder))
+        del self._zkeys[index]
+        del self._objects[index]
+        self._version += 1
+
+    def _reorder(self, obj: object):
+        """Replace un objet dont le zorder a changé (devant les objets de même zorder)"""
+        if obj not in self._zorders or getattr(obj, 'zorder', 0) == self._zorders[obj]: return
+        self._discard(obj)
+        self._append(obj)
+        self._flush()
+
+    # Grille de survol
+    def _moved(self, obj: object):
+        """Signale qu'un objet a changé de zone (position, taille, panel) : réindexé au prochain survol, conteneur prévenu"""
+        self._hit_dirty.add(obj)
+        layout = self._layout_parents.get(obj)
+        if layout is not None:
+            layout._child_changed(obj)
+
+    def _hit_rect(self, obj: object) -> pygame.Rect | None:
+        """Zone englobante d'un objet dans les coordonnées de son panel (_hitbox, à défaut _rect)"""
+        hitbox = getattr(obj, '_hitbox', None)
+        return hitbox() if hitbox is not None else getattr(obj, '_rect', None)
+
+    def _index(self, obj: object):
+        """(Ré)indexe un objet dans les cellules couvertes par sa zone"""
+        self._unindex(obj)
+        if not hasattr(obj, '_rect') and not hasattr(obj, '_hitbox'):
+            self._hit_loose.add(obj)
+            return
+        rect = self._hit_rect(obj)
+        if rect is None:
+            return
+        size = self.HIT_CELL_SIZE
+        panel = str(obj.panel)
+        grid = self._hit_cells.setdefault(panel, {})
+        cells = tuple((column, row) for column in range(rect.left // size, (rect.right - 1) // size + 1) for row in range(rect.top // size, (rect.bottom - 1) // size + 1))
+        for cell in cells:
+            grid.setdefault(cell, set()).add(obj)
+        self._hit_entries[obj] = (panel, cells)
+
+    def _unindex(self, obj: object):
+        """Retire un objet de la grille"""
+        self._hit_loose.discard(obj)
+        entry = self._hit_entries.pop(obj, None)
+        if entry is None:
+            return
+        grid = self._hit_cells[entry[0]]
+        for cell in entry[1]:
+            members = grid[cell]
+            members.discard(obj)
+            if not members:
+                del grid[cell]
+
+    # Mise en page
+    def _add_layout(self, layout: LayoutObject):
+        """Enregistrement d'un conteneur racine"""
+        if layout not in self._layouts:
+            self._layouts.append(layout)
+
+    def _remove_layout(self, layout: LayoutObject):
+        """Suppression d'un conteneur racine"""
+        if layout in self._layouts:
+            self._layouts.remove(layout)
+
+    def _attach(self, obj: object, layout: LayoutObject):
+        """Rattache un widget à son conteneur"""
+        self._layout_parents[obj] = layout
+
+    def _detach(self, obj: object):
+        """Détache un widget de son conteneur"""
+        layout = self._layout_parents.pop(obj, None)
+        if layout is not None:
+            layout._forget(obj)
+
+    def _layout_of(self, obj: object) -> LayoutObject | None:
+        """Renvoie le conteneur d'un widget"""
+        return self._layout_parents.get(obj)
+
     # Souris
     def _update_hover(self):
-        """Actualise le survol"""
+        """Actualise le survol (objets de la cellule sous la souris, du plus haut au plus bas dans l'ordre z)"""
+        if self._ranks is None or self._ranks[0] != self._version:
+            self._ranks = (self._version, {obj: rank for rank, obj in enumerate(self._objects)})
+        ranks = self._ranks[1]
+        if self._hit_dirty:
+            for obj in self._hit_dirty:
+                if obj in ranks:
+                    self._index(obj)
+            self._hit_dirty.clear()
+
         hovered_panel = context.panels.hovered
+        panel = str(hovered_panel)
         self._hovered_object = None
-        for obj in reversed(self._filtered):
-            if str(obj.panel) == str(hovered_panel) and obj.collidemouse() and obj.visible:
-                self._hovered_object = obj
-                return
+        x, y = context.panels[hovered_panel].mouse_pos if hovered_panel is not None else context.mouse.get_pos()
+        size = self.HIT_CELL_SIZE
+        candidates = self._hit_cells.get(panel, {}).get((int(x) // size, int(y) // size), ())
+        if self._hit_loose:
+            candidates = [*candidates, *(obj for obj in self._hit_loose if str(obj.panel) == panel)]
+
+        best = -1
+        for obj in candidates:
+            rank = ranks[obj]
+            if rank > best and obj in self._filtered_set and obj.collidemouse() and obj.visible:
+                self._hovered_object, best = obj, rank
 
     def _click(self, key: int, up: bool = False):
         """Clic utilisateur"""
@@ -116,6 +293,7 @@ class UiManager:
     def update(self):
         """Actualisation par frame"""
         self._update_filter()
+        self._update_layouts()
         self._update_hover()
         for obj in self._filtered:
             if hasattr(obj, 'update') and callable(obj.update):
@@ -123,13 +301,24 @@ class UiManager:
         self._update_messages()
 
     def _update_filter(self):
-        """Actualisation des objects filtrés"""
+        """Actualisation des objects filtrés (seulement après un changement d'objets ou de panels actifs)"""
+        self._flush()
+        key = (self._version, tuple(context.panels.get_active_panels()))
+        if key == self._filter_key:
+            return
+        self._filter_key = key
         self._filtered = []
         for obj in self._objects:
             panel = getattr(obj, '_panel', None)
             if panel is not None and not context.panels.is_active(panel): continue
             self._filtered.append(obj)
+        self._filtered_set = set(self._filtered)
     
+    def _update_layouts(self):
+        """Actualisation des conteneurs racines (placement des seules branches invalidées)"""
+        for layout in self._layouts:
+            layout.update()
+
     def _update_messages(self):
         """Actualisation des messages"""
         messages_to_remove = []
@@ -214,6 +403,22 @@ class UiManager:
         self._message_spacing = spacing
     
     # ======================================== METHODES PUBLIQUES ========================================
+    @contextmanager
+    def batch(self):
+        """
+        Construction en bloc : les objets créés dans le bloc sont insérés en une fois à sa sortie (un seul tri)
+
+        Utilisation:
+            with context.ui.batch():
+                for ...: context.ui.RectButton(...)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            self._flush()
+
     def sys_message(self, text: TextObject, lifetime: float = 3.0, fade_duration: float = 0.5):
         """
         Affiche un TextObject comme message système
@@ -226,8 +431,7 @@ class UiManager:
         if not isinstance(text, TextObject):
             raise RuntimeError("[UiManager].sys_message : text must be a TextObject")
 
-        if text in self._objects:
-            self._objects.remove(text)
+        self._remove(text)
         
         y_position = self._message_base_y
         for msg_data in self._system_messages:
@@ -263,5 +467,297 @@ class UiManager:
             elif id_selector in self._selections[id_selection]:
                 self._selections[id_selection].remove(id_selector)
 
+    # ======================================== POLICES ========================================
+    @property
+    def font_stats(self) -> dict[str, int]:
+        """Renvoie les compteurs du registre de polices (hits, misses, evictions, cached, atlases)"""
+        return {**self._font_stats, "cached": len(self._fonts), "atlases": len(self._glyph_atlases), "fits": len(self._text_fits)}
+
+    def get_font(self, size: int, sysfont: str = None, path: str = None, bold: bool = False, italic: bool = False, underline: bool = False) -> pygame.font.Font:
+        """
+        Renvoie une police partagée, chargée une seule fois (ses effets ne doivent pas être modifiés)
+        Chargement : fichier path, à défaut police système sysfont, à défaut police par défaut
+
+        Args:
+            size (int) : taille de la police
+            sysfont (str, optional) : nom de la police système
+            path (str, optional) : chemin du fichier de police
+            bold (bool, optional) : gras
+            italic (bool, optional) : italique
+            underline (bool, optional) : souligné
+        """
+        if not isinstance(size, int) or size <= 0: _raise_error(self, 'get_font', 'Invalid size argument')
+        if sysfont is not None and not isinstance(sysfont, str): _raise_error(self, 'get_font', 'Invalid sysfont argument')
+        if path is not None and not isinstance(path, str): _raise_error(self, 'get_font', 'Invalid path argument')
+        if not all(isinstance(e, bool) for e in (bold, italic, underline)): _raise_error(self, 'get_font', 'Invalid style argument')
+        return self._get_font(size, sysfont, path, bold, italic, underline)
+
+    def get_glyph_atlas(self, font: pygame.font.Font, color: pygame.Color, antialias: bool = True) -> GlyphAtlasObject:
+        """
+        Renvoie l'atlas de glyphes partagé d'une police et d'une couleur
+
+        Args:
+            font (Font) : police (de préférence obtenue par get_font)
+            color (Color) : couleur des glyphes
+            antialias (bool, optional) : antialiasing des glyphes
+        """
+        if not isinstance(font, pygame.font.Font): _raise_error(self, 'get_glyph_atlas', 'Invalid font argument')
+        color = _to_color(color, method='get_glyph_atlas')
+        if color is None: _raise_error(self, 'get_glyph_atlas', 'Invalid color argument')
+        if not isinstance(antialias, bool): _raise_error(self, 'get_glyph_atlas', 'Invalid antialias argument')
+        return self._get_glyph_atlas(font, color, antialias)
+
+    def fit_font_size(
+            self,
+            text: str | list[str],
+            max_size: int,
+            width: Real,
+            height: Real = None,
+            min_size: int = 5,
+            sysfont: str = None,
+            path: str = None,
+            bold: bool = False,
+            italic: bool = False,
+            underline: bool = False,
+            wrap: bool = False,
+            line_spacing: float = 0.1,
+        ) -> int:
+        """
+        Renvoie la plus grande taille de police pour laquelle le texte tient dans la boîte (min_size à défaut)
+        Mesure par Font.size, recherche dichotomique, résultat mémoïsé par (texte, boîte, police)
+
+        Args:
+            text (str | list[str]) : texte ou lignes du texte
+            max_size (int) : taille maximale
+            width (Real) : largeur de la boîte
+            height (Real, optional) : hauteur de la boîte (None : non contrainte)
+            min_size (int, optional) : taille minimale
+            sysfont (str, optional) : nom de la police système
+            path (str, optional) : chemin du fichier de police
+            bold (bool, optional) : gras
+            italic (bool, optional) : italique
+            underline (bool, optional) : souligné
+            wrap (bool, optional) : découpage des lignes en mots à la largeur de la boîte
+            line_spacing (float, optional) : espacement entre lignes (proportion de la hauteur de police)
+        """
+        if isinstance(text, str): text = [text]
+        if not isinstance(text, (list, tuple)) or not all(isinstance(line, str) for line in text): _raise_error(self, 'fit_font_size', 'Invalid text argument')
+        if not isinstance(max_size, int) or max_size <= 0: _raise_error(self, 'fit_font_size', 'Invalid max_size argument')
+        if not isinstance(width, Real) or width < 0: _raise_error(self, 'fit_font_size', 'Invalid width argument')
+        if height is not None and (not isinstance(height, Real) or height < 0): _raise_error(self, 'fit_font_size', 'Invalid height argument')
+        if not isinstance(min_size, int) or min_size <= 0: _raise_error(self, 'fit_font_size', 'Invalid min_size argument')
+        if sysfont is not None and not isinstance(sysfont, str): _raise_error(self, 'fit_font_size', 'Invalid sysfont argument')
+        if path is not None and not isinstance(path, str): _raise_error(self, 'fit_font_size', 'Invalid path argument')
+        if not all(isinstance(e, bool) for e in (bold, italic, underline, wrap)): _raise_error(self, 'fit_font_size', 'Invalid style argument')
+        if not isinstance(line_spacing, Real) or line_spacing < 0: _raise_error(self, 'fit_font_size', 'Invalid line_spacing argument')
+        return self._fit_font_size(tuple(text), max_size, width, height, min(min_size, max_size), sysfont, path, bold, italic, underline, wrap, line_spacing)
+
+    def wrap_text(self, text: str, font: pygame.font.Font, width: Real) -> list[str]:
+        """
+        Découpe un texte en lignes de mots tenant dans une largeur (avances des glyphes mémoïsées par police)
+        Les sauts de ligne du texte sont conservés, un mot plus large que la boîte occupe seul sa ligne
+
+        Args:
+            text (str) : texte à découper
+            font (Font) : police du texte
+            width (Real) : largeur maximale d'une ligne
+        """
+        if not isinstance(text, str): _raise_error(self, 'wrap_text', 'Invalid text argument')
+        if not isinstance(font, pygame.font.Font): _raise_error(self, 'wrap_text', 'Invalid font argument')
+        if not isinstance(width, Real) or width < 0: _raise_error(self, 'wrap_text', 'Invalid width argument')
+        return self._wrap_text(text, font, width)
+
+    def clear_fonts(self):
+        """Vide le registre de polices, les atlas de glyphes et les ajustements (les éléments existants conservent les leurs)"""
+        self._fonts.clear()
+        self._glyph_atlases.clear()
+        self._glyph_advances.clear()
+        self._text_fits.clear()
+
+    def _fit_font_size(self, lines: tuple[str], max_size: int, width: Real, height: Real | None, min_size: int, sysfont: str | None, path: str | None, bold: bool, italic: bool, underline: bool, wrap: bool, line_spacing: float) -> int:
+        """Recherche dichotomique de la taille ajustée (taille convenable croissante avec la boîte)"""
+        key = (lines, max_size, width, height, min_size, sysfont, path, bold, italic, underline, wrap, line_spacing)
+        size = self._text_fits.get(key)
+        if size is not None:
+            self._text_fits.move_to_end(key)
+            return size
+
+        low, high = min_size, max_size
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._text_fits_box(lines, self._get_font(middle, sysfont, path, bold, italic, underline), width, height, wrap, line_spacing):
+                low = middle
+            else:
+                high = middle - 1
+
+        self._text_fits[key] = low
+        while len(self._text_fits) > self.FIT_CACHE_SIZE:
+            self._text_fits.popitem(last=False)
+        return low
+
+    def _text_fits_box(self, lines: tuple[str], font: pygame.font.Font, width: Real, height: Real | None, wrap: bool, line_spacing: float) -> bool:
+        """Vérifie que les lignes (découpées si wrap) tiennent dans la boîte"""
+        if wrap:
+            lines = [wrapped for line in lines for wrapped in self._wrap_text(line, font, width)]
+        if any(font.size(line)[0] > width for line in lines):
+            return False
+        line_height = font.get_height()
+        return height is None or len(lines) * line_height + (len(lines) - 1) * int(line_height * line_spacing) <= height
+
+    def _wrap_text(self, text: str, font: pygame.font.Font, width: Real) -> list[str]:
+        """Découpage glouton des paragraphes en lignes, mesuré par les avances des glyphes"""
+        advances = self._get_glyph_advances(font)
+        space = self._advance(' ', font, advances)
+        lines = []
+        for paragraph in text.split('\n'):
+            words = paragraph.split(' ')
+            start, line_width = 0, -space
+            for i, word in enumerate(words):
+                word_width = self._advance(word, font, advances)
+                if i > start and line_width + space + word_width > width:
+                    lines.append(' '.join(words[start:i]))
+                    start, line_width = i, word_width
+                else:
+                    line_width += space + word_width
+            lines.append(' '.join(words[start:]))
+        return lines
+
+    def _get_glyph_advances(self, font: pygame.font.Font) -> dict[str, int]:
+        """Renvoie la table des avances d'une police (LRU)"""
+        advances = self._glyph_advances.get(font)
+        if advances is not None:
+            self._glyph_advances.move_to_end(font)
+            return advances
+        advances = self._glyph_advances[font] = {}
+        while len(self._glyph_advances) > self.FONT_CACHE_SIZE:
+            self._glyph_advances.popitem(last=False)
+        return advances
+
+    def _advance(self, text: str, font: pygame.font.Font, advances: dict[str, int]) -> int:
+        """Somme des avances des caractères d'un texte (mesurées une fois par caractère)"""
+        total = 0
+        for char in text:
+            advance = advances.get(char)
+            if advance is None:
+                metrics = font.metrics(char)[0]
+                advance = advances[char] = metrics[4] if metrics is not None else font.size(char)[0]
+            total += advance
+        return total
+
+    def _get_glyph_atlas(self, font: pygame.font.Font, color: pygame.Color, antialias: bool) -> GlyphAtlasObject:
+        """Renvoie l'atlas du registre, créé au premier appel"""
+        key = (font, tuple(color), antialias)
+        atlas = self._glyph_atlases.get(key)
+        if atlas is not None:
+            self._glyph_atlases.move_to_end(key)
+            return atlas
+        atlas = self._glyph_atlases[key] = GlyphAtlasObject(font, color, antialias)
+        while len(self._glyph_atlases) > self.ATLAS_CACHE_SIZE:
+            self._glyph_atlases.popitem(last=False)
+        return atlas
+
+    def _styled_font(self, font: pygame.font.Font, bold: bool, italic: bool, underline: bool) -> pygame.font.Font:
+        """Applique des effets à une police fournie : variante du registre si elle en vient (jamais modifiée), sinon la police elle-même"""
+        for (path, sysfont, size, *_), cached in self._fonts.items():
+            if cached is font:
+                return self._get_font(size, sysfont, path, bold, italic, underline)
+        font.set_bold(bold)
+        font.set_italic(italic)
+        font.set_underline(underline)
+        return font
+
+    def _get_font(self, size: int, sysfont: str | None, path: str | None, bold: bool, italic: bool, underline: bool) -> pygame.font.Font:
+        """Renvoie la police du registre, chargée au premier appel"""
+        key = (path, sysfont, size, bold, italic, underline)
+        font = self._fonts.get(key)
+        if font is not None:
+            self._font_stats["hits"] += 1
+            self._fonts.move_to_end(key)
+            return font
+
+        self._font_stats["misses"] += 1
+        font = self._load_font(size, sysfont, path, bold, italic)
+        font.set_underline(underline)
+        self._fonts[key] = font
+        while len(self._fonts) > self.FONT_CACHE_SIZE:
+            self._fonts.popitem(last=False)
+            self._font_stats["evictions"] += 1
+        return font
+
+    def _load_font(self, size: int, sysfont: str | None, path: str | None, bold: bool, italic: bool) -> pygame.font.Font:
+        """Charge une police (fichier, puis police système, puis police par défaut)"""
+        if path is not None:
+            try:
+                font = pygame.font.Font(path, size)
+                font.set_bold(bold)
+                font.set_italic(italic)
+                return font
+            except Exception:
+                pass
+        file, fake_bold, fake_italic = self._font_file(sysfont, bold, italic) if sysfont is not None else (None, bold, italic)
+        font = pygame.font.Font(file, size)
+        font.set_bold(fake_bold)
+        font.set_italic(fake_italic)
+        return font
+
+    def _font_file(self, sysfont: str, bold: bool, italic: bool) -> tuple[str | None, bool, bool]:
+        """Résout une fois le fichier d'une police système et les effets à synthétiser (comme SysFont)"""
+        key = (sysfont, bold, italic)
+        resolved = self._font_files.get(key)
+        if resolved is None:
+            file = pygame.font.match_font(sysfont, bold, italic)
+            if file is None or file == pygame.font.match_font(sysfont):
+                style = (False, False)
+            elif bold and italic and file == pygame.font.match_font(sysfont, True, False):
+                style = (True, False)
+            else:
+                style = (bold, italic)
+            resolved = self._font_files[key] = (file, bold and not style[0], italic and not style[1])
+        return resolved
+
+    # ======================================== SURFACES REDIMENSIONNEES ========================================
+    @property
+    def scale_stats(self) -> dict[str, int]:
+        """Renvoie les compteurs du cache de variantes redimensionnées (hits, misses, cached)"""
+        return {**self._scale_stats, "cached": len(self._scaled_surfaces)}
+
+    def get_scaled(self, surface: pygame.Surface, ratio: Real) -> pygame.Surface:
+        """
+        Renvoie une variante redimensionnée partagée d'une surface (ratio quantifié au pas SCALE_STEP)
+        Les surfaces d'apparence identique partagent leurs variantes ; ni la source ni la variante ne doivent être modifiées
+
+        Args:
+            surface (pygame.Surface) : surface source
+            ratio (Real) : facteur de redimensionnement
+        """
+        if not isinstance(surface, pygame.Surface): _raise_error(self, 'get_scaled', 'Invalid surface argument')
+        if not isinstance(ratio, Real) or ratio <= 0: _raise_error(self, 'get_scaled', 'Invalid ratio argument')
+        return self._get_scaled(surface, ratio)
+
+    def clear_scaled(self):
+        """Vide le cache de variantes redimensionnées"""
+        self._scaled_surfaces.clear()
+
+    def _get_scaled(self, surface: pygame.Surface, ratio: float) -> pygame.Surface:
+        """Variante du cache (créée au premier pas rencontré), la source elle-même au ratio 1"""
+        step = round(ratio / self.SCALE_STEP)
+        if step == round(1 / self.SCALE_STEP) or step <= 0:
+            return surface
+        style = self._surface_styles.get(surface)
+        if style is None:
+            style = self._surface_styles[surface] = (surface.get_bitsize(), surface.get_flags() & pygame.SRCALPHA, surface.get_size(), hashlib.blake2b(pygame.image.tobytes(surface, "RGBA"), digest_size=16).digest())
+        key = (style, step)
+        scaled = self._scaled_surfaces.get(key)
+        if scaled is not None:
+            self._scaled_surfaces.move_to_end(key)
+            self._scale_stats["hits"] += 1
+            return scaled
+        self._scale_stats["misses"] += 1
+        width, height = surface.get_size()
+        scaled = self._scaled_surfaces[key] = pygame.transform.smoothscale(surface, (max(1, round(width * step * self.SCALE_STEP)), max(1, round(height * step * self.SCALE_STEP))))
+        while len(self._scaled_surfaces) > self.SCALE_CACHE_SIZE:
+            self._scaled_surfaces.popitem(last=False)
+        return scaled
+
 # ======================================== INSTANCE ========================================
 ui_manager = UiManager()
\ No newline at end of file
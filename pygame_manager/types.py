@@ -17,11 +17,17 @@ from .managers.geometry import (
     LineObject,
     CircleObject,
     RectObject,
-    PolygonObject
+    PolygonObject,
+    PointArrayObject,
+    VectorArrayObject,
+    SegmentArrayObject,
 )
 
 # ========================================== PANELS ==========================================
-from .managers.panels import Panel
+from .managers.panels import Panel, ScrollPanel
+
+# ========================================== PHYSICS ==========================================
+from .managers.physics import BodyObject
 
 # ========================================== STATES ==========================================
 from .managers.states import State
@@ -39,6 +45,10 @@ from .managers.ui import (
     CircleSelectorObject,
     TextCaseObject,
     InputButtonObject,
+    GlyphAtlasObject,
+    LayoutObject,
+    ListViewObject,
+    TableViewObject,
 )
 
 # ========================================== EXPOSITION ==========================================
@@ -59,9 +69,16 @@ __all__ = [
     "CircleObject",
     "RectObject",
     "PolygonObject",
+    "PointArrayObject",
+    "VectorArrayObject",
+    "SegmentArrayObject",
 
     # Panels
     "Panel",
+    "ScrollPanel",
+
+    # Physics
+    "BodyObject",
 
     # States
     "State",
@@ -78,4 +95,8 @@ __all__ = [
     "CircleSelectorObject",
     "TextCaseObject",
     "InputButtonObject",
+    "GlyphAtlasObject",
+    "LayoutObject",
+    "ListViewObject",
+    "TableViewObject",
 ]
\ No newline at end of file